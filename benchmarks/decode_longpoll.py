@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+"""Decode throughput of RE/longPoll response bodies per JSON backend.
+
+Decodes long-poll bodies the way the API layer and the session do: the
+response body with ``codec.loads``, then the ``deviceServiceDataModel``
+string of every ``message`` result. Without ``--payloads`` a synthetic
+burst is used (``--results`` DeviceServiceData entries plus a few messages);
+``--payloads`` takes a file with one recorded response body per line, e.g.
+captured with ``boschshc_rawscan`` or a debug log.
+
+    python benchmarks/decode_longpoll.py [--results 40] [--payloads FILE]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from boschshcpy import codec  # noqa: E402
+
+
+def synthetic_body(results: int) -> bytes:
+    entries: list[dict] = []
+    for index in range(results):
+        device_id = f"hdm:ZigBee:{index:016x}"
+        entries.append(
+            {
+                "@type": "DeviceServiceData",
+                "id": "ShutterControl",
+                "deviceId": device_id,
+                "path": f"/devices/{device_id}/services/ShutterControl",
+                "state": {
+                    "@type": "shutterControlState",
+                    "calibrated": True,
+                    "referenceMovingTimes": {
+                        "movingTimeTopToBottomInMillis": 21000,
+                        "movingTimeBottomToTopInMillis": 22000,
+                    },
+                    "level": index / results,
+                    "operationState": "MOVING",
+                },
+            }
+        )
+    for index in range(3):
+        inner = {
+            "@type": "DeviceServiceData",
+            "id": "BatteryLevel",
+            "deviceId": f"hdm:ZigBee:{index:016x}",
+            "faults": {"entries": [{"type": "LOW_BATTERY", "category": "WARNING"}]},
+        }
+        entries.append(
+            {
+                "@type": "message",
+                "id": f"message-{index}",
+                "messageCode": {"name": "BATTERY_LOW", "category": "WARNING"},
+                "arguments": {"deviceServiceDataModel": json.dumps(inner)},
+            }
+        )
+    return json.dumps([{"jsonrpc": "2.0", "result": entries}]).encode("utf-8")
+
+
+def decode(body: bytes) -> int:
+    decoded = 0
+    for entry in codec.loads(body):
+        for raw_result in entry.get("result") or []:
+            decoded += 1
+            arguments = raw_result.get("arguments") or {}
+            if "deviceServiceDataModel" in arguments:
+                codec.loads(arguments["deviceServiceDataModel"])
+    return decoded
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--results", type=int, default=40)
+    parser.add_argument("--payloads", help="file with one response body per line")
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+
+    if args.payloads:
+        with open(args.payloads, "rb") as payload_file:
+            bodies = [line.strip() for line in payload_file if line.strip()]
+    else:
+        bodies = [synthetic_body(args.results)]
+    size = sum(len(body) for body in bodies)
+    results = sum(decode(body) for body in bodies)
+    print(f"bodies: {len(bodies)}, {size / 1024:.1f} KiB, {results} results")
+
+    for backend in codec.BACKENDS:
+        codec.select_backend(backend)
+        seconds = min(
+            timeit.repeat(
+                lambda: [decode(body) for body in bodies],
+                number=args.number,
+                repeat=3,
+            )
+        )
+        per_pass = seconds / args.number
+        print(
+            f"{backend:>7}: {per_pass * 1e6:8.1f} us/pass  "
+            f"{size / per_pass / 2**20:7.1f} MiB/s  "
+            f"{results / per_pass:10.0f} results/s"
+        )
+    codec.select_backend()
+
+
+if __name__ == "__main__":
+    main()
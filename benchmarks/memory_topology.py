@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+"""Memory footprint of a synthetic 500-device topology.
+
+Builds SHCDevice/SHCDeviceService objects for a mix of common models from
+synthetic ``/devices`` and ``/services`` JSON documents (no controller
+needed), parsed with ``json.loads`` just like the API responses, and reports
+the memory the session retains: the object graph plus the raw dicts it wraps.
+
+    python benchmarks/memory_topology.py [--devices 500]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tracemalloc
+from unittest.mock import MagicMock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from boschshcpy.device_helper import SHCDeviceHelper  # noqa: E402
+
+# deviceModel -> service ids of a typical device of that model
+MODELS: dict[str, list[str]] = {
+    "PSM": ["PowerMeter", "PowerSwitch", "PowerSwitchProgram", "Routing"],
+    "BBL": ["ShutterControl", "ChildProtection", "PowerMeter"],
+    "TRV": [
+        "BatteryLevel",
+        "Thermostat",
+        "TemperatureLevel",
+        "TemperatureOffset",
+        "ValveTappet",
+        "SilentMode",
+        "CommunicationQuality",
+    ],
+    "SWD2": ["BatteryLevel", "ShutterContact", "Bypass", "CommunicationQuality"],
+    "MD": ["BatteryLevel", "LatestMotion", "MultiLevelSensor"],
+}
+
+
+def synthetic_topology(count: int) -> list[tuple[dict, list[dict]]]:
+    models = list(MODELS)
+    topology = []
+    for index in range(count):
+        model = models[index % len(models)]
+        device_id = f"hdm:ZigBee:{index:016x}"
+        services = [
+            {
+                "@type": "DeviceServiceData",
+                "id": service_id,
+                "deviceId": device_id,
+                "path": f"/devices/{device_id}/services/{service_id}",
+                "state": {"@type": f"{service_id[0].lower()}{service_id[1:]}State"},
+            }
+            for service_id in MODELS[model]
+        ]
+        raw_device = {
+            "@type": "device",
+            "id": device_id,
+            "deviceModel": model,
+            "name": f"Device {index}",
+            "manufacturer": "BOSCH",
+            "roomId": f"hz_{index % 20}",
+            "deviceServiceIds": MODELS[model],
+            "status": "AVAILABLE",
+        }
+        topology.append((raw_device, services))
+    return topology
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--devices", type=int, default=500)
+    args = parser.parse_args()
+
+    topology = synthetic_topology(args.devices)
+    devices_json = json.dumps([raw for raw, _ in topology])
+    services_json = json.dumps([svc for _, services in topology for svc in services])
+    del topology
+    helper = SHCDeviceHelper(MagicMock())
+
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    raw_devices = json.loads(devices_json)
+    services_by_device: dict[str, list[dict]] = {}
+    for raw_service in json.loads(services_json):
+        services_by_device.setdefault(raw_service["deviceId"], []).append(raw_service)
+    devices = [
+        helper.device_init(raw, services_by_device[raw["id"]]) for raw in raw_devices
+    ]
+    del raw_devices, services_by_device
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    service_count = sum(len(device.device_services) for device in devices)
+    with_dict = sum(1 for device in devices if getattr(device, "__dict__", None))
+    total = after - before
+    print(f"devices:            {len(devices)}")
+    print(f"device services:    {service_count}")
+    print(f"retained:           {total / 1024:.1f} KiB")
+    print(f"per device:         {total / len(devices):.0f} bytes (incl. services)")
+    print(f"instance __dict__s: {with_dict} device(s)")
+
+
+if __name__ == "__main__":
+    main()
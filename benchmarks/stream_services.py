@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+"""Peak memory of decoding ``/services``: buffered vs. streamed.
+
+Compares what ``get_services()`` does (hold the whole body, decode it, then
+filter against SUPPORTED_DEVICE_SERVICE_IDS) with ``iter_services()`` (feed
+64 KiB chunks to ``codec.IncrementalArrayDecoder`` and drop unsupported
+services as they are decoded) on a synthetic body, with the selected codec
+backend for the buffered decode. No controller needed.
+
+    python benchmarks/stream_services.py [--devices 500]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from boschshcpy import codec  # noqa: E402
+from boschshcpy.api import STREAM_CHUNK_SIZE  # noqa: E402
+from boschshcpy.services_impl import SUPPORTED_DEVICE_SERVICE_IDS  # noqa: E402
+
+# Services a typical device carries; the unsupported ones are dropped.
+SERVICE_IDS = [
+    "PowerSwitch",
+    "PowerMeter",
+    "BatteryLevel",
+    "CommunicationQuality",
+    "HSMSoftwareUpdate",
+    "ZigbeeRouting",
+    "DeviceDiagnostics",
+    "FirmwareInfo",
+]
+
+
+def synthetic_body(devices: int) -> bytes:
+    services = [
+        {
+            "@type": "DeviceServiceData",
+            "id": service_id,
+            "deviceId": f"hdm:ZigBee:{index:016x}",
+            "path": f"/devices/hdm:ZigBee:{index:016x}/services/{service_id}",
+            "state": {"@type": "someState", "value": index, "values": list(range(8))},
+        }
+        for index in range(devices)
+        for service_id in SERVICE_IDS
+    ]
+    return json.dumps(services).encode("utf-8")
+
+
+def buffered(chunks: list[bytes]) -> list[dict]:
+    body = b"".join(chunks)
+    return [s for s in codec.loads(body) if s["id"] in SUPPORTED_DEVICE_SERVICE_IDS]
+
+
+def streamed(chunks: list[bytes]) -> list[dict]:
+    decoder = codec.IncrementalArrayDecoder()
+    kept = []
+    for chunk in chunks:
+        for service in decoder.feed(chunk):
+            if service["id"] in SUPPORTED_DEVICE_SERVICE_IDS:
+                kept.append(service)
+    decoder.close()
+    return kept
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--devices", type=int, default=500)
+    args = parser.parse_args()
+
+    raw = synthetic_body(args.devices)
+    chunks = [
+        raw[i : i + STREAM_CHUNK_SIZE] for i in range(0, len(raw), STREAM_CHUNK_SIZE)
+    ]
+    del raw
+    print(f"body: {sum(map(len, chunks)) / 2**20:.2f} MiB in {len(chunks)} chunks")
+    for name, decode in (("buffered", buffered), ("streamed", streamed)):
+        elapsed = min(timeit.repeat(lambda: decode(chunks), number=1, repeat=5))
+        tracemalloc.start()
+        kept = decode(chunks)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(
+            f"{name:>8}: {len(kept)} services kept, peak {peak / 2**20:6.2f} MiB, "
+            f"{elapsed * 1e3:6.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,43 @@
 from __future__ import annotations
 
 import importlib.resources
-import json
 import logging
+import time
+from collections.abc import Callable, Container, Iterator, Sequence
 from typing import Any, NoReturn, cast
 
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.poolmanager import PoolManager
 
+from . import codec
 from .exceptions import SHCConnectionError, SHCSessionError
 from .exceptions import JSONRPCError as JSONRPCError  # noqa: F401 -- explicit re-export
+from .jsonrpc import JSONRPCCall, build_batch, demultiplex_batch
+from .response_cache import SHCResponseCache
+from .retry import RETRY_ONCE_ON_DROP, SHCRetryPolicy
+from .scheduler import SHCRequestScheduler, request_priority
+from .singleflight import SingleFlight
 
 logger = logging.getLogger("boschshcpy")
 
+# Read size for streamed list responses (iter_services / iter_devices).
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def check_element_type(raw: Any, expected_element_type: str) -> None:
+    """Raise SHCSessionError unless ``raw`` has ``@type`` ``expected_element_type``.
+
+    The list getters run this for every element; callers that pass
+    ``validate=False`` run it themselves in the loop that consumes the list,
+    so each element is visited once.
+    """
+    if raw.get("@type") != expected_element_type:
+        raise SHCSessionError(
+            f"Unexpected @type in API response element: "
+            f"expected {expected_element_type!r}, got {raw.get('@type')!r}"
+        )
+
 
 class HostNameIgnoringAdapter(HTTPAdapter):  # type: ignore[misc]
     def init_poolmanager(
@@ -36,9 +60,21 @@ class SHCAPI:
         key: str,
         verify_hostname: bool = False,
         ssl_verify: bool = True,
+        response_cache: SHCResponseCache | None = None,
+        scheduler: SHCRequestScheduler | None = None,
+        retry_policy: SHCRetryPolicy | None = None,
     ) -> None:
         self._certificate = certificate
         self._key = key
+        # Opt-in cache for rarely changing resources (see response_cache.py)
+        self._response_cache = response_cache
+        # Concurrent identical GETs share one request (see singleflight.py)
+        self._single_flight = SingleFlight()
+        # Opt-in rate limit / priority queue (see scheduler.py)
+        self._scheduler = scheduler
+        self._retry_policy = (
+            retry_policy if retry_policy is not None else RETRY_ONCE_ON_DROP
+        )
         self._controller_ip = controller_ip
         self._api_root = f"https://{self._controller_ip}:8444/smarthome"
         self._public_root = f"https://{self._controller_ip}:8446/smarthome/public"
@@ -86,7 +122,7 @@ class SHCAPI:
     def _session_request(
         self, method: str, api_url: str, **kwargs: Any
     ) -> requests.Response:
-        """Issue a request, retrying once on a bare connection drop.
+        """Issue a request, retrying as the retry policy allows.
 
         #281: the SHC silently closes idle keep-alive connections. The next
         request reusing that dead pooled connection then raises
@@ -95,20 +131,55 @@ class SHCAPI:
         no response was received, the command was not processed, so a single
         retry on a fresh connection is safe (no risk of double-execution) and
         turns the intermittent automation failure into a transparent recovery.
+        That is all the default policy does; an SHCRetryPolicy may also retry
+        idempotent requests on timeouts and retryable status codes, with
+        backoff (see retry.py). A response with a status that is not retried
+        is returned for the caller to handle.
+
+        With a scheduler, the request first waits for its turn; retries do
+        not queue again.
         """
+        if self._scheduler is not None:
+            priority = request_priority(method, api_url)
+            if priority is not None:
+                self._scheduler.acquire(priority)
         # Dispatch on the named verb (session.get/put/post) so callers and tests
         # observe the same call surface as before this retry wrapper existed.
         verb = getattr(self._requests_session, method.lower())
-        try:
-            return cast(requests.Response, verb(api_url, **kwargs))
-        except requests.exceptions.ConnectionError as err:
+        policy = self._retry_policy
+        attempt = 1
+        while True:
+            try:
+                result = cast(requests.Response, verb(api_url, **kwargs))
+            except requests.exceptions.SSLError:
+                # A ConnectionError subclass, but a certificate or handshake
+                # failure does not go away on retry (SHCAPIAsync does not
+                # retry ClientSSLError either).
+                raise
+            except requests.exceptions.ConnectionError as err:
+                if not policy.retries_error(method, attempt, dropped=True):
+                    raise
+                reason: object = err
+            except requests.exceptions.Timeout as err:
+                if not policy.retries_error(method, attempt, dropped=False):
+                    raise
+                reason = err
+            else:
+                if not policy.retries_status(method, result.status_code, attempt):
+                    return result
+                reason = f"status {result.status_code}"
+                result.close()
+            delay = policy.backoff(attempt)
             logger.debug(
-                "%s %s dropped (%s); retrying once on a fresh connection",
+                "%s %s failed (%s); retrying in %.2fs",
                 method,
                 api_url,
-                err,
+                reason,
+                delay,
             )
-            return cast(requests.Response, verb(api_url, **kwargs))
+            if delay > 0:
+                time.sleep(delay)
+            attempt += 1
 
     def _get_api_result_or_fail(
         self,
@@ -117,33 +188,89 @@ class SHCAPI:
         expected_element_type: str | None = None,
         headers: dict[str, str] | None = None,
         timeout: int = 30,
+        validate: bool = True,
+        cache_key: str = "",
+    ) -> Any:
+        key = (
+            api_url,
+            expected_type,
+            expected_element_type,
+            None if headers is None else tuple(sorted(headers.items())),
+            validate,
+            cache_key,
+        )
+        return self._single_flight.do(
+            key,
+            lambda: self._get_api_result(
+                api_url,
+                expected_type,
+                expected_element_type,
+                headers,
+                timeout,
+                validate,
+                cache_key,
+            ),
+        )
+
+    def _get_api_result(
+        self,
+        api_url: str,
+        expected_type: str | None,
+        expected_element_type: str | None,
+        headers: dict[str, str] | None,
+        timeout: int,
+        validate: bool,
+        cache_key: str,
     ) -> Any:
+        cache = self._response_cache if cache_key else None
+        request_headers = headers
+        if cache is not None:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return codec.loads(cached)
+            validators = cache.validators(cache_key)
+            if validators:
+                request_headers = {**(headers or {}), **validators}
         try:
             result = self._session_request(
-                "GET", api_url, headers=headers, timeout=timeout
+                "GET", api_url, headers=request_headers, timeout=timeout
             )
+            if cache is not None and result.status_code == 304:
+                cached = cache.revalidated(cache_key)
+                if cached is not None:
+                    return codec.loads(cached)
+                # Invalidated while in flight: fetch unconditionally.
+                return self._get_api_result(
+                    api_url,
+                    expected_type,
+                    expected_element_type,
+                    headers,
+                    timeout,
+                    validate,
+                    cache_key,
+                )
             if not result.ok:
                 self._process_nok_result(result)
 
             else:
                 if len(result.content) > 0:
-                    result = json.loads(result.content)
-                    if (
-                        expected_type is not None
-                        and result.get("@type") != expected_type
-                    ):
-                        raise SHCSessionError(
-                            f"Unexpected @type in API response: expected "
-                            f"{expected_type!r}, got {result.get('@type')!r}"
-                        )
-                    if expected_element_type is not None:
-                        for result_ in result:
-                            if result_.get("@type") != expected_element_type:
-                                raise SHCSessionError(
-                                    f"Unexpected @type in API response element: "
-                                    f"expected {expected_element_type!r}, got "
-                                    f"{result_.get('@type')!r}"
-                                )
+                    content = result.content
+                    response_headers = result.headers if cache is not None else None
+                    result = codec.loads(content)
+                    if validate:
+                        if (
+                            expected_type is not None
+                            and result.get("@type") != expected_type
+                        ):
+                            raise SHCSessionError(
+                                f"Unexpected @type in API response: expected "
+                                f"{expected_type!r}, got {result.get('@type')!r}"
+                            )
+                        if expected_element_type is not None:
+                            for result_ in result:
+                                check_element_type(result_, expected_element_type)
+                    if cache is not None and validate:
+                        cache.store(cache_key, content, response_headers)
 
                     return result
                 else:
@@ -151,25 +278,61 @@ class SHCAPI:
         except requests.exceptions.SSLError as e:
             raise SHCConnectionError(f"API call returned SSLError: {e}.") from e
 
+    def _iter_api_list(
+        self,
+        api_url: str,
+        expected_element_type: str,
+        validate: bool = True,
+        accept: Callable[[dict[str, Any]], bool] | None = None,
+        timeout: int = 30,
+    ) -> Iterator[dict[str, Any]]:
+        """Stream a list resource, yielding each element once it is decoded.
+
+        The body is read in chunks and never held in full; elements rejected
+        by ``accept`` are dropped right after decoding.
+        """
+        try:
+            result = self._session_request("GET", api_url, stream=True, timeout=timeout)
+        except requests.exceptions.SSLError as e:
+            raise SHCConnectionError(f"API call returned SSLError: {e}.") from e
+        try:
+            if not result.ok:
+                self._process_nok_result(result)
+            decoder = codec.IncrementalArrayDecoder()
+            try:
+                for chunk in result.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                    for element in decoder.feed(chunk):
+                        if validate:
+                            check_element_type(element, expected_element_type)
+                        if accept is None or accept(element):
+                            yield element
+                decoder.close()
+            except ValueError as e:
+                raise SHCSessionError(f"Malformed list response: {e}") from e
+            except requests.exceptions.RequestException as e:
+                raise SHCConnectionError(f"API stream interrupted: {e}.") from e
+        finally:
+            result.close()
+
     def _put_api_or_fail(self, api_url: str, body: Any, timeout: int = 30) -> Any:
         result = self._session_request(
-            "PUT", api_url, data=json.dumps(body), timeout=timeout
+            "PUT", api_url, data=codec.dumps(body), timeout=timeout
         )
         if not result.ok:
             self._process_nok_result(result)
         if len(result.content) > 0:
-            return json.loads(result.content)
+            return codec.loads(result.content)
         else:
             return {}
 
     def _post_api_or_fail(self, api_url: str, body: Any, timeout: int = 30) -> Any:
         result = self._session_request(
-            "POST", api_url, data=json.dumps(body), timeout=timeout
+            "POST", api_url, data=codec.dumps(body), timeout=timeout
         )
         if not result.ok:
             self._process_nok_result(result)
         if len(result.content) > 0:
-            return json.loads(result.content)
+            return codec.loads(result.content)
         else:
             return {}
 
@@ -190,7 +353,7 @@ class SHCAPI:
     def get_information(self) -> Any:
         api_url = f"{self._api_root}/information"
         try:
-            result = self._get_api_result_or_fail(api_url)
+            result = self._get_api_result_or_fail(api_url, cache_key="information")
         except Exception as e:
             logger.error("Failed to get information from SHC controller: %s", e)
             return None
@@ -199,33 +362,49 @@ class SHCAPI:
     def get_public_information(self) -> Any:
         api_url = f"{self._public_root}/information"
         try:
-            result = self._get_api_result_or_fail(api_url, headers={})
+            result = self._get_api_result_or_fail(
+                api_url, headers={}, cache_key="public_information"
+            )
         except Exception as e:
             logger.error("Failed to get public information from SHC controller: %s", e)
             return None
         return result
 
-    def get_rooms(self) -> Any:
+    def get_rooms(self, validate: bool = True) -> Any:
         api_url = f"{self._api_root}/rooms"
-        return self._get_api_result_or_fail(api_url, expected_element_type="room")
+        return self._get_api_result_or_fail(
+            api_url, expected_element_type="room", validate=validate, cache_key="rooms"
+        )
 
-    def get_scenarios(self) -> Any:
+    def get_scenarios(self, validate: bool = True) -> Any:
         api_url = f"{self._api_root}/scenarios"
-        return self._get_api_result_or_fail(api_url, expected_element_type="scenario")
+        return self._get_api_result_or_fail(
+            api_url,
+            expected_element_type="scenario",
+            validate=validate,
+            cache_key="scenarios",
+        )
 
-    def get_userdefinedstates(self) -> Any:
+    def get_userdefinedstates(self, validate: bool = True) -> Any:
         api_url = f"{self._api_root}/userdefinedstates"
         return self._get_api_result_or_fail(
-            api_url, expected_element_type="userDefinedState"
+            api_url,
+            expected_element_type="userDefinedState",
+            validate=validate,
+            cache_key="userdefinedstates",
         )
 
-    def get_messages(self) -> Any:
+    def get_messages(self, validate: bool = True) -> Any:
         api_url = f"{self._api_root}/messages"
-        return self._get_api_result_or_fail(api_url, expected_element_type="message")
+        return self._get_api_result_or_fail(
+            api_url, expected_element_type="message", validate=validate
+        )
 
-    def get_devices(self) -> Any:
+    def get_devices(self, validate: bool = True) -> Any:
         api_url = f"{self._api_root}/devices"
-        return self._get_api_result_or_fail(api_url, expected_element_type="device")
+        return self._get_api_result_or_fail(
+            api_url, expected_element_type="device", validate=validate
+        )
 
     def get_device(self, device_id: str) -> Any:
         api_url = f"{self._api_root}/devices/{device_id}"
@@ -241,12 +420,35 @@ class SHCAPI:
         api_url = f"{self._api_root}/devices/{device_id}"
         return self._put_api_or_fail(api_url, device_data)
 
-    def get_services(self) -> Any:
+    def get_services(self, validate: bool = True) -> Any:
         api_url = f"{self._api_root}/services"
         return self._get_api_result_or_fail(
-            api_url, expected_element_type="DeviceServiceData"
+            api_url, expected_element_type="DeviceServiceData", validate=validate
         )
 
+    def iter_services(
+        self, service_ids: Container[str] | None = None, validate: bool = True
+    ) -> Iterator[dict[str, Any]]:
+        """Stream ``/services``, yielding each DeviceServiceData as it arrives.
+
+        With ``service_ids`` only services whose id is in it are yielded; the
+        others are dropped as soon as they are decoded.
+        """
+        accept = None
+        if service_ids is not None:
+            ids = service_ids
+
+            def accept(service: dict[str, Any]) -> bool:
+                return service.get("id") in ids
+
+        return self._iter_api_list(
+            f"{self._api_root}/services", "DeviceServiceData", validate, accept
+        )
+
+    def iter_devices(self, validate: bool = True) -> Iterator[dict[str, Any]]:
+        """Stream ``/devices``, yielding each device as it arrives."""
+        return self._iter_api_list(f"{self._api_root}/devices", "device", validate)
+
     def get_device_services(self, device_id: str) -> Any:
         api_url = f"{self._api_root}/devices/{device_id}/services"
         return self._get_api_result_or_fail(api_url)
@@ -344,3 +546,33 @@ class SHCAPI:
             )
         else:
             return result[0]["result"]
+
+    def jsonrpc_batch(
+        self, calls: Sequence[JSONRPCCall], timeout: int = 30
+    ) -> list[Any]:
+        """POST several JSON-RPC calls in one request.
+
+        Returns one entry per call, in call order: the call's result, or a
+        JSONRPCError instance if the SHC rejected that call (see
+        jsonrpc.demultiplex_batch). Include the long-poll wait in ``timeout``
+        when the batch contains an RE/longPoll.
+        """
+        result = self._post_api_or_fail(self._rpc_root, build_batch(calls), timeout)
+        return demultiplex_batch(result, calls)
+
+    def long_polling_resubscribe(self, old_poll_id: str) -> str:
+        """Drop ``old_poll_id`` and subscribe again in a single round trip.
+
+        An error for the unsubscribe (typically -32001, the old id already
+        expired) is ignored; an error for the subscribe is raised.
+        """
+        unsubscribed, poll_id = self.jsonrpc_batch(
+            [JSONRPCCall.unsubscribe(old_poll_id), JSONRPCCall.subscribe()]
+        )
+        if isinstance(unsubscribed, JSONRPCError):
+            logger.debug(
+                "Ignoring RE/unsubscribe error on resubscribe: %s", unsubscribed
+            )
+        if isinstance(poll_id, JSONRPCError):
+            raise poll_id
+        return str(poll_id)
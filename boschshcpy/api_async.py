@@ -22,29 +22,100 @@ This is the aiohttp equivalent of the HostNameIgnoringAdapter pattern and must
 be validated against live SHC hardware before Phase 1 ships (see
 01_analysis/async-phase1-verify.md).
 
+Connection pool
+---------------
+An owned session uses a bounded ``TCPConnector`` (``connection_limit``) whose
+idle keep-alive timeout is kept well below aiohttp's 15 s default, so pooled
+connections are recycled before the SHC silently closes them (#281) instead
+of being discovered dead by the next write. ``RE/longPoll`` runs on its own
+single-connection session (created on first use), so commands never queue
+behind a poll that can stay open for ``wait_seconds + 5`` seconds.
+With an external session that is off by default (see below).
+``SHCAPIAsync.pool_stats`` reports request and connection counters.
+
 External session
 ----------------
 Pass an existing ``aiohttp.ClientSession`` via ``external_session`` to let HA's
 ``async_create_clientsession`` manage the lifecycle. When no external session is
 provided, SHCAPIAsync creates and owns its own session; call ``await api.close()``
-when done.
+when done. Long polls then share the external session too, so the library
+opens no connections of its own; ``dedicated_long_poll=True`` opts back in
+to the separate long-poll session, which ``close()`` must then be awaited
+for.
 """
 
 from __future__ import annotations
 
+import asyncio
 import importlib.resources
-import json
 import logging
 import ssl
-from typing import Any
+from collections.abc import AsyncIterator, Callable, Container, Sequence
+from contextlib import AsyncExitStack
+from typing import Any, NamedTuple
 
+from . import codec
 from .exceptions import SHCConnectionError, SHCSessionError
+from .jsonrpc import JSONRPCCall, build_batch, demultiplex_batch
+from .response_cache import SHCResponseCache
+from .retry import RETRY_ONCE_ON_DROP, SHCRetryPolicy
+from .scheduler import SHCRequestSchedulerAsync, request_priority
+from .singleflight import AsyncSingleFlight
 
 logger = logging.getLogger("boschshcpy")
 
 # Re-export so callers can ``from boschshcpy.api_async import JSONRPCError``
 # without importing the sync api module.
 from .api import JSONRPCError as JSONRPCError  # noqa: E402  -- explicit re-export for mypy
+from .api import STREAM_CHUNK_SIZE, check_element_type  # noqa: E402
+
+
+# Defaults for the owned connection pool (see module docstring).
+DEFAULT_CONNECTION_LIMIT = 10
+DEFAULT_KEEPALIVE_TIMEOUT = 5.0
+
+
+class _RetryableStatusError(SHCSessionError):
+    """Non-OK answer with a status the retry policy lists."""
+
+    def __init__(self, message: str, status: int) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+# Returned by a GET attempt whose 304 answer found its cache entry gone.
+_INVALIDATED = object()
+
+
+def _dropped_before_sending(exc: BaseException) -> bool:
+    """Whether a failed request never reached the SHC (retry.py ``dropped``).
+
+    Every aiohttp connection error counts, connect timeouts included, as in
+    the sync client where requests' ConnectTimeout is a ConnectionError.
+    The exceptions are read timeouts (aiohttp >= 3.10 SocketTimeoutError),
+    raised after the request was sent, and the plain asyncio.TimeoutError of
+    the total timeout.
+    """
+    import aiohttp
+
+    if not isinstance(exc, aiohttp.ClientConnectionError):
+        return False
+    read_timeout = getattr(aiohttp, "SocketTimeoutError", None)
+    return read_timeout is None or not isinstance(exc, read_timeout)
+
+
+class SHCConnectionPoolStats(NamedTuple):
+    """Snapshot of SHCAPIAsync request and connection counters."""
+
+    requests: int  # HTTP requests issued (retries included)
+    in_flight: int  # requests currently awaiting a response
+    peak_in_flight: int  # highest concurrent in_flight seen
+    long_polls: int  # RE/longPoll requests issued
+    connection_drops: int  # requests retried after a dropped keep-alive
+    retries: int  # attempts re-sent under the retry policy (drops included)
+    connections_created: int  # new TCP/TLS connections (owned sessions only)
+    connections_reused: int  # pooled connections reused (owned sessions only)
+    coalesced: int  # GETs that joined an identical request already in flight
 
 
 def build_ssl_context(certificate: str, key: str) -> ssl.SSLContext:
@@ -91,6 +162,12 @@ class SHCAPIAsync:
         *,
         external_session: Any | None = None,
         ssl_context: Any | None = None,
+        connection_limit: int = DEFAULT_CONNECTION_LIMIT,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+        dedicated_long_poll: bool | None = None,
+        response_cache: SHCResponseCache | None = None,
+        scheduler: SHCRequestSchedulerAsync | None = None,
+        retry_policy: SHCRetryPolicy | None = None,
     ) -> None:
         """Initialise the async API layer.
 
@@ -108,6 +185,21 @@ class SHCAPIAsync:
                 ``await hass.async_add_executor_job(build_ssl_context, cert,
                 key)``) to avoid a blocking-call-in-event-loop warning. When
                 None, it is built here from ``certificate``/``key``.
+            connection_limit: Maximum simultaneous connections of the owned
+                session (ignored for an external session).
+            keepalive_timeout: Seconds an idle pooled connection is kept
+                open (owned sessions only).
+            dedicated_long_poll: Run RE/longPoll on a separate
+                single-connection session owned by SHCAPIAsync. None (the
+                default) enables it for an owned session only; with True
+                and an external session, ``close()`` must be awaited to
+                close the long-poll session.
+            response_cache: Optional cache for rooms, scenarios, user-defined
+                states and the information blocks (see response_cache.py).
+            scheduler: Optional rate limit and priority queue for requests
+                (see scheduler.py); JSON-RPC is not scheduled.
+            retry_policy: Optional SHCRetryPolicy; by default only a request
+                whose connection dropped before sending is retried, once.
         """
         # Lazy import: boschshcpy stays importable without aiohttp
         try:
@@ -129,12 +221,31 @@ class SHCAPIAsync:
             else build_ssl_context(certificate, key)
         )
         self._owns_session = external_session is None
+        self._keepalive_timeout = keepalive_timeout
+        self._dedicated_long_poll = (
+            dedicated_long_poll
+            if dedicated_long_poll is not None
+            else self._owns_session
+        )
+        self._long_poll_session: Any = None
+        self._stats = dict.fromkeys(SHCConnectionPoolStats._fields, 0)
+        self._response_cache = response_cache
+        self._single_flight = AsyncSingleFlight()
+        self._scheduler = scheduler
+        self._retry_policy = (
+            retry_policy if retry_policy is not None else RETRY_ONCE_ON_DROP
+        )
 
         if self._owns_session:
-            connector = aiohttp.TCPConnector(ssl=self._ssl_ctx)
+            connector = aiohttp.TCPConnector(
+                ssl=self._ssl_ctx,
+                limit=connection_limit,
+                keepalive_timeout=keepalive_timeout,
+            )
             self._session: Any = aiohttp.ClientSession(
                 connector=connector,
                 headers={"api-version": "3.2", "Content-Type": "application/json"},
+                trace_configs=[self._build_trace_config()],
             )
         else:
             self._session = external_session
@@ -145,17 +256,67 @@ class SHCAPIAsync:
     def controller_ip(self) -> str:
         return self._controller_ip
 
+    @property
+    def pool_stats(self) -> SHCConnectionPoolStats:
+        return SHCConnectionPoolStats(**self._stats)
+
     async def close(self) -> None:
-        """Close the managed ClientSession (no-op when an external session was provided)."""
+        """Close the managed ClientSession (an external session is left open)
+        and the dedicated long-poll session, if one was created."""
+        if self._long_poll_session is not None and not self._long_poll_session.closed:
+            await self._long_poll_session.close()
+        self._long_poll_session = None
         if self._owns_session and not self._session.closed:
             await self._session.close()
 
+    def _build_trace_config(self) -> Any:
+        """aiohttp TraceConfig feeding the connection counters of pool_stats."""
+        import aiohttp
+
+        async def on_connection_create_end(*_: Any) -> None:
+            self._stats["connections_created"] += 1
+
+        async def on_connection_reuseconn(*_: Any) -> None:
+            self._stats["connections_reused"] += 1
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        return trace_config
+
+    def _get_long_poll_session(self) -> Any:
+        """Session for RE/longPoll: a lazily created single-connection
+        session, or the shared one when dedicated_long_poll is off."""
+        if not self._dedicated_long_poll:
+            return self._session
+        if self._long_poll_session is None or self._long_poll_session.closed:
+            import aiohttp
+
+            self._long_poll_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    ssl=self._ssl_ctx,
+                    limit=1,
+                    keepalive_timeout=self._keepalive_timeout,
+                ),
+                headers=self._headers,
+                trace_configs=[self._build_trace_config()],
+            )
+        return self._long_poll_session
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
-    async def _retry_once_on_connection_drop(self, api_url: str, attempt: Any) -> Any:
-        """Run attempt() once, retrying a single time on a bare connection drop.
+    async def _wait_for_turn(self, method: str, api_url: str) -> None:
+        if self._scheduler is not None:
+            priority = request_priority(method, api_url)
+            if priority is not None:
+                await self._scheduler.acquire(priority)
+
+    async def _request_with_retry(
+        self, api_url: str, attempt: Any, method: str = "GET"
+    ) -> Any:
+        """Run attempt(), retrying as the retry policy allows.
 
         #281 parity with the sync client (api.py:_session_request): the SHC
         silently closes idle keep-alive connections, and aiohttp raises
@@ -165,30 +326,65 @@ class SHCAPIAsync:
         connection is safe (no risk of double-execution). Without this, the
         async path (the one actually used by session_async.py / HA's
         production long-poll session) hits the exact intermittent failure
-        #281 already fixed on the sync path.
+        #281 already fixed on the sync path. That is all the default policy
+        does; an SHCRetryPolicy may also retry idempotent requests (``method``)
+        on timeouts and retryable status codes, with backoff (see retry.py).
 
         ClientSSLError is a ClientConnectionError subclass but is
         deliberately NOT retried — a cert/handshake failure won't be fixed by
         trying again.
+
+        With a scheduler, the request first waits for its turn (``method``
+        selects its class); retries do not queue again.
         """
         import aiohttp
 
+        await self._wait_for_turn(method, api_url)
+
+        policy = self._retry_policy
+        stats = self._stats
+        stats["requests"] += 1
+        stats["in_flight"] += 1
+        stats["peak_in_flight"] = max(stats["peak_in_flight"], stats["in_flight"])
         try:
-            return await attempt()
-        except aiohttp.ClientSSLError as exc:
-            raise SHCConnectionError(f"API call returned SSLError: {exc}.") from exc
-        except aiohttp.ClientConnectionError as exc:
-            logger.debug(
-                "%s dropped (%s); retrying once on a fresh connection", api_url, exc
-            )
-            try:
-                return await attempt()
-            except aiohttp.ClientSSLError as exc2:
-                raise SHCConnectionError(
-                    f"API call returned SSLError: {exc2}."
-                ) from exc2
-            except aiohttp.ClientConnectionError as exc2:
-                raise SHCConnectionError(f"API connection error: {exc2}.") from exc2
+            attempt_no = 1
+            while True:
+                try:
+                    return await attempt()
+                except aiohttp.ClientSSLError as exc:
+                    raise SHCConnectionError(
+                        f"API call returned SSLError: {exc}."
+                    ) from exc
+                except _RetryableStatusError as exc:
+                    if not policy.retries_status(method, exc.status, attempt_no):
+                        raise
+                    reason: Exception = exc
+                except (asyncio.TimeoutError, aiohttp.ClientConnectionError) as exc:
+                    dropped = _dropped_before_sending(exc)
+                    if not policy.retries_error(method, attempt_no, dropped):
+                        if isinstance(exc, aiohttp.ClientConnectionError):
+                            raise SHCConnectionError(
+                                f"API connection error: {exc}."
+                            ) from exc
+                        raise
+                    if dropped:
+                        stats["connection_drops"] += 1
+                    reason = exc
+                delay = policy.backoff(attempt_no)
+                logger.debug(
+                    "%s %s failed (%s); retrying in %.2fs",
+                    method,
+                    api_url,
+                    reason,
+                    delay,
+                )
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                attempt_no += 1
+                stats["requests"] += 1
+                stats["retries"] += 1
+        finally:
+            stats["in_flight"] -= 1
 
     async def _get_api_result_or_fail(
         self,
@@ -197,13 +393,58 @@ class SHCAPIAsync:
         expected_element_type: str | None = None,
         extra_headers: dict[str, str] | None = None,
         timeout: int = 30,
+        validate: bool = True,
+        cache_key: str = "",
+    ) -> Any:
+        """Async GET — mirrors sync ``_get_api_result_or_fail``.
+
+        A caller arriving while an identical GET is in flight awaits that
+        request instead of sending its own (see singleflight.py).
+        """
+        key = (
+            api_url,
+            expected_type,
+            expected_element_type,
+            None if extra_headers is None else tuple(sorted(extra_headers.items())),
+            validate,
+            cache_key,
+        )
+        if key in self._single_flight:
+            self._stats["coalesced"] += 1
+        return await self._single_flight.do(
+            key,
+            lambda: self._get_api_result(
+                api_url,
+                expected_type,
+                expected_element_type,
+                extra_headers,
+                timeout,
+                validate,
+                cache_key,
+            ),
+        )
+
+    async def _get_api_result(
+        self,
+        api_url: str,
+        expected_type: str | None,
+        expected_element_type: str | None,
+        extra_headers: dict[str, str] | None,
+        timeout: int,
+        validate: bool,
+        cache_key: str,
     ) -> Any:
-        """Async GET — mirrors sync ``_get_api_result_or_fail``."""
         import aiohttp
 
+        cache = self._response_cache if cache_key else None
         headers = dict(self._headers)
         if extra_headers:
             headers.update(extra_headers)
+        if cache is not None:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return codec.loads(cached)
+            headers.update(cache.validators(cache_key))
 
         async def _attempt() -> Any:
             async with self._session.get(
@@ -212,6 +453,11 @@ class SHCAPIAsync:
                 ssl=self._ssl_ctx,
                 timeout=aiohttp.ClientTimeout(total=timeout),
             ) as resp:
+                if cache is not None and resp.status == 304:
+                    cached = cache.revalidated(cache_key)
+                    if cached is None:
+                        return _INVALIDATED
+                    return codec.loads(cached)
                 if not resp.ok:
                     await self._process_nok_result(resp)
 
@@ -219,24 +465,88 @@ class SHCAPIAsync:
                 if len(content) == 0:
                     return {}
 
-                result = json.loads(content)
+                result = codec.loads(content)
+
+                if validate:
+                    if (
+                        expected_type is not None
+                        and result.get("@type") != expected_type
+                    ):
+                        raise SHCSessionError(
+                            f"Unexpected @type in API response: expected "
+                            f"{expected_type!r}, got {result.get('@type')!r}"
+                        )
+                    if expected_element_type is not None:
+                        for item in result:
+                            check_element_type(item, expected_element_type)
+                    if cache is not None:
+                        cache.store(cache_key, content, resp.headers)
+                return result
+
+        result = await self._request_with_retry(api_url, _attempt)
+        if result is _INVALIDATED:
+            # Invalidated while in flight: fetch unconditionally, after the
+            # 304 response has released its connection.
+            return await self._get_api_result(
+                api_url,
+                expected_type,
+                expected_element_type,
+                extra_headers,
+                timeout,
+                validate,
+                cache_key,
+            )
+        return result
+
+    async def _iter_api_list(
+        self,
+        api_url: str,
+        expected_element_type: str,
+        validate: bool = True,
+        accept: Callable[[dict[str, Any]], bool] | None = None,
+        timeout: int = 30,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Async counterpart of ``SHCAPI._iter_api_list``.
+
+        Opening the response goes through _request_with_retry like every
+        other GET; once elements may have been yielded, a broken stream is
+        not retried.
+        """
+        import aiohttp
 
-                if expected_type is not None and result.get("@type") != expected_type:
-                    raise SHCSessionError(
-                        f"Unexpected @type in API response: expected "
-                        f"{expected_type!r}, got {result.get('@type')!r}"
+        async def _open() -> tuple[AsyncExitStack, Any]:
+            async with AsyncExitStack() as stack:
+                resp = await stack.enter_async_context(
+                    self._session.get(
+                        api_url,
+                        headers=self._headers,
+                        ssl=self._ssl_ctx,
+                        timeout=aiohttp.ClientTimeout(total=timeout),
                     )
-                if expected_element_type is not None:
-                    for item in result:
-                        if item.get("@type") != expected_element_type:
-                            raise SHCSessionError(
-                                f"Unexpected @type in API response element: "
-                                f"expected {expected_element_type!r}, got "
-                                f"{item.get('@type')!r}"
-                            )
-                return result
+                )
+                if not resp.ok:
+                    await self._process_nok_result(resp)
+                # Keep the response open for the caller.
+                return stack.pop_all(), resp
 
-        return await self._retry_once_on_connection_drop(api_url, _attempt)
+        response_stack, resp = await self._request_with_retry(api_url, _open)
+        async with response_stack:
+            decoder = codec.IncrementalArrayDecoder()
+            try:
+                async for chunk in resp.content.iter_chunked(STREAM_CHUNK_SIZE):
+                    for element in decoder.feed(chunk):
+                        if validate:
+                            check_element_type(element, expected_element_type)
+                        if accept is None or accept(element):
+                            yield element
+                decoder.close()
+            except ValueError as exc:
+                raise SHCSessionError(f"Malformed list response: {exc}") from exc
+            except aiohttp.ClientSSLError as exc:
+                raise SHCConnectionError(f"API call returned SSLError: {exc}.") from exc
+            except (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError) as exc:
+                self._stats["connection_drops"] += 1
+                raise SHCConnectionError(f"API stream interrupted: {exc}.") from exc
 
     async def _put_api_or_fail(
         self,
@@ -250,7 +560,7 @@ class SHCAPIAsync:
         async def _attempt() -> Any:
             async with self._session.put(
                 api_url,
-                data=json.dumps(body),
+                data=codec.dumps(body),
                 headers=self._headers,
                 ssl=self._ssl_ctx,
                 timeout=aiohttp.ClientTimeout(total=timeout),
@@ -258,23 +568,29 @@ class SHCAPIAsync:
                 if not resp.ok:
                     await self._process_nok_result(resp)
                 content = await resp.read()
-                return json.loads(content) if content else {}
+                return codec.loads(content) if content else {}
 
-        return await self._retry_once_on_connection_drop(api_url, _attempt)
+        return await self._request_with_retry(api_url, _attempt, "PUT")
 
     async def _post_api_or_fail(
         self,
         api_url: str,
         body: Any,
         timeout: int = 30,
+        session: Any | None = None,
     ) -> Any:
-        """Async POST — mirrors sync ``_post_api_or_fail``."""
+        """Async POST — mirrors sync ``_post_api_or_fail``.
+
+        ``session`` overrides the shared session (used for RE/longPoll).
+        """
         import aiohttp
 
+        http_session = self._session if session is None else session
+
         async def _attempt() -> Any:
-            async with self._session.post(
+            async with http_session.post(
                 api_url,
-                data=json.dumps(body),
+                data=codec.dumps(body),
                 headers=self._headers,
                 ssl=self._ssl_ctx,
                 timeout=aiohttp.ClientTimeout(total=timeout),
@@ -282,9 +598,9 @@ class SHCAPIAsync:
                 if not resp.ok:
                     await self._process_nok_result(resp)
                 content = await resp.read()
-                return json.loads(content) if content else {}
+                return codec.loads(content) if content else {}
 
-        return await self._retry_once_on_connection_drop(api_url, _attempt)
+        return await self._request_with_retry(api_url, _attempt, "POST")
 
     async def _process_nok_result(self, resp: Any) -> None:
         """Raise SHCSessionError for non-OK HTTP responses."""
@@ -292,9 +608,10 @@ class SHCAPIAsync:
             body = await resp.read()
         except Exception:
             body = b""
-        raise SHCSessionError(
-            f"API call returned non-OK result (code {resp.status})!: {body!r}"
-        )
+        message = f"API call returned non-OK result (code {resp.status})!: {body!r}"
+        if resp.status in self._retry_policy.retry_statuses:
+            raise _RetryableStatusError(message, resp.status)
+        raise SHCSessionError(message)
 
     # ------------------------------------------------------------------
     # Public API methods (mirror the sync SHCAPI)
@@ -303,7 +620,7 @@ class SHCAPIAsync:
     async def get_information(self) -> Any:
         api_url = f"{self._api_root}/information"
         try:
-            return await self._get_api_result_or_fail(api_url)
+            return await self._get_api_result_or_fail(api_url, cache_key="information")
         except Exception as exc:
             logger.error("Failed to get information from SHC controller: %s", exc)
             return None
@@ -311,39 +628,49 @@ class SHCAPIAsync:
     async def get_public_information(self) -> Any:
         api_url = f"{self._public_root}/information"
         try:
-            return await self._get_api_result_or_fail(api_url, extra_headers={})
+            return await self._get_api_result_or_fail(
+                api_url, extra_headers={}, cache_key="public_information"
+            )
         except Exception as exc:
             logger.error(
                 "Failed to get public information from SHC controller: %s", exc
             )
             return None
 
-    async def get_rooms(self) -> Any:
+    async def get_rooms(self, validate: bool = True) -> Any:
         api_url = f"{self._api_root}/rooms"
-        return await self._get_api_result_or_fail(api_url, expected_element_type="room")
+        return await self._get_api_result_or_fail(
+            api_url, expected_element_type="room", validate=validate, cache_key="rooms"
+        )
 
-    async def get_scenarios(self) -> Any:
+    async def get_scenarios(self, validate: bool = True) -> Any:
         api_url = f"{self._api_root}/scenarios"
         return await self._get_api_result_or_fail(
-            api_url, expected_element_type="scenario"
+            api_url,
+            expected_element_type="scenario",
+            validate=validate,
+            cache_key="scenarios",
         )
 
-    async def get_userdefinedstates(self) -> Any:
+    async def get_userdefinedstates(self, validate: bool = True) -> Any:
         api_url = f"{self._api_root}/userdefinedstates"
         return await self._get_api_result_or_fail(
-            api_url, expected_element_type="userDefinedState"
+            api_url,
+            expected_element_type="userDefinedState",
+            validate=validate,
+            cache_key="userdefinedstates",
         )
 
-    async def get_messages(self) -> Any:
+    async def get_messages(self, validate: bool = True) -> Any:
         api_url = f"{self._api_root}/messages"
         return await self._get_api_result_or_fail(
-            api_url, expected_element_type="message"
+            api_url, expected_element_type="message", validate=validate
         )
 
-    async def get_devices(self) -> Any:
+    async def get_devices(self, validate: bool = True) -> Any:
         api_url = f"{self._api_root}/devices"
         return await self._get_api_result_or_fail(
-            api_url, expected_element_type="device"
+            api_url, expected_element_type="device", validate=validate
         )
 
     async def get_device(self, device_id: str) -> Any:
@@ -360,12 +687,31 @@ class SHCAPIAsync:
         api_url = f"{self._api_root}/devices/{device_id}"
         return await self._put_api_or_fail(api_url, device_data)
 
-    async def get_services(self) -> Any:
+    async def get_services(self, validate: bool = True) -> Any:
         api_url = f"{self._api_root}/services"
         return await self._get_api_result_or_fail(
-            api_url, expected_element_type="DeviceServiceData"
+            api_url, expected_element_type="DeviceServiceData", validate=validate
         )
 
+    def iter_services(
+        self, service_ids: Container[str] | None = None, validate: bool = True
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream ``/services`` (``async for``); see ``SHCAPI.iter_services``."""
+        accept = None
+        if service_ids is not None:
+            ids = service_ids
+
+            def accept(service: dict[str, Any]) -> bool:
+                return service.get("id") in ids
+
+        return self._iter_api_list(
+            f"{self._api_root}/services", "DeviceServiceData", validate, accept
+        )
+
+    def iter_devices(self, validate: bool = True) -> AsyncIterator[dict[str, Any]]:
+        """Stream ``/devices`` (``async for``), yielding each device as it arrives."""
+        return self._iter_api_list(f"{self._api_root}/devices", "device", validate)
+
     async def get_device_services(self, device_id: str) -> Any:
         api_url = f"{self._api_root}/devices/{device_id}/services"
         return await self._get_api_result_or_fail(api_url)
@@ -457,8 +803,12 @@ class SHCAPIAsync:
                 "params": [poll_id, wait_seconds],
             }
         ]
+        self._stats["long_polls"] += 1
         result = await self._post_api_or_fail(
-            self._rpc_root, data, timeout=wait_seconds + 5
+            self._rpc_root,
+            data,
+            timeout=wait_seconds + 5,
+            session=self._get_long_poll_session(),
         )
         self._check_jsonrpc_version(result, "RE/longPoll")
         if "error" in result[0]:
@@ -477,3 +827,39 @@ class SHCAPIAsync:
                 result[0]["error"]["code"], result[0]["error"]["message"]
             )
         return result[0]["result"]
+
+    async def jsonrpc_batch(
+        self, calls: Sequence[JSONRPCCall], timeout: int = 30
+    ) -> list[Any]:
+        """POST several JSON-RPC calls in one request.
+
+        Returns one entry per call, in call order: the call's result, or a
+        JSONRPCError instance if the SHC rejected that call. A batch that
+        contains an RE/longPoll runs on the long-poll connection; include
+        the wait in ``timeout``.
+        """
+        session = None
+        if any(call.method == "RE/longPoll" for call in calls):
+            self._stats["long_polls"] += 1
+            session = self._get_long_poll_session()
+        result = await self._post_api_or_fail(
+            self._rpc_root, build_batch(calls), timeout=timeout, session=session
+        )
+        return demultiplex_batch(result, calls)
+
+    async def long_polling_resubscribe(self, old_poll_id: str) -> str:
+        """Drop ``old_poll_id`` and subscribe again in a single round trip.
+
+        An error for the unsubscribe (typically -32001, the old id already
+        expired) is ignored; an error for the subscribe is raised.
+        """
+        unsubscribed, poll_id = await self.jsonrpc_batch(
+            [JSONRPCCall.unsubscribe(old_poll_id), JSONRPCCall.subscribe()]
+        )
+        if isinstance(unsubscribed, JSONRPCError):
+            logger.debug(
+                "Ignoring RE/unsubscribe error on resubscribe: %s", unsubscribed
+            )
+        if isinstance(poll_id, JSONRPCError):
+            raise poll_id
+        return str(poll_id)
@@ -0,0 +1,145 @@
+"""Coroutine callbacks for the async session.
+
+Device, service, intrusion-system and EMMA listeners, and the session's
+scenario, user-defined-state and subscriber callbacks, may be coroutine
+functions when used with ``SHCSessionAsync``. Every callback site calls the
+listener through ``run_callback``: a plain callable runs inline as before,
+and a coroutine it returns is handed to the ``SHCCallbackTasks`` of the
+session dispatching the event, which runs it as a task
+
+* with at most ``max_concurrency`` coroutine callbacks running at once
+  (the others wait for a slot), and
+* with its exceptions logged instead of reaching the poll loop.
+
+Listeners fired from an awaited library call outside the session's
+dispatch (``await device.async_update(fire_callbacks=True)``) use a default
+``SHCCallbackTasks`` of the running loop instead (``callback_tasks``).
+
+Under ``SHCSession`` there is no event loop to run a coroutine on; it is
+closed unawaited and a warning is logged.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import inspect
+import logging
+import weakref
+from collections.abc import Awaitable, Callable, Coroutine, Iterator
+from contextvars import ContextVar
+from typing import Any
+
+logger = logging.getLogger("boschshcpy")
+
+DEFAULT_MAX_CONCURRENCY = 16
+
+# What a listener may return: nothing, or an awaitable for the session to run.
+CallbackResult = Awaitable[None] | None
+
+_callback_tasks: ContextVar[SHCCallbackTasks | None] = ContextVar(
+    "boschshcpy_callback_tasks", default=None
+)
+
+# Default callback tasks per event loop, for callbacks fired outside a
+# session's dispatch.
+_loop_callback_tasks: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, SHCCallbackTasks
+] = weakref.WeakKeyDictionary()
+
+
+@contextlib.contextmanager
+def coroutine_callbacks(tasks: SHCCallbackTasks) -> Iterator[None]:
+    """Run coroutine callbacks fired in this block (task) on ``tasks``."""
+    token = _callback_tasks.set(tasks)
+    try:
+        yield
+    finally:
+        _callback_tasks.reset(token)
+
+
+def callback_tasks() -> SHCCallbackTasks:
+    """The tasks for coroutine callbacks fired now, on the running loop.
+
+    Those of the session dispatching the current event, else the loop's
+    default ones.
+    """
+    tasks = _callback_tasks.get()
+    if tasks is None:
+        loop = asyncio.get_running_loop()
+        tasks = _loop_callback_tasks.get(loop)
+        if tasks is None:
+            tasks = _loop_callback_tasks[loop] = SHCCallbackTasks()
+    return tasks
+
+
+def run_callback(fn: Callable[..., Any], *args: Any) -> None:
+    """Call a listener; schedule the coroutine it returns, if any."""
+    result = fn(*args)
+    if result is None or not inspect.iscoroutine(result):
+        return
+    tasks = _callback_tasks.get()
+    if tasks is None:
+        result.close()
+        logger.warning(
+            "Coroutine callback %r needs SHCSessionAsync; it was not run", fn
+        )
+        return
+    tasks.start(result)
+
+
+class SHCCallbackTasks:
+    """Runs coroutine callbacks as tasks on the session's event loop."""
+
+    def __init__(self, max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+        self._max_concurrency = max_concurrency
+        # Created on first use, inside the running loop.
+        self._semaphore: asyncio.Semaphore | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._failed = 0
+
+    @property
+    def pending(self) -> int:
+        """Callback tasks running or waiting for a slot."""
+        return len(self._tasks)
+
+    @property
+    def failed(self) -> int:
+        """Callback tasks that raised."""
+        return self._failed
+
+    def start(self, coro: Coroutine[Any, Any, Any]) -> None:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        task = asyncio.get_running_loop().create_task(self._run(self._semaphore, coro))
+        # The loop keeps only weak references to tasks.
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(
+        self, semaphore: asyncio.Semaphore, coro: Coroutine[Any, Any, Any]
+    ) -> None:
+        try:
+            async with semaphore:
+                await coro
+        except Exception as ex:
+            self._failed += 1
+            logger.error("Error in async callback %r: %s", coro, ex)
+        finally:
+            # Never started when cancelled while waiting for a slot.
+            coro.close()
+
+    async def drain(self) -> None:
+        """Wait for the callback tasks started so far."""
+        while self._tasks:
+            await asyncio.wait(set(self._tasks))
+
+    async def cancel(self) -> None:
+        """Cancel every callback task and wait until they are gone."""
+        tasks = set(self._tasks)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.wait(tasks)
@@ -0,0 +1,157 @@
+"""JSON encoding/decoding for SHC request and response bodies.
+
+Every REST response and every long-poll batch is decoded here, and every
+request body encoded. When `orjson <https://github.com/ijl/orjson>`_ is
+installed (``pip install boschshcpy[speedups]``) it is used; otherwise the
+stdlib ``json`` module is. Both backends produce the same Python objects, and
+``dumps`` always returns UTF-8 ``bytes`` so callers do not depend on the
+backend.
+
+Call the module functions through the module (``codec.loads(...)``) rather
+than importing them by name, so :func:`select_backend` takes effect
+everywhere.
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None  # type: ignore[assignment]
+
+BACKENDS = ("orjson", "json") if orjson is not None else ("json",)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    return json.dumps(obj).encode("utf-8")
+
+
+def _orjson_dumps(obj: Any) -> bytes:
+    try:
+        result: bytes = orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        return result
+    except TypeError:
+        # Values orjson refuses but json accepts (ints wider than 64 bits,
+        # tuples as keys via default handling, ...).
+        return _json_dumps(obj)
+
+
+backend: str = ""
+loads: Callable[[bytes | bytearray | str], Any] = json.loads
+dumps: Callable[[Any], bytes] = _json_dumps
+
+
+def select_backend(name: str | None = None) -> str:
+    """Switch the codec to ``name`` ("orjson" or "json").
+
+    With ``None`` the fastest available backend is chosen. Raises ValueError
+    for a backend that is not installed. Returns the selected backend name.
+    """
+    global backend, loads, dumps
+    if name is None:
+        name = BACKENDS[0]
+    if name not in BACKENDS:
+        raise ValueError(
+            f"JSON backend {name!r} is not available (available: {BACKENDS})"
+        )
+    if name == "orjson":
+        loads, dumps = orjson.loads, _orjson_dumps
+    else:
+        loads, dumps = json.loads, _json_dumps
+    backend = name
+    return name
+
+
+select_backend()
+
+
+_WHITESPACE = " \t\n\r"
+_DELIMITERS = ",]" + _WHITESPACE
+_skip_whitespace = re.compile(r"[ \t\n\r]*").match
+
+
+class IncrementalArrayDecoder:
+    """Decode the elements of a top-level JSON array as its bytes arrive.
+
+    Feed the response body chunk by chunk; :meth:`feed` returns the elements
+    completed so far, so callers can process (or drop) each one before the
+    rest of the body has been received and without ever holding the whole
+    document. :meth:`close` raises ValueError if the array was not complete.
+    Elements are decoded with the stdlib's C scanner regardless of the
+    selected backend, because orjson has no incremental interface.
+    """
+
+    def __init__(self) -> None:
+        # The C scanner behind json.JSONDecoder.raw_decode, without the
+        # per-call wrapper.
+        self._scan: Callable[[str, int], tuple[Any, int]] = json.JSONDecoder().scan_once  # type: ignore[attr-defined]
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._started = False
+        self._finished = False
+        # An element needs a separating comma unless it is the first one.
+        self._expect_element = True
+        self._count = 0
+
+    def feed(self, data: bytes) -> list[Any]:
+        buffer = self._buffer + self._text.decode(data)
+        size = len(buffer)
+        scan = self._scan
+        skip = _skip_whitespace
+        elements: list[Any] = []
+        pos = 0
+        while True:
+            pos = skip(buffer, pos).end()  # type: ignore[union-attr]  # "*" always matches
+            if pos == size or self._finished:
+                break
+            char = buffer[pos]
+            if char == "," and not self._expect_element:
+                self._expect_element = True
+                pos += 1
+            elif not self._started:
+                if char != "[":
+                    raise ValueError(f"Expected a JSON array, got {char!r}")
+                self._started = True
+                pos += 1
+            elif char == "]":
+                if self._expect_element and self._count:
+                    raise ValueError(f"Trailing ',' before ']' at {pos}")
+                self._finished = True
+                pos += 1
+            else:
+                try:
+                    element, end = scan(buffer, pos)
+                except StopIteration:
+                    # Most likely an element split across chunks; wait for
+                    # more data (close() reports a truly malformed body).
+                    break
+                except json.JSONDecodeError:
+                    break
+                if not isinstance(element, (dict, list, str)) and (
+                    end == size or buffer[end] not in _DELIMITERS
+                ):
+                    # A number cut by a chunk boundary ("2." of "2.5") decodes
+                    # as a shorter number; wait until its delimiter arrived.
+                    break
+                if not self._expect_element:
+                    raise ValueError(f"Missing ',' between array elements at {pos}")
+                elements.append(element)
+                self._count += 1
+                self._expect_element = False
+                pos = end
+        self._buffer = buffer[pos:]
+        if self._finished and self._buffer.strip():
+            raise ValueError("Trailing data after the JSON array")
+        return elements
+
+    def close(self) -> None:
+        self._buffer += self._text.decode(b"", final=True)
+        if not self._finished:
+            raise ValueError(
+                f"Incomplete JSON array ({len(self._buffer)} undecoded characters)"
+            )
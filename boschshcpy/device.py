@@ -5,14 +5,31 @@ import typing
 from typing import Any, Callable
 
 from .api import SHCAPI
+from .callbacks import CallbackResult, run_callback
 from .device_service import SHCDeviceService
 from .exceptions import SHCException
 from .services_impl import SUPPORTED_DEVICE_SERVICE_IDS, build
+from .state_store import intern_raw
 
 logger = logging.getLogger("boschshcpy")
 
 
 class SHCDevice:
+    # Slotted: a session holds one instance per device, and integrations run
+    # several sessions per process. Subclasses in models_impl declare their
+    # own service handles; the private capability mixins declare empty slots
+    # so they can be combined freely. "__dict__" keeps instances patchable
+    # (tests, integrations) — it is only allocated when an undeclared
+    # attribute is actually assigned.
+    __slots__ = (
+        "_api",
+        "_raw_device",
+        "_callbacks",
+        "_device_services_by_id",
+        "__dict__",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         api: SHCAPI,
@@ -20,9 +37,9 @@ class SHCDevice:
         raw_device_services: list[dict[str, Any]],
     ) -> None:
         self._api = api
-        self._raw_device = raw_device
+        self._raw_device = intern_raw(raw_device)
 
-        self._callbacks: dict[Any, Callable[[], None]] = {}
+        self._callbacks: dict[Any, Callable[[], CallbackResult]] = {}
         self._device_services_by_id: dict[str, SHCDeviceService] = {}
         if not raw_device_services:
             raw_device_services = self._enumerate_services()
@@ -173,7 +190,9 @@ class SHCDevice:
     def device_service_ids(self) -> typing.Set[str]:
         return set(self._device_services_by_id.keys())
 
-    def subscribe_callback(self, entity: Any, callback: Callable[[], None]) -> None:
+    def subscribe_callback(
+        self, entity: Any, callback: Callable[[], CallbackResult]
+    ) -> None:
         self._callbacks[entity] = callback
 
     def unsubscribe_callback(self, entity: Any) -> None:
@@ -185,7 +204,7 @@ class SHCDevice:
         self._raw_device = raw_device
 
         for fn in list(self._callbacks.values()):
-            fn()
+            run_callback(fn)
 
     def device_service(self, device_service_id: str) -> SHCDeviceService | None:
         return (
@@ -236,3 +255,14 @@ class SHCDevice:
             logger.debug(
                 f"Skipping polling result with unknown device service id {device_service_id}."
             )
+
+    def process_refresh_result(self, raw_result: dict[str, Any]) -> bool:
+        """Route a freshly fetched DeviceServiceData to its service.
+
+        See SHCDeviceService.process_refresh_result; returns True if the
+        service state changed.
+        """
+        device_service = self._device_services_by_id.get(raw_result.get("id", ""))
+        if device_service is None:
+            return False
+        return device_service.process_refresh_result(raw_result)
@@ -1,24 +1,82 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
 from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
 from typing import Any, Callable
 
 from .api import SHCAPI
+from .callbacks import (
+    CallbackResult,
+    callback_tasks,
+    coroutine_callbacks,
+    run_callback,
+)
+from .state_store import intern_raw
+
+
+_MISSING = object()
+
+# Shared immutable defaults. Most services never get a listener, an event
+# callback or a state update, so allocating an empty dict/frozenset for each
+# of them (thousands per session) is pure overhead; a real dict replaces the
+# placeholder on first use.
+_NO_CALLBACKS: Mapping[Any, Callable[[], CallbackResult]] = MappingProxyType({})
+_NO_CHANGES: frozenset[str] = frozenset()
+_NO_STATE: Mapping[str, Any] = MappingProxyType({})
+
+
+def diff_state(old: dict[str, Any], new: dict[str, Any]) -> frozenset[str]:
+    """Return the top-level state keys whose value differs between two states.
+
+    Added and removed keys count as changed. An empty result means the SHC
+    re-delivered an identical state.
+    """
+    if old is new:
+        return frozenset()
+    return frozenset(
+        key
+        for key in old.keys() | new.keys()
+        if old.get(key, _MISSING) != new.get(key, _MISSING)
+    )
 
 
 class SHCDeviceService:
+    # Slotted like SHCDevice (including the lazily allocated "__dict__");
+    # every subclass in services_impl declares __slots__ as well.
+    __slots__ = (
+        "_api",
+        "_raw_device_service",
+        "_raw_state",
+        "_last_update",
+        "_changed_keys",
+        "_previous_state",
+        "_callbacks",
+        "_event_callbacks",
+        "_last_event_timestamp",
+        "_last_event_value",
+        "__dict__",
+        "__weakref__",
+    )
+
     def __init__(self, api: SHCAPI, raw_device_service: dict[str, Any]) -> None:
         self._api = api
-        self._raw_device_service = raw_device_service
+        self._raw_device_service = intern_raw(raw_device_service)
         self._raw_state: dict[str, Any] = (
             self._raw_device_service["state"]
             if "state" in self._raw_device_service
             else {}
         )
         self._last_update: datetime | None = None
+        # Result of the last long-poll/refresh state diff, readable from
+        # inside a state callback: which keys changed, and the state before.
+        self._changed_keys = _NO_CHANGES
+        self._previous_state: Mapping[str, Any] = _NO_STATE
 
-        self._callbacks: dict[Any, Callable[[], None]] = {}
-        self._event_callbacks: dict[str, Callable[[], None]] = {}
+        self._callbacks: Mapping[Any, Callable[[], CallbackResult]] = _NO_CALLBACKS
+        self._event_callbacks: Mapping[str, Callable[[], CallbackResult]] = (
+            _NO_CALLBACKS
+        )
         # Baseline event timestamp (Keypad eventTimestamp / LatestMotion
         # latestMotionDetected), seeded from the construction snapshot so the
         # first post-subscribe poll of that same last event is suppressed
@@ -46,18 +104,43 @@ class SHCDeviceService:
     def state(self) -> dict[str, Any]:
         return self._raw_state
 
+    @property
+    def changed_keys(self) -> frozenset[str]:
+        """State keys that changed in the last applied update.
+
+        Valid while state callbacks run; callbacks are only invoked when this
+        is non-empty (long-poll and refresh paths).
+        """
+        return self._changed_keys
+
+    @property
+    def previous_state(self) -> Mapping[str, Any]:
+        """The state this service held before the last applied update."""
+        return self._previous_state
+
     @property
     def path(self) -> str:
         return str(self._raw_device_service["path"])
 
-    def subscribe_callback(self, entity: Any, callback: Callable[[], None]) -> None:
-        self._callbacks[entity] = callback
+    def subscribe_callback(
+        self, entity: Any, callback: Callable[[], CallbackResult]
+    ) -> None:
+        callbacks = self._callbacks if isinstance(self._callbacks, dict) else {}
+        callbacks[entity] = callback
+        self._callbacks = callbacks
 
     def unsubscribe_callback(self, entity: Any) -> None:
-        self._callbacks.pop(entity, None)
+        if isinstance(self._callbacks, dict):
+            self._callbacks.pop(entity, None)
 
-    def register_event(self, event: str, callback: Callable[[], None]) -> None:
-        self._event_callbacks[event] = callback
+    def register_event(
+        self, event: str, callback: Callable[[], CallbackResult]
+    ) -> None:
+        event_callbacks = (
+            self._event_callbacks if isinstance(self._event_callbacks, dict) else {}
+        )
+        event_callbacks[event] = callback
+        self._event_callbacks = event_callbacks
 
     def summary(self) -> None:
         print(f"  Device Service: {self.id}")
@@ -130,7 +213,7 @@ class SHCDeviceService:
             # At initial setup _callbacks is empty, so firing is a no-op anyway.
             if fire_callbacks:
                 for fn in list(self._callbacks.values()):  # [S4]
-                    fn()
+                    run_callback(fn)
 
     async def async_short_poll(self, fire_callbacks: bool = False) -> None:
         """Async counterpart to short_poll for the aiohttp (SHCAPIAsync) path.
@@ -154,8 +237,11 @@ class SHCDeviceService:
                 else {}
             )
             if fire_callbacks:
-                for fn in list(self._callbacks.values()):  # [S4]
-                    fn()
+                # Also called directly by integrations, outside the session's
+                # dispatch: coroutine listeners still run as tasks.
+                with coroutine_callbacks(callback_tasks()):
+                    for fn in list(self._callbacks.values()):  # [S4]
+                        run_callback(fn)
 
     def process_long_polling_poll_result(self, raw_result: dict[str, Any]) -> None:
         # Defensive: skip malformed/mismatched results rather than assert
@@ -170,13 +256,54 @@ class SHCDeviceService:
                 "@type"
             ):
                 return
-            self._raw_state = raw_result["state"]  # Update state
+            new_state = raw_result["state"]
+            changed_keys = diff_state(self._raw_state, new_state)
+            self._previous_state = self._raw_state
+            self._raw_state = new_state  # Update state
 
-            for fn in list(self._callbacks.values()):  # [S4]
-                fn()
+            # The SHC re-delivers identical states (e.g. after a resubscribe
+            # or as a side effect of a sibling service changing); fanning
+            # those out would schedule a redundant HA state write per entity.
+            if changed_keys:
+                self._changed_keys = changed_keys
+                for fn in list(self._callbacks.values()):  # [S4]
+                    run_callback(fn)
 
+            # Events are edge-detected separately (timestamp/value baselines),
+            # so they are evaluated even for an unchanged state.
             self._process_events(raw_result)
 
+    def process_refresh_result(self, raw_device_service: dict[str, Any]) -> bool:
+        """Apply a freshly fetched DeviceServiceData (reconcile/resync path).
+
+        Unlike process_long_polling_poll_result this never dispatches
+        register_event callbacks: a refreshed Keypad/LatestMotion/Alarm state
+        is the *current* state, not a new event. Instead the replay baselines
+        are re-seeded from it, exactly as at construction. State callbacks fire
+        only when the state actually differs from what this service holds.
+        Returns True if the state changed.
+        """
+        if raw_device_service.get("@type") != "DeviceServiceData":
+            return False
+        raw_device_service = intern_raw(raw_device_service)
+        new_state = raw_device_service.get("state", {})
+        if self.state and new_state.get("@type") != self.state.get("@type"):
+            return False
+        changed_keys = diff_state(self._raw_state, new_state)
+        self._raw_device_service = raw_device_service
+        self._previous_state = self._raw_state
+        self._raw_state = new_state
+        self._last_update = datetime.now(timezone.utc)
+        self._last_event_timestamp = new_state.get("eventTimestamp") or new_state.get(
+            "latestMotionDetected"
+        )
+        self._last_event_value = new_state.get("value")
+        if changed_keys:
+            self._changed_keys = changed_keys
+            for fn in list(self._callbacks.values()):  # [S4]
+                run_callback(fn)
+        return bool(changed_keys)
+
     def _is_replayed_event(self, timestamp: Any) -> bool:
         """True if this event must be suppressed (replay on (re)subscribe).
 
@@ -216,16 +343,16 @@ class SHCDeviceService:
                 return
             key_name = state.get("keyName")
             if key_name in self._event_callbacks:
-                self._event_callbacks[key_name]()
+                run_callback(self._event_callbacks[key_name])
         if raw_result["id"] == "LatestMotion":
             state = raw_result.get("state", {})
             if self._is_replayed_event(state.get("latestMotionDetected")):
                 return
             if raw_result["deviceId"] in self._event_callbacks:
-                self._event_callbacks[raw_result["deviceId"]]()
+                run_callback(self._event_callbacks[raw_result["deviceId"]])
         if raw_result["id"] in ("Alarm", "SurveillanceAlarm"):
             state = raw_result.get("state", {})
             if self._is_replayed_value(state.get("value")):
                 return
             if raw_result["deviceId"] in self._event_callbacks:
-                self._event_callbacks[raw_result["deviceId"]]()
+                run_callback(self._event_callbacks[raw_result["deviceId"]])
@@ -0,0 +1,248 @@
+"""Worker pool for long-poll callbacks of the sync session.
+
+``SHCSession`` processes every long-poll result, and so runs every device,
+service, scenario and user-defined-state callback, on one thread: a single
+slow subscriber delays all later events. Pass an ``SHCCallbackExecutor`` as
+``callback_executor=`` to hand each result to a bounded pool of worker
+threads instead. Results are keyed by device (``dispatch_key``); results of
+one key run one at a time in arrival order, different keys run in parallel.
+
+When ``max_queue`` results are waiting, ``OverflowPolicy.BLOCK`` makes the
+poll thread wait for a free slot and ``OverflowPolicy.DROP_OLDEST`` discards
+the oldest waiting result; ``stats`` counts both.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Hashable
+from enum import Enum
+from typing import Any, NamedTuple
+
+from . import codec
+
+logger = logging.getLogger("boschshcpy")
+
+DEFAULT_WORKERS = 4
+DEFAULT_MAX_QUEUE = 256
+
+
+class OverflowPolicy(Enum):
+    """What ``submit`` does when the queue is full."""
+
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+
+
+class SHCDispatchStats(NamedTuple):
+    """Snapshot of callback executor counters."""
+
+    queued: int  # results waiting for a worker
+    peak_queued: int  # highest queued seen
+    running: int  # results being processed right now
+    executed: int  # results processed, failed ones included
+    failed: int  # results whose processing raised
+    dropped: int  # results discarded by DROP_OLDEST
+
+
+def dispatch_key(raw_result: dict[str, Any]) -> Hashable:
+    """Ordering key of a long-poll result: its device, else its own id.
+
+    A ``message`` carrying a ``deviceServiceDataModel`` is processed as that
+    DeviceServiceData, so it is keyed by the model's device.
+    """
+    device_id: Hashable = raw_result.get("deviceId")
+    if device_id:
+        return device_id
+    arguments = raw_result.get("arguments")
+    if isinstance(arguments, dict) and "deviceServiceDataModel" in arguments:
+        try:
+            model = codec.loads(arguments["deviceServiceDataModel"])
+        except (TypeError, ValueError):
+            model = None
+        if isinstance(model, dict) and model.get("deviceId"):
+            device_id = model["deviceId"]
+            return device_id
+    own_id: Hashable = raw_result.get("id")
+    return own_id
+
+
+class _Generation:
+    """The worker threads started together, and their stop flags."""
+
+    __slots__ = ("threads", "stopping", "retired")
+
+    def __init__(self) -> None:
+        self.threads: list[threading.Thread] = []
+        # Drain the queue, then exit.
+        self.stopping = False
+        # shutdown() has returned: exit without taking further calls, even
+        # if a newer generation has work queued.
+        self.retired = False
+
+
+class _Task:
+    __slots__ = ("seq", "fn", "args")
+
+    def __init__(self, seq: int, fn: Callable[..., Any], args: tuple[Any, ...]):
+        self.seq = seq
+        self.fn = fn
+        self.args = args
+
+
+class SHCCallbackExecutor:
+    """Bounded pool of daemon threads running calls in per-key order.
+
+    The threads start with the first ``submit`` and stop in ``shutdown``;
+    a later ``submit`` starts them again.
+    """
+
+    def __init__(
+        self,
+        workers: int = DEFAULT_WORKERS,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        overflow: OverflowPolicy = OverflowPolicy.BLOCK,
+    ) -> None:
+        if workers < 1 or max_queue < 1:
+            raise ValueError("workers and max_queue must be >= 1")
+        self._workers = workers
+        self._max_queue = max_queue
+        self._overflow = overflow
+        self._cond = threading.Condition()
+        self._generation: _Generation | None = None
+        # Waiting calls per key; a key is in _ready while it has waiting
+        # calls and none running.
+        self._pending: dict[Hashable, deque[_Task]] = {}
+        self._ready: deque[Hashable] = deque()
+        self._running: set[Hashable] = set()
+        self._seq = 0
+        self._queued = 0
+        self._peak_queued = 0
+        self._executed = 0
+        self._failed = 0
+        self._dropped = 0
+
+    @property
+    def stats(self) -> SHCDispatchStats:
+        with self._cond:
+            return SHCDispatchStats(
+                self._queued,
+                self._peak_queued,
+                len(self._running),
+                self._executed,
+                self._failed,
+                self._dropped,
+            )
+
+    def submit(self, key: Hashable, fn: Callable[..., Any], *args: Any) -> None:
+        """Queue ``fn(*args)`` behind the calls already queued for ``key``."""
+        with self._cond:
+            if self._generation is None:
+                self._start()
+            while self._queued >= self._max_queue:
+                if self._overflow is OverflowPolicy.DROP_OLDEST:
+                    self._drop_oldest()
+                else:
+                    self._cond.wait()
+            self._seq += 1
+            tasks = self._pending.get(key)
+            if tasks is None:
+                tasks = self._pending[key] = deque()
+                if key not in self._running:
+                    self._ready.append(key)
+            tasks.append(_Task(self._seq, fn, args))
+            self._queued += 1
+            self._peak_queued = max(self._peak_queued, self._queued)
+            self._cond.notify_all()
+
+    def join(self, timeout: float | None = None) -> bool:
+        """Wait until every queued call has run; False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._queued or self._running:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return True
+
+    def shutdown(self, timeout: float | None = None) -> None:
+        """Run the queued calls, then stop the worker threads.
+
+        A worker still inside a call when ``timeout`` expires finishes that
+        call and exits; it never takes calls submitted after shutdown, so
+        a later ``submit`` starts at most ``workers`` new threads.
+        """
+        with self._cond:
+            generation = self._generation
+            if generation is None:
+                return
+            generation.stopping = True
+            self._cond.notify_all()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for thread in generation.threads:
+            thread.join(
+                None if deadline is None else max(0.0, deadline - time.monotonic())
+            )
+        with self._cond:
+            generation.retired = True
+            if self._generation is generation:
+                self._generation = None
+
+    def _start(self) -> None:
+        generation = self._generation = _Generation()
+        generation.threads = [
+            threading.Thread(
+                target=self._worker,
+                args=(generation,),
+                name=f"SHCCallbackWorker-{i}",
+                daemon=True,
+            )
+            for i in range(self._workers)
+        ]
+        for thread in generation.threads:
+            thread.start()
+
+    def _drop_oldest(self) -> None:
+        key = min(self._pending, key=lambda k: self._pending[k][0].seq)
+        tasks = self._pending[key]
+        tasks.popleft()
+        if not tasks:
+            del self._pending[key]
+            if key not in self._running:
+                self._ready.remove(key)
+        self._queued -= 1
+        self._dropped += 1
+
+    def _worker(self, generation: _Generation) -> None:
+        while True:
+            with self._cond:
+                while not self._ready or generation.retired:
+                    if generation.retired or (generation.stopping and not self._queued):
+                        return
+                    self._cond.wait()
+                key = self._ready.popleft()
+                tasks = self._pending[key]
+                task = tasks.popleft()
+                if not tasks:
+                    del self._pending[key]
+                self._running.add(key)
+                self._queued -= 1
+                # A slot is free for a blocked submit().
+                self._cond.notify_all()
+            failed = False
+            try:
+                task.fn(*task.args)
+            except Exception as ex:
+                failed = True
+                logger.error(f"Error in long poll callback: {ex}")
+            with self._cond:
+                self._running.discard(key)
+                if key in self._pending:
+                    self._ready.append(key)
+                self._executed += 1
+                self._failed += failed
+                self._cond.notify_all()
@@ -4,6 +4,8 @@ from collections.abc import Callable
 from enum import Enum
 from typing import Any
 
+from .callbacks import CallbackResult, run_callback
+
 
 class SHCIntrusionSystem:
     DOMAIN_STATES = {
@@ -59,7 +61,7 @@ class SHCIntrusionSystem:
         )
         self._root_device_id = root_device_id
 
-        self._callbacks: dict[Any, Callable[[], None]] = {}
+        self._callbacks: dict[Any, Callable[[], CallbackResult]] = {}
 
     @property
     def id(self) -> str:
@@ -130,7 +132,9 @@ class SHCIntrusionSystem:
     def security_gaps(self) -> list[Any]:
         return list(self._raw_security_gap_state.get("securityGaps", []))
 
-    def subscribe_callback(self, entity: Any, callback: Callable[[], None]) -> None:
+    def subscribe_callback(
+        self, entity: Any, callback: Callable[[], CallbackResult]
+    ) -> None:
         self._callbacks[entity] = callback
 
     def unsubscribe_callback(self, entity: Any) -> None:
@@ -218,7 +222,7 @@ class SHCIntrusionSystem:
             self._raw_security_gap_state = raw_result
 
         for fn in list(self._callbacks.values()):
-            fn()
+            run_callback(fn)
 
 
 MODEL_MAPPING = {"IDS": SHCIntrusionSystem}
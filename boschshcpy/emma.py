@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 from typing import Any
 
+from .callbacks import run_callback
 from .device import SHCDevice
 from .exceptions import SHCException
 from .information import SHCInformation
@@ -91,7 +92,7 @@ class SHCEmma(SHCDevice):
         self._raw_device["status"] = "AVAILABLE"
 
         for fn in list(self._callbacks.values()):
-            fn()
+            run_callback(fn)
 
     def summary(self) -> None:
         super().summary()
@@ -0,0 +1,240 @@
+"""Typed stream of device service state changes.
+
+Besides per-object callbacks, both sessions offer ``events()``: an iterator
+(``SHCSession``, blocking) or async iterator (``SHCSessionAsync``) over
+``SHCChangeEvent`` tuples, one per service whose state changed through the
+long poll or the resubscribe refresh::
+
+    async with session.events(SHCEventFilter(service_ids={"PowerSwitch"})) as events:
+        async for event in events:
+            export(event.device.id, event.changes)
+
+An ``SHCEventFilter`` selects events by device model, device id, service id
+or room; every field left at None matches everything. Each stream buffers
+at most ``max_queue`` events: when its consumer falls behind, the oldest
+buffered event is dropped and counted in ``dropped``. Streams end when they
+are closed or polling stops. Streams are change subscriptions of the
+session (see subscriptions.py); no work is done for events while there are
+none.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections import deque
+from collections.abc import Callable, Iterator, Mapping, Set
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, NamedTuple, TypeVar
+
+from .device_service import SHCDeviceService, diff_state
+
+if TYPE_CHECKING:
+    from .device import SHCDevice
+    from .subscriptions import SHCSubscriptionRegistry
+
+DEFAULT_MAX_QUEUE = 1000
+
+_R = TypeVar("_R")
+
+
+class SHCChangeEvent(NamedTuple):
+    """A device service whose state changed."""
+
+    device: SHCDevice
+    service: SHCDeviceService
+    changed_keys: frozenset[str]
+    old_state: Mapping[str, Any]
+    new_state: Mapping[str, Any]
+
+    @property
+    def changes(self) -> dict[str, tuple[Any, Any]]:
+        """``{key: (old value, new value)}``; None for an absent key."""
+        return {
+            key: (self.old_state.get(key), self.new_state.get(key))
+            for key in self.changed_keys
+        }
+
+
+class SHCEventFilter(NamedTuple):
+    """Which events a stream receives; None matches everything."""
+
+    device_models: Set[str] | None = None
+    device_ids: Set[str] | None = None
+    service_ids: Set[str] | None = None
+    room_ids: Set[str] | None = None
+
+    def matches(self, event: SHCChangeEvent) -> bool:
+        return (
+            (self.service_ids is None or event.service.id in self.service_ids)
+            and (self.device_ids is None or event.device.id in self.device_ids)
+            and (
+                self.device_models is None
+                or event.device.device_model in self.device_models
+            )
+            and (self.room_ids is None or event.device.room_id in self.room_ids)
+        )
+
+
+class _EventBuffer:
+    """Bounded buffer shared by both stream flavours."""
+
+    def __init__(
+        self,
+        filter: SHCEventFilter | None,
+        max_queue: int,
+        on_close: Callable[[Any], None],
+    ) -> None:
+        if max_queue < 1:
+            raise ValueError("max_queue must be >= 1")
+        self._filter = filter
+        self._events: deque[SHCChangeEvent] = deque(maxlen=max_queue)
+        self._on_close = on_close
+        self._closed = False
+        self._dropped = 0
+
+    @property
+    def dropped(self) -> int:
+        """Events discarded because this stream's buffer was full."""
+        return self._dropped
+
+    def _append(self, event: SHCChangeEvent) -> bool:
+        """Buffer ``event`` if it passes the filter; True if buffered."""
+        if self._closed or (
+            self._filter is not None and not self._filter.matches(event)
+        ):
+            return False
+        if len(self._events) == self._events.maxlen:
+            self._dropped += 1
+        self._events.append(event)
+        return True
+
+    def _close(self) -> bool:
+        if self._closed:
+            return False
+        self._closed = True
+        self._on_close(self)
+        return True
+
+
+class SHCEventStream(_EventBuffer):
+    """Blocking iterator of ``SHCSession`` change events; thread-safe."""
+
+    def __init__(
+        self,
+        filter: SHCEventFilter | None,
+        max_queue: int,
+        on_close: Callable[[Any], None],
+    ) -> None:
+        super().__init__(filter, max_queue, on_close)
+        self._cond = threading.Condition()
+
+    def publish(self, event: SHCChangeEvent) -> None:
+        with self._cond:
+            if self._append(event):
+                self._cond.notify()
+
+    def get(self, timeout: float | None = None) -> SHCChangeEvent | None:
+        """Next event; None once closed or after ``timeout`` seconds."""
+        with self._cond:
+            self._cond.wait_for(lambda: self._events or self._closed, timeout)
+            return self._events.popleft() if self._events else None
+
+    def close(self) -> None:
+        """End the stream; buffered events can still be read."""
+        with self._cond:
+            if self._close():
+                self._cond.notify_all()
+
+    def __iter__(self) -> Iterator[SHCChangeEvent]:
+        return self
+
+    def __next__(self) -> SHCChangeEvent:
+        event = self.get()
+        if event is None:
+            raise StopIteration
+        return event
+
+    def __enter__(self) -> SHCEventStream:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+class SHCEventStreamAsync(_EventBuffer):
+    """Async iterator of ``SHCSessionAsync`` change events; one event loop."""
+
+    def __init__(
+        self,
+        filter: SHCEventFilter | None,
+        max_queue: int,
+        on_close: Callable[[Any], None],
+    ) -> None:
+        super().__init__(filter, max_queue, on_close)
+        self._waiter: asyncio.Future[None] | None = None
+
+    def publish(self, event: SHCChangeEvent) -> None:
+        if self._append(event):
+            self._wake()
+
+    def close(self) -> None:
+        """End the stream; buffered events can still be read."""
+        if self._close():
+            self._wake()
+
+    def _wake(self) -> None:
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    def __aiter__(self) -> SHCEventStreamAsync:
+        return self
+
+    async def __anext__(self) -> SHCChangeEvent:
+        while not self._events:
+            if self._closed:
+                raise StopAsyncIteration
+            self._waiter = asyncio.get_running_loop().create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+        return self._events.popleft()
+
+    async def __aenter__(self) -> SHCEventStreamAsync:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+def apply_service_result(
+    subscriptions: SHCSubscriptionRegistry,
+    device: SHCDevice,
+    raw_result: dict[str, Any],
+    apply: Callable[[dict[str, Any]], _R],
+) -> _R:
+    """Return ``apply(raw_result)``; publish the resulting state change of
+    the addressed service of ``device`` to the change ``subscriptions``."""
+    if not subscriptions:
+        return apply(raw_result)
+    service = device.device_service(raw_result.get("id", ""))
+    old_state = service.state if service is not None else None
+    result = apply(raw_result)
+    if service is not None and old_state is not None:
+        new_state = service.state
+        changed_keys = diff_state(old_state, new_state)
+        if changed_keys:
+            event = SHCChangeEvent(device, service, changed_keys, old_state, new_state)
+            subscriptions.publish(event)
+    return result
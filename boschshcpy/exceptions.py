@@ -40,6 +40,10 @@ class SHCConnectionError(Exception):
     """Error to indicate a connection problem."""
 
 
+class SHCQueueFullError(SHCConnectionError):
+    """Error to indicate the client-side request queue is full."""
+
+
 class SHCAuthenticationError(Exception):
     """Error to indicate an authentication problem."""
 
@@ -54,3 +58,7 @@ class SHCSessionError(SHCException):
 
 class SHCCertificateError(SHCException):
     """Error to indicate a certificate problem."""
+
+
+class SHCJournalOverrunError(SHCException):
+    """Error to indicate requested journal entries were already evicted."""
@@ -0,0 +1,168 @@
+"""In-memory journal of received long-poll results.
+
+Pass an ``SHCEventJournal`` as ``event_journal=`` to either session to keep
+the last ``max_entries`` long-poll results, each numbered with a sequence
+number and stamped with the time it was received. A consumer that fell
+behind (a listener that was detached, a process exporting changes in
+batches) remembers the last ``seq`` it handled and catches up with
+``replay(seq)``; when the entries it missed have already been evicted,
+``replay`` raises ``SHCJournalOverrunError`` and the consumer has to
+re-read the current state instead.
+
+Results the session never received cannot be journaled. When the poll id
+had to be (re)subscribed, changes made in the meantime were not delivered;
+the journal records a gap entry (``result`` None) before the first results
+of the new subscription, and the session refreshes every service (#183),
+so consumers seeing a gap should re-read the current state too.
+
+With ``spill_path`` every entry is also appended to that file as one JSON
+line, for post-mortem analysis. The file is written by a writer thread, so
+neither the polling thread nor the event loop waits for the disk; it is
+never rotated or read back. If the file cannot be written, the error is
+logged and spilling stops: the journal never interrupts dispatch.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import IO, Any, NamedTuple
+
+from .exceptions import SHCJournalOverrunError
+
+logger = logging.getLogger("boschshcpy")
+
+DEFAULT_MAX_ENTRIES = 1000
+
+
+class SHCJournalEntry(NamedTuple):
+    """One received long-poll result; ``result`` None marks a gap."""
+
+    seq: int
+    timestamp: float
+    result: dict[str, Any] | None
+
+
+# Batches of entries on their way to the spill writer; None stops it.
+_SpillQueue = queue.SimpleQueue[list[SHCJournalEntry] | None]
+
+
+class SHCEventJournal:
+    """Bounded, thread-safe ring buffer of long-poll results."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        spill_path: str | os.PathLike[str] | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self._entries: deque[SHCJournalEntry] = deque(maxlen=max_entries)
+        self._spill_path = Path(spill_path) if spill_path is not None else None
+        self._spill_queue: _SpillQueue | None = None
+        self._spill_thread: threading.Thread | None = None
+        self._clock = clock
+        self._last_seq = 0
+        self._lock = threading.Lock()
+
+    @property
+    def last_seq(self) -> int:
+        """Sequence number of the newest entry; 0 while empty."""
+        return self._last_seq
+
+    @property
+    def first_seq(self) -> int:
+        """Sequence number of the oldest entry still held."""
+        with self._lock:
+            return self._entries[0].seq if self._entries else self._last_seq + 1
+
+    def record(self, raw_results: Iterable[dict[str, Any]], gap: bool = False) -> None:
+        """Append ``raw_results``, preceded by a gap entry if ``gap``."""
+        with self._lock:
+            timestamp = self._clock()
+            results: Iterable[dict[str, Any] | None] = raw_results
+            if gap:
+                results = itertools.chain((None,), raw_results)
+            entries = [
+                SHCJournalEntry(seq, timestamp, result)
+                for seq, result in enumerate(results, self._last_seq + 1)
+            ]
+            if not entries:
+                return
+            self._entries.extend(entries)
+            self._last_seq = entries[-1].seq
+            if self._spill_path is not None:
+                self._spill_entries(entries)
+
+    def replay(self, since_seq: int = 0) -> list[SHCJournalEntry]:
+        """Entries after ``since_seq``, oldest first.
+
+        Raises SHCJournalOverrunError when some of them have been evicted.
+        """
+        with self._lock:
+            if not self._entries or since_seq >= self._last_seq:
+                return []
+            oldest = self._entries[0].seq
+            if since_seq < oldest - 1:
+                raise SHCJournalOverrunError(
+                    f"Journal entries {since_seq + 1}..{oldest - 1} were evicted"
+                )
+            return list(self._entries)[since_seq - oldest + 1 :]
+
+    def close(self) -> None:
+        """Write out pending spill entries and close the file.
+
+        Entries recorded later reopen it.
+        """
+        with self._lock:
+            spill_queue, self._spill_queue = self._spill_queue, None
+            spill_thread, self._spill_thread = self._spill_thread, None
+        if spill_queue is not None and spill_thread is not None:
+            spill_queue.put(None)
+            spill_thread.join()
+
+    def _spill_entries(self, entries: list[SHCJournalEntry]) -> None:
+        if self._spill_queue is None:
+            assert self._spill_path is not None
+            self._spill_queue = queue.SimpleQueue()
+            self._spill_thread = threading.Thread(
+                target=self._spill_thread_main,
+                args=(self._spill_path, self._spill_queue),
+                name="SHCJournalSpillThread",
+                daemon=True,
+            )
+            self._spill_thread.start()
+        self._spill_queue.put(entries)
+
+    def _spill_thread_main(self, path: Path, spill_queue: _SpillQueue) -> None:
+        """Append queued entries to ``path`` until the ``None`` sentinel."""
+        spill: IO[str] | None = None
+        try:
+            while (entries := spill_queue.get()) is not None:
+                if spill is None:
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    spill = path.open("a", encoding="utf-8")
+                spill.writelines(
+                    json.dumps(entry._asdict(), separators=(",", ":")) + "\n"
+                    for entry in entries
+                )
+                spill.flush()
+        except (OSError, TypeError, ValueError) as ex:
+            logger.warning("Stopped spilling the event journal to %s: %s", path, ex)
+            with self._lock:
+                self._spill_path = None
+        finally:
+            if spill is not None:
+                try:
+                    spill.close()
+                except OSError:
+                    pass
@@ -0,0 +1,93 @@
+"""JSON-RPC batch helpers shared by ``SHCAPI`` and ``SHCAPIAsync``.
+
+The SHC's ``/remote/json-rpc`` endpoint takes an array of calls and answers
+with an array of responses, so several ``RE/*`` methods can share one HTTPS
+round trip. ``build_batch`` numbers the calls; ``demultiplex_batch`` maps the
+responses back to the calls by ``id`` and turns per-call errors into
+``JSONRPCError`` instances, so one failed call does not hide the results of
+the others.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any, NamedTuple
+
+from .exceptions import JSONRPCError, SHCSessionError
+
+LONG_POLL_TOPIC = "com/bosch/sh/remote/*"
+
+
+class JSONRPCCall(NamedTuple):
+    """One method call of a JSON-RPC batch."""
+
+    method: str
+    params: list[Any] | None = None
+
+    @classmethod
+    def subscribe(cls) -> JSONRPCCall:
+        return cls("RE/subscribe", [LONG_POLL_TOPIC, None])
+
+    @classmethod
+    def unsubscribe(cls, poll_id: str) -> JSONRPCCall:
+        return cls("RE/unsubscribe", [poll_id])
+
+    @classmethod
+    def long_poll(cls, poll_id: str, wait_seconds: int = 30) -> JSONRPCCall:
+        return cls("RE/longPoll", [poll_id, wait_seconds])
+
+
+def build_batch(calls: Sequence[JSONRPCCall]) -> list[dict[str, Any]]:
+    """Build the request body for ``calls``; ids are 1-based call positions."""
+    if not calls:
+        raise ValueError("A JSON-RPC batch needs at least one call")
+    return [
+        {"jsonrpc": "2.0", "id": index, "method": call.method, "params": call.params}
+        for index, call in enumerate(calls, start=1)
+    ]
+
+
+def demultiplex_batch(result: Any, calls: Sequence[JSONRPCCall]) -> list[Any]:
+    """Return one entry per call, in call order.
+
+    Each entry is the call's ``result`` or, if the SHC answered that call
+    with an ``error`` object, a ``JSONRPCError`` instance (returned, not
+    raised). Responses are matched by ``id``; a response without ids is
+    matched by position when it has exactly one entry per call. A response
+    that cannot be matched raises ``SHCSessionError``.
+    """
+    methods = ", ".join(call.method for call in calls)
+    if not isinstance(result, list) or not all(
+        isinstance(entry, dict) for entry in result
+    ):
+        raise SHCSessionError(
+            f"Malformed JSON-RPC batch response for {methods}: expected a "
+            f"list of objects, got {result!r}"
+        )
+    for entry in result:
+        if entry.get("jsonrpc") != "2.0":
+            raise SHCSessionError(
+                f"Unexpected JSON-RPC version in batch response for {methods}: "
+                f"{entry.get('jsonrpc')!r}"
+            )
+
+    by_id = {entry["id"]: entry for entry in result if entry.get("id") is not None}
+    if by_id:
+        responses = [by_id.get(index) for index in range(1, len(calls) + 1)]
+    elif len(result) == len(calls):
+        responses = list(result)
+    else:
+        responses = [None] * len(calls)
+
+    values: list[Any] = []
+    for call, response in zip(calls, responses):
+        if response is None:
+            raise SHCSessionError(
+                f"JSON-RPC batch response has no answer for {call.method}: {result!r}"
+            )
+        if "error" in response:
+            error = response["error"]
+            values.append(JSONRPCError(error["code"], error["message"]))
+        else:
+            values.append(response.get("result"))
+    return values
@@ -0,0 +1,165 @@
+"""Helpers for processing ``RE/longPoll`` result batches.
+
+A scenario moving many shutters, or a heating schedule change, makes the SHC
+deliver a burst of ``DeviceServiceData`` results in which the same service
+appears several times. Only its last state matters to listeners, so the
+sessions can optionally coalesce such bursts before dispatching them.
+
+The sessions can also pick the long-poll wait adaptively
+(``SHCAdaptivePollWait``): longer while nothing happens, saving requests and
+TLS wakeups on the controller, back to the short wait once events flow.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from collections.abc import Callable, Iterable
+from typing import Any
+
+# Services whose results are *events* rather than states: every occurrence
+# may trigger a register_event callback (button press, motion, alarm edge),
+# so they are never coalesced.
+EVENT_SERVICE_IDS = frozenset({"Keypad", "LatestMotion", "Alarm", "SurveillanceAlarm"})
+
+
+def coalesce_poll_results(
+    raw_results: Iterable[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    """Keep only the last ``DeviceServiceData`` per (deviceId, service id).
+
+    Every other result (devices, messages, scenarios, event services, ...) is
+    kept. The surviving state of a service takes the position of its last
+    occurrence, so the relative order of all dispatched results is preserved.
+    """
+    results = list(raw_results)
+    seen: set[tuple[Any, Any]] = set()
+    coalesced: list[dict[str, Any]] = []
+    for raw_result in reversed(results):
+        if (
+            raw_result.get("@type") == "DeviceServiceData"
+            and raw_result.get("id") not in EVENT_SERVICE_IDS
+        ):
+            key = (raw_result.get("deviceId"), raw_result.get("id"))
+            if key in seen:
+                continue
+            seen.add(key)
+        coalesced.append(raw_result)
+    coalesced.reverse()
+    return coalesced
+
+
+class SHCPollResultCoalescer:
+    """Buffers long-poll results for a time window, then releases them coalesced.
+
+    With ``window == 0`` every poll batch is coalesced and released at once.
+    With a positive window the results of consecutive polls are buffered
+    until ``window`` seconds after the first buffered result; while results
+    are pending, :meth:`wait_seconds` shortens the next long-poll so the
+    window is honoured even when no further events arrive.
+    """
+
+    def __init__(
+        self, window: float = 0.0, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self._window = max(0.0, window)
+        self._clock = clock
+        self._pending: list[dict[str, Any]] = []
+        self._deadline: float | None = None
+
+    @property
+    def window(self) -> float:
+        return self._window
+
+    @property
+    def pending(self) -> bool:
+        return bool(self._pending)
+
+    def add(self, raw_results: Iterable[dict[str, Any]]) -> None:
+        for raw_result in raw_results:
+            if self._deadline is None:
+                self._deadline = self._clock() + self._window
+            self._pending.append(raw_result)
+
+    def ready(self) -> bool:
+        """True once the pending results should be dispatched."""
+        return self._deadline is not None and self._clock() >= self._deadline
+
+    def wait_seconds(self, default: int) -> int:
+        """Long-poll wait for the next poll: ``default``, shortened to the
+        remaining window (at least one second) while results are pending."""
+        if self._deadline is None:
+            return default
+        remaining = math.ceil(self._deadline - self._clock())
+        return max(1, min(default, remaining))
+
+    def drain(self) -> list[dict[str, Any]]:
+        """Return the pending results coalesced and reset the window."""
+        coalesced = coalesce_poll_results(self._pending)
+        self._pending = []
+        self._deadline = None
+        return coalesced
+
+
+class SHCAdaptivePollWait:
+    """Chooses the ``RE/longPoll`` wait from the observed event rate.
+
+    The SHC answers a long poll as soon as it has results, so the wait only
+    decides how often an idle poll comes back empty. After every poll that
+    ran its full wait without results the wait doubles, up to ``max_wait``,
+    as long as fewer than one event per wait is expected from the decayed
+    event rate. Any result drops it back to ``min_wait``, so a burst is
+    followed by short polls until the house is quiet again.
+
+    Call :meth:`wait_seconds` before and :meth:`observe` after each poll.
+    """
+
+    def __init__(
+        self,
+        min_wait: int = 10,
+        max_wait: int = 60,
+        rate_window: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not 1 <= min_wait <= max_wait or rate_window <= 0:
+            raise ValueError("need 1 <= min_wait <= max_wait and rate_window > 0")
+        self._min_wait = min_wait
+        self._max_wait = max_wait
+        self._rate_window = rate_window
+        self._clock = clock
+        self._wait = min_wait
+        self._events = 0.0
+        self._updated = clock()
+        self._started: float | None = None
+
+    @property
+    def current_wait(self) -> int:
+        return self._wait
+
+    @property
+    def event_rate(self) -> float:
+        """Events per second, exponentially decayed over ``rate_window``."""
+        return self._decayed(self._clock()) / self._rate_window
+
+    def _decayed(self, now: float) -> float:
+        return self._events * math.exp(-(now - self._updated) / self._rate_window)
+
+    def wait_seconds(self) -> int:
+        """Wait for the next poll; also marks the poll's start."""
+        self._started = self._clock()
+        return self._wait
+
+    def observe(self, result_count: int) -> None:
+        """Account for a poll that returned ``result_count`` results."""
+        now = self._clock()
+        self._events = self._decayed(now) + result_count
+        self._updated = now
+        started, self._started = self._started, None
+        if result_count:
+            self._wait = self._min_wait
+        elif (
+            started is not None
+            and now - started >= self._wait - 1
+            and self.event_rate * self._wait < 1
+        ):
+            self._wait = min(self._max_wait, self._wait * 2)
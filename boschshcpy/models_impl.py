@@ -77,6 +77,8 @@ from .services_impl import (
 
 
 class SHCBatteryDevice(SHCDevice):
+    __slots__ = ("_batterylevel_service",)
+
     def __init__(
         self,
         api: SHCAPI,
@@ -100,6 +102,8 @@ class SHCBatteryDevice(SHCDevice):
 
 
 class _CommunicationQuality(SHCDevice):
+    __slots__ = ()
+
     def __init__(
         self,
         api: SHCAPI,
@@ -127,6 +131,8 @@ class _CommunicationQuality(SHCDevice):
 
 
 class _PowerMeter(SHCDevice):
+    __slots__ = ()
+
     def __init__(
         self,
         api: SHCAPI,
@@ -159,6 +165,8 @@ class _PowerMeter(SHCDevice):
 
 
 class _ChildProtection(SHCDevice):
+    __slots__ = ()
+
     def __init__(
         self,
         api: SHCAPI,
@@ -186,6 +194,8 @@ class _ChildProtection(SHCDevice):
 
 
 class _Thermostat(SHCDevice):
+    __slots__ = ()
+
     def __init__(
         self,
         api: SHCAPI,
@@ -215,6 +225,8 @@ class _Thermostat(SHCDevice):
 
 
 class _PowerSwitch(SHCDevice):
+    __slots__ = ()
+
     def __init__(
         self,
         api: SHCAPI,
@@ -244,6 +256,8 @@ class _PowerSwitch(SHCDevice):
 
 
 class _PowerSwitchProgram(SHCDevice):
+    __slots__ = ()
+
     def __init__(
         self,
         api: SHCAPI,
@@ -261,6 +275,8 @@ class _PowerSwitchProgram(SHCDevice):
 
 
 class _TemperatureLevel(SHCDevice):
+    __slots__ = ()
+
     def __init__(
         self,
         api: SHCAPI,
@@ -282,6 +298,8 @@ class _TemperatureLevel(SHCDevice):
 
 
 class _HumidityLevel(SHCDevice):
+    __slots__ = ()
+
     def __init__(
         self,
         api: SHCAPI,
@@ -305,6 +323,8 @@ class _HumidityLevel(SHCDevice):
 
 
 class _TemperatureOffset(SHCDevice):
+    __slots__ = ()
+
     def __init__(
         self,
         api: SHCAPI,
@@ -354,6 +374,8 @@ class _TemperatureOffset(SHCDevice):
 
 
 class _SilentMode(SHCDevice):
+    __slots__ = ()
+
     def __init__(
         self,
         api: SHCAPI,
@@ -391,6 +413,12 @@ class _SilentMode(SHCDevice):
 
 
 class SHCSmokeDetector(SHCBatteryDevice):
+    __slots__ = (
+        "_alarm_service",
+        "_smoke_sensitivity_service",
+        "_smokedetectorcheck_service",
+    )
+
     def __init__(
         self,
         api: SHCAPI,
@@ -527,6 +555,17 @@ class SHCSmokeDetector(SHCBatteryDevice):
 
 
 class SHCSmartPlug(_PowerMeter, _PowerSwitch, _PowerSwitchProgram):
+    __slots__ = (
+        "_energy_saving_mode_service",
+        "_led_brightness_configuration_service",
+        "_power_switch_configuration_service",
+        "_power_switch_warning_service",
+        "_powermeter_service",
+        "_powerswitch_service",
+        "_powerswitchprogram_service",
+        "_routing_service",
+    )
+
     def __init__(
         self,
         api: SHCAPI,
@@ -701,6 +740,17 @@ class SHCSmartPlug(_PowerMeter, _PowerSwitch, _PowerSwitchProgram):
 class SHCSmartPlugCompact(
     _CommunicationQuality, _PowerMeter, _PowerSwitch, _PowerSwitchProgram
 ):
+    __slots__ = (
+        "_communicationquality_service",
+        "_energy_saving_mode_service",
+        "_led_brightness_configuration_service",
+        "_power_switch_configuration_service",
+        "_power_switch_warning_service",
+        "_powermeter_service",
+        "_powerswitch_service",
+        "_powerswitchprogram_service",
+    )
+
     def __init__(
         self,
         api: SHCAPI,
@@ -855,14 +905,29 @@ class SHCSmartPlugCompact(
 
 
 class SHCLightSwitch(_ChildProtection, _PowerSwitch, _PowerSwitchProgram):
+    __slots__ = (
+        "_childprotection_service",
+        "_powerswitch_service",
+        "_powerswitchprogram_service",
+    )
+
     pass
 
 
 class SHCLightSwitchBSM(SHCLightSwitch, _PowerMeter):
+    __slots__ = ("_powermeter_service",)
+
     pass
 
 
 class SHCLightControl(_CommunicationQuality, _PowerMeter):
+    __slots__ = (
+        "_communicationquality_service",
+        "_keypad_service",
+        "_powermeter_service",
+        "_switch_config_service",
+    )
+
     def __init__(
         self,
         api: SHCAPI,
@@ -993,6 +1058,15 @@ class SHCLightControl(_CommunicationQuality, _PowerMeter):
 class SHCMicromoduleRelay(
     _CommunicationQuality, _ChildProtection, _PowerSwitch, _PowerSwitchProgram
 ):
+    __slots__ = (
+        "_childprotection_service",
+        "_communicationquality_service",
+        "_impulseswitch_service",
+        "_powerswitch_service",
+        "_powerswitchprogram_service",
+        "_switch_config_service",
+    )
+
     class RelayType(Enum):
         BUTTON = "BUTTON"
         SWITCH = "SWITCH"
@@ -1149,6 +1223,8 @@ class SHCMicromoduleRelay(
 
 
 class SHCShutterControl(SHCDevice):
+    __slots__ = ("_service",)
+
     def __init__(
         self,
         api: SHCAPI,
@@ -1185,6 +1261,13 @@ class SHCShutterControl(SHCDevice):
 class SHCMicromoduleShutterControl(
     SHCShutterControl, _CommunicationQuality, _ChildProtection, _PowerMeter
 ):
+    __slots__ = (
+        "_childprotection_service",
+        "_communicationquality_service",
+        "_keypad_service",
+        "_powermeter_service",
+    )
+
     def __init__(
         self,
         api: SHCAPI,
@@ -1241,6 +1324,8 @@ class SHCMicromoduleShutterControl(
 
 
 class SHCMicromoduleBlinds(SHCMicromoduleShutterControl):
+    __slots__ = ("_blindscontrol_service", "_blindsscenecontrol_service")
+
     def __init__(
         self,
         api: SHCAPI,
@@ -1305,6 +1390,8 @@ class SHCMicromoduleBlinds(SHCMicromoduleShutterControl):
 
 
 class SHCShutterContact(SHCBatteryDevice):
+    __slots__ = ("_service",)
+
     def __init__(
         self,
         api: SHCAPI,
@@ -1324,6 +1411,8 @@ class SHCShutterContact(SHCBatteryDevice):
 
 
 class SHCShutterContact2(SHCShutterContact, _CommunicationQuality):
+    __slots__ = ("_bypass_service", "_communicationquality_service")
+
     def __init__(
         self,
         api: SHCAPI,
@@ -1390,6 +1479,8 @@ class SHCShutterContact2(SHCShutterContact, _CommunicationQuality):
 
 
 class SHCShutterContact2Plus(SHCShutterContact2):
+    __slots__ = ("_vibrationsensor_service",)
+
     def __init__(
         self,
         api: SHCAPI,
@@ -1435,6 +1526,8 @@ class SHCShutterContact2Plus(SHCShutterContact2):
 
 
 class SHCCamera360(SHCDevice):
+    __slots__ = ("_cameranotification_service", "_privacymode_service")
+
     def __init__(
         self,
         api: SHCAPI,
@@ -1490,6 +1583,8 @@ class SHCCamera360(SHCDevice):
 
 
 class SHCCameraEyes(SHCCamera360):
+    __slots__ = ("_cameralight_service",)
+
     def __init__(
         self,
         api: SHCAPI,
@@ -1523,6 +1618,8 @@ class SHCCameraEyes(SHCCamera360):
 
 
 class SHCCameraOutdoorGen2(SHCCamera360):
+    __slots__ = ("_cameraambientlight_service", "_camerafrontlight_service")
+
     def __init__(
         self,
         api: SHCAPI,
@@ -1590,6 +1687,15 @@ class SHCThermostat(
     _TemperatureLevel,
     _TemperatureOffset,
 ):
+    __slots__ = (
+        "_communicationquality_service",
+        "_silentmode_service",
+        "_temperaturelevel_service",
+        "_temperatureoffset_service",
+        "_thermostat_service",
+        "_valvetappet_service",
+    )
+
     def __init__(
         self,
         api: SHCAPI,
@@ -1611,6 +1717,12 @@ class SHCThermostat(
 
 
 class SHCClimateControl(_TemperatureLevel):
+    __slots__ = (
+        "_roomclimatecontrol_service",
+        "_supportedcontrolmode_service",
+        "_temperaturelevel_service",
+    )
+
     def __init__(
         self,
         api: SHCAPI,
@@ -1761,6 +1873,8 @@ class SHCClimateControl(_TemperatureLevel):
 
 
 class SHCHeatingCircuit(SHCDevice):
+    __slots__ = ("_heating_circuit_service",)
+
     def __init__(
         self,
         api: SHCAPI,
@@ -1838,10 +1952,24 @@ class SHCHeatingCircuit(SHCDevice):
 class SHCWallThermostat(
     SHCBatteryDevice, _TemperatureLevel, _HumidityLevel, _Thermostat, _TemperatureOffset
 ):
+    __slots__ = (
+        "_humiditylevel_service",
+        "_temperaturelevel_service",
+        "_temperatureoffset_service",
+        "_thermostat_service",
+    )
+
     pass
 
 
 class SHCThermostatGen2(SHCThermostat):
+    __slots__ = (
+        "_display_config_service",
+        "_display_direction_service",
+        "_displayed_temp_service",
+        "_wall_thermostat_config_service",
+    )
+
     def __init__(
         self,
         api: SHCAPI,
@@ -2006,6 +2134,14 @@ class SHCRoomThermostat2(
     _Thermostat,
     _TemperatureOffset,
 ):
+    __slots__ = (
+        "_communicationquality_service",
+        "_display_config_service",
+        "_display_direction_service",
+        "_displayed_temp_service",
+        "_terminal_config_service",
+    )
+
     def __init__(
         self,
         api: SHCAPI,
@@ -2158,6 +2294,8 @@ class SHCRoomThermostat2(
 
 
 class SHCUniversalSwitch(SHCBatteryDevice):
+    __slots__ = ("_keypad_service", "_keypadtrigger_service")
+
     def __init__(
         self,
         api: SHCAPI,
@@ -2206,6 +2344,8 @@ class SHCUniversalSwitch(SHCBatteryDevice):
 
 
 class SHCUniversalSwitch2(SHCUniversalSwitch):
+    __slots__ = ()
+
     def __init__(
         self,
         api: SHCAPI,
@@ -2225,6 +2365,8 @@ class SHCUniversalSwitch2(SHCUniversalSwitch):
 
 
 class SHCMotionDetector(SHCBatteryDevice):
+    __slots__ = ("_multi_level_sensor_service", "_service")
+
     def __init__(
         self,
         api: SHCAPI,
@@ -2247,6 +2389,23 @@ class SHCMotionDetector(SHCBatteryDevice):
 
 
 class SHCMotionDetector2(SHCBatteryDevice):
+    __slots__ = (
+        "_binaryswitch_service",
+        "_communicationquality_service",
+        "_detectiontest_service",
+        "_latestmotion_service",
+        "_latesttamper_service",
+        "_multi_level_sensor_service",
+        "_multi_level_switch_service",
+        "_occupancydetection_service",
+        "_petimmunity_service",
+        "_pirsensorconfiguration_service",
+        "_pollcontrol_service",
+        "_smart_sensitivity_control_service",
+        "_temperaturelevel_service",
+        "_walktest_service",
+    )
+
     def __init__(
         self,
         api: SHCAPI,
@@ -2572,6 +2731,13 @@ class SHCMotionDetector2(SHCBatteryDevice):
 
 
 class SHCTwinguard(SHCBatteryDevice):
+    __slots__ = (
+        "_airqualitylevel_service",
+        "_smoke_sensitivity_service",
+        "_smokedetectorcheck_service",
+        "_twinguard_nightly_promise_service",
+    )
+
     def __init__(
         self,
         api: SHCAPI,
@@ -2712,6 +2878,8 @@ class SHCTwinguard(SHCBatteryDevice):
 
 
 class SHCSmokeDetectionSystem(SHCDevice):
+    __slots__ = ("_surveillancealarm_service",)
+
     def __init__(
         self,
         api: SHCAPI,
@@ -2730,6 +2898,8 @@ class SHCSmokeDetectionSystem(SHCDevice):
 
 
 class SHCPresenceSimulationSystem(SHCDevice):
+    __slots__ = ("_presencesimulationconfiguration_service",)
+
     def __init__(
         self,
         api: SHCAPI,
@@ -2757,6 +2927,14 @@ class SHCPresenceSimulationSystem(SHCDevice):
 
 
 class SHCLight(SHCDevice):
+    __slots__ = (
+        "_binaryswitch_service",
+        "_capabilities",
+        "_hsbcoloractuator_service",
+        "_huecolortemperature_service",
+        "_multilevelswitch_service",
+    )
+
     class Capabilities(Flag):
         BRIGHTNESS = auto()
         COLOR_TEMP = auto()
@@ -2893,6 +3071,8 @@ class SHCLight(SHCDevice):
 
 
 class SHCWaterLeakageSensor(SHCBatteryDevice):
+    __slots__ = ("_leakage_service", "_sensor_check_service", "_tilt_service")
+
     def __init__(
         self,
         api: SHCAPI,
@@ -2933,6 +3113,13 @@ class SHCWaterLeakageSensor(SHCBatteryDevice):
 class SHCMicromoduleDimmer(
     SHCLight, _CommunicationQuality, _ChildProtection, _PowerSwitch
 ):
+    __slots__ = (
+        "_childprotection_service",
+        "_communicationquality_service",
+        "_dimmerconfig_service",
+        "_powerswitch_service",
+    )
+
     def __init__(
         self,
         api: SHCAPI,
@@ -2986,6 +3173,8 @@ class SHCOutdoorSiren(SHCBatteryDevice):
     intrusion system; the only on-demand acoustic check is the test alarm.
     """
 
+    __slots__ = ("_powersupply_service", "_siren_service")
+
     def __init__(
         self,
         api: SHCAPI,
@@ -0,0 +1,132 @@
+"""Response cache for controller resources that rarely change.
+
+Rooms, scenarios and user-defined states are fetched in full on every
+session start, although they almost never change.
+Pass an ``SHCResponseCache`` to ``SHCAPI`` / ``SHCAPIAsync`` (or the
+sessions) to serve repeat GETs of those resources from memory for a
+per-resource TTL. One cache may be shared by several API/session instances
+for the same controller.
+
+Bodies are stored as the raw response bytes and decoded on every hit, so
+callers always get fresh objects they may modify. When the controller sent
+an ``ETag`` or ``Last-Modified`` header, an expired entry is revalidated
+with a conditional GET and a ``304 Not Modified`` answer extends it.
+
+The (public) information block is not cached by default: ``authenticate``
+checks against it and the firmware update state is refreshed from it, so
+both need the live answer. Pass ``ttls`` with ``"information"`` /
+``"public_information"`` entries to cache it anyway.
+
+Long-poll events invalidate what they may have changed (see
+``INVALIDATING_EVENTS``); the sessions call :meth:`invalidate_for_event` for
+every result they dispatch.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Mapping
+from typing import Any, NamedTuple
+
+# Seconds a cached response is served without asking the controller.
+DEFAULT_TTLS: Mapping[str, float] = {
+    "rooms": 300.0,
+    "scenarios": 300.0,
+    "userdefinedstates": 60.0,
+}
+
+# Long-poll result "@type" -> cached resources it may have made stale.
+INVALIDATING_EVENTS: Mapping[str, tuple[str, ...]] = {
+    "userDefinedState": ("userdefinedstates",),
+    # Device add/remove/rename can come with room changes.
+    "device": ("rooms",),
+    "scenarioTriggered": ("scenarios",),
+}
+
+
+class _Entry(NamedTuple):
+    body: bytes
+    expires: float
+    etag: str | None
+    last_modified: str | None
+
+
+class SHCResponseCache:
+    """TTL cache of raw GET response bodies, keyed by resource name."""
+
+    def __init__(
+        self,
+        ttls: Mapping[str, float] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self._clock = clock
+        self._entries: dict[str, _Entry] = {}
+        # The sync session polls on its own thread.
+        self._lock = threading.Lock()
+
+    def caches(self, resource: str) -> bool:
+        return resource in self._ttls
+
+    def get(self, resource: str) -> bytes | None:
+        """The cached body if it has not expired yet, else None."""
+        with self._lock:
+            entry = self._entries.get(resource)
+        if entry is None or self._clock() >= entry.expires:
+            return None
+        return entry.body
+
+    def validators(self, resource: str) -> dict[str, str]:
+        """Conditional-request headers for an (expired) cached entry."""
+        with self._lock:
+            entry = self._entries.get(resource)
+        headers: dict[str, str] = {}
+        if entry is not None:
+            if entry.etag is not None:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified is not None:
+                headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def store(
+        self,
+        resource: str,
+        body: bytes,
+        headers: Mapping[str, str] | None = None,
+    ) -> None:
+        if resource not in self._ttls:
+            return
+        headers = headers or {}
+        entry = _Entry(
+            body,
+            self._clock() + self._ttls[resource],
+            headers.get("ETag"),
+            headers.get("Last-Modified"),
+        )
+        with self._lock:
+            self._entries[resource] = entry
+
+    def revalidated(self, resource: str) -> bytes | None:
+        """Extend an entry after a 304 answer; returns its body (None if gone)."""
+        with self._lock:
+            entry = self._entries.get(resource)
+            if entry is None:
+                return None
+            self._entries[resource] = entry._replace(
+                expires=self._clock() + self._ttls[resource]
+            )
+        return entry.body
+
+    def invalidate(self, *resources: str) -> None:
+        """Drop the given resources, or everything when called without any."""
+        with self._lock:
+            if not resources:
+                self._entries.clear()
+            for resource in resources:
+                self._entries.pop(resource, None)
+
+    def invalidate_for_event(self, raw_result: Mapping[str, Any]) -> None:
+        resources = INVALIDATING_EVENTS.get(raw_result.get("@type", ""))
+        if resources:
+            self.invalidate(*resources)
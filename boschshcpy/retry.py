@@ -0,0 +1,69 @@
+"""Retry policy for controller requests and the long-poll loops.
+
+Without a policy, ``SHCAPI`` / ``SHCAPIAsync`` retry a request exactly once,
+immediately, when the connection dropped before any response arrived (#281,
+``RETRY_ONCE_ON_DROP``), and the poll loops wait a fixed 15 s after an
+unexpected error. Pass an ``SHCRetryPolicy`` as ``retry_policy=`` to the API
+or session classes to also retry
+
+* idempotent requests (GET and PUT by default) after a dropped connection,
+  a timeout or a retryable status code (502/503/504 by default), up to
+  ``max_attempts`` in total, and
+* back off exponentially with jitter between attempts and between failed
+  long polls, instead of stalling 15 s after every hiccup.
+
+POSTs (``post_domain_action``, service operations, JSON-RPC) are never
+retried once they may have reached the controller: only the #281 retry of a
+connection that dropped before sending applies to them.
+"""
+
+from __future__ import annotations
+
+import random
+from collections.abc import Callable
+from typing import NamedTuple
+
+
+class SHCRetryPolicy(NamedTuple):
+    """When and how often to retry a request."""
+
+    max_attempts: int = 3  # attempts per request, the first one included
+    backoff_base: float = 0.5  # seconds before the second attempt
+    backoff_max: float = 15.0  # cap of the doubling delay
+    jitter: float = 0.5  # delays are cut by a random fraction up to this
+    retry_statuses: frozenset[int] = frozenset({502, 503, 504})
+    idempotent_methods: frozenset[str] = frozenset({"GET", "PUT"})
+
+    def retries_error(self, method: str, attempt: int, dropped: bool) -> bool:
+        """Whether to retry after attempt number ``attempt`` raised.
+
+        ``dropped`` means the connection broke before the request was sent,
+        so the controller cannot have processed it.
+        """
+        if attempt >= self.max_attempts:
+            return False
+        if method in self.idempotent_methods:
+            return True
+        return dropped and attempt == 1
+
+    def retries_status(self, method: str, status: int, attempt: int) -> bool:
+        """Whether to retry after attempt number ``attempt`` got ``status``."""
+        return (
+            attempt < self.max_attempts
+            and status in self.retry_statuses
+            and method in self.idempotent_methods
+        )
+
+    def backoff(self, attempt: int, rand: Callable[[], float] = random.random) -> float:
+        """Seconds to wait after the ``attempt``-th consecutive failure."""
+        delay = min(self.backoff_max, self.backoff_base * 2.0 ** (attempt - 1))
+        return delay * (1 - self.jitter * rand())
+
+
+# The behaviour without a policy: one immediate retry of a dropped request.
+RETRY_ONCE_ON_DROP = SHCRetryPolicy(
+    max_attempts=2,
+    backoff_base=0.0,
+    retry_statuses=frozenset(),
+    idempotent_methods=frozenset(),
+)
@@ -0,0 +1,266 @@
+"""Client-side rate limiting and priority scheduling of controller requests.
+
+The SHC is a small embedded box: a resubscribe refresh, an
+``SHCDevice.update()`` sweep or a scripted ``put_state`` loop can keep it
+busy long enough that a light toggle waits behind hundreds of refresh GETs.
+Pass an ``SHCRequestScheduler`` (sync) or ``SHCRequestSchedulerAsync`` as
+``scheduler=`` to ``SHCAPI`` / ``SHCAPIAsync`` (or the sessions) to send
+requests through a token bucket, highest priority first:
+
+    INTERACTIVE  device/service writes (PUT, POST)
+    IDS          intrusion detection actions (writes below /intrusion/)
+    READ         GETs
+    BACKGROUND   anything issued inside ``scheduling_priority(BACKGROUND)``;
+                 the sessions use it for the resubscribe refresh
+
+Requests of one class are served in arrival order. The queue is bounded:
+when it is full, the newest request of a lower class than the newcomer is
+dropped, otherwise the newcomer is, with ``SHCQueueFullError``. JSON-RPC
+(subscribe, long poll) bypasses the scheduler; it is not what loads the
+controller, and delaying it only delays events.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import heapq
+import itertools
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import NamedTuple
+
+from .exceptions import SHCQueueFullError
+
+DEFAULT_RATE = 10.0
+DEFAULT_BURST = 5
+DEFAULT_MAX_QUEUE = 256
+
+
+class Priority(IntEnum):
+    """Request classes, most urgent first."""
+
+    INTERACTIVE = 0
+    IDS = 1
+    READ = 2
+    BACKGROUND = 3
+
+
+_priority_override: ContextVar[Priority | None] = ContextVar(
+    "boschshcpy_scheduling_priority", default=None
+)
+
+
+@contextlib.contextmanager
+def scheduling_priority(priority: Priority) -> Iterator[None]:
+    """Schedule every request issued in this block (thread / task) as
+    ``priority``, whatever its method."""
+    token = _priority_override.set(priority)
+    try:
+        yield
+    finally:
+        _priority_override.reset(token)
+
+
+def request_priority(method: str, api_url: str) -> Priority | None:
+    """Class of a request, or None if it bypasses the scheduler."""
+    if "/remote/json-rpc" in api_url:
+        return None
+    override = _priority_override.get()
+    if override is not None:
+        return override
+    if method == "GET":
+        return Priority.READ
+    if "/intrusion/" in api_url:
+        return Priority.IDS
+    return Priority.INTERACTIVE
+
+
+class SHCSchedulerStats(NamedTuple):
+    """Snapshot of scheduler counters."""
+
+    queued: int  # requests currently waiting
+    peak_queued: int  # highest queued seen
+    granted: int  # requests let through
+    rejected: int  # requests dropped because the queue was full
+    wait_seconds: float  # total time granted requests spent queued
+
+
+class _Ticket:
+    __slots__ = ("priority", "seq", "enqueued", "evicted")
+
+    def __init__(self, priority: Priority, seq: int, enqueued: float) -> None:
+        self.priority = priority
+        self.seq = seq
+        self.enqueued = enqueued
+        self.evicted = False
+
+    def __lt__(self, other: _Ticket) -> bool:
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
+
+class _SchedulerCore:
+    """Token bucket plus priority queue; the callers provide the locking."""
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        max_queue: int,
+        clock: Callable[[], float],
+    ) -> None:
+        if rate <= 0 or burst < 1 or max_queue < 1:
+            raise ValueError("rate must be > 0, burst and max_queue >= 1")
+        self._rate = rate
+        self._burst = float(burst)
+        self._max_queue = max_queue
+        self._clock = clock
+        self._tokens = float(burst)
+        self._refilled = clock()
+        self._queue: list[_Ticket] = []
+        self._seq = itertools.count()
+        self._peak_queued = 0
+        self._granted = 0
+        self._rejected = 0
+        self._wait_seconds = 0.0
+
+    def push(self, priority: Priority) -> tuple[_Ticket, bool]:
+        """Queue a request; also returns whether another one was dropped."""
+        ticket = _Ticket(priority, next(self._seq), self._clock())
+        evicted = False
+        if len(self._queue) >= self._max_queue:
+            victim = max(self._queue)
+            if not ticket < victim:
+                self._rejected += 1
+                raise SHCQueueFullError(
+                    f"Request queue full ({self._max_queue} waiting)"
+                )
+            self.remove(victim)
+            victim.evicted = evicted = True
+            self._rejected += 1
+        heapq.heappush(self._queue, ticket)
+        self._peak_queued = max(self._peak_queued, len(self._queue))
+        return ticket, evicted
+
+    def remove(self, ticket: _Ticket) -> None:
+        if ticket in self._queue:
+            self._queue.remove(ticket)
+            heapq.heapify(self._queue)
+
+    def try_grant(self, ticket: _Ticket) -> float | None:
+        """Grant ``ticket`` if it is first in line and a token is available.
+
+        Returns 0 when granted, the seconds until the next token when it is
+        first in line, and None when other requests are ahead of it.
+        """
+        if ticket.evicted:
+            raise SHCQueueFullError("Dropped from the full request queue")
+        if self._queue[0] is not ticket:
+            return None
+        now = self._clock()
+        self._tokens = min(
+            self._burst, self._tokens + (now - self._refilled) * self._rate
+        )
+        self._refilled = now
+        if self._tokens < 1:
+            return (1 - self._tokens) / self._rate
+        self._tokens -= 1
+        heapq.heappop(self._queue)
+        self._granted += 1
+        self._wait_seconds += now - ticket.enqueued
+        return 0.0
+
+    @property
+    def stats(self) -> SHCSchedulerStats:
+        return SHCSchedulerStats(
+            len(self._queue),
+            self._peak_queued,
+            self._granted,
+            self._rejected,
+            self._wait_seconds,
+        )
+
+
+class SHCRequestScheduler:
+    """Thread-safe scheduler for ``SHCAPI``."""
+
+    def __init__(
+        self,
+        rate: float = DEFAULT_RATE,
+        burst: int = DEFAULT_BURST,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """``rate`` requests per second on average, ``burst`` at once after
+        an idle period, at most ``max_queue`` requests waiting."""
+        self._core = _SchedulerCore(rate, burst, max_queue, clock)
+        self._cond = threading.Condition()
+
+    @property
+    def stats(self) -> SHCSchedulerStats:
+        with self._cond:
+            return self._core.stats
+
+    def acquire(self, priority: Priority) -> None:
+        """Block until a request of class ``priority`` may be sent."""
+        with self._cond:
+            ticket, evicted = self._core.push(priority)
+            if evicted:
+                self._cond.notify_all()
+            try:
+                while True:
+                    delay = self._core.try_grant(ticket)
+                    if delay == 0:
+                        return
+                    self._cond.wait(delay)
+            except BaseException:
+                self._core.remove(ticket)
+                raise
+            finally:
+                # The queue head changed: let the next request check its turn.
+                self._cond.notify_all()
+
+
+class SHCRequestSchedulerAsync:
+    """Scheduler for ``SHCAPIAsync``; use it from one event loop."""
+
+    def __init__(
+        self,
+        rate: float = DEFAULT_RATE,
+        burst: int = DEFAULT_BURST,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._core = _SchedulerCore(rate, burst, max_queue, clock)
+        self._cond: asyncio.Condition | None = None
+
+    @property
+    def stats(self) -> SHCSchedulerStats:
+        return self._core.stats
+
+    async def acquire(self, priority: Priority) -> None:
+        """Wait until a request of class ``priority`` may be sent."""
+        if self._cond is None:
+            self._cond = asyncio.Condition()
+        cond = self._cond
+        async with cond:
+            ticket, evicted = self._core.push(priority)
+            if evicted:
+                cond.notify_all()
+            try:
+                while True:
+                    delay = self._core.try_grant(ticket)
+                    if delay == 0:
+                        return
+                    try:
+                        await asyncio.wait_for(cond.wait(), delay)
+                    except asyncio.TimeoutError:
+                        pass
+            except BaseException:
+                self._core.remove(ticket)
+                raise
+            finally:
+                cond.notify_all()
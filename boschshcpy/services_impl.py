@@ -10,6 +10,8 @@ logger = logging.getLogger("boschshcpy")
 
 
 class TemperatureOffsetService(SHCDeviceService):
+    __slots__ = ()
+
     @property
     def offset(self) -> float:
         return float(self.state["offset"] if "offset" in self.state else 0.0)
@@ -39,6 +41,8 @@ class TemperatureOffsetService(SHCDeviceService):
 
 
 class TemperatureLevelService(SHCDeviceService):
+    __slots__ = ()
+
     @property
     def temperature(self) -> float:
         return float(self.state["temperature"] if "temperature" in self.state else 0.0)
@@ -49,6 +53,8 @@ class TemperatureLevelService(SHCDeviceService):
 
 
 class HumidityLevelService(SHCDeviceService):
+    __slots__ = ()
+
     @property
     def humidity(self) -> float:
         return float(self.state["humidity"] if "humidity" in self.state else 0.0)
@@ -59,6 +65,8 @@ class HumidityLevelService(SHCDeviceService):
 
 
 class RoomClimateControlService(SHCDeviceService):
+    __slots__ = ()
+
     class OperationMode(Enum):
         AUTOMATIC = "AUTOMATIC"
         MANUAL = "MANUAL"
@@ -193,6 +201,8 @@ class RoomClimateControlService(SHCDeviceService):
 
 
 class ThermostatSupportedControlModeService(SHCDeviceService):
+    __slots__ = ()
+
     # Per-room capability service on the virtual `roomClimateControl_hz_*`
     # device. Advertises which control modes the room genuinely supports,
     # e.g. ["HEATING", "OFF"] for a radiator room vs
@@ -214,6 +224,8 @@ class ThermostatSupportedControlModeService(SHCDeviceService):
 
 
 class HeatingCircuitService(SHCDeviceService):
+    __slots__ = ()
+
     class OperationMode(Enum):
         AUTOMATIC = "AUTOMATIC"
         MANUAL = "MANUAL"
@@ -307,6 +319,8 @@ class HeatingCircuitService(SHCDeviceService):
 
 
 class SilentModeService(SHCDeviceService):
+    __slots__ = ()
+
     class State(Enum):
         MODE_SILENT = "MODE_SILENT"
         MODE_NORMAL = "MODE_NORMAL"
@@ -323,6 +337,8 @@ class SilentModeService(SHCDeviceService):
 
 
 class ShutterContactService(SHCDeviceService):
+    __slots__ = ()
+
     class State(Enum):
         CLOSED = "CLOSED"
         OPEN = "OPEN"
@@ -349,6 +365,8 @@ class BypassService(SHCDeviceService):
     (SWD2/SWD2_PLUS rawscans) for the confirmed shape.
     """
 
+    __slots__ = ()
+
     class State(Enum):
         BYPASS_INACTIVE = "BYPASS_INACTIVE"
         BYPASS_ACTIVE = "BYPASS_ACTIVE"
@@ -454,6 +472,8 @@ class BypassService(SHCDeviceService):
 
 
 class VibrationSensorService(SHCDeviceService):
+    __slots__ = ()
+
     class State(Enum):
         NO_VIBRATION = "NO_VIBRATION"
         VIBRATION_DETECTED = "VIBRATION_DETECTED"
@@ -493,6 +513,8 @@ class VibrationSensorService(SHCDeviceService):
 
 
 class ValveTappetService(SHCDeviceService):
+    __slots__ = ()
+
     class State(Enum):
         VALVE_ADAPTION_SUCCESSFUL = "VALVE_ADAPTION_SUCCESSFUL"
         VALVE_ADAPTION_IN_PROGRESS = "VALVE_ADAPTION_IN_PROGRESS"
@@ -537,6 +559,8 @@ class ValveTappetService(SHCDeviceService):
 
 
 class PowerSwitchService(SHCDeviceService):
+    __slots__ = ()
+
     class State(Enum):
         ON = "ON"
         OFF = "OFF"
@@ -556,6 +580,8 @@ class PowerSwitchService(SHCDeviceService):
 
 
 class PowerMeterService(SHCDeviceService):
+    __slots__ = ()
+
     @property
     def powerconsumption(self) -> float:
         return float(self.state.get("powerConsumption", 0.0))
@@ -580,6 +606,8 @@ class PowerMeterService(SHCDeviceService):
 
 
 class RoutingService(SHCDeviceService):
+    __slots__ = ()
+
     class State(Enum):
         ENABLED = "ENABLED"
         DISABLED = "DISABLED"
@@ -597,6 +625,8 @@ class RoutingService(SHCDeviceService):
 
 
 class PowerSwitchProgramService(SHCDeviceService):
+    __slots__ = ()
+
     class State(Enum):
         MANUAL = "MANUAL"
         AUTOMATIC = "AUTOMATIC"
@@ -615,6 +645,8 @@ class PowerSwitchProgramService(SHCDeviceService):
 
 
 class BinarySwitchService(SHCDeviceService):
+    __slots__ = ()
+
     @property
     def value(self) -> bool:
         return bool(self.state["on"])
@@ -625,6 +657,8 @@ class BinarySwitchService(SHCDeviceService):
 
 
 class MultiLevelSwitchService(SHCDeviceService):
+    __slots__ = ()
+
     @property
     def value(self) -> int:
         return int(self.state["level"])
@@ -635,6 +669,8 @@ class MultiLevelSwitchService(SHCDeviceService):
 
 
 class MultiLevelSensorService(SHCDeviceService):
+    __slots__ = ()
+
     @property
     def illuminance(self) -> int:
         return int(self.state.get("illuminance", 0))
@@ -645,6 +681,8 @@ class MultiLevelSensorService(SHCDeviceService):
 
 
 class HueColorTemperatureService(SHCDeviceService):
+    __slots__ = ()
+
     @property
     def value(self) -> int:
         return int(self.state["colorTemperature"])
@@ -665,6 +703,8 @@ class HueColorTemperatureService(SHCDeviceService):
 
 
 class HSBColorActuatorService(SHCDeviceService):
+    __slots__ = ()
+
     @property
     def value(self) -> int:
         return int(self.state["rgb"])
@@ -690,6 +730,8 @@ class HSBColorActuatorService(SHCDeviceService):
 
 
 class SmokeDetectorCheckService(SHCDeviceService):
+    __slots__ = ()
+
     class State(Enum):
         NONE = "NONE"
         SMOKE_TEST_OK = "SMOKE_TEST_OK"
@@ -715,6 +757,8 @@ class SmokeDetectorCheckService(SHCDeviceService):
 
 
 class AlarmService(SHCDeviceService):
+    __slots__ = ()
+
     class State(Enum):
         IDLE_OFF = "IDLE_OFF"
         INTRUSION_ALARM = "INTRUSION_ALARM"
@@ -740,6 +784,8 @@ class AlarmService(SHCDeviceService):
 
 
 class ShutterControlService(SHCDeviceService):
+    __slots__ = ()
+
     class State(Enum):
         STOPPED = "STOPPED"
         MOVING = "MOVING"
@@ -782,6 +828,8 @@ class ShutterControlService(SHCDeviceService):
 
 
 class BlindsControlService(SHCDeviceService):
+    __slots__ = ()
+
     class BlindsType(Enum):
         DEGREE_90 = "DEGREE_90"
         DEGREE_180 = "DEGREE_180"
@@ -814,6 +862,8 @@ class BlindsControlService(SHCDeviceService):
 
 
 class BlindsSceneControlService(SHCDeviceService):
+    __slots__ = ()
+
     @property
     def level(self) -> float:
         return float(self.state.get("level", 0.0))
@@ -839,6 +889,8 @@ class BlindsSceneControlService(SHCDeviceService):
 
 
 class CameraLightService(SHCDeviceService):
+    __slots__ = ()
+
     class State(Enum):
         ON = "ON"
         OFF = "OFF"
@@ -854,14 +906,20 @@ class CameraLightService(SHCDeviceService):
 
 
 class CameraAmbientLightService(CameraLightService):
+    __slots__ = ()
+
     pass
 
 
 class CameraFrontLightService(CameraLightService):
+    __slots__ = ()
+
     pass
 
 
 class PrivacyModeService(SHCDeviceService):
+    __slots__ = ()
+
     class State(Enum):
         ENABLED = "ENABLED"
         DISABLED = "DISABLED"
@@ -876,6 +934,8 @@ class PrivacyModeService(SHCDeviceService):
 
 
 class CameraNotificationService(SHCDeviceService):
+    __slots__ = ()
+
     class State(Enum):
         ENABLED = "ENABLED"
         DISABLED = "DISABLED"
@@ -893,6 +953,8 @@ class CameraNotificationService(SHCDeviceService):
 
 
 class ChildProtectionService(SHCDeviceService):
+    __slots__ = ()
+
     @property
     def childLockActive(self) -> bool:
         return bool(self.state["childLockActive"])
@@ -903,6 +965,8 @@ class ChildProtectionService(SHCDeviceService):
 
 
 class ImpulseSwitchService(SHCDeviceService):
+    __slots__ = ()
+
     @property
     def impulse_state(self) -> bool:
         return bool(self.state["impulseState"])
@@ -920,6 +984,8 @@ class ImpulseSwitchService(SHCDeviceService):
 
 
 class KeypadService(SHCDeviceService):
+    __slots__ = ()
+
     class KeyState(Enum):
         LOWER_BUTTON = "LOWER_BUTTON"
         LOWER_LEFT_BUTTON = "LOWER_LEFT_BUTTON"
@@ -977,6 +1043,8 @@ class KeypadService(SHCDeviceService):
 
 
 class LatestMotionService(SHCDeviceService):
+    __slots__ = ()
+
     @property
     def latestMotionDetected(self) -> str:
         return (
@@ -991,6 +1059,8 @@ class LatestMotionService(SHCDeviceService):
 
 
 class DetectionTestService(SHCDeviceService):
+    __slots__ = ()
+
     # GET state values (detectionState reported by the controller).
     class DetectionState(Enum):
         DETECTION_TEST_STARTED = "DETECTION_TEST_STARTED"
@@ -1055,6 +1125,8 @@ class DetectionTestService(SHCDeviceService):
 
 
 class LatestTamperService(SHCDeviceService):
+    __slots__ = ()
+
     @property
     def tamper_protection_enabled(self) -> bool:
         return bool(self.state.get("tamperProtectionEnabled", False))
@@ -1094,6 +1166,8 @@ class LatestTamperService(SHCDeviceService):
 
 
 class PollControlService(SHCDeviceService):
+    __slots__ = ()
+
     class PollControlState(Enum):
         LONG = "LONG"
         SHORT = "SHORT"
@@ -1125,6 +1199,8 @@ class PollControlService(SHCDeviceService):
 
 
 class PirSensorConfigurationService(SHCDeviceService):
+    __slots__ = ()
+
     class MotionSensitivity(Enum):
         HIGH = "HIGH"
         MIDDLE = "MIDDLE"
@@ -1144,6 +1220,8 @@ class PirSensorConfigurationService(SHCDeviceService):
 
 
 class OccupancyDetectionService(SHCDeviceService):
+    __slots__ = ()
+
     @property
     def isOccupied(self) -> bool:
         return bool(self.state["isOccupied"])
@@ -1168,6 +1246,8 @@ class OccupancyDetectionService(SHCDeviceService):
 
 
 class PetImmunityService(SHCDeviceService):
+    __slots__ = ()
+
     @property
     def enabled(self) -> bool:
         return bool(self.state.get("enabled", False))
@@ -1182,6 +1262,8 @@ class PetImmunityService(SHCDeviceService):
 
 
 class SmartSensitivityControlService(SHCDeviceService):
+    __slots__ = ()
+
     class SmartSensitivityContext(Enum):
         SECURITY = "SECURITY"
         COMFORT = "COMFORT"
@@ -1261,6 +1343,8 @@ class SmartSensitivityControlService(SHCDeviceService):
 
 
 class WalkTestService(SHCDeviceService):
+    __slots__ = ()
+
     class WalkState(Enum):
         WALK_TEST_STARTED = "WALK_TEST_STARTED"
         WALK_TEST_STOPPED = "WALK_TEST_STOPPED"  # APK: WalkTestState.WalkState
@@ -1325,6 +1409,8 @@ class WalkTestService(SHCDeviceService):
 
 
 class SmokeSensitivityService(SHCDeviceService):
+    __slots__ = ()
+
     class SmokeSensitivityLevel(Enum):
         HIGH = "HIGH"
         MIDDLE = "MIDDLE"
@@ -1372,6 +1458,8 @@ class SmokeSensitivityService(SHCDeviceService):
 
 
 class TwinguardNightlyPromiseService(SHCDeviceService):
+    __slots__ = ()
+
     @property
     def nightly_promise_enabled(self) -> bool:
         return bool(self.state.get("nightlyPromiseEnabled", False))
@@ -1389,6 +1477,8 @@ class TwinguardNightlyPromiseService(SHCDeviceService):
 
 
 class EnergySavingModeService(SHCDeviceService):
+    __slots__ = ()
+
     @property
     def energy_saving_mode_enabled(self) -> bool:
         return bool(self.state.get("energySavingModeEnabled", False))
@@ -1430,6 +1520,8 @@ class EnergySavingModeService(SHCDeviceService):
 
 
 class LedBrightnessConfigurationService(SHCDeviceService):
+    __slots__ = ()
+
     @property
     def brightness(self) -> int | None:
         raw = self.state.get("brightness")
@@ -1466,6 +1558,8 @@ class LedBrightnessConfigurationService(SHCDeviceService):
 
 
 class PowerSwitchConfigurationService(SHCDeviceService):
+    __slots__ = ()
+
     class StateAfterPowerOutage(Enum):
         OFF = "OFF"
         ON = "ON"
@@ -1508,6 +1602,8 @@ class PowerSwitchConfigurationService(SHCDeviceService):
 
 
 class PowerSwitchWarningService(SHCDeviceService):
+    __slots__ = ()
+
     @property
     def warning_suppressed(self) -> bool:
         return bool(self.state.get("warningSuppressed", False))
@@ -1525,6 +1621,8 @@ class PowerSwitchWarningService(SHCDeviceService):
 
 
 class AirQualityLevelService(SHCDeviceService):
+    __slots__ = ()
+
     class RatingState(Enum):
         GOOD = "GOOD"
         MEDIUM = "MEDIUM"
@@ -1609,6 +1707,8 @@ class AirQualityLevelService(SHCDeviceService):
 
 
 class SurveillanceAlarmService(SHCDeviceService):
+    __slots__ = ()
+
     class State(Enum):
         ALARM_OFF = "ALARM_OFF"
         ALARM_ON = "ALARM_ON"
@@ -1627,12 +1727,16 @@ class SurveillanceAlarmService(SHCDeviceService):
 
 
 class SmokeDetectionControlService(SHCDeviceService):
+    __slots__ = ()
+
     def summary(self) -> None:
         super().summary()
         print("    not yet implemented!")
 
 
 class BatteryLevelService(SHCDeviceService):
+    __slots__ = ()
+
     class State(Enum):
         LOW_BATTERY = "LOW_BATTERY"
         CRITICAL_LOW = "CRITICAL_LOW"
@@ -1660,6 +1764,8 @@ class BatteryLevelService(SHCDeviceService):
 
 
 class ThermostatService(SHCDeviceService):
+    __slots__ = ()
+
     class State(Enum):
         ON = "ON"
         OFF = "OFF"
@@ -1674,6 +1780,8 @@ class ThermostatService(SHCDeviceService):
 
 
 class CommunicationQualityService(SHCDeviceService):
+    __slots__ = ()
+
     class State(Enum):
         BAD = "BAD"
         GOOD = "GOOD"
@@ -1717,6 +1825,8 @@ class CommunicationQualityService(SHCDeviceService):
 
 
 class WaterLeakageSensorService(SHCDeviceService):
+    __slots__ = ()
+
     class State(Enum):
         LEAKAGE_DETECTED = "LEAKAGE_DETECTED"
         NO_LEAKAGE = "NO_LEAKAGE"
@@ -1734,6 +1844,8 @@ class WaterLeakageSensorService(SHCDeviceService):
 
 
 class WaterLeakageSensorTiltService(SHCDeviceService):
+    __slots__ = ()
+
     class State(Enum):
         ENABLED = "ENABLED"
         DISABLED = "DISABLED"
@@ -1759,6 +1871,8 @@ class WaterLeakageSensorTiltService(SHCDeviceService):
 
 
 class WaterLeakageSensorCheckService(SHCDeviceService):
+    __slots__ = ()
+
     @property
     def value(self) -> str:
         return str(self.state["result"])
@@ -1769,6 +1883,8 @@ class WaterLeakageSensorCheckService(SHCDeviceService):
 
 
 class PresenceSimulationConfigurationService(SHCDeviceService):
+    __slots__ = ()
+
     @property
     def enabled(self) -> bool:
         return bool(self.state.get("enabled", False))
@@ -1783,6 +1899,8 @@ class PresenceSimulationConfigurationService(SHCDeviceService):
 
 
 class DisplayConfiguration(SHCDeviceService):
+    __slots__ = ()
+
     @property
     def display_brightness(self) -> int | None:
         raw = self.state.get("displayBrightness")
@@ -1857,6 +1975,8 @@ class DisplayConfiguration(SHCDeviceService):
 
 
 class DisplayDirection(SHCDeviceService):
+    __slots__ = ()
+
     class Direction(Enum):
         NORMAL = "NORMAL"
         REVERSED = "REVERSED"
@@ -1885,6 +2005,8 @@ class DisplayDirection(SHCDeviceService):
 
 
 class DisplayedTemperatureConfiguration(SHCDeviceService):
+    __slots__ = ()
+
     class DisplayedTemperature(Enum):
         SETPOINT = "SETPOINT"
         MEASURED = "MEASURED"
@@ -1919,6 +2041,8 @@ class DisplayedTemperatureConfiguration(SHCDeviceService):
 
 
 class TerminalConfiguration(SHCDeviceService):
+    __slots__ = ()
+
     class Type(Enum):
         NOT_CONNECTED = "NOT_CONNECTED"
         FLOOR_SENSOR_CONNECTED = "FLOOR_SENSOR_CONNECTED"
@@ -1968,6 +2092,8 @@ class TerminalConfiguration(SHCDeviceService):
 
 
 class WallThermostatConfiguration(SHCDeviceService):
+    __slots__ = ()
+
     class ValveType(Enum):
         NORMALLY_CLOSE = "NORMALLY_CLOSE"
         NORMALLY_OPEN = "NORMALLY_OPEN"
@@ -2047,6 +2173,8 @@ class WallThermostatConfiguration(SHCDeviceService):
 
 
 class SwitchConfiguration(SHCDeviceService):
+    __slots__ = ()
+
     class SwitchType(Enum):
         NONE = "NONE"
         PUSHBUTTON = "PUSHBUTTON"
@@ -2172,6 +2300,8 @@ class OutdoorSirenService(SHCDeviceService):
     OutdoorSiren-local-openapi-v3.yml.
     """
 
+    __slots__ = ()
+
     class SoundLevel(Enum):
         LOW = "LOW"
         MEDIUM = "MEDIUM"
@@ -2297,6 +2427,8 @@ class OutdoorSirenService(SHCDeviceService):
 class OutdoorSirenPowerSupplyService(SHCDeviceService):
     """Outdoor Siren power-supply diagnostics (read-only)."""
 
+    __slots__ = ()
+
     class ConfiguredPowerSupply(Enum):
         NONE = "NONE"
         AC = "AC"
@@ -2388,6 +2520,8 @@ class KeypadTriggerService(SHCDeviceService):
     only (the actual press events arrive via the separate Keypad service).
     """
 
+    __slots__ = ()
+
     @property
     def switch_type(self) -> str | None:
         raw = self.state.get("switchType")
@@ -2421,6 +2555,8 @@ class SoftwareUpdateService(SHCDeviceService):
     all access is .get/try-guarded and any device may or may not carry it.
     """
 
+    __slots__ = ()
+
     class SwUpdateState(Enum):
         NO_UPDATE_AVAILABLE = "NO_UPDATE_AVAILABLE"
         UPDATE_AVAILABLE = "UPDATE_AVAILABLE"
@@ -2479,6 +2615,8 @@ class DimmerConfigurationService(SHCDeviceService):
     configured extremes for calibration. All access is .get-guarded.
     """
 
+    __slots__ = ()
+
     class EdgePhaseControlMode(Enum):
         TRAILING = "TRAILING"
         LEADING = "LEADING"
@@ -1,30 +1,62 @@
 from __future__ import annotations
 
-import json
 import logging
+import queue
 import threading
 import time
 import typing
 from collections import defaultdict
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Any, cast
 
-from .api import SHCAPI
+from . import codec
+from .api import SHCAPI, check_element_type
+from .callbacks import run_callback
 from .api import JSONRPCError as JSONRPCError  # noqa: F401 -- explicit re-export
 from .device import SHCDevice
 from .device_helper import SHCDeviceHelper
+from .dispatch import SHCCallbackExecutor, dispatch_key
 from .domain_impl import SHCIntrusionSystem
 from .exceptions import SHCSessionError
 from .information import SHCInformation
+from .journal import SHCEventJournal
+from .longpoll import SHCAdaptivePollWait, SHCPollResultCoalescer
 from .room import SHCRoom
 from .scenario import SHCScenario
 from .message import SHCMessage
 from .emma import SHCEmma
+from .events import (
+    DEFAULT_MAX_QUEUE as DEFAULT_EVENT_QUEUE,
+    SHCChangeEvent,
+    SHCEventFilter,
+    SHCEventStream,
+    apply_service_result,
+)
 from .userdefinedstate import SHCUserDefinedState
 from .services_impl import SUPPORTED_DEVICE_SERVICE_IDS
+from .response_cache import SHCResponseCache
+from .retry import SHCRetryPolicy
+from .scheduler import Priority, SHCRequestScheduler, scheduling_priority
+from .subscriptions import SHCSubscriptionRegistry
+from .topology_cache import (
+    SHCTopologyCache,
+    apply_service_changes,
+    diff_topology,
+    service_versions,
+)
 
 logger = logging.getLogger("boschshcpy")
 
+# Poll batches (results, resubscribed) on their way to the dispatcher thread;
+# None tells it to stop.
+_DispatchQueue = queue.Queue[tuple[list[dict[str, Any]], bool] | None]
+
+# One worker per independent enumeration GET; well below the 20-connection
+# SHCAPI pool so a parallel startup never blocks on pool checkout.
+_DEFAULT_ENUMERATION_WORKERS = 7
+
 
 class SHCSession:
     def __init__(
@@ -37,20 +69,74 @@ class SHCSession:
         long_poll_timeout: int = 10,
         verify_hostname: bool = False,
         ssl_verify: bool = True,
+        parallel_enumeration: bool = False,
+        enumeration_workers: int = _DEFAULT_ENUMERATION_WORKERS,
+        topology_cache: SHCTopologyCache | None = None,
+        coalesce_window: float | None = None,
+        streaming_enumeration: bool = False,
+        response_cache: SHCResponseCache | None = None,
+        scheduler: SHCRequestScheduler | None = None,
+        retry_policy: SHCRetryPolicy | None = None,
+        adaptive_poll_wait: SHCAdaptivePollWait | None = None,
+        pipeline_depth: int | None = None,
+        callback_executor: SHCCallbackExecutor | None = None,
+        event_journal: SHCEventJournal | None = None,
     ) -> None:
         # API
         self._long_poll_timeout = long_poll_timeout
+        # Opt-in: lengthen the long-poll wait while the house is quiet
+        # instead of always asking for long_poll_timeout (see longpoll.py).
+        self._adaptive_poll_wait = adaptive_poll_wait
+        # Opt-in: dispatch results on a separate thread, up to this many
+        # batches behind, so the next long poll is sent while callbacks run.
+        self._pipeline_depth = (
+            max(1, pipeline_depth) if pipeline_depth is not None else None
+        )
+        self._dispatch_queue: _DispatchQueue | None = None
+        self._dispatch_thread: threading.Thread | None = None
+        # Opt-in: process results on a worker pool, in order per device.
+        self._callback_executor = callback_executor
+        # Opt-in: keep the received results for replay (see journal.py).
+        self._event_journal = event_journal
+        # Opt-in: coalesce DeviceServiceData bursts per poll batch (0) or per
+        # time window in seconds (> 0) before dispatching (see longpoll.py).
+        self._coalescer = (
+            SHCPollResultCoalescer(coalesce_window)
+            if coalesce_window is not None
+            else None
+        )
+        # Opt-in: fetch the enumeration resources concurrently over the
+        # SHCAPI connection pool (see _enumerate_all_parallel).
+        self._parallel_enumeration = parallel_enumeration
+        self._enumeration_workers = max(
+            1, min(enumeration_workers, _DEFAULT_ENUMERATION_WORKERS)
+        )
+        # Opt-in: stream /services and /devices in the serial enumeration,
+        # building each device as soon as it has been received.
+        self._streaming_enumeration = streaming_enumeration
+        # Opt-in warm start from an on-disk snapshot (see _warm_start)
+        self._topology_cache = topology_cache
+        self._reconcile_thread: threading.Thread | None = None
         self._api = SHCAPI(
             controller_ip=controller_ip,
             certificate=certificate,
             key=key,
             verify_hostname=verify_hostname,
             ssl_verify=ssl_verify,
+            response_cache=response_cache,
+            scheduler=scheduler,
+            retry_policy=retry_policy,
         )
+        # Opt-in: back off per policy after poll errors instead of 15 s.
+        self._retry_policy = retry_policy
+        # Long-poll events invalidate what they may have changed in the cache.
+        self._response_cache = response_cache
         self._device_helper = SHCDeviceHelper(self._api)
 
-        # Subscription status
+        # Subscription status; a poll id the SHC rejected is dropped with
+        # the next subscribe, in the same JSON-RPC batch.
         self._poll_id: str | None = None
+        self._expired_poll_id: str | None = None
 
         # SHC Information
         self._shc_information: SHCInformation | None = None
@@ -64,11 +150,18 @@ class SHCSession:
         self._domains_by_id: dict[str, Any] = {}
         self._messages_by_id: dict[str, SHCMessage] = {}
         self._userdefinedstates_by_id: dict[str, SHCUserDefinedState] = {}
-        self._subscribers: list[Any] = []
+        # Class and change subscriptions, events() streams included; state
+        # changes are only captured while a change subscription exists.
+        self._subscriptions = SHCSubscriptionRegistry()
+        self._event_streams: list[SHCEventStream] = []
         self._emma: SHCEmma = SHCEmma(self._api)
-
-        if not lazy:
-            self._enumerate_all()
+        # Long-poll result routing: "@type" -> handler, and "link" id -> handler.
+        # Integrators extend these via register_poll_result_handler() /
+        # register_link_handler().
+        self._poll_result_handlers = self._default_poll_result_handlers()
+        self._link_handlers: dict[str, Callable[[dict[str, Any]], None]] = {
+            "com.bosch.tt.emma.applink": self._handle_emma_link,
+        }
 
         self._polling_thread: threading.Thread | None = None
         self._stop_polling_thread: bool = False
@@ -81,16 +174,203 @@ class SHCSession:
             defaultdict(list)
         )
 
+        # Held while poll results are dispatched and while a topology
+        # reconcile applies its differences, so the two never interleave.
+        self._topology_lock = threading.RLock()
+        self._reconcile_pending = False
+
+        if not lazy:
+            self._enumerate_all()
+            self._start_reconcile()
+
     def _enumerate_all(self) -> None:
         self.authenticate()
-        self._enumerate_services()
-        self._enumerate_devices()
-        self._enumerate_rooms()
-        self._enumerate_scenarios()
-        self._enumerate_messages()
-        self._enumerate_userdefinedstates()
+        if self._topology_cache is not None and self._warm_start():
+            return
+        if self._parallel_enumeration:
+            self._enumerate_all_parallel()
+        else:
+            self._enumerate_services()
+            self._enumerate_devices()
+            self._enumerate_rooms()
+            self._enumerate_scenarios()
+            self._enumerate_messages()
+            self._enumerate_userdefinedstates()
+            self._initialize_domains()
+            self._initialize_emma()
+        self._save_topology()
+
+    def _enumerate_all_parallel(self) -> None:
+        """Fetch the enumeration resources concurrently, then build in order.
+
+        The blocking GETs are independent of each other (only device building
+        needs the services map), so they run on a bounded thread pool that
+        shares the SHCAPI connection pool. The objects are then built on the
+        caller's thread in exactly the serial order of _enumerate_all(), so the
+        resulting object graph is identical.
+        """
+        fetches: dict[str, Callable[[], Any]] = {
+            "services": partial(self._api.get_services, validate=False),
+            "devices": self._api.get_devices,
+            "rooms": self._api.get_rooms,
+            "scenarios": self._api.get_scenarios,
+            "messages": self._api.get_messages,
+            "userdefinedstates": self._api.get_userdefinedstates,
+            "domains": self._api.get_domain_intrusion_detection,
+        }
+        with ThreadPoolExecutor(
+            max_workers=self._enumeration_workers,
+            thread_name_prefix="SHCEnumeration",
+        ) as executor:
+            futures = {name: executor.submit(fetch) for name, fetch in fetches.items()}
+            try:
+                raw = {name: future.result() for name, future in futures.items()}
+            except BaseException:
+                for future in futures.values():
+                    future.cancel()
+                raise
+
+        self._load_services(raw["services"], validate=True)
+        self._load_devices(raw["devices"])
+        self._load_rooms(raw["rooms"])
+        self._load_scenarios(raw["scenarios"])
+        self._load_messages(raw["messages"])
+        self._load_userdefinedstates(raw["userdefinedstates"])
+        self._load_domains(raw["domains"])
+        self._initialize_emma()
+
+    def _warm_start(self) -> bool:
+        """Build the device graph from the topology snapshot, if there is one.
+
+        Returns False on a cache miss so the caller falls back to a cold
+        enumeration. On a hit the session is usable immediately and
+        reconcile_topology() runs on a background thread to pull in whatever
+        changed while the session was down.
+        """
+        assert self._topology_cache is not None and self._shc_information is not None
+        snapshot = self._topology_cache.load(self._shc_information.macAddress)
+        if snapshot is None:
+            return False
+        logger.debug(
+            "Building topology from snapshot with %d device(s)",
+            len(snapshot["devices"]),
+        )
+        self._load_services(snapshot["services"])
+        self._load_devices(snapshot["devices"])
+        self._load_rooms(snapshot["rooms"])
+        self._load_scenarios(snapshot["scenarios"])
+        self._load_userdefinedstates(snapshot["userdefinedstates"])
+        # The IDS arming/alarm state is never taken from the snapshot.
         self._initialize_domains()
         self._initialize_emma()
+        self._reconcile_pending = True
+        return True
+
+    def _start_reconcile(self) -> None:
+        """Start the reconcile a warm start left pending on a background thread.
+
+        Called once the session is fully constructed: the thread dispatches
+        results through the same handlers as the polling thread.
+        """
+        if not self._reconcile_pending:
+            return
+        self._reconcile_pending = False
+
+        def reconcile_thread_main() -> None:
+            try:
+                self.reconcile_topology()
+            except Exception as ex:
+                logger.warning("Topology reconcile with the SHC failed: %s", ex)
+            finally:
+                self._reconcile_thread = None
+
+        self._reconcile_thread = threading.Thread(
+            target=reconcile_thread_main,
+            name="SHCTopologyReconcileThread",
+            daemon=True,
+        )
+        self._reconcile_thread.start()
+
+    def reconcile_topology(self) -> None:
+        """Re-fetch the topology from the SHC and apply the differences.
+
+        The differences come from topology_cache.diff_topology: service state
+        changes go through SHCDevice.process_refresh_result (so only changed
+        services fire callbacks), services a device did not have yet are
+        added, and new, changed and removed devices and user-defined states
+        are fed through the long-poll result handler, exactly like the
+        ``device``/``userDefinedState`` events the SHC sends while polling.
+        The topology snapshot is rewritten afterwards.
+
+        The GETs run unlocked; the differences are applied under the topology
+        lock, so no poll result is processed in between. A service updated
+        by a poll result during the GETs keeps that newer state. Rooms,
+        scenarios and messages are rebuilt aside and swapped in with one
+        assignment each.
+        """
+        with self._topology_lock:
+            self._join_callback_executor()
+            versions = service_versions(self._devices_by_id.values())
+        raw_services = self._api.get_services()
+        raw_devices = self._api.get_devices()
+        raw_rooms = self._api.get_rooms()
+        raw_scenarios = self._api.get_scenarios()
+        raw_messages = self._api.get_messages()
+        raw_states = self._api.get_userdefinedstates()
+
+        with self._topology_lock:
+            self._join_callback_executor()
+            diff = diff_topology(
+                self._devices_by_id,
+                self._userdefinedstates_by_id,
+                versions,
+                raw_services,
+                raw_devices,
+                raw_states,
+            )
+            for raw_result in diff.poll_results:
+                self._process_long_polling_poll_result(raw_result)
+            apply_service_changes(diff, self._subscriptions)
+            for state_id in diff.removed_state_ids:
+                self._userdefinedstates_by_id.pop(state_id, None)
+            self._rooms_by_id = self._build_rooms(raw_rooms)
+            self._scenarios_by_id = self._build_scenarios(raw_scenarios)
+            self._messages_by_id = self._build_messages(raw_messages)
+        self._save_topology()
+
+    def _join_callback_executor(self) -> None:
+        """Wait for the results already handed to the callback workers."""
+        executor = self._callback_executor
+        if executor is not None:
+            executor.join()
+
+    def _topology_resources(self) -> dict[str, list[Any]]:
+        devices = list(self._devices_by_id.values())
+        return {
+            "services": [
+                service._raw_device_service
+                for device in devices
+                for service in device.device_services
+            ],
+            "devices": [device._raw_device for device in devices],
+            "rooms": [room._raw_room for room in self._rooms_by_id.values()],
+            "scenarios": [
+                scenario._raw_scenario for scenario in self._scenarios_by_id.values()
+            ],
+            "userdefinedstates": [
+                state._raw_state for state in self._userdefinedstates_by_id.values()
+            ],
+        }
+
+    def _save_topology(self) -> None:
+        if self._topology_cache is None or self._shc_information is None:
+            return
+        try:
+            self._topology_cache.save(
+                self._shc_information.macAddress, self._topology_resources()
+            )
+        except OSError as ex:
+            logger.warning("Could not write topology snapshot: %s", ex)
 
     def _add_device(
         self, raw_device: dict[str, Any], update_services: bool = False
@@ -123,42 +403,79 @@ class SHCSession:
         self._devices_by_id[device_id].update_raw_information(raw_device)
 
     def _enumerate_services(self) -> None:
-        raw_services = self._api.get_services()
+        if self._streaming_enumeration:
+            # Unsupported services are dropped while the body is parsed.
+            self._load_services(self._api.iter_services(SUPPORTED_DEVICE_SERVICE_IDS))
+            return
+        # Element @types are checked while the services are grouped instead
+        # of in a separate pass inside SHCAPI.
+        self._load_services(self._api.get_services(validate=False), validate=True)
+
+    def _load_services(
+        self, raw_services: Iterable[dict[str, Any]], validate: bool = False
+    ) -> None:
         for service in raw_services:
+            if validate and service.get("@type") != "DeviceServiceData":
+                check_element_type(service, "DeviceServiceData")
             if service["id"] not in SUPPORTED_DEVICE_SERVICE_IDS:
                 continue
             device_id = service["deviceId"]
             self._services_by_device_id[device_id].append(service)
 
     def _enumerate_devices(self) -> None:
-        raw_devices = self._api.get_devices()
+        if self._streaming_enumeration:
+            self._load_devices(self._api.iter_devices())
+            return
+        self._load_devices(self._api.get_devices())
 
+    def _load_devices(self, raw_devices: Iterable[dict[str, Any]]) -> None:
         for raw_device in raw_devices:
             self._add_device(raw_device)
 
     def _enumerate_rooms(self) -> None:
-        raw_rooms = self._api.get_rooms()
-        for raw_room in raw_rooms:
-            room_id = raw_room["id"]
-            room = SHCRoom(api=self._api, raw_room=raw_room)
-            self._rooms_by_id[room_id] = room
+        self._load_rooms(self._api.get_rooms())
+
+    def _load_rooms(self, raw_rooms: list[dict[str, Any]]) -> None:
+        self._rooms_by_id.update(self._build_rooms(raw_rooms))
+
+    def _build_rooms(self, raw_rooms: list[dict[str, Any]]) -> dict[str, SHCRoom]:
+        return {
+            raw_room["id"]: SHCRoom(api=self._api, raw_room=raw_room)
+            for raw_room in raw_rooms
+        }
 
     def _enumerate_scenarios(self) -> None:
-        raw_scenarios = self._api.get_scenarios()
-        for raw_scenario in raw_scenarios:
-            scenario_id = raw_scenario["id"]
-            scenario = SHCScenario(api=self._api, raw_scenario=raw_scenario)
-            self._scenarios_by_id[scenario_id] = scenario
+        self._load_scenarios(self._api.get_scenarios())
+
+    def _load_scenarios(self, raw_scenarios: list[dict[str, Any]]) -> None:
+        self._scenarios_by_id.update(self._build_scenarios(raw_scenarios))
+
+    def _build_scenarios(
+        self, raw_scenarios: list[dict[str, Any]]
+    ) -> dict[str, SHCScenario]:
+        return {
+            raw_scenario["id"]: SHCScenario(api=self._api, raw_scenario=raw_scenario)
+            for raw_scenario in raw_scenarios
+        }
 
     def _enumerate_messages(self) -> None:
-        raw_messages = self._api.get_messages()
-        for raw_message in raw_messages:
-            message_id = raw_message["id"]
-            message = SHCMessage(api=self._api, raw_message=raw_message)
-            self._messages_by_id[message_id] = message
+        self._load_messages(self._api.get_messages())
+
+    def _load_messages(self, raw_messages: list[dict[str, Any]]) -> None:
+        self._messages_by_id.update(self._build_messages(raw_messages))
+
+    def _build_messages(
+        self, raw_messages: list[dict[str, Any]]
+    ) -> dict[str, SHCMessage]:
+        return {
+            raw_message["id"]: SHCMessage(api=self._api, raw_message=raw_message)
+            for raw_message in raw_messages
+        }
 
     def _enumerate_userdefinedstates(self) -> None:
-        raw_states = self._api.get_userdefinedstates()
+        self._load_userdefinedstates(self._api.get_userdefinedstates())
+
+    def _load_userdefinedstates(self, raw_states: list[dict[str, Any]]) -> None:
         for raw_state in raw_states:
             userdefinedstate_id = raw_state["id"]
             userdefinedstate = SHCUserDefinedState(
@@ -169,10 +486,13 @@ class SHCSession:
             self._userdefinedstates_by_id[userdefinedstate_id] = userdefinedstate
 
     def _initialize_domains(self) -> None:
+        self._load_domains(self._api.get_domain_intrusion_detection())
+
+    def _load_domains(self, raw_ids: dict[str, Any]) -> None:
         assert self._shc_information is not None
         self._domains_by_id["IDS"] = SHCIntrusionSystem(
             self._api,
-            self._api.get_domain_intrusion_detection(),
+            raw_ids,
             self._shc_information.macAddress,
         )
 
@@ -180,48 +500,48 @@ class SHCSession:
         self._emma = SHCEmma(self._api, self._shc_information, None)
 
     def _long_poll(self, wait_seconds: int | None = None) -> bool:
+        adaptive = self._adaptive_poll_wait if wait_seconds is None else None
         if wait_seconds is None:
-            wait_seconds = self._long_poll_timeout
+            wait_seconds = (
+                adaptive.wait_seconds()
+                if adaptive is not None
+                else self._long_poll_timeout
+            )
+        coalescer = self._coalescer
+        if coalescer is not None:
+            wait_seconds = coalescer.wait_seconds(wait_seconds)
         resubscribed = False
         if self._poll_id is None:
-            self._poll_id = self.api.long_polling_subscribe()
+            expired_poll_id, self._expired_poll_id = self._expired_poll_id, None
+            if expired_poll_id is None:
+                self._poll_id = self.api.long_polling_subscribe()
+            else:
+                self._poll_id = self.api.long_polling_resubscribe(expired_poll_id)
             logger.debug(f"Subscribed for long poll. Poll id: {self._poll_id}")
             resubscribed = True
         try:
             raw_results = self.api.long_polling_poll(self._poll_id, wait_seconds)
-            for raw_result in raw_results:
-                self._process_long_polling_poll_result(raw_result)
-
-            if resubscribed:
-                # Refresh all device-service states after a poll-id resubscribe
-                # (#183): the SHC invalidates poll IDs roughly every 24 h; any
-                # device state that changed during the gap is not delivered in the
-                # next long-poll response.  Calling device.update() issues a
-                # short-poll (GET /devices/<id>/services/<svc>) for every
-                # registered service so listeners receive current state.  This
-                # runs on the SHCPollingThread — no event-loop involvement.
-                logger.debug(
-                    "Poll-id resubscribed — refreshing %d device(s) via short-poll (#183)",
-                    len(self._devices_by_id),
+            if self._event_journal is not None:
+                self._event_journal.record(raw_results, gap=resubscribed)
+            if adaptive is not None:
+                adaptive.observe(len(raw_results))
+            if coalescer is not None:
+                coalescer.add(raw_results)
+                # Flush before a resubscribe refresh so buffered (older)
+                # states can't overwrite the freshly fetched ones.
+                raw_results = (
+                    coalescer.drain() if coalescer.ready() or resubscribed else []
                 )
-                for device in list(self._devices_by_id.values()):
-                    try:
-                        # fire_callbacks=True so listeners (HA entity closures)
-                        # are notified of any state that changed during the
-                        # poll-id gap (#183).  The ordinary HA poll path calls
-                        # device.update() without this flag and stays quiet.
-                        device.update(fire_callbacks=True)
-                    except Exception as ex:  # noqa: BLE001
-                        logger.warning(
-                            "Short-poll refresh failed for device %s after resubscribe: %s",
-                            device.id,
-                            ex,
-                        )
-
+            dispatch_queue = self._dispatch_queue
+            if dispatch_queue is None:
+                self._dispatch_batch(raw_results, resubscribed)
+            elif raw_results or resubscribed:
+                # Blocks while the dispatcher is pipeline_depth batches behind.
+                dispatch_queue.put((raw_results, resubscribed))
             return True
         except JSONRPCError as json_rpc_error:
             if json_rpc_error.code == -32001:
-                self._poll_id = None
+                self._expired_poll_id, self._poll_id = self._poll_id, None
                 logger.debug(
                     "SHC claims unknown poll id. Invalidating poll id and trying resubscribe next time..."
                 )
@@ -229,101 +549,233 @@ class SHCSession:
             else:
                 raise json_rpc_error
 
+    def _dispatch_batch(
+        self, raw_results: list[dict[str, Any]], resubscribed: bool
+    ) -> None:
+        with self._topology_lock:
+            executor = self._callback_executor
+            for raw_result in raw_results:
+                if executor is None:
+                    self._process_long_polling_poll_result(raw_result)
+                else:
+                    executor.submit(
+                        dispatch_key(raw_result),
+                        self._process_long_polling_poll_result,
+                        raw_result,
+                    )
+
+            if resubscribed:
+                if executor is not None:
+                    # Queued (older) states must not overwrite the refreshed ones.
+                    executor.join()
+                # Bulk refresh: let user requests overtake it (scheduler.py).
+                with scheduling_priority(Priority.BACKGROUND):
+                    self._resync_device_services()
+
+    def _dispatch_thread_main(self, dispatch_queue: _DispatchQueue) -> None:
+        """Dispatch queued poll batches until the ``None`` sentinel."""
+        while True:
+            batch = dispatch_queue.get()
+            if batch is None:
+                return
+            try:
+                self._dispatch_batch(*batch)
+            except Exception as ex:
+                logger.error(f"Error dispatching long poll results: {ex}")
+
+    def _resync_device_services(self) -> None:
+        """Refresh every device-service state after a poll-id resubscribe (#183).
+
+        The SHC invalidates poll IDs roughly every 24 h; any device state that
+        changed during the gap is not delivered in the next long-poll response.
+        A single GET /services returns the current state of every service, and
+        each entry goes through SHCDevice.process_refresh_result, so listeners
+        (HA entity closures) are notified only for services whose state
+        actually changed — instead of one short-poll GET per service and a
+        callback for every one of them. If the bulk GET fails, fall back to
+        the per-service short-poll sweep. Runs on the SHCPollingThread.
+        """
+        logger.debug(
+            "Poll-id resubscribed — refreshing %d device(s) via GET /services (#183)",
+            len(self._devices_by_id),
+        )
+        try:
+            raw_services = self._api.get_services()
+        except Exception as ex:  # noqa: BLE001
+            logger.warning(
+                "Bulk service refresh failed after resubscribe (%s); "
+                "falling back to per-device short-poll",
+                ex,
+            )
+            for device in list(self._devices_by_id.values()):
+                try:
+                    device.update(fire_callbacks=True)
+                except Exception as ex:  # noqa: BLE001
+                    logger.warning(
+                        "Short-poll refresh failed for device %s after resubscribe: %s",
+                        device.id,
+                        ex,
+                    )
+            return
+
+        changed = 0
+        for raw_service in raw_services:
+            owner = self._devices_by_id.get(raw_service.get("deviceId"))
+            if owner is not None and apply_service_result(
+                self._subscriptions, owner, raw_service, owner.process_refresh_result
+            ):
+                changed += 1
+        logger.debug("%d service state(s) changed during the poll-id gap", changed)
+
     def _maybe_unsubscribe(self) -> None:
         if self._poll_id is not None:
             self.api.long_polling_unsubscribe(self._poll_id)
             logger.debug(f"Unsubscribed from long poll w/ poll id {self._poll_id}")
             self._poll_id = None
 
+    def _default_poll_result_handlers(
+        self,
+    ) -> dict[str, Callable[[dict[str, Any]], None]]:
+        handlers: dict[str, Callable[[dict[str, Any]], None]] = {
+            "DeviceServiceData": self._handle_device_service_data,
+            "message": self._handle_message,
+            "scenarioTriggered": self._handle_scenario_triggered,
+            "device": self._handle_device,
+            "userDefinedState": self._handle_userdefinedstate,
+            "link": self._handle_link,
+        }
+        for domain_state in SHCIntrusionSystem.DOMAIN_STATES:
+            handlers[domain_state] = self._handle_domain_state
+        return handlers
+
+    def register_poll_result_handler(
+        self, result_type: str, handler: Callable[[dict[str, Any]], None]
+    ) -> None:
+        """Route long-poll results with ``@type == result_type`` to ``handler``.
+
+        Replaces the built-in handler for that type, if any. Handlers run on
+        the polling thread and receive the raw result dict.
+        """
+        self._poll_result_handlers[result_type] = handler
+
+    def register_link_handler(
+        self, link_id: str, handler: Callable[[dict[str, Any]], None]
+    ) -> None:
+        """Route ``link`` long-poll results with the given ``id`` to ``handler``."""
+        self._link_handlers[link_id] = handler
+
     def _process_long_polling_poll_result(self, raw_result: dict[str, Any]) -> None:
-        logger.debug(f"Long poll: {raw_result}")
-        if raw_result["@type"] == "DeviceServiceData":
-            device_id = raw_result["deviceId"]
-            if device_id in self._devices_by_id:  # [S1]
-                device = self._devices_by_id[device_id]
-                device.process_long_polling_poll_result(raw_result)
-            else:
-                logger.debug(
-                    f"Skipping polling result with unknown device id {device_id}."
-                )
+        logger.debug("Long poll: %s", raw_result)
+        if self._response_cache is not None:
+            self._response_cache.invalidate_for_event(raw_result)
+        handler = self._poll_result_handlers.get(raw_result["@type"])
+        if handler is None:
+            logger.debug("No handler for long poll result type %s", raw_result["@type"])
             return
-        if raw_result["@type"] == "message":
-            # The SHC can emit messages without "arguments" (e.g. during boot /
-            # firmware update); guard instead of asserting so the poll thread
-            # survives and -O builds don't KeyError.
-            if "arguments" in raw_result and (
-                "deviceServiceDataModel" in raw_result["arguments"]
-            ):
-                raw_data_model = json.loads(
-                    raw_result["arguments"]["deviceServiceDataModel"]
-                )
-                self._process_long_polling_poll_result(raw_data_model)
-            else:
-                # callback is missing when receiving new message
-                message_id = raw_result["id"]
-                message = SHCMessage(api=self._api, raw_message=raw_result)
-                self._messages_by_id[message_id] = message
-            return
-        if raw_result["@type"] == "scenarioTriggered":
-            if raw_result["id"] in self._scenario_callbacks:
-                self._scenario_callbacks[raw_result["id"]](raw_result)
+        handler(raw_result)
+
+    def _handle_device_service_data(self, raw_result: dict[str, Any]) -> None:
+        device_id = raw_result["deviceId"]
+        device = self._devices_by_id.get(device_id)  # [S1]
+        if device is not None:
+            apply_service_result(
+                self._subscriptions,
+                device,
+                raw_result,
+                device.process_long_polling_poll_result,
+            )
+        else:
+            logger.debug(
+                "Skipping polling result with unknown device id %s.", device_id
+            )
+
+    def _handle_message(self, raw_result: dict[str, Any]) -> None:
+        # The SHC can emit messages without "arguments" (e.g. during boot /
+        # firmware update); guard instead of asserting so the poll thread
+        # survives and -O builds don't KeyError.
+        if "arguments" in raw_result and (
+            "deviceServiceDataModel" in raw_result["arguments"]
+        ):
+            raw_data_model = codec.loads(
+                raw_result["arguments"]["deviceServiceDataModel"]
+            )
+            self._process_long_polling_poll_result(raw_data_model)
+        else:
+            # callback is missing when receiving new message
+            message_id = raw_result["id"]
+            message = SHCMessage(api=self._api, raw_message=raw_result)
+            self._messages_by_id[message_id] = message
+
+    def _handle_scenario_triggered(self, raw_result: dict[str, Any]) -> None:
+        if raw_result["id"] in self._scenario_callbacks:
+            run_callback(self._scenario_callbacks[raw_result["id"]], raw_result)
+        if (
+            "shc" in self._scenario_callbacks
+        ):  # deprecated for providing bosch_shc.event trigger callbacks
+            run_callback(self._scenario_callbacks["shc"], raw_result)
+
+    def _handle_device(self, raw_result: dict[str, Any]) -> None:
+        device_id = raw_result["id"]
+        if device_id in self._devices_by_id:  # [S1]
+            self._update_device(raw_result)
             if (
-                "shc" in self._scenario_callbacks
-            ):  # deprecated for providing bosch_shc.event trigger callbacks
-                self._scenario_callbacks["shc"](raw_result)
-            return
-        if raw_result["@type"] == "device":
-            device_id = raw_result["id"]
-            if device_id in self._devices_by_id:  # [S1]
-                self._update_device(raw_result)
-                if (
-                    "deleted" in raw_result and raw_result["deleted"] is True
-                ):  # Device deleted
-                    logger.debug("Deleting device with id %s", device_id)
-                    self._services_by_device_id.pop(device_id, None)
-                    self._devices_by_id.pop(device_id, None)
-            else:  # New device registered
-                logger.debug("Found new device with id %s", device_id)
-                new_device = self._add_device(raw_result, update_services=True)
-                if new_device is not None:
-                    for instance, callback in list(self._subscribers):
-                        if isinstance(new_device, instance):
-                            callback(new_device)
-            return
-        if raw_result["@type"] in SHCIntrusionSystem.DOMAIN_STATES:
-            if self.intrusion_system is not None:
-                self.intrusion_system.process_long_polling_poll_result(raw_result)
-            return
-        if raw_result["@type"] == "userDefinedState":
-            state_id = raw_result["id"]
-            if state_id in self._userdefinedstates_by_id:
-                self._userdefinedstates_by_id[state_id].update_raw_information(
-                    raw_result
-                )
-            else:
-                userdefinedstate = SHCUserDefinedState(
-                    api=self._api,
-                    info=cast(SHCInformation, self.information),
-                    raw_state=raw_result,
-                )
-                self._userdefinedstates_by_id[state_id] = userdefinedstate
-                for instance, callback in list(self._subscribers):
-                    if isinstance(userdefinedstate, instance):
-                        callback(userdefinedstate)
-            if state_id in self._userdefinedstate_callbacks:
-                for callback in list(self._userdefinedstate_callbacks[state_id]):
-                    callback()
-            return
-        if raw_result["@type"] == "link":
-            link_id = raw_result["id"]
-            if link_id == "com.bosch.tt.emma.applink":
-                self._emma.update_emma_data(raw_result)
-        return
+                "deleted" in raw_result and raw_result["deleted"] is True
+            ):  # Device deleted
+                logger.debug("Deleting device with id %s", device_id)
+                self._services_by_device_id.pop(device_id, None)
+                self._devices_by_id.pop(device_id, None)
+        else:  # New device registered
+            logger.debug("Found new device with id %s", device_id)
+            new_device = self._add_device(raw_result, update_services=True)
+            if new_device is not None:
+                for callback in self._subscriptions.class_subscribers(new_device):
+                    run_callback(callback, new_device)
+
+    def _handle_domain_state(self, raw_result: dict[str, Any]) -> None:
+        if self.intrusion_system is not None:
+            self.intrusion_system.process_long_polling_poll_result(raw_result)
+
+    def _handle_userdefinedstate(self, raw_result: dict[str, Any]) -> None:
+        state_id = raw_result["id"]
+        if state_id in self._userdefinedstates_by_id:
+            self._userdefinedstates_by_id[state_id].update_raw_information(raw_result)
+        else:
+            userdefinedstate = SHCUserDefinedState(
+                api=self._api,
+                info=cast(SHCInformation, self.information),
+                raw_state=raw_result,
+            )
+            self._userdefinedstates_by_id[state_id] = userdefinedstate
+            for callback in self._subscriptions.class_subscribers(userdefinedstate):
+                run_callback(callback, userdefinedstate)
+        if state_id in self._userdefinedstate_callbacks:
+            for callback in list(self._userdefinedstate_callbacks[state_id]):
+                run_callback(callback)
+
+    def _handle_link(self, raw_result: dict[str, Any]) -> None:
+        handler = self._link_handlers.get(raw_result["id"])
+        if handler is not None:
+            handler(raw_result)
+
+    def _handle_emma_link(self, raw_result: dict[str, Any]) -> None:
+        self._emma.update_emma_data(raw_result)
 
     def start_polling(self) -> None:
         if self._polling_thread is None:
+            dispatch_queue: _DispatchQueue | None = None
+            if self._pipeline_depth is not None:
+                dispatch_queue = queue.Queue(maxsize=self._pipeline_depth)
+                self._dispatch_thread = threading.Thread(
+                    target=self._dispatch_thread_main,
+                    args=(dispatch_queue,),
+                    name="SHCDispatchThread",
+                    daemon=True,
+                )
+                self._dispatch_thread.start()
+            self._dispatch_queue = dispatch_queue
 
             def polling_thread_main() -> None:
+                failures = 0
                 try:
                     while not self._stop_polling_thread:
                         try:
@@ -332,6 +784,7 @@ class SHCSession:
                                     "_long_poll returned False. Waiting 1 second."
                                 )
                                 time.sleep(1.0)
+                            failures = 0
                         except RuntimeError as err:
                             self._stop_polling_thread = True
                             logger.debug(
@@ -345,10 +798,13 @@ class SHCSession:
                                 logger.debug(f"Unsubscribe not successful: {ex}")
 
                         except Exception as ex:
+                            failures += 1
+                            delay = self._error_backoff(failures)
                             logger.error(
-                                f"Error in polling thread: {ex}. Waiting 15 seconds."
+                                f"Error in polling thread: {ex}. "
+                                f"Waiting {delay:.1f} seconds."
                             )
-                            time.sleep(15.0)
+                            time.sleep(delay)
                 finally:
                     # Ensure the handle is cleared however the thread exits, so a
                     # dead thread (e.g. after the RuntimeError path above) doesn't
@@ -362,6 +818,10 @@ class SHCSession:
                     # already reset by the RuntimeError branch's own
                     # _maybe_unsubscribe() above when that path is taken, and by
                     # stop_polling() itself on the normal path.
+                    if dispatch_queue is not None:
+                        # The dispatcher exits after the batches still queued.
+                        self._dispatch_queue = None
+                        dispatch_queue.put(None)
                     self._polling_thread = None
 
             self._polling_thread = threading.Thread(
@@ -372,6 +832,12 @@ class SHCSession:
         else:
             raise SHCSessionError("Already polling!")
 
+    def _error_backoff(self, failures: int) -> float:
+        """Seconds to wait after ``failures`` consecutive poll errors."""
+        if self._retry_policy is None:
+            return 15.0
+        return self._retry_policy.backoff(failures)
+
     def stop_polling(self) -> None:
         # Capture a local reference: the thread's own finally-block can clear
         # self._polling_thread concurrently (e.g. after a RuntimeError), which
@@ -382,25 +848,78 @@ class SHCSession:
             logger.debug("Unsubscribing from long poll")
             self._stop_polling_thread = True
             # The polling thread may be blocked inside a long-poll HTTP call
-            # (timeout = long_poll_timeout + 5). Bound the join so an in-flight
-            # poll can't wedge HA shutdown for the full timeout; the daemon
-            # thread is reaped by the interpreter if it outlives the join.
-            polling_thread.join(timeout=self._long_poll_timeout + 10)
+            # (timeout = wait + 5). Bound the join so an in-flight poll can't
+            # wedge HA shutdown for the full timeout; the daemon thread is
+            # reaped by the interpreter if it outlives the join.
+            adaptive = self._adaptive_poll_wait
+            join_timeout = (
+                adaptive.current_wait
+                if adaptive is not None
+                else self._long_poll_timeout
+            ) + 10
+            polling_thread.join(timeout=join_timeout)
             if polling_thread.is_alive():
                 logger.warning(
                     "Long-poll thread did not stop within %ss; it will be "
                     "reaped on interpreter exit",
-                    self._long_poll_timeout + 10,
+                    join_timeout,
                 )
+            dispatch_thread = self._dispatch_thread
+            self._dispatch_thread = None
+            if dispatch_thread is not None and not polling_thread.is_alive():
+                dispatch_thread.join(timeout=10)
+            if self._callback_executor is not None:
+                self._callback_executor.shutdown(timeout=10)
 
             self._maybe_unsubscribe()
             self._polling_thread = None
             self._poll_id = None
+            self._close_event_streams()
+            if self._event_journal is not None:
+                self._event_journal.close()
         else:
             raise SHCSessionError("Not polling!")
 
+    def events(
+        self,
+        filter: SHCEventFilter | None = None,
+        max_queue: int = DEFAULT_EVENT_QUEUE,
+    ) -> SHCEventStream:
+        """Blocking iterator over service state changes (see events.py).
+
+        Use it as a context manager, or close() it, to stop receiving
+        events; it also ends when polling stops.
+        """
+
+        def on_close(stream: SHCEventStream) -> None:
+            self._event_streams.remove(stream)
+            self._subscriptions.remove(token)
+
+        stream = SHCEventStream(None, max_queue, on_close)
+        token = self._subscriptions.add_changes(stream.publish, filter)
+        self._event_streams.append(stream)
+        return stream
+
+    def subscribe_changes(
+        self,
+        callback: Callable[[SHCChangeEvent], Any],
+        filter: SHCEventFilter | None = None,
+    ) -> Callable[[], None]:
+        """Call ``callback`` with every service state change ``filter``
+        accepts; returns a function that unsubscribes it."""
+        return partial(
+            self._subscriptions.remove,
+            self._subscriptions.add_changes(callback, filter),
+        )
+
+    def _close_event_streams(self) -> None:
+        for stream in list(self._event_streams):
+            stream.close()
+
     def subscribe(self, callback_tuple: Any) -> None:
-        self._subscribers.append(callback_tuple)
+        """Call ``callback`` with each new device or user-defined state
+        that is an instance of ``cls``; ``callback_tuple`` is (cls, callback)."""
+        self._subscriptions.add_class(*callback_tuple)
 
     def subscribe_scenario_callback(
         self, scenario_id: str, callback: Callable[..., Any]
@@ -31,26 +31,67 @@ unsubscribes and closes the API session.
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
+import time
 from collections import defaultdict
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager, suppress
+from functools import partial
 from typing import Any, Sequence, cast
 
+from . import codec
+from .api import check_element_type
 from .api_async import JSONRPCError as JSONRPCError, SHCAPIAsync  # noqa: F401
+from .callbacks import (
+    DEFAULT_MAX_CONCURRENCY,
+    SHCCallbackTasks,
+    coroutine_callbacks,
+    run_callback,
+)
 from .device import SHCDevice
 from .device_helper import SHCDeviceHelper
 from .domain_impl import SHCIntrusionSystem
 from .emma import SHCEmma
+from .events import (
+    DEFAULT_MAX_QUEUE as DEFAULT_EVENT_QUEUE,
+    SHCChangeEvent,
+    SHCEventFilter,
+    SHCEventStreamAsync,
+    apply_service_result,
+)
+from .journal import SHCEventJournal
+from .longpoll import SHCAdaptivePollWait, SHCPollResultCoalescer
 from .exceptions import SHCAuthenticationError, SHCConnectionError, SHCSessionError
 from .message import SHCMessage
 from .room import SHCRoom
 from .scenario import SHCScenario
 from .services_impl import SUPPORTED_DEVICE_SERVICE_IDS
+from .response_cache import SHCResponseCache
+from .retry import SHCRetryPolicy
+from .scheduler import Priority, SHCRequestSchedulerAsync, scheduling_priority
+from .subscriptions import SHCSubscriptionRegistry
+from .topology_cache import (
+    SHCTopologyCache,
+    apply_service_changes,
+    diff_topology,
+    service_versions,
+)
 from .userdefinedstate import SHCUserDefinedState
 
 logger = logging.getLogger("boschshcpy")
 
+# Long-poll result handler: a plain function, or a coroutine function whose
+# result the session awaits.
+PollResultHandler = Callable[[dict[str, Any]], Awaitable[None] | None]
+
+# Poll batches (results, resubscribed) on their way to the dispatcher task;
+# None stops it.
+_DispatchQueue = asyncio.Queue[tuple[list[dict[str, Any]], bool] | None]
+
+# How long a stopping poll loop lets the dispatcher work off its queue
+# (mirrors the dispatcher join in SHCSession.stop_polling).
+_DISPATCH_DRAIN_TIMEOUT = 10.0
+
 # Backoff constants (mirroring sync session.py polling_thread_main)
 _BACKOFF_STALE_POLL_ID = 1.0  # seconds to wait after -32001 before next iteration
 _BACKOFF_OTHER_ERROR = 15.0  # seconds to wait after unexpected error
@@ -83,6 +124,15 @@ class SHCSessionAsync:
         external_session: Any | None = None,
         long_poll_timeout: int = 30,
         ssl_context: Any | None = None,
+        topology_cache: SHCTopologyCache | None = None,
+        coalesce_window: float | None = None,
+        response_cache: SHCResponseCache | None = None,
+        scheduler: SHCRequestSchedulerAsync | None = None,
+        retry_policy: SHCRetryPolicy | None = None,
+        adaptive_poll_wait: SHCAdaptivePollWait | None = None,
+        pipeline_depth: int | None = None,
+        max_callback_tasks: int = DEFAULT_MAX_CONCURRENCY,
+        event_journal: SHCEventJournal | None = None,
     ) -> None:
         """Initialise without doing any I/O.
 
@@ -99,8 +149,50 @@ class SHCSessionAsync:
             ssl_context: Optional pre-built mTLS SSLContext (see SHCAPIAsync).
                 Pass one built off the event loop to avoid blocking file I/O
                 when constructing on the loop.
+            topology_cache: Optional SHCTopologyCache.  When it holds a
+                snapshot for this controller, async_init() builds the device
+                graph from it and reconciles with the SHC in a background task.
+            coalesce_window: Optional.  0 keeps only the last DeviceServiceData
+                per (deviceId, service id) of each poll batch; a positive
+                value buffers consecutive batches for that many seconds
+                before dispatching them coalesced.  None (default) dispatches
+                every result as received.
+            response_cache: Optional SHCResponseCache serving rooms,
+                scenarios, user-defined states and the information block
+                from memory; long-poll events invalidate its entries.
+            scheduler: Optional SHCRequestSchedulerAsync rate-limiting and
+                prioritising requests; the resubscribe refresh is scheduled
+                as background work.
+            retry_policy: Optional SHCRetryPolicy for requests; the poll
+                loop then also backs off per policy after errors instead of
+                waiting 15 s each time.
+            adaptive_poll_wait: Optional SHCAdaptivePollWait choosing the
+                RE/longPoll wait from the observed event rate instead of
+                always asking for long_poll_timeout.
+            pipeline_depth: Optional.  Hand received poll batches to a
+                separate dispatcher task through a queue of this many
+                batches, so the next RE/longPoll is already outstanding
+                while callbacks run.  None (default) dispatches each batch
+                before sending the next poll.
+            max_callback_tasks: How many coroutine callbacks (async def
+                listeners) may run at once; further ones wait for a slot.
+                Their exceptions are logged (see callbacks.py).
+            event_journal: Optional SHCEventJournal recording every
+                received long-poll result, and resubscribe gaps, for
+                replay by consumers that fell behind (see journal.py).
         """
         self._long_poll_timeout = long_poll_timeout
+        self._adaptive_poll_wait = adaptive_poll_wait
+        self._pipeline_depth = (
+            max(1, pipeline_depth) if pipeline_depth is not None else None
+        )
+        self._callback_tasks = SHCCallbackTasks(max_callback_tasks)
+        self._event_journal = event_journal
+        self._coalescer = (
+            SHCPollResultCoalescer(coalesce_window)
+            if coalesce_window is not None
+            else None
+        )
 
         # Build the async API layer (aiohttp lazy-imported inside SHCAPIAsync)
         self._api = SHCAPIAsync(
@@ -109,7 +201,13 @@ class SHCSessionAsync:
             key=key,
             external_session=external_session,
             ssl_context=ssl_context,
+            response_cache=response_cache,
+            scheduler=scheduler,
+            retry_policy=retry_policy,
         )
+        self._retry_policy = retry_policy
+        # Long-poll events invalidate what they may have changed in the cache.
+        self._response_cache = response_cache
 
         # SHCDeviceHelper mirrors the sync path — it takes a sync SHCAPI but
         # only stores it (never calls it at init).  The async session passes
@@ -126,15 +224,35 @@ class SHCSessionAsync:
         self._domains_by_id: dict[str, Any] = {}
         self._messages_by_id: dict[str, SHCMessage] = {}
         self._userdefinedstates_by_id: dict[str, SHCUserDefinedState] = {}
-        self._subscribers: list[Any] = []
+        # Class and change subscriptions, events() streams included; state
+        # changes are only captured while a change subscription exists.
+        self._subscriptions = SHCSubscriptionRegistry()
+        self._event_streams: list[SHCEventStreamAsync] = []
         self._emma: SHCEmma | None = None
+        # Long-poll result routing: "@type" -> handler, and "link" id -> handler
+        self._poll_result_handlers = self._default_poll_result_handlers()
+        self._link_handlers: dict[str, PollResultHandler] = {
+            "com.bosch.tt.emma.applink": self._handle_emma_link,
+        }
 
         # SHC information (populated by async_init)
         self._shc_information: Any = None
 
+        # Per-phase durations (seconds) of the last async_init()
+        self._startup_timings: dict[str, float] = {}
+
+        # Warm start from an on-disk topology snapshot (opt-in)
+        self._topology_cache = topology_cache
+        self._reconcile_task: asyncio.Task[None] | None = None
+        # Held while a poll batch is dispatched and while a topology
+        # reconcile applies its differences, so the two never interleave.
+        self._topology_lock = asyncio.Lock()
+
         # Long-poll state
         self._poll_id: str | None = None
         self._poll_task: asyncio.Task[None] | None = None
+        self._dispatch_queue: _DispatchQueue | None = None
+        self._dispatch_task: asyncio.Task[None] | None = None
         self._stop_polling: bool = False
 
         # Callback registries (same API as SHCSession)
@@ -147,22 +265,244 @@ class SHCSessionAsync:
     # Initialisation (async)
     # ------------------------------------------------------------------
 
-    async def async_init(self) -> None:
+    async def async_init(
+        self, *, concurrent: bool = False, streaming: bool = False
+    ) -> None:
         """Enumerate all devices/rooms/scenarios/etc. from the SHC.
 
         Must be awaited once before calling start_polling().
 
         Mirrors SHCSession._enumerate_all() + SHCSession.authenticate().
+
+        Args:
+            concurrent: Issue the independent enumeration GETs (services,
+                devices, rooms, scenarios, messages, user-defined states and
+                the IDS domain) together instead of one after another.  The
+                object graph is still built in the serial order afterwards, so
+                SHCDeviceHelper.device_init sees the complete services map and
+                devices in /devices order exactly as in the default mode.
+            streaming: In the serial mode, stream /services and /devices
+                (SHCAPIAsync.iter_services / iter_devices): unsupported
+                services are dropped while the body is parsed and each device
+                is built as soon as it has been received.  Ignored with
+                ``concurrent``.
+
+        The per-phase wall-clock breakdown of the last call is available as
+        ``startup_timings``.
         """
-        await self._async_authenticate()
-        await self._async_enumerate_services()
-        await self._async_enumerate_devices()
-        await self._async_enumerate_rooms()
-        await self._async_enumerate_scenarios()
-        await self._async_enumerate_messages()
-        await self._async_enumerate_userdefinedstates()
+        self._startup_timings = {}
+        with self._timed_phase("authenticate"):
+            await self._async_authenticate()
+
+        if self._topology_cache is not None:
+            with self._timed_phase("topology_cache"):
+                if await self._async_warm_start():
+                    return
+
+        if concurrent:
+            await self._async_enumerate_concurrently()
+        else:
+            with self._timed_phase("services"):
+                await self._async_enumerate_services(streaming=streaming)
+            with self._timed_phase("devices"):
+                await self._async_enumerate_devices(streaming=streaming)
+            with self._timed_phase("rooms"):
+                await self._async_enumerate_rooms()
+            with self._timed_phase("scenarios"):
+                await self._async_enumerate_scenarios()
+            with self._timed_phase("messages"):
+                await self._async_enumerate_messages()
+            with self._timed_phase("userdefinedstates"):
+                await self._async_enumerate_userdefinedstates()
+            with self._timed_phase("domains"):
+                await self._async_initialize_domains()
+            with self._timed_phase("emma"):
+                await self._async_initialize_emma()
+        await self._async_save_topology()
+
+    async def _async_enumerate_concurrently(self) -> None:
+        """Fetch every enumeration resource at once, then build in order.
+
+        Only device building depends on another resource (the services map),
+        so the GETs themselves are independent.  In this mode the per-resource
+        phases in ``startup_timings`` measure the local object build only; the
+        overlapped network time is reported once under ``"fetch"``.
+        """
+        tasks = [
+            asyncio.ensure_future(coro)
+            for coro in (
+                self._api.get_services(validate=False),
+                self._api.get_devices(),
+                self._api.get_rooms(),
+                self._api.get_scenarios(),
+                self._api.get_messages(),
+                self._api.get_userdefinedstates(),
+                self._api.get_domain_intrusion_detection(),
+            )
+        ]
+        with self._timed_phase("fetch"):
+            try:
+                (
+                    raw_services,
+                    raw_devices,
+                    raw_rooms,
+                    raw_scenarios,
+                    raw_messages,
+                    raw_states,
+                    raw_ids,
+                ) = await asyncio.gather(*tasks)
+            except BaseException:
+                # Don't leave the sibling GETs running after the first failure,
+                # and collect their outcomes so none is reported as never
+                # retrieved.
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+
+        with self._timed_phase("services"):
+            self._load_services(raw_services, validate=True)
+        with self._timed_phase("devices"):
+            self._load_devices(raw_devices)
+        with self._timed_phase("rooms"):
+            self._load_rooms(raw_rooms)
+        with self._timed_phase("scenarios"):
+            self._load_scenarios(raw_scenarios)
+        with self._timed_phase("messages"):
+            self._load_messages(raw_messages)
+        with self._timed_phase("userdefinedstates"):
+            self._load_userdefinedstates(raw_states)
+        with self._timed_phase("domains"):
+            self._load_domains(raw_ids)
+        with self._timed_phase("emma"):
+            await self._async_initialize_emma()
+
+    async def _async_warm_start(self) -> bool:
+        """Mirrors SHCSession._warm_start() — snapshot build + background reconcile."""
+        assert self._topology_cache is not None
+        loop = asyncio.get_running_loop()
+        snapshot = await loop.run_in_executor(
+            None, self._topology_cache.load, self.information.macAddress
+        )
+        if snapshot is None:
+            return False
+        logger.debug(
+            "Async session building topology from snapshot with %d device(s)",
+            len(snapshot["devices"]),
+        )
+        self._load_services(snapshot["services"])
+        self._load_devices(snapshot["devices"])
+        self._load_rooms(snapshot["rooms"])
+        self._load_scenarios(snapshot["scenarios"])
+        self._load_userdefinedstates(snapshot["userdefinedstates"])
+        # The IDS arming/alarm state is never taken from the snapshot.
         await self._async_initialize_domains()
         await self._async_initialize_emma()
+        self._reconcile_task = loop.create_task(
+            self._async_reconcile_topology_main(), name="SHCTopologyReconcileTask"
+        )
+        return True
+
+    async def _async_reconcile_topology_main(self) -> None:
+        try:
+            with coroutine_callbacks(self._callback_tasks):
+                await self.async_reconcile_topology()
+        except Exception as ex:
+            logger.warning("Async topology reconcile with the SHC failed: %s", ex)
+        finally:
+            self._reconcile_task = None
+
+    async def async_reconcile_topology(self) -> None:
+        """Mirrors SHCSession.reconcile_topology().
+
+        The GETs are issued together, without the topology lock; the
+        differences (topology_cache.diff_topology) are applied under it, so
+        the poll loop dispatches nothing in between.
+        """
+        async with self._topology_lock:
+            versions = service_versions(self._devices_by_id.values())
+        (
+            raw_services,
+            raw_devices,
+            raw_rooms,
+            raw_scenarios,
+            raw_messages,
+            raw_states,
+        ) = await asyncio.gather(
+            self._api.get_services(),
+            self._api.get_devices(),
+            self._api.get_rooms(),
+            self._api.get_scenarios(),
+            self._api.get_messages(),
+            self._api.get_userdefinedstates(),
+        )
+
+        async with self._topology_lock:
+            diff = diff_topology(
+                self._devices_by_id,
+                self._userdefinedstates_by_id,
+                versions,
+                raw_services,
+                raw_devices,
+                raw_states,
+            )
+            for raw_result in diff.poll_results:
+                await self._process_long_polling_poll_result(raw_result)
+            with coroutine_callbacks(self._callback_tasks):
+                apply_service_changes(diff, self._subscriptions)
+            for state_id in diff.removed_state_ids:
+                self._userdefinedstates_by_id.pop(state_id, None)
+            self._rooms_by_id = self._build_rooms(raw_rooms)
+            self._scenarios_by_id = self._build_scenarios(raw_scenarios)
+            self._messages_by_id = self._build_messages(raw_messages)
+        await self._async_save_topology()
+
+    def _topology_resources(self) -> dict[str, list[Any]]:
+        """Mirrors SHCSession._topology_resources()."""
+        devices = list(self._devices_by_id.values())
+        return {
+            "services": [
+                service._raw_device_service
+                for device in devices
+                for service in device.device_services
+            ],
+            "devices": [device._raw_device for device in devices],
+            "rooms": [room._raw_room for room in self._rooms_by_id.values()],
+            "scenarios": [
+                scenario._raw_scenario for scenario in self._scenarios_by_id.values()
+            ],
+            "userdefinedstates": [
+                state._raw_state for state in self._userdefinedstates_by_id.values()
+            ],
+        }
+
+    async def _async_save_topology(self) -> None:
+        """Write the topology snapshot off the event loop (blocking file I/O)."""
+        if self._topology_cache is None or self._shc_information is None:
+            return
+        try:
+            await asyncio.get_running_loop().run_in_executor(
+                None,
+                self._topology_cache.save,
+                self._shc_information.macAddress,
+                self._topology_resources(),
+            )
+        except OSError as ex:
+            logger.warning("Could not write topology snapshot: %s", ex)
+
+    @contextmanager
+    def _timed_phase(self, phase: str) -> Iterator[None]:
+        """Record the wall-clock duration of a startup phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._startup_timings[phase] = time.perf_counter() - start
+            logger.debug(
+                "Async session startup phase %s took %.3fs",
+                phase,
+                self._startup_timings[phase],
+            )
 
     async def _async_authenticate(self) -> None:
         """Mirrors SHCSession.authenticate() — builds SHCInformation."""
@@ -186,17 +526,38 @@ class SHCSessionAsync:
 
         self._shc_information = _AsyncSHCInformation(pub_info, info_raw, self._api)
 
-    async def _async_enumerate_services(self) -> None:
+    async def _async_enumerate_services(self, streaming: bool = False) -> None:
         """Mirrors SHCSession._enumerate_services()."""
-        raw_services = await self._api.get_services()
+        if streaming:
+            async for service in self._api.iter_services(SUPPORTED_DEVICE_SERVICE_IDS):
+                self._services_by_device_id[service["deviceId"]].append(service)
+            return
+        # Element @types are checked while the services are grouped instead
+        # of in a separate pass inside SHCAPIAsync.
+        self._load_services(await self._api.get_services(validate=False), validate=True)
+
+    def _load_services(
+        self, raw_services: list[dict[str, Any]], validate: bool = False
+    ) -> None:
         for service in raw_services:
+            if validate and service.get("@type") != "DeviceServiceData":
+                check_element_type(service, "DeviceServiceData")
             if service["id"] not in SUPPORTED_DEVICE_SERVICE_IDS:
                 continue
             device_id = service["deviceId"]
             self._services_by_device_id[device_id].append(service)
 
-    async def _async_enumerate_devices(self) -> None:
+    async def _async_enumerate_devices(self, streaming: bool = False) -> None:
         """Mirrors SHCSession._enumerate_devices()."""
+        if streaming:
+            # Same helper set-up as _load_devices().
+            self._device_helper = SHCDeviceHelper(self._api)  # type: ignore[arg-type]
+            async for raw_device in self._api.iter_devices():
+                self._add_device(raw_device)
+            return
+        self._load_devices(await self._api.get_devices())
+
+    def _load_devices(self, raw_devices: list[dict[str, Any]]) -> None:
         # Device helper must be built with a "sync-api-like" object.
         # SHCDeviceHelper.__init__ only stores the api ref and builds empty
         # model dicts; it does not call the api at construction.  We pass our
@@ -205,7 +566,6 @@ class SHCSessionAsync:
         device_helper = SHCDeviceHelper(self._api)  # type: ignore[arg-type]
         self._device_helper = device_helper
 
-        raw_devices = await self._api.get_devices()
         for raw_device in raw_devices:
             self._add_device(raw_device)
 
@@ -251,31 +611,52 @@ class SHCSessionAsync:
 
     async def _async_enumerate_rooms(self) -> None:
         """Mirrors SHCSession._enumerate_rooms()."""
-        raw_rooms = await self._api.get_rooms()
-        for raw_room in raw_rooms:
-            room_id = raw_room["id"]
-            room = SHCRoom(api=self._api, raw_room=raw_room)
-            self._rooms_by_id[room_id] = room
+        self._load_rooms(await self._api.get_rooms())
+
+    def _load_rooms(self, raw_rooms: list[dict[str, Any]]) -> None:
+        self._rooms_by_id.update(self._build_rooms(raw_rooms))
+
+    def _build_rooms(self, raw_rooms: list[dict[str, Any]]) -> dict[str, SHCRoom]:
+        return {
+            raw_room["id"]: SHCRoom(api=self._api, raw_room=raw_room)
+            for raw_room in raw_rooms
+        }
 
     async def _async_enumerate_scenarios(self) -> None:
         """Mirrors SHCSession._enumerate_scenarios()."""
-        raw_scenarios = await self._api.get_scenarios()
-        for raw_scenario in raw_scenarios:
-            scenario_id = raw_scenario["id"]
-            scenario = SHCScenario(api=self._api, raw_scenario=raw_scenario)  # type: ignore[arg-type]
-            self._scenarios_by_id[scenario_id] = scenario
+        self._load_scenarios(await self._api.get_scenarios())
+
+    def _load_scenarios(self, raw_scenarios: list[dict[str, Any]]) -> None:
+        self._scenarios_by_id.update(self._build_scenarios(raw_scenarios))
+
+    def _build_scenarios(
+        self, raw_scenarios: list[dict[str, Any]]
+    ) -> dict[str, SHCScenario]:
+        return {
+            raw_scenario["id"]: SHCScenario(api=self._api, raw_scenario=raw_scenario)  # type: ignore[arg-type]
+            for raw_scenario in raw_scenarios
+        }
 
     async def _async_enumerate_messages(self) -> None:
         """Mirrors SHCSession._enumerate_messages()."""
-        raw_messages = await self._api.get_messages()
-        for raw_message in raw_messages:
-            message_id = raw_message["id"]
-            message = SHCMessage(api=self._api, raw_message=raw_message)
-            self._messages_by_id[message_id] = message
+        self._load_messages(await self._api.get_messages())
+
+    def _load_messages(self, raw_messages: list[dict[str, Any]]) -> None:
+        self._messages_by_id.update(self._build_messages(raw_messages))
+
+    def _build_messages(
+        self, raw_messages: list[dict[str, Any]]
+    ) -> dict[str, SHCMessage]:
+        return {
+            raw_message["id"]: SHCMessage(api=self._api, raw_message=raw_message)
+            for raw_message in raw_messages
+        }
 
     async def _async_enumerate_userdefinedstates(self) -> None:
         """Mirrors SHCSession._enumerate_userdefinedstates()."""
-        raw_states = await self._api.get_userdefinedstates()
+        self._load_userdefinedstates(await self._api.get_userdefinedstates())
+
+    def _load_userdefinedstates(self, raw_states: list[dict[str, Any]]) -> None:
         for raw_state in raw_states:
             userdefinedstate_id = raw_state["id"]
             userdefinedstate = SHCUserDefinedState(
@@ -287,7 +668,9 @@ class SHCSessionAsync:
 
     async def _async_initialize_domains(self) -> None:
         """Mirrors SHCSession._initialize_domains()."""
-        raw_ids = await self._api.get_domain_intrusion_detection()
+        self._load_domains(await self._api.get_domain_intrusion_detection())
+
+    def _load_domains(self, raw_ids: dict[str, Any]) -> None:
         self._domains_by_id["IDS"] = SHCIntrusionSystem(
             self._api,
             raw_ids,
@@ -348,6 +731,21 @@ class SHCSessionAsync:
         finally:
             self._poll_task = None
 
+        reconcile_task = self._reconcile_task
+        if reconcile_task is not None and not reconcile_task.done():
+            reconcile_task.cancel()
+            try:
+                await reconcile_task
+            except asyncio.CancelledError:
+                pass
+        await self._callback_tasks.cancel()
+        self._close_event_streams()
+        if self._event_journal is not None:
+            # Joins the spill writer thread.
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._event_journal.close
+            )
+
         # Best-effort unsubscribe (SHC session already cleaned up)
         if self._poll_id is not None:
             try:
@@ -377,7 +775,7 @@ class SHCSessionAsync:
 
         Error handling mirrors the sync session:
         - JSONRPCError -32001: re-subscribe (new poll_id) + asyncio.sleep(1)
-        - Other exceptions: log + asyncio.sleep(15) + continue
+        - Other exceptions: log + back off (15 s, or per retry policy) + continue
         - asyncio.CancelledError: cleanup + re-raise (structured concurrency)
         """
         try:
@@ -393,54 +791,101 @@ class SHCSessionAsync:
             # reasoning as the sync fix: stop_polling() handles poll_id
             # cleanup itself after awaiting this task.
             self._poll_task = None
+            dispatch_queue, self._dispatch_queue = self._dispatch_queue, None
+            dispatch_task, self._dispatch_task = self._dispatch_task, None
+            if dispatch_queue is not None and dispatch_task is not None:
+                await self._stop_dispatcher(dispatch_queue, dispatch_task)
+
+    async def _stop_dispatcher(
+        self, dispatch_queue: _DispatchQueue, dispatch_task: asyncio.Task[None]
+    ) -> None:
+        """Let the dispatcher work off the queued batches, a resubscribe
+        refresh among them, then stop it; cancel it only if that takes
+        longer than _DISPATCH_DRAIN_TIMEOUT."""
+
+        async def drain() -> None:
+            await dispatch_queue.put(None)
+            await asyncio.shield(dispatch_task)
+
+        try:
+            await asyncio.wait_for(drain(), _DISPATCH_DRAIN_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Dispatcher did not finish the queued poll results within %ss; "
+                "cancelling it",
+                _DISPATCH_DRAIN_TIMEOUT,
+            )
+        except Exception as ex:
+            logger.debug("Dispatcher task raised on stop: %s", ex)
+        finally:
+            if not dispatch_task.done():
+                dispatch_task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await dispatch_task
 
     async def _poll_loop_body(self) -> None:
         """The actual long-poll while-loop, split out so _poll_loop() can
         wrap it in a finally that always clears self._poll_task."""
+        failures = 0
+        # A poll id the SHC rejected; dropped with the next subscribe, in
+        # the same JSON-RPC batch.
+        expired_poll_id: str | None = None
+        dispatch_queue: _DispatchQueue | None = None
+        if self._pipeline_depth is not None:
+            dispatch_queue = asyncio.Queue(maxsize=self._pipeline_depth)
+            self._dispatch_queue = dispatch_queue
+            self._dispatch_task = asyncio.get_running_loop().create_task(
+                self._dispatch_loop(dispatch_queue), name="SHCAsyncDispatchTask"
+            )
         while not self._stop_polling:
             try:
                 resubscribed = False
 
                 # Re-subscribe if poll_id was invalidated (-32001 path)
                 if self._poll_id is None:
-                    self._poll_id = await self._api.long_polling_subscribe()
+                    if expired_poll_id is None:
+                        self._poll_id = await self._api.long_polling_subscribe()
+                    else:
+                        self._poll_id = await self._api.long_polling_resubscribe(
+                            expired_poll_id
+                        )
+                        expired_poll_id = None
                     logger.debug(
                         "Async session re-subscribed for long poll. New poll id: %s",
                         self._poll_id,
                     )
                     resubscribed = True
 
+                coalescer = self._coalescer
+                adaptive = self._adaptive_poll_wait
+                wait_seconds = (
+                    adaptive.wait_seconds()
+                    if adaptive is not None
+                    else self._long_poll_timeout
+                )
+                if coalescer is not None:
+                    wait_seconds = coalescer.wait_seconds(wait_seconds)
                 raw_results = await self._api.long_polling_poll(
-                    self._poll_id, self._long_poll_timeout
+                    self._poll_id, wait_seconds
                 )
-
-                for raw_result in raw_results:
-                    await self._process_long_polling_poll_result(raw_result)
-
-                if resubscribed:
-                    # Mirrors session.py:183-206: after a poll-id resubscribe
-                    # the SHC doesn't deliver state changes that happened during
-                    # the gap.  Short-poll every device so listeners get current
-                    # state (#183).  Use async_update() (not the sync update() +
-                    # executor) — calling sync short_poll() against SHCAPIAsync
-                    # stores an unawaited coroutine in _raw_device_service, which
-                    # causes 'coroutine object is not subscriptable' on the next
-                    # state write (issue #345).
-                    logger.debug(
-                        "Poll-id resubscribed — refreshing %d device(s) via "
-                        "async short-poll (#183, async)",
-                        len(self._devices_by_id),
+                if self._event_journal is not None:
+                    self._event_journal.record(raw_results, gap=resubscribed)
+                if adaptive is not None:
+                    adaptive.observe(len(raw_results))
+                if coalescer is not None:
+                    # Mirrors SHCSession._long_poll(): flush before a
+                    # resubscribe refresh.
+                    coalescer.add(raw_results)
+                    raw_results = (
+                        coalescer.drain() if coalescer.ready() or resubscribed else []
                     )
-                    for device in list(self._devices_by_id.values()):
-                        try:
-                            await device.async_update(fire_callbacks=True)
-                        except Exception as ex:  # noqa: BLE001
-                            logger.warning(
-                                "Short-poll refresh failed for device %s "
-                                "after async resubscribe: %s",
-                                device.id,
-                                ex,
-                            )
+
+                if dispatch_queue is None:
+                    await self._dispatch_batch(raw_results, resubscribed)
+                elif raw_results or resubscribed:
+                    # Waits while the dispatcher is pipeline_depth batches behind.
+                    await dispatch_queue.put((raw_results, resubscribed))
+                failures = 0
 
             except asyncio.CancelledError:
                 # Task was cancelled by stop_polling() — clean up and propagate.
@@ -454,145 +899,296 @@ class SHCSessionAsync:
                     # Stale poll id — SHC rotates these ~every 24h.
                     # Invalidate; next iteration will re-subscribe.
                     # Mirrors session.py:209-217.
-                    self._poll_id = None
+                    expired_poll_id, self._poll_id = self._poll_id, None
                     logger.debug(
                         "Async session: SHC claims unknown poll id. "
                         "Invalidating and resubscribing next iteration..."
                     )
                     await asyncio.sleep(_BACKOFF_STALE_POLL_ID)
                 else:
+                    failures += 1
+                    delay = self._error_backoff(failures)
                     logger.error(
                         "Async poll got unexpected JSONRPCError (code %s): %s. "
-                        "Waiting %ss.",
+                        "Waiting %.1fs.",
                         json_rpc_error.code,
                         json_rpc_error,
-                        _BACKOFF_OTHER_ERROR,
+                        delay,
                     )
-                    await asyncio.sleep(_BACKOFF_OTHER_ERROR)
+                    await asyncio.sleep(delay)
 
             except Exception as ex:
                 # Mirrors session.py:330-334: generic error → log + backoff.
+                failures += 1
+                delay = self._error_backoff(failures)
                 logger.error(
-                    "Error in async polling task: %s. Waiting %ss.",
+                    "Error in async polling task: %s. Waiting %.1fs.",
                     ex,
-                    _BACKOFF_OTHER_ERROR,
+                    delay,
                 )
-                await asyncio.sleep(_BACKOFF_OTHER_ERROR)
+                await asyncio.sleep(delay)
+
+    async def _dispatch_batch(
+        self, raw_results: list[dict[str, Any]], resubscribed: bool
+    ) -> None:
+        async with self._topology_lock:
+            for raw_result in raw_results:
+                await self._process_long_polling_poll_result(raw_result)
+
+            if resubscribed:
+                # Bulk refresh: let user requests overtake it (scheduler.py).
+                with (
+                    scheduling_priority(Priority.BACKGROUND),
+                    coroutine_callbacks(self._callback_tasks),
+                ):
+                    await self._async_resync_device_services()
+
+    async def _dispatch_loop(self, dispatch_queue: _DispatchQueue) -> None:
+        """Dispatcher task of the pipelined poll loop (pipeline_depth);
+        runs until the ``None`` sentinel."""
+        while True:
+            batch = await dispatch_queue.get()
+            if batch is None:
+                return
+            raw_results, resubscribed = batch
+            try:
+                await self._dispatch_batch(raw_results, resubscribed)
+            except Exception as ex:
+                logger.error("Error dispatching async long poll results: %s", ex)
+
+    def _error_backoff(self, failures: int) -> float:
+        """Seconds to wait after ``failures`` consecutive poll errors."""
+        if self._retry_policy is None:
+            return _BACKOFF_OTHER_ERROR
+        return self._retry_policy.backoff(failures)
+
+    async def _async_resync_device_services(self) -> None:
+        """Mirrors SHCSession._resync_device_services() (#183).
+
+        One GET /services instead of an async short-poll per service; only
+        services whose state changed fire callbacks. The fallback uses
+        async_update() (not the sync update() + executor) — calling sync
+        short_poll() against SHCAPIAsync stores an unawaited coroutine in
+        _raw_device_service, which causes 'coroutine object is not
+        subscriptable' on the next state write (issue #345).
+        """
+        logger.debug(
+            "Poll-id resubscribed — refreshing %d device(s) via GET /services "
+            "(#183, async)",
+            len(self._devices_by_id),
+        )
+        try:
+            raw_services = await self._api.get_services()
+        except Exception as ex:  # noqa: BLE001
+            logger.warning(
+                "Bulk service refresh failed after async resubscribe (%s); "
+                "falling back to per-device short-poll",
+                ex,
+            )
+            for device in list(self._devices_by_id.values()):
+                try:
+                    await device.async_update(fire_callbacks=True)
+                except Exception as ex:  # noqa: BLE001
+                    logger.warning(
+                        "Short-poll refresh failed for device %s "
+                        "after async resubscribe: %s",
+                        device.id,
+                        ex,
+                    )
+            return
+
+        changed = 0
+        for raw_service in raw_services:
+            owner = self._devices_by_id.get(raw_service.get("deviceId"))
+            if owner is not None and apply_service_result(
+                self._subscriptions, owner, raw_service, owner.process_refresh_result
+            ):
+                changed += 1
+        logger.debug("%d service state(s) changed during the poll-id gap", changed)
 
     # ------------------------------------------------------------------
     # Long-poll result dispatch
     # ------------------------------------------------------------------
 
+    def _default_poll_result_handlers(self) -> dict[str, PollResultHandler]:
+        """Mirrors SHCSession._default_poll_result_handlers()."""
+        handlers: dict[str, PollResultHandler] = {
+            "DeviceServiceData": self._handle_device_service_data,
+            "message": self._handle_message,
+            "scenarioTriggered": self._handle_scenario_triggered,
+            "device": self._handle_device,
+            "userDefinedState": self._handle_userdefinedstate,
+            "link": self._handle_link,
+        }
+        for domain_state in SHCIntrusionSystem.DOMAIN_STATES:
+            handlers[domain_state] = self._handle_domain_state
+        return handlers
+
+    def register_poll_result_handler(
+        self, result_type: str, handler: PollResultHandler
+    ) -> None:
+        """Route long-poll results with ``@type == result_type`` to ``handler``.
+
+        Replaces the built-in handler for that type, if any. The handler runs
+        on the event loop; it may be a plain function or a coroutine function.
+        """
+        self._poll_result_handlers[result_type] = handler
+
+    def register_link_handler(self, link_id: str, handler: PollResultHandler) -> None:
+        """Route ``link`` long-poll results with the given ``id`` to ``handler``."""
+        self._link_handlers[link_id] = handler
+
     async def _process_long_polling_poll_result(
         self, raw_result: dict[str, Any]
     ) -> None:
-        """Dispatch a single long-poll event to the correct handler.
-
-        Mirrors SHCSession._process_long_polling_poll_result() line-for-line
-        (session.py:225-305).  The only difference is:
-        - new-device events call ``await _async_add_new_device()`` instead of
-          the sync ``_add_device(update_services=True)`` that issues a blocking
-          GET.
-        - The method is async so it can be awaited by _poll_loop; all the
-          actual dispatch sub-calls remain sync (dict-parsing + callbacks).
+        """Dispatch a single long-poll event to the handler for its ``@type``.
+
+        Mirrors SHCSession._process_long_polling_poll_result(). Handlers that
+        need I/O (new devices are fetched with ``await
+        _async_add_new_device()``) are coroutine functions; the hot
+        DeviceServiceData path stays a plain call without a coroutine per
+        event.
         """
         logger.debug("Async long poll: %s", raw_result)
-
-        # --- DeviceServiceData (session.py:227-236) ---
-        if raw_result["@type"] == "DeviceServiceData":
-            device_id = raw_result["deviceId"]
-            if device_id in self._devices_by_id:
-                device = self._devices_by_id[device_id]
-                device.process_long_polling_poll_result(raw_result)
-            else:
-                logger.debug(
-                    "Skipping async polling result with unknown device id %s.",
-                    device_id,
-                )
+        if self._response_cache is not None:
+            self._response_cache.invalidate_for_event(raw_result)
+        handler = self._poll_result_handlers.get(raw_result["@type"])
+        if handler is None:
+            logger.debug(
+                "No handler for async long poll result type %s", raw_result["@type"]
+            )
             return
+        with coroutine_callbacks(self._callback_tasks):
+            result = handler(raw_result)
+            if result is not None:
+                await result
+
+    def _handle_device_service_data(self, raw_result: dict[str, Any]) -> None:
+        device_id = raw_result["deviceId"]
+        device = self._devices_by_id.get(device_id)
+        if device is not None:
+            apply_service_result(
+                self._subscriptions,
+                device,
+                raw_result,
+                device.process_long_polling_poll_result,
+            )
+        else:
+            logger.debug(
+                "Skipping async polling result with unknown device id %s.",
+                device_id,
+            )
 
-        # --- message (session.py:237-253) ---
-        if raw_result["@type"] == "message":
-            if "arguments" in raw_result and (
-                "deviceServiceDataModel" in raw_result["arguments"]
-            ):
-                raw_data_model = json.loads(
-                    raw_result["arguments"]["deviceServiceDataModel"]
-                )
-                await self._process_long_polling_poll_result(raw_data_model)
-            else:
-                message_id = raw_result["id"]
-                message = SHCMessage(api=self._api, raw_message=raw_result)
-                self._messages_by_id[message_id] = message
-            return
+    async def _handle_message(self, raw_result: dict[str, Any]) -> None:
+        if "arguments" in raw_result and (
+            "deviceServiceDataModel" in raw_result["arguments"]
+        ):
+            raw_data_model = codec.loads(
+                raw_result["arguments"]["deviceServiceDataModel"]
+            )
+            await self._process_long_polling_poll_result(raw_data_model)
+        else:
+            message_id = raw_result["id"]
+            message = SHCMessage(api=self._api, raw_message=raw_result)
+            self._messages_by_id[message_id] = message
 
-        # --- scenarioTriggered (session.py:254-261) ---
-        if raw_result["@type"] == "scenarioTriggered":
-            if raw_result["id"] in self._scenario_callbacks:
-                self._scenario_callbacks[raw_result["id"]](raw_result)
-            if "shc" in self._scenario_callbacks:
-                self._scenario_callbacks["shc"](raw_result)
-            return
+    def _handle_scenario_triggered(self, raw_result: dict[str, Any]) -> None:
+        if raw_result["id"] in self._scenario_callbacks:
+            run_callback(self._scenario_callbacks[raw_result["id"]], raw_result)
+        if "shc" in self._scenario_callbacks:
+            run_callback(self._scenario_callbacks["shc"], raw_result)
+
+    async def _handle_device(self, raw_result: dict[str, Any]) -> None:
+        device_id = raw_result["id"]
+        if device_id in self._devices_by_id:
+            self._devices_by_id[device_id].update_raw_information(raw_result)
+            if raw_result.get("deleted") is True:
+                logger.debug("Async session: deleting device with id %s", device_id)
+                self._services_by_device_id.pop(device_id, None)
+                self._devices_by_id.pop(device_id, None)
+        else:
+            logger.debug("Async session: found new device with id %s", device_id)
+            new_device = await self._async_add_new_device(raw_result)
+            if new_device is not None:
+                for callback in self._subscriptions.class_subscribers(new_device):
+                    run_callback(callback, new_device)
+
+    def _handle_domain_state(self, raw_result: dict[str, Any]) -> None:
+        if self.intrusion_system is not None:
+            self.intrusion_system.process_long_polling_poll_result(raw_result)
+
+    def _handle_userdefinedstate(self, raw_result: dict[str, Any]) -> None:
+        state_id = raw_result["id"]
+        if state_id in self._userdefinedstates_by_id:
+            self._userdefinedstates_by_id[state_id].update_raw_information(raw_result)
+        else:
+            userdefinedstate = SHCUserDefinedState(
+                api=self._api,  # type: ignore[arg-type]
+                info=self.information,
+                raw_state=raw_result,
+            )
+            self._userdefinedstates_by_id[state_id] = userdefinedstate
+            for callback in self._subscriptions.class_subscribers(userdefinedstate):
+                run_callback(callback, userdefinedstate)
+        if state_id in self._userdefinedstate_callbacks:
+            for callback in self._userdefinedstate_callbacks[state_id]:
+                run_callback(callback)
+
+    async def _handle_link(self, raw_result: dict[str, Any]) -> None:
+        handler = self._link_handlers.get(raw_result["id"])
+        if handler is not None:
+            result = handler(raw_result)
+            if result is not None:
+                await result
+
+    def _handle_emma_link(self, raw_result: dict[str, Any]) -> None:
+        if self._emma is not None:
+            self._emma.update_emma_data(raw_result)
 
-        # --- device: update/delete/new (session.py:262-278) ---
-        if raw_result["@type"] == "device":
-            device_id = raw_result["id"]
-            if device_id in self._devices_by_id:
-                self._devices_by_id[device_id].update_raw_information(raw_result)
-                if raw_result.get("deleted") is True:
-                    logger.debug("Async session: deleting device with id %s", device_id)
-                    self._services_by_device_id.pop(device_id, None)
-                    self._devices_by_id.pop(device_id, None)
-            else:
-                logger.debug("Async session: found new device with id %s", device_id)
-                new_device = await self._async_add_new_device(raw_result)
-                if new_device is not None:
-                    for instance, callback in list(self._subscribers):
-                        if isinstance(new_device, instance):
-                            callback(new_device)
-            return
+    # ------------------------------------------------------------------
+    # Subscription API (same as SHCSession)
+    # ------------------------------------------------------------------
 
-        # --- intrusion-system domain states (session.py:279-281) ---
-        if raw_result["@type"] in SHCIntrusionSystem.DOMAIN_STATES:
-            if self.intrusion_system is not None:
-                self.intrusion_system.process_long_polling_poll_result(raw_result)
-            return
+    def events(
+        self,
+        filter: SHCEventFilter | None = None,
+        max_queue: int = DEFAULT_EVENT_QUEUE,
+    ) -> SHCEventStreamAsync:
+        """Async iterator over service state changes (see events.py).
 
-        # --- userDefinedState (session.py:283-299) ---
-        if raw_result["@type"] == "userDefinedState":
-            state_id = raw_result["id"]
-            if state_id in self._userdefinedstates_by_id:
-                self._userdefinedstates_by_id[state_id].update_raw_information(
-                    raw_result
-                )
-            else:
-                userdefinedstate = SHCUserDefinedState(
-                    api=self._api,  # type: ignore[arg-type]
-                    info=self.information,
-                    raw_state=raw_result,
-                )
-                self._userdefinedstates_by_id[state_id] = userdefinedstate
-                for instance, callback in list(self._subscribers):
-                    if isinstance(userdefinedstate, instance):
-                        callback(userdefinedstate)
-            if state_id in self._userdefinedstate_callbacks:
-                for callback in self._userdefinedstate_callbacks[state_id]:
-                    callback()
-            return
+        Use it as an async context manager, or close() it, to stop
+        receiving events; it also ends when polling stops.
+        """
 
-        # --- link / emma (session.py:301-305) ---
-        if raw_result["@type"] == "link":
-            link_id = raw_result["id"]
-            if link_id == "com.bosch.tt.emma.applink":
-                if self._emma is not None:
-                    self._emma.update_emma_data(raw_result)
+        def on_close(stream: SHCEventStreamAsync) -> None:
+            self._event_streams.remove(stream)
+            self._subscriptions.remove(token)
 
-    # ------------------------------------------------------------------
-    # Subscription API (same as SHCSession)
-    # ------------------------------------------------------------------
+        stream = SHCEventStreamAsync(None, max_queue, on_close)
+        token = self._subscriptions.add_changes(stream.publish, filter)
+        self._event_streams.append(stream)
+        return stream
+
+    def subscribe_changes(
+        self,
+        callback: Callable[[SHCChangeEvent], Any],
+        filter: SHCEventFilter | None = None,
+    ) -> Callable[[], None]:
+        """Call ``callback`` with every service state change ``filter``
+        accepts; returns a function that unsubscribes it."""
+        return partial(
+            self._subscriptions.remove,
+            self._subscriptions.add_changes(callback, filter),
+        )
+
+    def _close_event_streams(self) -> None:
+        for stream in list(self._event_streams):
+            stream.close()
 
     def subscribe(self, callback_tuple: Any) -> None:
-        self._subscribers.append(callback_tuple)
+        """Call ``callback`` with each new device or user-defined state
+        that is an instance of ``cls``; ``callback_tuple`` is (cls, callback)."""
+        self._subscriptions.add_class(*callback_tuple)
 
     def subscribe_scenario_callback(
         self, scenario_id: str, callback: Callable[..., Any]
@@ -622,6 +1218,11 @@ class SHCSessionAsync:
     def device_helper(self) -> SHCDeviceHelper | None:
         return self._device_helper
 
+    @property
+    def startup_timings(self) -> dict[str, float]:
+        """Per-phase durations in seconds recorded by the last async_init()."""
+        return dict(self._startup_timings)
+
     @property
     def devices(self) -> Sequence[SHCDevice]:
         return list(self._devices_by_id.values())
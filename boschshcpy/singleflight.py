@@ -0,0 +1,93 @@
+"""Single-flight coalescing of identical concurrent requests.
+
+HA ``should_poll`` entities and the post-resubscribe refresh can both ask
+for the same ``GET /devices/<id>/services/<svc>`` while an earlier request
+for it is still on the wire; the 1 s ``_last_update`` guard of
+``SHCDeviceService`` only kicks in once that request has returned.
+``SHCAPI`` and ``SHCAPIAsync`` route their GETs through these helpers so
+that a caller arriving while an identical request is in flight waits for
+it and gets its result (or exception) instead of sending a duplicate.
+
+Callers that shared a flight receive the same result object; treat GET
+results as read-only or copy them before modifying.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+
+class _Flight:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Thread-safe single-flight group for blocking calls."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._flights: dict[Hashable, _Flight] = {}
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._flights
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Return ``fn()``, or the outcome of an in-flight call for ``key``."""
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+        try:
+            flight.result = fn()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+        return flight.result
+
+
+class AsyncSingleFlight:
+    """Single-flight group for coroutines on one event loop."""
+
+    def __init__(self) -> None:
+        self._flights: dict[Hashable, asyncio.Future[Any]] = {}
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._flights
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Await ``fn()``, or the outcome of an in-flight call for ``key``.
+
+        The call runs as its own task, so cancelling one waiter neither
+        cancels the request nor fails the other waiters.
+        """
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = asyncio.ensure_future(fn())
+            self._flights[key] = flight
+            flight.add_done_callback(lambda done: self._finish(key, done))
+        return await asyncio.shield(flight)
+
+    def _finish(self, key: Hashable, flight: asyncio.Future[Any]) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        # Mark the exception retrieved when every waiter was cancelled.
+        if not flight.cancelled():
+            flight.exception()
@@ -0,0 +1,89 @@
+"""Compact storage for the raw SHC JSON retained by device/service objects.
+
+Every ``SHCDevice`` keeps its raw ``/devices`` entry and every
+``SHCDeviceService`` its raw ``DeviceServiceData`` for the lifetime of the
+session; the property accessors in ``models_impl`` / ``services_impl`` read
+straight from those dicts. ``json.loads`` creates a fresh string object for
+every key and value it parses, so a large installation holds thousands of
+copies of ``"@type"``, ``"DeviceServiceData"``, the same ``deviceId`` and the
+same enum values (``"ON"``, ``"AVAILABLE"``, ...).
+
+``intern_raw`` rebuilds such a document with all keys interned and its
+enum-like string values (``"ON"``, ``"AVAILABLE"``, the ``@type`` names)
+shared, so equal strings are one object across the whole process (and
+across sessions). The structure is otherwise unchanged: the result is made
+of plain dicts and lists, so existing accessors and callers keep working
+and the state diff in ``SHCDeviceService`` compares shared strings by
+identity first.
+
+Documents are interned where a device or service is built and on the
+refresh path (reconcile, resubscribe), which replace the whole graph's
+state at once. Long-poll and short-poll results are kept as received:
+rebuilding every update would allocate more than sharing its strings saves,
+on the library's hottest path.
+
+Only keys go through ``sys.intern``: they are the field names of the SHC
+schema, a small fixed set. Values are not interned, since interned strings
+are never freed on Python 3.12+ and ids, timestamps and message payloads
+are unbounded; enum-like values are shared through a bounded table instead,
+and everything else is kept as parsed.
+"""
+
+from __future__ import annotations
+
+import re
+import sys
+from typing import Any, TypeVar
+
+# Longer strings (paths, localized texts, base64 payloads) rarely repeat and
+# are never shared.
+MAX_INTERNED_VALUE_LENGTH = 64
+
+# Upper bound of the shared value table; values first seen once it is full
+# are kept as parsed.
+MAX_SHARED_VALUES = 4096
+
+# SHC enum constants: "ON", "AVAILABLE", "SYSTEM_ARMED", ...
+_ENUM_VALUE = re.compile(r"[A-Z][A-Z0-9_]*")
+
+_shared_values: dict[str, str] = {}
+
+_T = TypeVar("_T")
+
+
+def _share(value: str) -> str:
+    shared = _shared_values.get(value)
+    if shared is not None:
+        return shared
+    if len(_shared_values) < MAX_SHARED_VALUES:
+        # setdefault: another thread may have added it in the meantime.
+        return _shared_values.setdefault(value, value)
+    return value
+
+
+def _intern(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {
+            sys.intern(key): (
+                _share(item)
+                if isinstance(item, str)
+                and len(item) <= MAX_INTERNED_VALUE_LENGTH
+                and (key == "@type" or _ENUM_VALUE.fullmatch(item))
+                else _intern(item)
+            )
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_intern(item) for item in value]
+    return value
+
+
+def intern_raw(raw: _T) -> _T:
+    """Return ``raw`` with its keys interned and enum-like values shared.
+
+    Dicts and lists are rebuilt (the caller's document is never mutated);
+    other strings, numbers, booleans, None and anything that is not
+    JSON-shaped are returned unchanged.
+    """
+    result: _T = _intern(raw)
+    return result
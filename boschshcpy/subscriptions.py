@@ -0,0 +1,155 @@
+"""Indexed registry of session-level subscriptions.
+
+Two kinds of subscriptions live here:
+
+* class subscriptions (``session.subscribe((cls, callback))``), called with
+  every new device or user-defined state that is an instance of ``cls``.
+  They are indexed by class; the callbacks for a concrete type are looked up
+  once along its MRO and cached until the next (un)subscribe, so a new
+  object costs one dict lookup instead of an ``isinstance`` per subscriber.
+  Virtual subclasses (``ABC.register``) are not matched.
+* change subscriptions (``session.subscribe_changes(callback, filter)``,
+  and the ``events()`` streams), called with an ``SHCChangeEvent`` for
+  every service state change their ``SHCEventFilter`` accepts. Each is
+  indexed under one field of its filter, the most selective one set
+  (device id, then service id, device model, room), so an event is only
+  checked against the subscriptions in its own buckets.
+
+Callbacks of either kind run in subscription order. The registry is
+thread-safe: ``SHCSession`` users subscribe from their own threads while the
+polling thread and callback workers publish. Matching callbacks are
+collected under a lock and called after it is released.
+"""
+
+from __future__ import annotations
+
+import itertools
+import threading
+from collections.abc import Callable, Hashable
+from operator import itemgetter
+from typing import Any
+
+from .callbacks import run_callback
+from .events import SHCChangeEvent, SHCEventFilter
+
+# SHCEventFilter fields, most selective first.
+_INDEX_FIELDS = ("device_ids", "service_ids", "device_models", "room_ids")
+
+_ChangeSubscription = tuple[int, Callable[..., Any], SHCEventFilter | None]
+
+
+class SHCSubscriptionRegistry:
+    """Subscriptions of one session; add and remove return/take a token."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._seq = itertools.count()
+        self._classes: dict[int, tuple[type, Callable[..., Any]]] = {}
+        self._by_class: dict[type, dict[int, Callable[..., Any]]] = {}
+        self._class_cache: dict[type, list[Callable[..., Any]]] = {}
+        self._changes: dict[int, tuple[str | None, tuple[Hashable, ...]]] = {}
+        self._wildcard: dict[int, _ChangeSubscription] = {}
+        self._index: dict[str, dict[Hashable, dict[int, _ChangeSubscription]]] = {
+            field: {} for field in _INDEX_FIELDS
+        }
+
+    def __bool__(self) -> bool:
+        """True while any change subscription exists."""
+        return bool(self._changes)
+
+    def add_class(self, cls: type, callback: Callable[..., Any]) -> int:
+        with self._lock:
+            token = next(self._seq)
+            self._classes[token] = (cls, callback)
+            self._by_class.setdefault(cls, {})[token] = callback
+            self._class_cache.clear()
+        return token
+
+    def add_changes(
+        self, callback: Callable[..., Any], filter: SHCEventFilter | None = None
+    ) -> int:
+        field = next(
+            (f for f in _INDEX_FIELDS if filter and getattr(filter, f) is not None),
+            None,
+        )
+        values: tuple[Hashable, ...] = (
+            tuple(getattr(filter, field)) if field is not None else ()
+        )
+        with self._lock:
+            token = next(self._seq)
+            subscription = (token, callback, filter)
+            if field is None:
+                self._wildcard[token] = subscription
+            else:
+                for value in values:
+                    self._index[field].setdefault(value, {})[token] = subscription
+            self._changes[token] = (field, values)
+        return token
+
+    def remove(self, token: int) -> None:
+        """Drop a subscription; unknown tokens are ignored."""
+        with self._lock:
+            self._remove(token)
+
+    def _remove(self, token: int) -> None:
+        registered = self._classes.pop(token, None)
+        if registered is not None:
+            cls = registered[0]
+            del self._by_class[cls][token]
+            if not self._by_class[cls]:
+                del self._by_class[cls]
+            self._class_cache.clear()
+            return
+        change = self._changes.pop(token, None)
+        if change is None:
+            return
+        field, values = change
+        if field is None:
+            del self._wildcard[token]
+            return
+        index = self._index[field]
+        for value in values:
+            del index[value][token]
+            if not index[value]:
+                del index[value]
+
+    def class_subscribers(self, obj: Any) -> list[Callable[..., Any]]:
+        """Callbacks of the class subscriptions ``obj`` is an instance of.
+
+        The returned list is a snapshot; it is never modified afterwards.
+        """
+        obj_type = type(obj)
+        with self._lock:
+            callbacks = self._class_cache.get(obj_type)
+            if callbacks is None:
+                matches = [
+                    item
+                    for cls in obj_type.__mro__
+                    for item in self._by_class.get(cls, {}).items()
+                ]
+                callbacks = [
+                    callback for _, callback in sorted(matches, key=itemgetter(0))
+                ]
+                self._class_cache[obj_type] = callbacks
+        return callbacks
+
+    def publish(self, event: SHCChangeEvent) -> None:
+        """Run the change subscriptions whose filter accepts ``event``."""
+        device = event.device
+        keys = (
+            ("device_ids", device.id),
+            ("service_ids", event.service.id),
+            ("device_models", device.device_model),
+            ("room_ids", device.room_id),
+        )
+        index = self._index
+        with self._lock:
+            candidates = list(self._wildcard.values())
+            for field, key in keys:
+                if index[field]:
+                    candidates.extend(index[field].get(key, {}).values())
+        if len(candidates) > 1:
+            candidates.sort(key=itemgetter(0))
+        for _, callback, filter in candidates:
+            if filter is None or filter.matches(event):
+                run_callback(callback, event)
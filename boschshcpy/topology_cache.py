@@ -0,0 +1,266 @@
+"""Persistent on-disk topology snapshot for warm session startup.
+
+A cold session start downloads ``/services``, ``/devices``, ``/rooms``,
+``/scenarios`` and ``/userdefinedstates`` and builds every ``SHCDevice`` from
+scratch.  ``SHCTopologyCache`` stores those raw resources in one versioned JSON
+file per controller, keyed by the controller MAC address
+(``SHCInformation.macAddress``), so the next session can build its whole
+device graph from disk and reconcile with the controller in the background.
+
+Staleness
+---------
+The snapshot carries the service *states* as they were when it was written.
+Sessions therefore treat it as a starting point only: they always re-fetch
+the live resources after a warm start and push every difference through the
+normal update path (service state changes fire callbacks, new and removed
+devices are handled like long-poll ``device`` events).  The intrusion
+detection state is safety relevant and is never served from the snapshot.
+
+Both sessions compute those differences with ``diff_topology``.  Long-poll
+results keep arriving while the live resources are fetched, so a fetched
+service state is only applied if the service has not been updated since
+the fetch started (``service_versions``); otherwise the newer long-poll
+state wins.
+
+Files are written atomically (temp file + ``os.replace``) so a crash mid-write
+never leaves a truncated snapshot behind; an unreadable, foreign or outdated
+snapshot is ignored and the session falls back to a cold enumeration.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import tempfile
+import time
+from collections import defaultdict
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from .events import apply_service_result
+from .services_impl import SUPPORTED_DEVICE_SERVICE_IDS
+
+if TYPE_CHECKING:
+    from .device import SHCDevice
+    from .subscriptions import SHCSubscriptionRegistry
+    from .userdefinedstate import SHCUserDefinedState
+
+logger = logging.getLogger("boschshcpy")
+
+# Bump when the snapshot layout changes; older files are then ignored.
+TOPOLOGY_CACHE_VERSION = 1
+
+TOPOLOGY_RESOURCES = ("services", "devices", "rooms", "scenarios", "userdefinedstates")
+
+
+class SHCTopologyCache:
+    """Versioned per-controller topology snapshots in a directory."""
+
+    def __init__(
+        self, directory: str | os.PathLike[str], max_age: float | None = None
+    ) -> None:
+        """Initialise the cache.
+
+        Args:
+            directory: Directory holding the snapshot files (created on the
+                first save).
+            max_age: Optional maximum snapshot age in seconds; older snapshots
+                are ignored on load.  ``None`` accepts any age.
+        """
+        self._directory = Path(directory)
+        self._max_age = max_age
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    def path(self, mac_address: str) -> Path:
+        """Snapshot file path for a controller MAC address."""
+        safe_mac = re.sub(r"[^0-9A-Za-z]", "-", mac_address)
+        return self._directory / f"topology-{safe_mac}.json"
+
+    def load(self, mac_address: str | None) -> dict[str, Any] | None:
+        """Return the stored snapshot for ``mac_address``, or None.
+
+        None is returned (never raised) for a missing, unreadable, foreign,
+        outdated or expired snapshot.
+        """
+        if not mac_address:
+            return None
+        path = self.path(mac_address)
+        try:
+            snapshot = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as err:
+            logger.debug("Ignoring unreadable topology snapshot %s: %s", path, err)
+            return None
+
+        if not isinstance(snapshot, dict):
+            return None
+        if snapshot.get("version") != TOPOLOGY_CACHE_VERSION:
+            logger.debug(
+                "Ignoring topology snapshot %s with version %r",
+                path,
+                snapshot.get("version"),
+            )
+            return None
+        if snapshot.get("macAddress") != mac_address:
+            return None
+        if not all(isinstance(snapshot.get(key), list) for key in TOPOLOGY_RESOURCES):
+            return None
+        if self._max_age is not None:
+            saved_at = snapshot.get("savedAt")
+            if not isinstance(saved_at, (int, float)) or (
+                time.time() - saved_at > self._max_age
+            ):
+                logger.debug("Ignoring expired topology snapshot %s", path)
+                return None
+        return snapshot
+
+    def save(self, mac_address: str | None, resources: dict[str, list[Any]]) -> None:
+        """Atomically write the snapshot for ``mac_address``.
+
+        ``resources`` maps every name in TOPOLOGY_RESOURCES to its raw list.
+        """
+        if not mac_address:
+            return
+        snapshot: dict[str, Any] = {
+            "version": TOPOLOGY_CACHE_VERSION,
+            "macAddress": mac_address,
+            "savedAt": time.time(),
+        }
+        for key in TOPOLOGY_RESOURCES:
+            snapshot[key] = list(resources.get(key, []))
+
+        self._directory.mkdir(parents=True, exist_ok=True)
+        path = self.path(mac_address)
+        fd, tmp_name = tempfile.mkstemp(
+            dir=self._directory, prefix=f".{path.name}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
+                json.dump(snapshot, tmp_file)
+            os.replace(tmp_name, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+        logger.debug("Saved topology snapshot %s", path)
+
+    def invalidate(self, mac_address: str | None) -> None:
+        """Delete the stored snapshot for ``mac_address`` (no-op if absent)."""
+        if not mac_address:
+            return
+        try:
+            self.path(mac_address).unlink()
+        except FileNotFoundError:
+            pass
+
+
+# (device id, service id) -> the raw DeviceServiceData the service held.
+ServiceVersions = dict[tuple[str, str], object]
+
+
+class SHCTopologyDiff(NamedTuple):
+    """What a reconcile changes in a session's device graph."""
+
+    # New, changed and removed devices, then new and changed user-defined
+    # states, as long-poll results for the session's result handlers.
+    poll_results: list[dict[str, Any]]
+    # Existing devices and their fetched services they do not have yet.
+    new_services: list[tuple[SHCDevice, list[dict[str, Any]]]]
+    # Fetched states of existing services not updated since the fetch began.
+    service_results: list[tuple[SHCDevice, dict[str, Any]]]
+    removed_state_ids: list[str]
+
+
+def service_versions(devices: Iterable[SHCDevice]) -> ServiceVersions:
+    """Record the state every service holds before a reconcile fetch.
+
+    Each long-poll or refresh result replaces a service's raw
+    DeviceServiceData, so a service whose entry is no longer the recorded
+    object has been updated since.
+    """
+    return {
+        (device.id, service.id): service._raw_device_service
+        for device in devices
+        for service in device.device_services
+    }
+
+
+def diff_topology(
+    devices_by_id: Mapping[str, SHCDevice],
+    userdefinedstates_by_id: Mapping[str, SHCUserDefinedState],
+    versions: ServiceVersions,
+    raw_services: list[dict[str, Any]],
+    raw_devices: list[dict[str, Any]],
+    raw_states: list[dict[str, Any]],
+) -> SHCTopologyDiff:
+    """Compare freshly fetched resources with the session's device graph.
+
+    ``versions`` is the service_versions() result taken before the fetch.
+    """
+    raw_services_by_device_id: dict[str, list[dict[str, Any]]] = defaultdict(list)
+    for raw_service in raw_services:
+        if raw_service["id"] in SUPPORTED_DEVICE_SERVICE_IDS:
+            raw_services_by_device_id[raw_service["deviceId"]].append(raw_service)
+
+    diff = SHCTopologyDiff([], [], [], [])
+    live_device_ids = set()
+    for raw_device in raw_devices:
+        device_id = raw_device["id"]
+        live_device_ids.add(device_id)
+        device = devices_by_id.get(device_id)
+        if device is None or device._raw_device != raw_device:
+            diff.poll_results.append(raw_device)
+        if device is None:
+            continue
+        missing = []
+        for raw_service in raw_services_by_device_id[device_id]:
+            service = device.device_service(raw_service["id"])
+            if service is None:
+                missing.append(raw_service)
+            elif service._raw_device_service is versions.get(
+                (device_id, raw_service["id"])
+            ):
+                diff.service_results.append((device, raw_service))
+        if missing:
+            diff.new_services.append((device, missing))
+    for device_id, device in devices_by_id.items():
+        if device_id not in live_device_ids:
+            diff.poll_results.append({**device._raw_device, "deleted": True})
+
+    live_state_ids = set()
+    for raw_state in raw_states:
+        live_state_ids.add(raw_state["id"])
+        state = userdefinedstates_by_id.get(raw_state["id"])
+        if state is None or state._raw_state != raw_state:
+            diff.poll_results.append(raw_state)
+    diff.removed_state_ids.extend(
+        state_id
+        for state_id in userdefinedstates_by_id
+        if state_id not in live_state_ids
+    )
+    return diff
+
+
+def apply_service_changes(
+    diff: SHCTopologyDiff, subscriptions: SHCSubscriptionRegistry
+) -> None:
+    """Add the new services of ``diff`` and apply its refreshed states.
+
+    States go through SHCDevice.process_refresh_result, so only services
+    whose state changed fire callbacks and change events.
+    """
+    for device, raw_device_services in diff.new_services:
+        device._init_services(raw_device_services)
+    for device, raw_service in diff.service_results:
+        apply_service_result(
+            subscriptions, device, raw_service, device.process_refresh_result
+        )
@@ -39,6 +39,9 @@ setup(
         "requests>=2.22",
         "zeroconf>=0.28.0",
     ],
+    extras_require={
+        "speedups": ["orjson>=3"],
+    },
     project_urls={
         "Bug Reports": "https://github.com/tschamm/boschshcpy/issues",
         "Source": "https://github.com/tschamm/boschshcpy",
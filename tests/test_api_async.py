@@ -16,8 +16,10 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from boschshcpy.api_async import SHCAPIAsync, build_ssl_context
+from boschshcpy.api_async import SHCAPIAsync, SHCConnectionPoolStats, build_ssl_context
 from boschshcpy.exceptions import SHCConnectionError, SHCSessionError
+from boschshcpy.singleflight import AsyncSingleFlight
+from boschshcpy.retry import RETRY_ONCE_ON_DROP
 
 
 # ---------------------------------------------------------------------------
@@ -131,6 +133,7 @@ class TestSSLContextParam:
         fake = types.SimpleNamespace(
             TCPConnector=lambda **kw: MagicMock(),
             ClientSession=lambda **kw: MagicMock(),
+            TraceConfig=MagicMock,
         )
         monkeypatch.setitem(sys.modules, "aiohttp", fake)
 
@@ -204,6 +207,14 @@ def _make_api(cert_and_key_paths: tuple[str, str]) -> SHCAPIAsync:
     api._owns_session = True
     api._session = mock_session
     api._headers = {"api-version": "3.2", "Content-Type": "application/json"}
+    api._keepalive_timeout = 5.0
+    api._dedicated_long_poll = False
+    api._long_poll_session = None
+    api._stats = dict.fromkeys(SHCConnectionPoolStats._fields, 0)
+    api._response_cache = None
+    api._single_flight = AsyncSingleFlight()
+    api._scheduler = None
+    api._retry_policy = RETRY_ONCE_ON_DROP
     return api
 
 
@@ -281,7 +292,7 @@ class TestUrlAndHeaders:
         called_url = api._session.put.call_args[0][0]
         assert called_url == "https://192.0.2.1:8444/smarthome/devices/dev-1"
         sent = api._session.put.call_args[1]["data"]
-        assert '"profile": "OUTDOOR"' in sent
+        assert json.loads(sent)["profile"] == "OUTDOOR"
 
     def test_long_polling_subscribe_url(self, cert_and_key_paths: tuple[str, str]) -> None:
         api = _make_api(cert_and_key_paths)
@@ -479,3 +490,665 @@ class TestImportSafety:
         with patch("builtins.__import__", side_effect=fake_import):
             with pytest.raises(ImportError, match="aiohttp"):
                 SHCAPIAsync("192.0.2.1", "cert.pem", "key.pem")
+
+
+# ---------------------------------------------------------------------------
+# Connection pool policy, dedicated long-poll session, pool_stats
+# ---------------------------------------------------------------------------
+
+class TestConnectionPool:
+    def test_owned_connector_is_bounded_with_short_keepalive(
+        self, cert_and_key_paths: tuple[str, str]
+    ) -> None:
+        from boschshcpy.api_async import DEFAULT_KEEPALIVE_TIMEOUT
+
+        cert, key = cert_and_key_paths
+        with (
+            patch("aiohttp.TCPConnector") as mock_tcp,
+            patch("aiohttp.ClientSession") as mock_cls,
+        ):
+            SHCAPIAsync("192.0.2.1", cert, key, connection_limit=4)
+
+        kwargs = mock_tcp.call_args[1]
+        assert kwargs["limit"] == 4
+        assert kwargs["keepalive_timeout"] == DEFAULT_KEEPALIVE_TIMEOUT
+        assert DEFAULT_KEEPALIVE_TIMEOUT < 15.0  # below aiohttp's default
+        assert len(mock_cls.call_args[1]["trace_configs"]) == 1
+
+    def test_long_poll_uses_dedicated_single_connection_session(
+        self, cert_and_key_paths: tuple[str, str]
+    ) -> None:
+        api = _make_api(cert_and_key_paths)
+        api._dedicated_long_poll = True
+        poll_session = MagicMock()
+        poll_session.closed = False
+        poll_session.close = AsyncMock()
+        poll_session.post = MagicMock(
+            side_effect=lambda *a, **kw: _make_mock_response(
+                body=[{"jsonrpc": "2.0", "result": []}]
+            )
+        )
+        api._session.post = MagicMock(
+            return_value=_make_mock_response(body=[{"jsonrpc": "2.0", "result": "pid"}])
+        )
+
+        with (
+            patch("aiohttp.TCPConnector") as mock_tcp,
+            patch("aiohttp.ClientSession", return_value=poll_session) as mock_cls,
+        ):
+            asyncio.run(api.long_polling_subscribe())
+            asyncio.run(api.long_polling_poll("pid", wait_seconds=10))
+            asyncio.run(api.long_polling_poll("pid", wait_seconds=10))
+
+        # Subscribe on the shared session, both polls on the dedicated one,
+        # which is created once with a single connection.
+        assert api._session.post.call_count == 1
+        assert poll_session.post.call_count == 2
+        mock_cls.assert_called_once()
+        assert mock_tcp.call_args[1]["limit"] == 1
+        assert api.pool_stats.long_polls == 2
+
+    def test_external_session_also_carries_long_polls_by_default(
+        self, cert_and_key_paths: tuple[str, str]
+    ) -> None:
+        cert, key = cert_and_key_paths
+        external = MagicMock()
+        with (
+            patch("aiohttp.TCPConnector"),
+            patch("aiohttp.ClientSession") as mock_cls,
+        ):
+            api = SHCAPIAsync("192.0.2.1", cert, key, external_session=external)
+            assert api._get_long_poll_session() is external
+            mock_cls.assert_not_called()
+
+            opted_in = SHCAPIAsync(
+                "192.0.2.1",
+                cert,
+                key,
+                external_session=external,
+                dedicated_long_poll=True,
+            )
+            assert opted_in._get_long_poll_session() is mock_cls.return_value
+
+    def test_close_closes_long_poll_session_even_with_external_session(
+        self, cert_and_key_paths: tuple[str, str]
+    ) -> None:
+        api = _make_api(cert_and_key_paths)
+        api._owns_session = False
+        poll_session = MagicMock()
+        poll_session.closed = False
+        poll_session.close = AsyncMock()
+        api._long_poll_session = poll_session
+
+        asyncio.run(api.close())
+
+        poll_session.close.assert_awaited_once()
+        api._session.close.assert_not_called()
+        assert api._long_poll_session is None
+
+    def test_pool_stats_count_requests_and_dropped_connections(
+        self, cert_and_key_paths: tuple[str, str]
+    ) -> None:
+        import aiohttp
+
+        api = _make_api(cert_and_key_paths)
+        api._session.get = MagicMock(
+            side_effect=[
+                aiohttp.ClientConnectionError("dropped"),
+                _make_mock_response(body=[]),
+            ]
+        )
+
+        asyncio.run(api.get_devices())
+
+        stats = api.pool_stats
+        assert stats.requests == 2
+        assert stats.connection_drops == 1
+        assert stats.in_flight == 0
+        assert stats.peak_in_flight == 1
+
+    def test_pool_stats_peak_in_flight(self, cert_and_key_paths: tuple[str, str]) -> None:
+        api = _make_api(cert_and_key_paths)
+
+        async def run() -> None:
+            gate = asyncio.Event()
+
+            async def slow_read() -> bytes:
+                await gate.wait()
+                return b"[]"
+
+            def make_resp(*args: Any, **kwargs: Any) -> MagicMock:
+                resp = _make_mock_response(body=[])
+                resp.read = slow_read
+                return resp
+
+            api._session.get = MagicMock(side_effect=make_resp)
+            # Distinct URLs: identical GETs would be coalesced into one.
+            tasks = [
+                asyncio.create_task(getter())
+                for getter in (api.get_rooms, api.get_scenarios, api.get_devices)
+            ]
+            for _ in range(3):
+                await asyncio.sleep(0)
+            assert api.pool_stats.in_flight == 3
+            gate.set()
+            await asyncio.gather(*tasks)
+
+        asyncio.run(run())
+        assert api.pool_stats.peak_in_flight == 3
+        assert api.pool_stats.in_flight == 0
+
+    def test_trace_config_counts_connections(
+        self, cert_and_key_paths: tuple[str, str]
+    ) -> None:
+        api = _make_api(cert_and_key_paths)
+        trace_config = api._build_trace_config()
+
+        async def run() -> None:
+            for callback in trace_config.on_connection_create_end:
+                await callback(None, None, None)
+            for _ in range(2):
+                for callback in trace_config.on_connection_reuseconn:
+                    await callback(None, None, None)
+
+        asyncio.run(run())
+        assert api.pool_stats.connections_created == 1
+        assert api.pool_stats.connections_reused == 2
+
+
+# ---------------------------------------------------------------------------
+# JSON-RPC batching
+# ---------------------------------------------------------------------------
+
+class TestJSONRPCBatch:
+    def test_resubscribe_is_one_request(self, cert_and_key_paths: tuple[str, str]) -> None:
+        api = _make_api(cert_and_key_paths)
+        api._session.post = MagicMock(
+            return_value=_make_mock_response(
+                body=[
+                    {"jsonrpc": "2.0", "id": 1, "error": {"code": -32001, "message": "x"}},
+                    {"jsonrpc": "2.0", "id": 2, "result": "new-id"},
+                ]
+            )
+        )
+
+        assert asyncio.run(api.long_polling_resubscribe("old-id")) == "new-id"
+
+        api._session.post.assert_called_once()
+        sent = json.loads(api._session.post.call_args[1]["data"])
+        assert [c["method"] for c in sent] == ["RE/unsubscribe", "RE/subscribe"]
+
+    def test_batch_with_long_poll_uses_long_poll_session(
+        self, cert_and_key_paths: tuple[str, str]
+    ) -> None:
+        from boschshcpy.jsonrpc import JSONRPCCall
+
+        api = _make_api(cert_and_key_paths)
+        poll_session = MagicMock()
+        poll_session.closed = False
+        poll_session.post = MagicMock(
+            return_value=_make_mock_response(
+                body=[
+                    {"jsonrpc": "2.0", "id": 1, "result": None},
+                    {"jsonrpc": "2.0", "id": 2, "result": [{"@type": "message"}]},
+                ]
+            )
+        )
+        api._dedicated_long_poll = True
+        api._long_poll_session = poll_session
+        api._session.post = MagicMock()
+
+        result = asyncio.run(
+            api.jsonrpc_batch(
+                [JSONRPCCall.unsubscribe("a"), JSONRPCCall.long_poll("b", 5)],
+                timeout=10,
+            )
+        )
+
+        assert result == [None, [{"@type": "message"}]]
+        api._session.post.assert_not_called()
+        assert api.pool_stats.long_polls == 1
+
+
+# ---------------------------------------------------------------------------
+# Streaming enumeration (iter_services / iter_devices)
+# ---------------------------------------------------------------------------
+
+def _make_streamed_response(body: Any, chunk_size: int = 5, ok: bool = True) -> MagicMock:
+    raw = json.dumps(body).encode()
+    resp = _make_mock_response(body=body, ok=ok, status=200 if ok else 500)
+
+    async def iter_chunked(size: int) -> Any:
+        for start in range(0, len(raw), chunk_size):
+            yield raw[start : start + chunk_size]
+
+    resp.content.iter_chunked = iter_chunked
+    return resp
+
+
+class TestStreamingEnumeration:
+    def test_iter_services_streams_and_filters(
+        self, cert_and_key_paths: tuple[str, str]
+    ) -> None:
+        api = _make_api(cert_and_key_paths)
+        api._session.get = MagicMock(
+            return_value=_make_streamed_response(
+                [
+                    {"@type": "DeviceServiceData", "id": "PowerSwitch", "deviceId": "d1"},
+                    {"@type": "DeviceServiceData", "id": "Other", "deviceId": "d1"},
+                ]
+            )
+        )
+
+        async def collect() -> list[Any]:
+            return [s async for s in api.iter_services({"PowerSwitch"})]
+
+        services = asyncio.run(collect())
+
+        assert [s["id"] for s in services] == ["PowerSwitch"]
+        assert api._session.get.call_args[0][0].endswith("/smarthome/services")
+        assert api.pool_stats.requests == 1
+        assert api.pool_stats.in_flight == 0
+
+    def test_iter_devices_validates_element_type(
+        self, cert_and_key_paths: tuple[str, str]
+    ) -> None:
+        api = _make_api(cert_and_key_paths)
+        api._session.get = MagicMock(
+            return_value=_make_streamed_response([{"@type": "room", "id": "r1"}])
+        )
+
+        async def collect() -> list[Any]:
+            return [d async for d in api.iter_devices()]
+
+        with pytest.raises(SHCSessionError, match="Unexpected @type"):
+            asyncio.run(collect())
+        assert api.pool_stats.in_flight == 0
+
+    def test_dropped_connection_raises_connection_error(
+        self, cert_and_key_paths: tuple[str, str]
+    ) -> None:
+        import aiohttp
+
+        api = _make_api(cert_and_key_paths)
+        resp = _make_mock_response(body=[])
+
+        async def iter_chunked(size: int) -> Any:
+            yield b'[{"@type": "device", "id": "d1"}, '
+            raise aiohttp.ClientPayloadError("reset")
+
+        resp.content.iter_chunked = iter_chunked
+        api._session.get = MagicMock(return_value=resp)
+        seen: list[Any] = []
+
+        async def collect() -> None:
+            async for device in api.iter_devices():
+                seen.append(device)
+
+        with pytest.raises(SHCConnectionError, match="interrupted"):
+            asyncio.run(collect())
+        assert [d["id"] for d in seen] == ["d1"]
+        assert api.pool_stats.connection_drops == 1
+
+    def test_dropped_connection_before_streaming_is_retried(
+        self, cert_and_key_paths: tuple[str, str]
+    ) -> None:
+        import aiohttp
+
+        api = _make_api(cert_and_key_paths)
+        api._session.get = MagicMock(
+            side_effect=[
+                aiohttp.ServerDisconnectedError(),
+                _make_streamed_response([{"@type": "device", "id": "d1"}]),
+            ]
+        )
+
+        async def collect() -> list[Any]:
+            return [d async for d in api.iter_devices()]
+
+        assert [d["id"] for d in asyncio.run(collect())] == ["d1"]
+        assert api._session.get.call_count == 2
+        assert api.pool_stats.connection_drops == 1
+        assert api.pool_stats.in_flight == 0
+
+
+# ---------------------------------------------------------------------------
+# Response cache
+# ---------------------------------------------------------------------------
+
+class TestResponseCache:
+    ROOMS = [{"@type": "room", "id": "hz_1", "name": "Living"}]
+
+    def _api(self, cert_and_key_paths: tuple[str, str], *responses: MagicMock) -> SHCAPIAsync:
+        from boschshcpy.response_cache import SHCResponseCache
+
+        self.now = 0.0
+        api = _make_api(cert_and_key_paths)
+        api._response_cache = SHCResponseCache(clock=lambda: self.now)
+        api._session.get = MagicMock(side_effect=list(responses))
+        return api
+
+    def _rooms_response(self, headers: dict[str, str] | None = None) -> MagicMock:
+        resp = _make_mock_response(body=self.ROOMS)
+        resp.headers = headers or {}
+        return resp
+
+    def test_fresh_hit_skips_request(self, cert_and_key_paths: tuple[str, str]) -> None:
+        api = self._api(cert_and_key_paths, self._rooms_response())
+
+        async def run() -> None:
+            assert await api.get_rooms() == self.ROOMS
+            assert await api.get_rooms() == self.ROOMS
+
+        asyncio.run(run())
+        assert api._session.get.call_count == 1
+        assert api.pool_stats.requests == 1
+
+    def test_expired_entry_revalidates_with_304(
+        self, cert_and_key_paths: tuple[str, str]
+    ) -> None:
+        not_modified = _make_mock_response(status=304, ok=False)
+        api = self._api(
+            cert_and_key_paths,
+            self._rooms_response({"ETag": '"r1"', "Last-Modified": "yesterday"}),
+            not_modified,
+        )
+
+        async def run() -> None:
+            await api.get_rooms()
+            self.now += 301
+            assert await api.get_rooms() == self.ROOMS
+            await api.get_rooms()
+
+        asyncio.run(run())
+        assert api._session.get.call_count == 2
+        headers = api._session.get.call_args[1]["headers"]
+        assert headers["If-None-Match"] == '"r1"'
+        assert headers["If-Modified-Since"] == "yesterday"
+        not_modified.read.assert_not_called()
+
+    def test_304_after_invalidation_refetches(
+        self, cert_and_key_paths: tuple[str, str]
+    ) -> None:
+        api = self._api(cert_and_key_paths)
+        responses = [
+            self._rooms_response({"ETag": '"r1"'}),
+            _make_mock_response(status=304, ok=False),
+            self._rooms_response(),
+        ]
+
+        def get(url: str, **kwargs: Any) -> MagicMock:
+            if len(responses) == 2:
+                api._response_cache.invalidate()
+            return responses.pop(0)
+
+        api._session.get = MagicMock(side_effect=get)
+
+        async def run() -> None:
+            await api.get_rooms()
+            self.now += 301
+            assert await api.get_rooms() == self.ROOMS
+
+        asyncio.run(run())
+        assert api._session.get.call_count == 3
+        assert "If-None-Match" not in api._session.get.call_args[1]["headers"]
+
+    def test_information_is_cached_only_with_a_ttl(
+        self, cert_and_key_paths: tuple[str, str]
+    ) -> None:
+        resp = _make_mock_response(body={"@type": "None", "apiVersions": []})
+        resp.headers = {}
+        api = self._api(cert_and_key_paths)
+        api._session.get = MagicMock(return_value=resp)
+
+        async def run() -> None:
+            await api.get_information()
+            await api.get_information()
+
+        asyncio.run(run())
+        assert api._session.get.call_count == 2
+
+        from boschshcpy.response_cache import SHCResponseCache
+
+        api._response_cache = SHCResponseCache(
+            {"information": 60.0}, clock=lambda: self.now
+        )
+        asyncio.run(run())
+        assert api._session.get.call_count == 3
+
+
+# ---------------------------------------------------------------------------
+# Single-flight GETs
+# ---------------------------------------------------------------------------
+
+class TestSingleFlightGets:
+    def test_concurrent_identical_gets_share_one_request(
+        self, cert_and_key_paths: tuple[str, str]
+    ) -> None:
+        api = _make_api(cert_and_key_paths)
+        body = {"@type": "DeviceServiceData", "id": "PowerSwitch"}
+        api._session.get = MagicMock(
+            side_effect=lambda *a, **kw: _make_mock_response(body=body)
+        )
+
+        async def run() -> list[Any]:
+            return await asyncio.gather(
+                *(api.get_device_service("hdm:D1", "PowerSwitch") for _ in range(3))
+            )
+
+        results = asyncio.run(run())
+        assert results == [body, body, body]
+        assert api._session.get.call_count == 1
+        assert api.pool_stats.requests == 1
+        assert api.pool_stats.coalesced == 2
+
+    def test_error_reaches_every_waiter(
+        self, cert_and_key_paths: tuple[str, str]
+    ) -> None:
+        api = _make_api(cert_and_key_paths)
+        api._session.get = MagicMock(
+            side_effect=lambda *a, **kw: _make_mock_response(body={"@type": "WRONG"})
+        )
+
+        async def run() -> list[Any]:
+            return await asyncio.gather(
+                *(api.get_device_service("hdm:D1", "PowerSwitch") for _ in range(2)),
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(run())
+        assert all(isinstance(result, SHCSessionError) for result in results)
+        assert api._session.get.call_count == 1
+
+    def test_different_urls_are_not_coalesced(
+        self, cert_and_key_paths: tuple[str, str]
+    ) -> None:
+        api = _make_api(cert_and_key_paths)
+        api._session.get = MagicMock(
+            side_effect=lambda *a, **kw: _make_mock_response(
+                body={"@type": "DeviceServiceData"}
+            )
+        )
+
+        async def run() -> None:
+            await asyncio.gather(
+                api.get_device_service("hdm:D1", "PowerSwitch"),
+                api.get_device_service("hdm:D1", "PowerMeter"),
+            )
+
+        asyncio.run(run())
+        assert api._session.get.call_count == 2
+        assert api.pool_stats.coalesced == 0
+
+
+# ---------------------------------------------------------------------------
+# Request scheduler
+# ---------------------------------------------------------------------------
+
+class TestRequestScheduler:
+    def test_requests_wait_for_their_class(
+        self, cert_and_key_paths: tuple[str, str]
+    ) -> None:
+        from boschshcpy.scheduler import Priority
+
+        api = _make_api(cert_and_key_paths)
+        api._scheduler = MagicMock()
+        api._scheduler.acquire = AsyncMock()
+        api._session.get = MagicMock(return_value=_make_mock_response(body=[]))
+        api._session.put = MagicMock(return_value=_make_mock_response())
+        api._session.post = MagicMock(
+            side_effect=lambda *a, **kw: _make_mock_response(
+                body=[{"jsonrpc": "2.0", "result": "poll-1"}]
+            )
+        )
+
+        async def run() -> None:
+            await api.get_rooms()
+            await api.put_device_service_state("hdm:D1", "PowerSwitch", {"on": True})
+            await api.post_domain_action("intrusion/actions/arm")
+            await api.long_polling_subscribe()
+
+        asyncio.run(run())
+        assert [c.args[0] for c in api._scheduler.acquire.await_args_list] == [
+            Priority.READ,
+            Priority.INTERACTIVE,
+            Priority.IDS,
+        ]
+
+    def test_scheduler_orders_real_requests(
+        self, cert_and_key_paths: tuple[str, str]
+    ) -> None:
+        from boschshcpy.scheduler import Priority, SHCRequestSchedulerAsync, scheduling_priority
+
+        api = _make_api(cert_and_key_paths)
+        api._scheduler = SHCRequestSchedulerAsync(rate=100.0, burst=1)
+        order: list[str] = []
+
+        def get(url: str, **kwargs: Any) -> MagicMock:
+            order.append("GET " + url.rsplit("/", 1)[1])
+            return _make_mock_response(body=[])
+
+        def put(url: str, **kwargs: Any) -> MagicMock:
+            order.append("PUT")
+            return _make_mock_response()
+
+        api._session.get = MagicMock(side_effect=get)
+        api._session.put = MagicMock(side_effect=put)
+
+        async def background() -> None:
+            with scheduling_priority(Priority.BACKGROUND):
+                await api.get_services()
+
+        async def run() -> None:
+            await api.get_rooms()  # uses the only token
+            await asyncio.gather(
+                background(),
+                api.put_device_service_state("hdm:D1", "PowerSwitch", {"on": True}),
+            )
+
+        asyncio.run(run())
+        assert order == ["GET rooms", "PUT", "GET services"]
+
+
+# ---------------------------------------------------------------------------
+# Retry policy
+# ---------------------------------------------------------------------------
+
+class TestRetryPolicy:
+    def _api(self, cert_and_key_paths: tuple[str, str], **policy: Any) -> SHCAPIAsync:
+        from boschshcpy.retry import SHCRetryPolicy
+
+        api = _make_api(cert_and_key_paths)
+        api._retry_policy = SHCRetryPolicy(**policy)
+        return api
+
+    def test_get_retried_on_retryable_status_with_backoff(
+        self, cert_and_key_paths: tuple[str, str]
+    ) -> None:
+        api = self._api(cert_and_key_paths, backoff_base=0.5, jitter=0.0)
+        responses = [
+            _make_mock_response(status=503, ok=False, body={"errorCode": "busy"}),
+            _make_mock_response(status=503, ok=False, body={"errorCode": "busy"}),
+            _make_mock_response(body=[]),
+        ]
+        api._session.get = MagicMock(side_effect=responses)
+        sleeps: list[float] = []
+
+        async def fake_sleep(seconds: float) -> None:
+            sleeps.append(seconds)
+
+        with patch("boschshcpy.api_async.asyncio.sleep", side_effect=fake_sleep):
+            assert asyncio.run(api.get_devices()) == []
+        assert sleeps == [0.5, 1.0]
+        assert api.pool_stats.requests == 3
+        assert api.pool_stats.retries == 2
+
+    def test_status_error_surfaces_after_max_attempts(
+        self, cert_and_key_paths: tuple[str, str]
+    ) -> None:
+        api = self._api(cert_and_key_paths, max_attempts=2, backoff_base=0.0)
+        api._session.get = MagicMock(
+            side_effect=lambda *a, **kw: _make_mock_response(status=503, ok=False)
+        )
+        with pytest.raises(SHCSessionError, match="code 503"):
+            asyncio.run(api.get_devices())
+        assert api._session.get.call_count == 2
+
+    def test_get_retried_on_timeout(self, cert_and_key_paths: tuple[str, str]) -> None:
+        api = self._api(cert_and_key_paths, backoff_base=0.0)
+        ok = _make_mock_response(body=[])
+        api._session.get = MagicMock(side_effect=[asyncio.TimeoutError(), ok])
+        assert asyncio.run(api.get_devices()) == []
+        assert api.pool_stats.connection_drops == 0
+
+    def test_connect_timeout_retried_once_without_policy(
+        self, cert_and_key_paths: tuple[str, str]
+    ) -> None:
+        import aiohttp
+
+        api = _make_api(cert_and_key_paths)
+        ok = _make_mock_response(body=[])
+        api._session.post = MagicMock(
+            side_effect=[aiohttp.ConnectionTimeoutError(), ok]
+        )
+        asyncio.run(api.post_domain_action("intrusion/actions/arm"))
+        assert api._session.post.call_count == 2
+        assert api.pool_stats.connection_drops == 1
+
+    def test_read_timeout_not_treated_as_dropped(
+        self, cert_and_key_paths: tuple[str, str]
+    ) -> None:
+        import aiohttp
+
+        api = _make_api(cert_and_key_paths)
+        api._session.post = MagicMock(side_effect=aiohttp.SocketTimeoutError())
+        with pytest.raises(SHCConnectionError):
+            asyncio.run(api.post_domain_action("intrusion/actions/arm"))
+        assert api._session.post.call_count == 1
+
+    def test_post_not_retried_on_status_or_timeout(
+        self, cert_and_key_paths: tuple[str, str]
+    ) -> None:
+        api = self._api(cert_and_key_paths, backoff_base=0.0)
+        api._session.post = MagicMock(
+            side_effect=[_make_mock_response(status=503, ok=False), asyncio.TimeoutError()]
+        )
+        with pytest.raises(SHCSessionError):
+            asyncio.run(api.post_domain_action("intrusion/actions/arm"))
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(api.post_domain_action("intrusion/actions/arm"))
+        assert api._session.post.call_count == 2
+
+    def test_post_retried_once_after_drop(
+        self, cert_and_key_paths: tuple[str, str]
+    ) -> None:
+        import aiohttp
+
+        api = self._api(cert_and_key_paths, backoff_base=0.0, max_attempts=5)
+        api._session.post = MagicMock(
+            side_effect=aiohttp.ServerDisconnectedError()
+        )
+        with pytest.raises(SHCConnectionError, match="API connection error"):
+            asyncio.run(api.post_domain_action("intrusion/actions/arm"))
+        assert api._session.post.call_count == 2
+        assert api.pool_stats.connection_drops == 1
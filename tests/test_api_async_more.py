@@ -27,8 +27,10 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from boschshcpy.api_async import SHCAPIAsync, build_ssl_context
+from boschshcpy.api_async import SHCAPIAsync, SHCConnectionPoolStats, build_ssl_context
 from boschshcpy.exceptions import SHCConnectionError, SHCSessionError
+from boschshcpy.singleflight import AsyncSingleFlight
+from boschshcpy.retry import RETRY_ONCE_ON_DROP
 
 
 # ---------------------------------------------------------------------------
@@ -109,6 +111,14 @@ def _make_api(cert_and_key_paths: tuple[str, str]) -> SHCAPIAsync:
     api._owns_session = True
     api._session = mock_session
     api._headers = {"api-version": "3.2", "Content-Type": "application/json"}
+    api._keepalive_timeout = 5.0
+    api._dedicated_long_poll = False
+    api._long_poll_session = None
+    api._stats = dict.fromkeys(SHCConnectionPoolStats._fields, 0)
+    api._response_cache = None
+    api._single_flight = AsyncSingleFlight()
+    api._scheduler = None
+    api._retry_policy = RETRY_ONCE_ON_DROP
     return api
 
 
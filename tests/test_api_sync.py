@@ -16,7 +16,10 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from boschshcpy import codec
 from boschshcpy.api import SHCAPI, JSONRPCError
+from boschshcpy.singleflight import SingleFlight
+from boschshcpy.retry import RETRY_ONCE_ON_DROP
 from boschshcpy.exceptions import SHCConnectionError, SHCSessionError
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -59,6 +62,10 @@ def _make_api() -> SHCAPI:
     api._public_root = _PUBLIC_ROOT
     api._rpc_root = _RPC_ROOT
     api._requests_session = MagicMock()
+    api._response_cache = None
+    api._single_flight = SingleFlight()
+    api._scheduler = None
+    api._retry_policy = RETRY_ONCE_ON_DROP
     return api
 
 
@@ -202,6 +209,20 @@ class TestGetApiResultOrFail:
                 f"{_API_ROOT}/devices", expected_element_type="device"
             )
 
+    def test_validate_false_skips_type_checks(self):
+        api = _make_api()
+        payload = [{"@type": "device"}, {"@type": "scenario"}]
+        api._requests_session.get.return_value = _fake_response(payload)
+        result = api.get_devices(validate=False)
+        assert result == payload
+
+    def test_check_element_type(self):
+        from boschshcpy.api import check_element_type
+
+        check_element_type({"@type": "room"}, "room")
+        with pytest.raises(SHCSessionError, match="got None"):
+            check_element_type({"id": "r1"}, "room")
+
 
 # ──────────────────────────────────────────────────────────────────────────────
 # _put_api_or_fail
@@ -216,7 +237,7 @@ class TestPutApiOrFail:
         url = f"{_API_ROOT}/devices/d1/services/s1/state"
         api._put_api_or_fail(url, body)
         api._requests_session.put.assert_called_once_with(
-            url, data=json.dumps(body), timeout=30
+            url, data=codec.dumps(body), timeout=30
         )
 
     def test_returns_parsed_json_when_content_present(self):
@@ -252,7 +273,7 @@ class TestPostApiOrFail:
         url = f"{_API_ROOT}/scenarios/s1/triggers"
         api._post_api_or_fail(url, body)
         api._requests_session.post.assert_called_once_with(
-            url, data=json.dumps(body), timeout=30
+            url, data=codec.dumps(body), timeout=30
         )
 
     def test_returns_parsed_json_when_content_present(self):
@@ -390,7 +411,7 @@ class TestGetEndpoints:
         called_url = api._requests_session.put.call_args[0][0]
         assert called_url == f"{_API_ROOT}/devices/hdm:ZigBee:abc"
         sent = api._requests_session.put.call_args.kwargs["data"]
-        assert '"profile": "OUTDOOR"' in sent
+        assert json.loads(sent)["profile"] == "OUTDOOR"
 
     # get_services --------------------------------------------------------------
     def test_get_services_url(self):
@@ -883,3 +904,432 @@ class TestHostNameIgnoringAdapter:
         assert captured.get("assert_hostname") is False
         assert captured["num_pools"] == 2
         assert captured["maxsize"] == 5
+
+
+class TestJSONRPCBatch:
+    def test_batch_is_one_post_and_demultiplexed(self):
+        from boschshcpy.jsonrpc import JSONRPCCall
+
+        api = _make_api()
+        api._requests_session.post.return_value = _fake_response(
+            [
+                {"jsonrpc": "2.0", "id": 2, "result": "new"},
+                {"jsonrpc": "2.0", "id": 1, "result": None},
+            ]
+        )
+        result = api.jsonrpc_batch(
+            [JSONRPCCall.unsubscribe("old"), JSONRPCCall.subscribe()]
+        )
+        assert result == [None, "new"]
+        api._requests_session.post.assert_called_once()
+        url = api._requests_session.post.call_args[0][0]
+        sent = json.loads(api._requests_session.post.call_args[1]["data"])
+        assert url == _RPC_ROOT
+        assert [c["method"] for c in sent] == ["RE/unsubscribe", "RE/subscribe"]
+
+    def test_resubscribe_ignores_expired_old_id(self):
+        api = _make_api()
+        api._requests_session.post.return_value = _fake_response(
+            [
+                {"jsonrpc": "2.0", "id": 1, "error": {"code": -32001, "message": "x"}},
+                {"jsonrpc": "2.0", "id": 2, "result": "new-id"},
+            ]
+        )
+        assert api.long_polling_resubscribe("old-id") == "new-id"
+        sent = json.loads(api._requests_session.post.call_args[1]["data"])
+        assert sent[0]["params"] == ["old-id"]
+
+    def test_resubscribe_raises_subscribe_error(self):
+        api = _make_api()
+        api._requests_session.post.return_value = _fake_response(
+            [
+                {"jsonrpc": "2.0", "id": 1, "result": None},
+                {"jsonrpc": "2.0", "id": 2, "error": {"code": -32000, "message": "no"}},
+            ]
+        )
+        with pytest.raises(JSONRPCError) as exc_info:
+            api.long_polling_resubscribe("old-id")
+        assert exc_info.value.code == -32000
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Streaming enumeration (iter_services / iter_devices)
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+def _streamed_response(body, chunk_size=7, status_code=200):
+    raw = json.dumps(body).encode()
+    resp = _fake_response(body, status_code=status_code)
+    resp.iter_content = MagicMock(
+        return_value=iter(
+            [raw[i : i + chunk_size] for i in range(0, len(raw), chunk_size)]
+        )
+    )
+    resp.close = MagicMock()
+    return resp
+
+
+class TestStreamingEnumeration:
+    SERVICES = [
+        {"@type": "DeviceServiceData", "id": "PowerSwitch", "deviceId": "hdm:D1"},
+        {"@type": "DeviceServiceData", "id": "Unsupported", "deviceId": "hdm:D1"},
+        {"@type": "DeviceServiceData", "id": "BatteryLevel", "deviceId": "hdm:D2"},
+    ]
+
+    def test_iter_services_streams_and_filters(self):
+        api = _make_api()
+        resp = _streamed_response(self.SERVICES)
+        api._requests_session.get.return_value = resp
+
+        services = list(api.iter_services({"PowerSwitch", "BatteryLevel"}))
+
+        assert [s["id"] for s in services] == ["PowerSwitch", "BatteryLevel"]
+        url = api._requests_session.get.call_args[0][0]
+        assert url == f"{_API_ROOT}/services"
+        assert api._requests_session.get.call_args[1]["stream"] is True
+        resp.close.assert_called_once()
+
+    def test_iter_services_is_lazy(self):
+        api = _make_api()
+        api._requests_session.get.return_value = _streamed_response(self.SERVICES)
+        services = api.iter_services()
+        api._requests_session.get.assert_not_called()
+        assert next(services)["id"] == "PowerSwitch"
+
+    def test_iter_devices_validates_element_type(self):
+        api = _make_api()
+        api._requests_session.get.return_value = _streamed_response(
+            [{"@type": "device", "id": "d1"}, {"@type": "room", "id": "r1"}]
+        )
+        devices = api.iter_devices()
+        assert next(devices)["id"] == "d1"
+        with pytest.raises(SHCSessionError, match="Unexpected @type"):
+            next(devices)
+
+    def test_iter_devices_without_validation(self):
+        api = _make_api()
+        api._requests_session.get.return_value = _streamed_response(
+            [{"@type": "room", "id": "r1"}]
+        )
+        assert list(api.iter_devices(validate=False)) == [{"@type": "room", "id": "r1"}]
+
+    def test_truncated_body_raises_session_error(self):
+        api = _make_api()
+        resp = _fake_response(None)
+        resp.iter_content = MagicMock(return_value=iter([b'[{"@type": "device"']))
+        resp.close = MagicMock()
+        api._requests_session.get.return_value = resp
+        with pytest.raises(SHCSessionError, match="Incomplete JSON array"):
+            list(api.iter_devices())
+        resp.close.assert_called_once()
+
+    def test_interrupted_stream_raises_connection_error(self):
+        import requests
+
+        api = _make_api()
+        resp = _fake_response(None)
+
+        def chunks(chunk_size):
+            yield b"["
+            raise requests.exceptions.ChunkedEncodingError("reset")
+
+        resp.iter_content = chunks
+        resp.close = MagicMock()
+        api._requests_session.get.return_value = resp
+        with pytest.raises(SHCConnectionError, match="interrupted"):
+            list(api.iter_devices())
+
+    def test_ssl_error_raises_connection_error(self):
+        import requests
+
+        api = _make_api()
+        api._requests_session.get.side_effect = requests.exceptions.SSLError("bad")
+        with pytest.raises(SHCConnectionError, match="SSLError"):
+            list(api.iter_devices())
+        assert api._requests_session.get.call_count == 1
+
+    def test_nok_raises_session_error(self):
+        api = _make_api()
+        resp = _streamed_response({"errorCode": "x"}, status_code=500)
+        api._requests_session.get.return_value = resp
+        with pytest.raises(SHCSessionError):
+            list(api.iter_services())
+        resp.close.assert_called_once()
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Response cache
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+class TestResponseCache:
+    ROOMS = [{"@type": "room", "id": "hz_1", "name": "Living"}]
+
+    def _api(self, *responses):
+        from boschshcpy.response_cache import SHCResponseCache
+
+        self.now = 0.0
+        api = _make_api()
+        api._response_cache = SHCResponseCache(clock=lambda: self.now)
+        api._requests_session.get.side_effect = list(responses)
+        return api
+
+    def _rooms_response(self, headers=None):
+        resp = _fake_response(self.ROOMS)
+        resp.headers = headers or {}
+        return resp
+
+    def test_fresh_hit_skips_request(self):
+        api = self._api(self._rooms_response())
+        assert api.get_rooms() == self.ROOMS
+        rooms = api.get_rooms()
+        assert rooms == self.ROOMS
+        assert api._requests_session.get.call_count == 1
+        # Every hit decodes its own copy.
+        rooms[0]["name"] = "changed"
+        assert api.get_rooms() == self.ROOMS
+
+    def test_expired_entry_sends_validators_and_uses_304(self):
+        api = self._api(
+            self._rooms_response({"ETag": '"r1"'}),
+            _fake_response(None, status_code=304),
+        )
+        api.get_rooms()
+        self.now += 301
+        assert api.get_rooms() == self.ROOMS
+        headers = api._requests_session.get.call_args[1]["headers"]
+        assert headers["If-None-Match"] == '"r1"'
+        # The 304 extended the entry.
+        api.get_rooms()
+        assert api._requests_session.get.call_count == 2
+
+    def test_304_after_invalidation_refetches_unconditionally(self):
+        api = self._api()
+        responses = [
+            self._rooms_response({"ETag": '"r1"'}),
+            _fake_response(None, status_code=304),
+            self._rooms_response(),
+        ]
+
+        def get(url, **kwargs):
+            if len(responses) == 2:
+                # A long-poll event invalidated the entry while in flight.
+                api._response_cache.invalidate()
+            return responses.pop(0)
+
+        api._requests_session.get.side_effect = get
+        api.get_rooms()
+        self.now += 301
+        assert api.get_rooms() == self.ROOMS
+        assert api._requests_session.get.call_count == 3
+        assert "If-None-Match" not in (
+            api._requests_session.get.call_args[1]["headers"] or {}
+        )
+
+    def test_invalid_response_is_not_cached(self):
+        wrong = _fake_response([{"@type": "device"}])
+        wrong.headers = {}
+        api = self._api(wrong, self._rooms_response())
+        with pytest.raises(SHCSessionError):
+            api.get_rooms()
+        assert api.get_rooms() == self.ROOMS
+        assert api._requests_session.get.call_count == 2
+
+    def test_unvalidated_response_is_not_cached(self):
+        api = self._api(self._rooms_response(), self._rooms_response())
+        api.get_rooms(validate=False)
+        api.get_rooms()
+        assert api._requests_session.get.call_count == 2
+
+    def test_uncached_resources_always_hit_the_controller(self):
+        api = self._api(_fake_response([]), _fake_response([]))
+        api.get_devices()
+        api.get_devices()
+        assert api._requests_session.get.call_count == 2
+
+    def test_no_cache_by_default(self):
+        api = _make_api()
+        api._requests_session.get.return_value = _fake_response(self.ROOMS)
+        api.get_rooms()
+        api.get_rooms()
+        assert api._requests_session.get.call_count == 2
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Single-flight GETs
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+class TestSingleFlightGets:
+    def test_concurrent_identical_gets_share_one_request(self):
+        import threading
+        import time
+
+        api = _make_api()
+        started = threading.Event()
+        release = threading.Event()
+        body = {"@type": "DeviceServiceData", "id": "PowerSwitch"}
+
+        def get(url, **kwargs):
+            started.set()
+            release.wait(5)
+            return _fake_response(body)
+
+        api._requests_session.get.side_effect = get
+        results = []
+
+        def call():
+            results.append(api.get_device_service("hdm:D1", "PowerSwitch"))
+
+        threads = [threading.Thread(target=call) for _ in range(3)]
+        threads[0].start()
+        assert started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+        time.sleep(0.05)  # let the followers join the flight
+        (key,) = api._single_flight._flights
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert key[0] == f"{_API_ROOT}/devices/hdm:D1/services/PowerSwitch"
+        assert results == [body, body, body]
+        assert api._requests_session.get.call_count == 1
+
+    def test_different_services_are_not_coalesced(self):
+        api = _make_api()
+        api._requests_session.get.side_effect = lambda url, **kwargs: _fake_response(
+            {"@type": "DeviceServiceData"}
+        )
+        api.get_device_service("hdm:D1", "PowerSwitch")
+        api.get_device_service("hdm:D1", "PowerMeter")
+        assert api._requests_session.get.call_count == 2
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Request scheduler
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+class TestRequestScheduler:
+    def test_requests_wait_for_their_class(self):
+        from boschshcpy.scheduler import Priority
+
+        api = _make_api()
+        api._scheduler = MagicMock()
+        api._requests_session.get.return_value = _fake_response([])
+        api._requests_session.put.return_value = _fake_response(None)
+        api._requests_session.post.return_value = _fake_response(None)
+
+        api.get_rooms()
+        api.put_device_service_state("hdm:D1", "PowerSwitch", {"on": True})
+        api.post_domain_action("intrusion/actions/arm")
+
+        assert [c.args[0] for c in api._scheduler.acquire.call_args_list] == [
+            Priority.READ,
+            Priority.INTERACTIVE,
+            Priority.IDS,
+        ]
+
+    def test_jsonrpc_and_retry_do_not_wait(self):
+        import requests as req_mod
+
+        api = _make_api()
+        api._scheduler = MagicMock()
+        api._requests_session.post.return_value = _fake_response(
+            [{"jsonrpc": "2.0", "result": "poll-1"}]
+        )
+        api.long_polling_subscribe()
+        api._requests_session.get.side_effect = [
+            req_mod.exceptions.ConnectionError("dropped"),
+            _fake_response([]),
+        ]
+        api.get_devices()
+        assert api._scheduler.acquire.call_count == 1
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Retry policy
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+class TestRetryPolicy:
+    def _api(self, **policy):
+        from boschshcpy.retry import SHCRetryPolicy
+
+        api = _make_api()
+        api._retry_policy = SHCRetryPolicy(**policy)
+        return api
+
+    def _busy(self):
+        resp = _fake_response({"errorCode": "busy"}, status_code=503)
+        resp.close = MagicMock()
+        return resp
+
+    def test_get_retried_on_retryable_status_with_backoff(self):
+        api = self._api(backoff_base=0.5, jitter=0.0)
+        busy = self._busy()
+        api._requests_session.get.side_effect = [busy, busy, _fake_response([])]
+        with patch("boschshcpy.api.time.sleep") as sleep:
+            assert api.get_devices() == []
+        assert api._requests_session.get.call_count == 3
+        assert [c.args[0] for c in sleep.call_args_list] == [0.5, 1.0]
+        assert busy.close.call_count == 2
+
+    def test_status_error_surfaces_after_max_attempts(self):
+        api = self._api(max_attempts=2, backoff_base=0.0)
+        api._requests_session.get.side_effect = [self._busy(), self._busy()]
+        with pytest.raises(SHCSessionError, match="code 503"):
+            api.get_devices()
+        assert api._requests_session.get.call_count == 2
+
+    def test_get_retried_on_timeout(self):
+        import requests as req_mod
+
+        api = self._api(backoff_base=0.0)
+        api._requests_session.get.side_effect = [
+            req_mod.exceptions.ReadTimeout("slow"),
+            _fake_response([]),
+        ]
+        assert api.get_devices() == []
+        assert api._requests_session.get.call_count == 2
+
+    def test_post_not_retried_on_status_or_timeout(self):
+        import requests as req_mod
+
+        api = self._api(backoff_base=0.0)
+        api._requests_session.post.side_effect = [self._busy()]
+        with pytest.raises(SHCSessionError):
+            api.post_domain_action("intrusion/actions/arm")
+        api._requests_session.post.side_effect = [
+            req_mod.exceptions.ReadTimeout("slow")
+        ]
+        with pytest.raises(req_mod.exceptions.ReadTimeout):
+            api.post_domain_action("intrusion/actions/arm")
+        assert api._requests_session.post.call_count == 2
+
+    def test_post_retried_once_after_drop(self):
+        import requests as req_mod
+
+        api = self._api(backoff_base=0.0, max_attempts=5)
+        drop = req_mod.exceptions.ConnectionError("dropped")
+        api._requests_session.post.side_effect = [drop, drop, _fake_response(None)]
+        with pytest.raises(req_mod.exceptions.ConnectionError):
+            api.post_domain_action("intrusion/actions/arm")
+        assert api._requests_session.post.call_count == 2
+
+    def test_ssl_error_not_retried(self):
+        import requests as req_mod
+
+        api = self._api(backoff_base=0.0, max_attempts=5)
+        api._requests_session.get.side_effect = req_mod.exceptions.SSLError("cert")
+        with pytest.raises(SHCConnectionError, match="SSLError"):
+            api.get_devices()
+        assert api._requests_session.get.call_count == 1
+
+    def test_default_policy_does_not_retry_status(self):
+        api = _make_api()
+        api._requests_session.get.side_effect = [self._busy()]
+        with pytest.raises(SHCSessionError):
+            api.get_devices()
+        assert api._requests_session.get.call_count == 1
@@ -0,0 +1,179 @@
+"""Tests for boschshcpy.callbacks — coroutine callbacks run as session tasks."""
+
+import asyncio
+import warnings
+from unittest.mock import AsyncMock
+
+import pytest
+
+from boschshcpy.callbacks import (
+    SHCCallbackTasks,
+    callback_tasks,
+    coroutine_callbacks,
+    run_callback,
+)
+from boschshcpy.device_service import SHCDeviceService
+
+
+def test_plain_callback_runs_inline():
+    seen = []
+    run_callback(seen.append, 1)
+    assert seen == [1]
+
+
+def test_coroutine_without_session_is_closed_with_warning(caplog):
+    ran = []
+
+    async def listener():
+        ran.append(1)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")  # no "never awaited" RuntimeWarning
+        run_callback(listener)
+    assert ran == []
+    assert "needs SHCSessionAsync" in caplog.text
+
+
+def test_invalid_concurrency():
+    with pytest.raises(ValueError):
+        SHCCallbackTasks(0)
+
+
+class TestSHCCallbackTasks:
+    def test_coroutines_run_as_tasks(self):
+        tasks = SHCCallbackTasks()
+        seen = []
+
+        async def listener(value):
+            await asyncio.sleep(0)
+            seen.append(value)
+
+        async def run():
+            with coroutine_callbacks(tasks):
+                run_callback(listener, 1)
+                run_callback(listener, 2)
+            assert seen == []  # scheduled, not awaited inline
+            assert tasks.pending == 2
+            await tasks.drain()
+
+        asyncio.run(run())
+        assert seen == [1, 2]
+        assert tasks.pending == 0
+
+    def test_concurrency_cap(self):
+        tasks = SHCCallbackTasks(max_concurrency=2)
+        running = [0]
+        peak = [0]
+
+        async def listener():
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+            await asyncio.sleep(0.001)
+            running[0] -= 1
+
+        async def run():
+            with coroutine_callbacks(tasks):
+                for _ in range(6):
+                    run_callback(listener)
+            await tasks.drain()
+
+        asyncio.run(run())
+        assert peak[0] == 2
+
+    def test_errors_are_isolated(self, caplog):
+        tasks = SHCCallbackTasks()
+        seen = []
+
+        async def broken():
+            raise ValueError("boom")
+
+        async def fine():
+            seen.append(1)
+
+        async def run():
+            with coroutine_callbacks(tasks):
+                run_callback(broken)
+                run_callback(fine)
+            await tasks.drain()
+
+        asyncio.run(run())
+        assert seen == [1]
+        assert tasks.failed == 1
+        assert "boom" in caplog.text
+
+    def test_cancel(self):
+        tasks = SHCCallbackTasks(max_concurrency=1)
+
+        async def forever():
+            await asyncio.Event().wait()
+
+        async def run():
+            with coroutine_callbacks(tasks):
+                run_callback(forever)
+                run_callback(forever)  # waits for a slot
+            await asyncio.sleep(0)
+            await tasks.cancel()
+            return tasks.pending
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert asyncio.run(run()) == 0
+
+
+def test_device_service_state_callback_may_be_a_coroutine():
+    service = SHCDeviceService(
+        api=None,
+        raw_device_service={
+            "@type": "DeviceServiceData",
+            "id": "PowerSwitch",
+            "deviceId": "hdm:D1",
+            "state": {"@type": "powerSwitchState", "switchState": "OFF"},
+        },
+    )
+    tasks = SHCCallbackTasks()
+    seen = []
+
+    async def listener():
+        seen.append(service.state["switchState"])
+
+    service.subscribe_callback("entity", listener)
+
+    async def run():
+        with coroutine_callbacks(tasks):
+            service.process_long_polling_poll_result(
+                {
+                    "@type": "DeviceServiceData",
+                    "id": "PowerSwitch",
+                    "deviceId": "hdm:D1",
+                    "state": {"@type": "powerSwitchState", "switchState": "ON"},
+                }
+            )
+        await tasks.drain()
+
+    asyncio.run(run())
+    assert seen == ["ON"]
+
+
+def test_async_short_poll_runs_coroutine_listeners_outside_a_session():
+    raw = {
+        "@type": "DeviceServiceData",
+        "id": "PowerSwitch",
+        "deviceId": "hdm:D1",
+        "state": {"@type": "powerSwitchState", "switchState": "ON"},
+    }
+    api = AsyncMock()
+    api.get_device_service.return_value = raw
+    service = SHCDeviceService(api=api, raw_device_service=raw)
+    seen = []
+
+    async def listener():
+        seen.append(service.state["switchState"])
+
+    service.subscribe_callback("entity", listener)
+
+    async def run():
+        await service.async_short_poll(fire_callbacks=True)
+        await callback_tasks().drain()
+
+    asyncio.run(run())
+    assert seen == ["ON"]
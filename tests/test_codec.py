@@ -0,0 +1,108 @@
+"""Tests for boschshcpy.codec — pluggable JSON backend."""
+
+import json
+
+import pytest
+
+from boschshcpy import codec
+
+POLL_BODY = [
+    {
+        "jsonrpc": "2.0",
+        "result": [
+            {
+                "@type": "DeviceServiceData",
+                "id": "PowerSwitch",
+                "deviceId": "hdm:ZigBee:0001",
+                "state": {"@type": "powerSwitchState", "switchState": "ON"},
+            },
+            {
+                "@type": "message",
+                "arguments": {"deviceServiceDataModel": '{"id": "Ünïcode", "v": 1.5}'},
+            },
+        ],
+    }
+]
+
+
+@pytest.fixture(params=codec.BACKENDS)
+def backend(request):
+    previous = codec.backend
+    codec.select_backend(request.param)
+    yield request.param
+    codec.select_backend(previous)
+
+
+class TestCodec:
+    def test_default_backend_is_fastest_available(self):
+        assert codec.backend == codec.BACKENDS[0]
+
+    def test_round_trip_matches_stdlib(self, backend):
+        encoded = codec.dumps(POLL_BODY)
+        assert isinstance(encoded, bytes)
+        assert json.loads(encoded) == POLL_BODY
+        assert codec.loads(encoded) == POLL_BODY
+        assert codec.loads(encoded.decode("utf-8")) == POLL_BODY
+        assert codec.loads(bytearray(encoded)) == POLL_BODY
+
+    def test_non_string_keys_and_wide_ints_are_encoded(self, backend):
+        assert json.loads(codec.dumps({1: 2**70})) == {"1": 2**70}
+
+    def test_decode_error_is_a_value_error(self, backend):
+        with pytest.raises(ValueError):
+            codec.loads(b"{not json")
+
+    def test_unknown_backend_is_rejected(self):
+        with pytest.raises(ValueError, match="not available"):
+            codec.select_backend("simdjson")
+        assert codec.backend in codec.BACKENDS
+
+
+class TestIncrementalArrayDecoder:
+    DOCUMENT = [
+        {"@type": "DeviceServiceData", "id": "Ünïcode", "state": {"a": [1, {}]}},
+        [],
+        "text, with ] and [",
+        -12.5e3,
+        123456,
+        True,
+        None,
+    ]
+
+    def _decode_in_chunks(self, raw, size):
+        decoder = codec.IncrementalArrayDecoder()
+        elements = []
+        for start in range(0, len(raw), size):
+            elements.extend(decoder.feed(raw[start : start + size]))
+        decoder.close()
+        return elements
+
+    @pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 4096])
+    def test_any_chunking_yields_the_elements(self, size):
+        raw = json.dumps(self.DOCUMENT, ensure_ascii=False).encode("utf-8")
+        assert self._decode_in_chunks(raw, size) == self.DOCUMENT
+
+    def test_elements_are_returned_as_soon_as_complete(self):
+        decoder = codec.IncrementalArrayDecoder()
+        assert decoder.feed(b'[{"id": "a"}, {"id": ') == [{"id": "a"}]
+        assert decoder.feed(b'"b"}, 4') == [{"id": "b"}]
+        assert decoder.feed(b"2]") == [42]
+        decoder.close()
+
+    def test_empty_array(self):
+        assert self._decode_in_chunks(b" [ ] ", 1) == []
+
+    @pytest.mark.parametrize(
+        "raw, message",
+        [
+            (b'{"id": 1}', "Expected a JSON array"),
+            (b"[1 2]", "Missing ','"),
+            (b"[1,]", "Trailing ','"),
+            (b"[1] x", "Trailing data"),
+            (b'[{"id": 1}', "Incomplete JSON array"),
+            (b"[1, {oops}]", "Incomplete JSON array"),
+        ],
+    )
+    def test_malformed_arrays_raise_value_error(self, raw, message):
+        with pytest.raises(ValueError, match=message):
+            self._decode_in_chunks(raw, 4)
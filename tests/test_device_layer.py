@@ -7,6 +7,7 @@ Run with:
 """
 from __future__ import annotations
 
+import inspect
 import types
 from types import SimpleNamespace
 from unittest.mock import MagicMock, call
@@ -1380,3 +1381,76 @@ class TestKeypadEventReplaySuppression:
                             "latestMotionDetected": "2026-06-21T10:00:00Z"}}
         svc.process_long_polling_poll_result(replay)
         assert fired == []
+
+
+# ---------------------------------------------------------------------------
+# __slots__ layout
+# ---------------------------------------------------------------------------
+
+class TestSlottedLayout:
+    """Every model keeps its service handles in slots, so building a device
+    never stores anything in the (lazily allocated) instance __dict__."""
+
+    @staticmethod
+    def _all_services(device_id):
+        from boschshcpy.services_impl import SUPPORTED_DEVICE_SERVICE_IDS
+
+        return [
+            {
+                "@type": "DeviceServiceData",
+                "id": service_id,
+                "deviceId": device_id,
+                "path": f"/devices/{device_id}/services/{service_id}",
+                "state": {"@type": "state"},
+            }
+            for service_id in sorted(SUPPORTED_DEVICE_SERVICE_IDS)
+        ]
+
+    def test_models_keep_attributes_in_slots(self):
+        from boschshcpy.models_impl import MODEL_MAPPING
+
+        for model in MODEL_MAPPING:
+            device_id = f"hdm:Test:{model}"
+            raw = {"id": device_id, "deviceModel": model, "deviceServiceIds": []}
+            device = SHCDeviceHelper(_fake_api()).device_init(
+                raw, self._all_services(device_id)
+            )
+            assert vars(device) == {}, model
+            for service in device.device_services:
+                assert vars(service) == {}, service.id
+
+    def test_every_class_declares_slots(self):
+        # A class without __slots__ would silently bring the instance
+        # __dict__ back into use for whatever it assigns.
+        from boschshcpy import models_impl, services_impl
+
+        for module, base in (
+            (models_impl, SHCDevice),
+            (services_impl, SHCDeviceService),
+        ):
+            for cls in vars(module).values():
+                if inspect.isclass(cls) and issubclass(cls, base):
+                    assert "__slots__" in cls.__dict__, cls.__name__
+
+    def test_instances_stay_patchable(self):
+        svc = SHCDeviceService(
+            api=_fake_api(),
+            raw_device_service={"id": "X", "deviceId": "d", "state": {}},
+        )
+        svc.put_state_element = MagicMock()
+        svc.put_state_element("k", 1)
+        svc.put_state_element.assert_called_once_with("k", 1)
+
+    def test_unsubscribed_services_share_empty_placeholders(self):
+        a = SHCDeviceService(api=_fake_api(), raw_device_service={"id": "A"})
+        b = SHCDeviceService(api=_fake_api(), raw_device_service={"id": "B"})
+        assert a._callbacks is b._callbacks
+        assert a.changed_keys is b.changed_keys
+
+        a.subscribe_callback("entity", lambda: None)
+        a.register_event("ev", lambda: None)
+        assert "entity" in a._callbacks and not b._callbacks
+        assert "ev" in a._event_callbacks and not b._event_callbacks
+        a.unsubscribe_callback("entity")
+        b.unsubscribe_callback("entity")  # no-op on the placeholder
+        assert not a._callbacks
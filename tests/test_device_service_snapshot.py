@@ -165,3 +165,66 @@ def test_alarm_register_event_suppresses_replayed_unchanged_value():
         # Repeating the new value again must not re-fire
         _poll(svc, service_id, "PRIMARY_ALARM")
         assert calls == [1], f"{service_id} re-fired an unchanged value"
+
+
+def _power_result(switch_state, **extra):
+    return {
+        "@type": "DeviceServiceData",
+        "id": "PowerSwitch",
+        "deviceId": "dev-1",
+        "path": "/devices/dev-1/services/PowerSwitch",
+        "state": {"@type": "powerSwitchState", "switchState": switch_state, **extra},
+    }
+
+
+def test_identical_state_redelivery_skips_callbacks():
+    """A re-delivered, unchanged state must not fan out to subscribers."""
+    svc = _make_service()
+    calls = []
+    svc.subscribe_callback("entity-a", lambda: calls.append("a"))
+
+    svc.process_long_polling_poll_result(_power_result("ON"))
+    assert calls == []
+
+    svc.process_long_polling_poll_result(_power_result("OFF"))
+    svc.process_long_polling_poll_result(_power_result("OFF"))
+    assert calls == ["a"]
+
+
+def test_changed_keys_visible_inside_callback():
+    svc = _make_service()
+    seen = []
+    svc.subscribe_callback(
+        "entity-a",
+        lambda: seen.append((svc.changed_keys, svc.previous_state.get("switchState"))),
+    )
+
+    svc.process_long_polling_poll_result(_power_result("OFF", automaticPowerOffTime=0))
+
+    assert seen == [(frozenset({"switchState", "automaticPowerOffTime"}), "ON")]
+    assert svc.state["switchState"] == "OFF"
+
+
+def test_events_still_processed_for_unchanged_state():
+    """Event edge detection is independent of the state diff: an unchanged
+    Alarm value is suppressed by its own baseline, not by the diff."""
+    svc = _make_alarm_service("Alarm", "IDLE_OFF")
+    state_calls = []
+    event_calls = []
+    svc.subscribe_callback("entity-a", lambda: state_calls.append(1))
+    svc.register_event("dev-1", lambda: event_calls.append(1))
+
+    _poll(svc, "Alarm", "IDLE_OFF")
+    assert state_calls == [] and event_calls == []
+
+    _poll(svc, "Alarm", "PRIMARY_ALARM")
+    assert state_calls == [1] and event_calls == [1]
+
+
+def test_diff_state_reports_added_removed_and_changed_keys():
+    from boschshcpy.device_service import diff_state
+
+    old = {"@type": "t", "a": 1, "b": 2}
+    assert diff_state(old, dict(old)) == frozenset()
+    assert diff_state(old, {"@type": "t", "a": 1, "c": None}) == frozenset({"b", "c"})
+    assert diff_state(old, {"@type": "t", "a": 5, "b": 2}) == frozenset({"a"})
@@ -0,0 +1,182 @@
+"""Tests for boschshcpy.dispatch — keyed callback worker pool."""
+
+import threading
+import time
+
+import pytest
+
+from boschshcpy.dispatch import (
+    OverflowPolicy,
+    SHCCallbackExecutor,
+    dispatch_key,
+)
+
+
+def _wait_until(predicate):
+    deadline = time.monotonic() + 5
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.001)
+    assert predicate()
+
+
+def test_dispatch_key():
+    assert dispatch_key({"@type": "DeviceServiceData", "id": "S", "deviceId": "d1"}) == "d1"
+    assert dispatch_key({"@type": "device", "id": "d1"}) == "d1"
+    assert dispatch_key({"@type": "scenarioTriggered", "id": "sc1"}) == "sc1"
+
+
+def test_dispatch_key_of_message_with_embedded_service_data():
+    model = '{"@type": "DeviceServiceData", "id": "S", "deviceId": "d1"}'
+    message = {"@type": "message", "id": "m1", "arguments": {}}
+    assert dispatch_key(message) == "m1"
+    message["arguments"]["deviceServiceDataModel"] = model
+    assert dispatch_key(message) == "d1"
+    message["arguments"]["deviceServiceDataModel"] = "not json"
+    assert dispatch_key(message) == "m1"
+
+
+@pytest.mark.parametrize("kwargs", [{"workers": 0}, {"max_queue": 0}])
+def test_invalid_settings(kwargs):
+    with pytest.raises(ValueError):
+        SHCCallbackExecutor(**kwargs)
+
+
+class TestOrdering:
+    def test_same_key_in_order_other_keys_in_parallel(self):
+        executor = SHCCallbackExecutor(workers=3)
+        release = threading.Event()
+        order = []
+
+        def slow(name):
+            release.wait(5)
+            order.append(name)
+
+        executor.submit("d1", slow, "d1-first")
+        executor.submit("d1", order.append, "d1-second")
+        executor.submit("d2", order.append, "d2")
+        _wait_until(lambda: "d2" in order)
+
+        # d2 ran while d1 was blocked; d1's second call waited its turn.
+        assert order == ["d2"]
+        assert executor.stats.running == 1
+        assert executor.stats.queued == 1
+        release.set()
+        assert executor.join(5)
+        assert order == ["d2", "d1-first", "d1-second"]
+        assert executor.stats.executed == 3
+        executor.shutdown(5)
+
+    def test_many_calls_per_key_keep_order(self):
+        executor = SHCCallbackExecutor(workers=4)
+        seen = {key: [] for key in "abc"}
+        for i in range(50):
+            for key in "abc":
+                executor.submit(key, seen[key].append, i)
+        assert executor.join(5)
+        assert all(values == list(range(50)) for values in seen.values())
+        executor.shutdown(5)
+
+
+class TestOverflow:
+    def test_block_waits_for_a_free_slot(self):
+        executor = SHCCallbackExecutor(workers=1, max_queue=1)
+        release = threading.Event()
+        executor.submit("d1", release.wait, 5)
+        _wait_until(lambda: executor.stats.running == 1)
+        executor.submit("d2", lambda: None)
+        submitted = threading.Event()
+
+        def submit():
+            executor.submit("d3", lambda: None)
+            submitted.set()
+
+        thread = threading.Thread(target=submit)
+        thread.start()
+        assert not submitted.wait(0.05)
+        release.set()
+        assert submitted.wait(5)
+        thread.join(5)
+        assert executor.join(5)
+        assert executor.stats.dropped == 0
+        assert executor.stats.peak_queued == 1
+        executor.shutdown(5)
+
+    def test_drop_oldest_discards_oldest_waiting_call(self):
+        executor = SHCCallbackExecutor(
+            workers=1, max_queue=2, overflow=OverflowPolicy.DROP_OLDEST
+        )
+        release = threading.Event()
+        ran = []
+        executor.submit("d1", release.wait, 5)
+        _wait_until(lambda: executor.stats.running == 1)
+        for name in ("x", "y", "z"):
+            executor.submit(name, ran.append, name)
+
+        assert executor.stats.dropped == 1
+        release.set()
+        assert executor.join(5)
+        assert ran == ["y", "z"]
+        executor.shutdown(5)
+
+
+class TestErrorsAndLifecycle:
+    def test_failing_call_is_logged_and_counted(self, caplog):
+        executor = SHCCallbackExecutor(workers=1)
+        ran = []
+
+        def boom():
+            raise ValueError("boom")
+
+        executor.submit("d1", boom)
+        executor.submit("d1", ran.append, 1)
+        assert executor.join(5)
+        assert ran == [1]
+        assert executor.stats.failed == 1
+        assert executor.stats.executed == 2
+        assert "boom" in caplog.text
+        executor.shutdown(5)
+
+    def test_join_times_out(self):
+        executor = SHCCallbackExecutor(workers=1)
+        release = threading.Event()
+        executor.submit("d1", release.wait, 5)
+        assert executor.join(0.01) is False
+        release.set()
+        assert executor.join(5)
+        executor.shutdown(5)
+
+    def test_shutdown_runs_queued_calls_and_restarts_on_submit(self):
+        executor = SHCCallbackExecutor(workers=2)
+        ran = []
+        for i in range(5):
+            executor.submit("d1", ran.append, i)
+        executor.shutdown(5)
+        assert ran == [0, 1, 2, 3, 4]
+        assert not any(t.name.startswith("SHCCallbackWorker") for t in threading.enumerate())
+
+        executor.submit("d1", ran.append, 5)
+        assert executor.join(5)
+        assert ran[-1] == 5
+        executor.shutdown(5)
+
+
+def test_shutdown_timeout_keeps_pool_bounded():
+    executor = SHCCallbackExecutor(workers=1)
+    release = threading.Event()
+    ran = []
+    executor.submit("a", release.wait)
+    _wait_until(lambda: executor.stats.running == 1)
+    stuck = [t for t in threading.enumerate() if t.name == "SHCCallbackWorker-0"]
+
+    executor.shutdown(timeout=0.01)
+    executor.submit("b", ran.append, "b")
+    _wait_until(lambda: ran == ["b"])
+    release.set()
+
+    # The worker that outlived shutdown finishes its call and exits instead
+    # of joining the new pool.
+    for thread in stuck:
+        thread.join(5)
+        assert not thread.is_alive()
+    assert executor.join(5)
+    executor.shutdown(5)
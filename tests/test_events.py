@@ -0,0 +1,208 @@
+"""Tests for boschshcpy.events — typed change event streams."""
+
+import asyncio
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from boschshcpy.device_service import SHCDeviceService
+from boschshcpy.events import (
+    SHCChangeEvent,
+    SHCEventFilter,
+    SHCEventStream,
+    SHCEventStreamAsync,
+    apply_service_result,
+)
+from boschshcpy.subscriptions import SHCSubscriptionRegistry
+
+
+def _service(switch_state="OFF"):
+    return SHCDeviceService(
+        api=None,
+        raw_device_service=_dsd(switch_state),
+    )
+
+
+def _dsd(switch_state, device_id="hdm:D1"):
+    return {
+        "@type": "DeviceServiceData",
+        "id": "PowerSwitch",
+        "deviceId": device_id,
+        "state": {"@type": "powerSwitchState", "switchState": switch_state},
+    }
+
+
+def _device(service, device_id="hdm:D1", model="PSM", room_id="hz_1"):
+    device = MagicMock()
+    device.id = device_id
+    device.device_model = model
+    device.room_id = room_id
+    device.device_service.side_effect = lambda sid: (
+        service if sid == service.id else None
+    )
+    return device
+
+
+def _subscribed(stream):
+    registry = SHCSubscriptionRegistry()
+    registry.add_changes(stream.publish)
+    return registry
+
+
+def _event(service_id="PowerSwitch", device_id="hdm:D1", model="PSM", room_id="hz_1"):
+    service = MagicMock()
+    service.id = service_id
+    return SHCChangeEvent(
+        _device(_service(), device_id, model, room_id),
+        service,
+        frozenset({"switchState"}),
+        {"switchState": "OFF"},
+        {"switchState": "ON"},
+    )
+
+
+class TestSHCEventFilter:
+    def test_empty_filter_matches_everything(self):
+        assert SHCEventFilter().matches(_event())
+
+    @pytest.mark.parametrize(
+        "field, values, matches",
+        [
+            ("service_ids", {"PowerSwitch"}, True),
+            ("service_ids", {"ShutterControl"}, False),
+            ("device_ids", {"hdm:D1"}, True),
+            ("device_models", {"BBL"}, False),
+            ("room_ids", {"hz_1", "hz_2"}, True),
+            ("room_ids", {"hz_2"}, False),
+        ],
+    )
+    def test_single_field(self, field, values, matches):
+        assert SHCEventFilter(**{field: values}).matches(_event()) is matches
+
+    def test_fields_are_combined(self):
+        event_filter = SHCEventFilter(service_ids={"PowerSwitch"}, room_ids={"hz_2"})
+        assert not event_filter.matches(_event())
+
+
+def test_changes():
+    assert _event().changes == {"switchState": ("OFF", "ON")}
+
+
+class TestApplyServiceResult:
+    def test_no_streams_just_applies(self):
+        service = _service()
+        device = _device(service)
+        apply_service_result(
+            SHCSubscriptionRegistry(),
+            device,
+            _dsd("ON"),
+            service.process_long_polling_poll_result,
+        )
+        assert service.state["switchState"] == "ON"
+        device.device_service.assert_not_called()
+
+    def test_publishes_change(self):
+        service = _service()
+        device = _device(service)
+        stream = SHCEventStream(None, 10, lambda s: None)
+        registry = _subscribed(stream)
+
+        apply_service_result(
+            registry, device, _dsd("ON"), service.process_long_polling_poll_result
+        )
+        apply_service_result(  # unchanged state: no event
+            registry, device, _dsd("ON"), service.process_long_polling_poll_result
+        )
+
+        event = stream.get(0)
+        assert event.device is device
+        assert event.service is service
+        assert event.changed_keys == {"switchState"}
+        assert event.old_state["switchState"] == "OFF"
+        assert event.new_state["switchState"] == "ON"
+        assert stream.get(0) is None
+
+    def test_returns_apply_result(self):
+        service = _service()
+        stream = SHCEventStream(None, 10, lambda s: None)
+        assert apply_service_result(
+            _subscribed(stream), _device(service), _dsd("ON"), service.process_refresh_result
+        ) is True
+        assert stream.get(0).changes == {"switchState": ("OFF", "ON")}
+
+
+class TestSHCEventStream:
+    def test_filter_and_overflow(self):
+        stream = SHCEventStream(SHCEventFilter(room_ids={"hz_1"}), 2, lambda s: None)
+        for room_id in ("hz_1", "hz_2", "hz_1", "hz_1"):
+            stream.publish(_event(room_id=room_id))
+        # hz_2 is filtered out; the first hz_1 event is dropped for the last.
+        assert stream.dropped == 1
+        assert stream.get(0) is not None
+        assert stream.get(0) is not None
+        assert stream.get(0) is None
+
+    def test_iteration_ends_on_close(self):
+        closed = []
+        stream = SHCEventStream(None, 10, closed.append)
+        received = []
+        consumer = threading.Thread(target=lambda: received.extend(stream))
+        consumer.start()
+        stream.publish(_event())
+        stream.close()
+        consumer.join(5)
+        assert len(received) == 1
+        assert closed == [stream]
+
+    def test_context_manager_closes(self):
+        closed = []
+        with SHCEventStream(None, 10, closed.append) as stream:
+            pass
+        assert closed == [stream]
+        stream.publish(_event())
+        assert stream.get(0) is None
+
+    def test_invalid_max_queue(self):
+        with pytest.raises(ValueError):
+            SHCEventStream(None, 0, lambda s: None)
+
+
+class TestSHCEventStreamAsync:
+    def test_async_iteration(self):
+        async def run():
+            stream = SHCEventStreamAsync(None, 10, lambda s: None)
+            received = []
+
+            async def consume():
+                async with stream:
+                    async for event in stream:
+                        received.append(event)
+                        if len(received) == 2:
+                            break
+
+            consumer = asyncio.create_task(consume())
+            await asyncio.sleep(0)
+            stream.publish(_event())
+            stream.publish(_event(device_id="hdm:D2"))
+            await asyncio.wait_for(consumer, 5)
+            return received, stream
+
+        received, stream = asyncio.run(run())
+        assert [event.device.id for event in received] == ["hdm:D1", "hdm:D2"]
+        stream.publish(_event())  # closed by the async with
+        assert not stream._events
+
+    def test_close_ends_waiting_iteration(self):
+        async def run():
+            stream = SHCEventStreamAsync(None, 10, lambda s: None)
+
+            async def consume():
+                return [event async for event in stream]
+
+            consumer = asyncio.create_task(consume())
+            await asyncio.sleep(0)
+            stream.close()
+            return await asyncio.wait_for(consumer, 5)
+
+        assert asyncio.run(run()) == []
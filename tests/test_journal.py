@@ -0,0 +1,83 @@
+"""Tests for boschshcpy.journal — replayable long-poll result journal."""
+
+import json
+
+import pytest
+
+from boschshcpy.exceptions import SHCJournalOverrunError
+from boschshcpy.journal import SHCEventJournal, SHCJournalEntry
+
+
+def _result(n):
+    return {"@type": "DeviceServiceData", "id": "PowerSwitch", "n": n}
+
+
+def test_sequence_and_timestamps():
+    now = [10.0]
+    journal = SHCEventJournal(clock=lambda: now[0])
+    assert journal.last_seq == 0
+    assert journal.replay() == []
+
+    journal.record([_result(1), _result(2)])
+    now[0] = 20.0
+    journal.record([], gap=True)
+    journal.record([])  # nothing to record
+
+    assert journal.replay() == [
+        SHCJournalEntry(1, 10.0, _result(1)),
+        SHCJournalEntry(2, 10.0, _result(2)),
+        SHCJournalEntry(3, 20.0, None),
+    ]
+    assert journal.last_seq == 3
+
+
+def test_replay_from_sequence():
+    journal = SHCEventJournal()
+    journal.record([_result(n) for n in range(5)])
+    assert [entry.seq for entry in journal.replay(3)] == [4, 5]
+    assert journal.replay(5) == []
+    assert journal.replay(9) == []
+
+
+def test_overrun():
+    journal = SHCEventJournal(max_entries=3)
+    journal.record([_result(n) for n in range(5)])
+    assert journal.first_seq == 3
+    assert [entry.seq for entry in journal.replay(2)] == [3, 4, 5]
+    with pytest.raises(SHCJournalOverrunError):
+        journal.replay(1)
+
+
+def test_invalid_max_entries():
+    with pytest.raises(ValueError):
+        SHCEventJournal(max_entries=0)
+
+
+def test_spill(tmp_path):
+    path = tmp_path / "journal" / "events.jsonl"
+    journal = SHCEventJournal(max_entries=1, spill_path=path, clock=lambda: 1.5)
+    journal.record([_result(1)], gap=True)
+    journal.close()
+    journal.record([_result(2)])
+    journal.close()
+
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert lines == [
+        {"seq": 1, "timestamp": 1.5, "result": None},
+        {"seq": 2, "timestamp": 1.5, "result": _result(1)},
+        {"seq": 3, "timestamp": 1.5, "result": _result(2)},
+    ]
+    assert len(journal.replay(2)) == 1
+
+
+def test_spill_failure_disables_spilling(tmp_path, caplog):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    journal = SHCEventJournal(spill_path=blocker / "events.jsonl")
+    journal.record([_result(1)])
+    journal.close()
+    journal.record([_result(2)])  # not retried
+    journal.close()
+
+    assert [entry.seq for entry in journal.replay()] == [1, 2]
+    assert caplog.text.count("Stopped spilling the event journal") == 1
@@ -0,0 +1,81 @@
+"""Tests for boschshcpy.jsonrpc — JSON-RPC batch building and demultiplexing."""
+
+import pytest
+
+from boschshcpy.exceptions import JSONRPCError, SHCSessionError
+from boschshcpy.jsonrpc import JSONRPCCall, build_batch, demultiplex_batch
+
+CALLS = [
+    JSONRPCCall.unsubscribe("old"),
+    JSONRPCCall.subscribe(),
+    JSONRPCCall.long_poll("old", 10),
+]
+
+
+class TestBuildBatch:
+    def test_calls_are_numbered_in_order(self):
+        body = build_batch(CALLS)
+        assert [entry["id"] for entry in body] == [1, 2, 3]
+        assert [entry["method"] for entry in body] == [
+            "RE/unsubscribe",
+            "RE/subscribe",
+            "RE/longPoll",
+        ]
+        assert body[1]["params"] == ["com/bosch/sh/remote/*", None]
+        assert body[2]["params"] == ["old", 10]
+        assert all(entry["jsonrpc"] == "2.0" for entry in body)
+
+    def test_empty_batch_is_rejected(self):
+        with pytest.raises(ValueError):
+            build_batch([])
+
+
+class TestDemultiplexBatch:
+    def test_results_are_matched_by_id_not_position(self):
+        response = [
+            {"jsonrpc": "2.0", "id": 3, "result": []},
+            {"jsonrpc": "2.0", "id": 1, "result": None},
+            {"jsonrpc": "2.0", "id": 2, "result": "new"},
+        ]
+        assert demultiplex_batch(response, CALLS) == [None, "new", []]
+
+    def test_errors_are_returned_per_call(self):
+        response = [
+            {"jsonrpc": "2.0", "id": 1, "error": {"code": -32001, "message": "gone"}},
+            {"jsonrpc": "2.0", "id": 2, "result": "new"},
+            {"jsonrpc": "2.0", "id": 3, "result": []},
+        ]
+        values = demultiplex_batch(response, CALLS)
+        assert isinstance(values[0], JSONRPCError)
+        assert values[0].code == -32001
+        assert values[1:] == ["new", []]
+
+    def test_response_without_ids_is_matched_by_position(self):
+        response = [
+            {"jsonrpc": "2.0", "result": None},
+            {"jsonrpc": "2.0", "result": "new"},
+            {"jsonrpc": "2.0", "result": []},
+        ]
+        assert demultiplex_batch(response, CALLS) == [None, "new", []]
+
+    def test_missing_answer_raises(self):
+        response = [
+            {"jsonrpc": "2.0", "id": 1, "result": None},
+            {"jsonrpc": "2.0", "id": 2, "result": "new"},
+        ]
+        with pytest.raises(SHCSessionError, match="RE/longPoll"):
+            demultiplex_batch(response, CALLS)
+
+    def test_short_response_without_ids_raises(self):
+        with pytest.raises(SHCSessionError, match="no answer"):
+            demultiplex_batch([{"jsonrpc": "2.0", "result": None}], CALLS)
+
+    @pytest.mark.parametrize("response", [{"jsonrpc": "2.0"}, ["x"], None])
+    def test_malformed_response_raises(self, response):
+        with pytest.raises(SHCSessionError, match="Malformed JSON-RPC batch"):
+            demultiplex_batch(response, CALLS)
+
+    def test_wrong_version_raises(self):
+        response = [{"jsonrpc": "1.0", "id": i, "result": None} for i in (1, 2, 3)]
+        with pytest.raises(SHCSessionError, match="JSON-RPC version"):
+            demultiplex_batch(response, CALLS)
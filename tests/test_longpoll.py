@@ -0,0 +1,167 @@
+"""Tests for longpoll.py — poll-batch coalescing and adaptive wait.
+
+Isolation: NO HA harness, NO real network.
+"""
+from __future__ import annotations
+
+import pytest
+
+from boschshcpy.longpoll import (
+    SHCAdaptivePollWait,
+    SHCPollResultCoalescer,
+    coalesce_poll_results,
+)
+
+
+def _dsd(device_id, service_id, value):
+    return {
+        "@type": "DeviceServiceData",
+        "id": service_id,
+        "deviceId": device_id,
+        "state": {"@type": "state", "value": value},
+    }
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_keeps_last_state_per_device_service():
+    results = [
+        _dsd("d1", "ShutterControl", 0.1),
+        _dsd("d2", "ShutterControl", 0.5),
+        _dsd("d1", "ShutterControl", 0.2),
+        _dsd("d1", "PowerMeter", 3),
+        _dsd("d1", "ShutterControl", 0.3),
+    ]
+
+    assert coalesce_poll_results(results) == [
+        results[1],
+        results[3],
+        results[4],
+    ]
+
+
+def test_non_state_results_and_event_services_are_kept():
+    device = {"@type": "device", "id": "d1"}
+    presses = [_dsd("d1", "Keypad", "UPPER"), _dsd("d1", "Keypad", "LOWER")]
+    results = [presses[0], device, presses[1], dict(device)]
+
+    assert coalesce_poll_results(results) == results
+
+
+def test_empty_batch():
+    assert coalesce_poll_results([]) == []
+
+
+def test_zero_window_releases_each_batch():
+    coalescer = SHCPollResultCoalescer(0.0)
+    assert not coalescer.ready()
+
+    coalescer.add([_dsd("d1", "S", 1), _dsd("d1", "S", 2)])
+
+    assert coalescer.ready()
+    assert coalescer.drain() == [_dsd("d1", "S", 2)]
+    assert not coalescer.pending
+
+
+def test_window_buffers_batches_until_deadline():
+    clock = _Clock()
+    coalescer = SHCPollResultCoalescer(2.5, clock=clock)
+    assert coalescer.wait_seconds(30) == 30
+
+    coalescer.add([_dsd("d1", "S", 1)])
+    assert not coalescer.ready()
+    assert coalescer.wait_seconds(30) == 3
+
+    clock.now += 2.0
+    coalescer.add([_dsd("d1", "S", 2)])
+    assert not coalescer.ready()
+    assert coalescer.wait_seconds(30) == 1
+
+    clock.now += 0.5
+    assert coalescer.ready()
+    assert coalescer.drain() == [_dsd("d1", "S", 2)]
+    assert coalescer.wait_seconds(30) == 30
+
+
+def test_empty_batch_does_not_open_window():
+    coalescer = SHCPollResultCoalescer(5.0)
+    coalescer.add([])
+    assert not coalescer.pending
+    assert not coalescer.ready()
+
+
+def _poll(adaptive, clock, results, elapsed=None):
+    """Run one poll taking ``elapsed`` seconds (default: the full wait)."""
+    wait = adaptive.wait_seconds()
+    clock.now += wait if elapsed is None else elapsed
+    adaptive.observe(results)
+    return wait
+
+
+def test_adaptive_wait_doubles_while_quiet():
+    clock = _Clock()
+    adaptive = SHCAdaptivePollWait(min_wait=10, max_wait=60, clock=clock)
+
+    assert [_poll(adaptive, clock, 0) for _ in range(5)] == [10, 20, 40, 60, 60]
+    assert adaptive.event_rate == 0
+
+
+def test_adaptive_wait_drops_to_min_on_results():
+    clock = _Clock()
+    adaptive = SHCAdaptivePollWait(min_wait=10, max_wait=60, clock=clock)
+    for _ in range(3):
+        _poll(adaptive, clock, 0)
+    assert adaptive.current_wait == 60
+
+    _poll(adaptive, clock, 3, elapsed=0.2)
+
+    assert adaptive.current_wait == 10
+    assert adaptive.event_rate == pytest.approx(3 / 60)
+
+
+def test_adaptive_wait_stays_short_while_events_flow():
+    clock = _Clock()
+    adaptive = SHCAdaptivePollWait(min_wait=10, max_wait=60, clock=clock)
+    for _ in range(3):
+        _poll(adaptive, clock, 3, elapsed=5)
+
+    # ~9 events in the last minute: a 10 s poll would likely see one.
+    _poll(adaptive, clock, 0)
+
+    assert adaptive.current_wait == 10
+
+
+def test_adaptive_wait_ignores_polls_cut_short():
+    clock = _Clock()
+    adaptive = SHCAdaptivePollWait(min_wait=10, max_wait=60, clock=clock)
+
+    # e.g. shortened by the coalescing window, or an empty answer
+    _poll(adaptive, clock, 0, elapsed=2)
+
+    assert adaptive.current_wait == 10
+
+
+def test_adaptive_event_rate_decays():
+    clock = _Clock()
+    adaptive = SHCAdaptivePollWait(rate_window=10.0, clock=clock)
+    _poll(adaptive, clock, 10, elapsed=0)
+    rate = adaptive.event_rate
+
+    clock.now += 10
+
+    assert adaptive.event_rate == pytest.approx(rate / 2.718281828, rel=1e-6)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"min_wait": 0}, {"min_wait": 30, "max_wait": 20}, {"rate_window": 0}],
+)
+def test_adaptive_wait_rejects_invalid_settings(kwargs):
+    with pytest.raises(ValueError):
+        SHCAdaptivePollWait(**kwargs)
@@ -0,0 +1,123 @@
+"""Tests for boschshcpy.response_cache — TTL / conditional-GET response cache."""
+
+from boschshcpy.response_cache import DEFAULT_TTLS, SHCResponseCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _cache(**ttls):
+    clock = FakeClock()
+    return SHCResponseCache(ttls or None, clock=clock), clock
+
+
+class TestTTL:
+    def test_default_ttls(self):
+        cache = SHCResponseCache()
+        for resource in DEFAULT_TTLS:
+            assert cache.caches(resource)
+        assert not cache.caches("devices")
+
+    def test_fresh_entry_is_served(self):
+        cache, clock = _cache(rooms=10.0)
+        cache.store("rooms", b"[]")
+        clock.now += 9.9
+        assert cache.get("rooms") == b"[]"
+
+    def test_expired_entry_is_not_served(self):
+        cache, clock = _cache(rooms=10.0)
+        cache.store("rooms", b"[]")
+        clock.now += 10.0
+        assert cache.get("rooms") is None
+
+    def test_unknown_resource_is_not_stored(self):
+        cache, _ = _cache(rooms=10.0)
+        cache.store("devices", b"[]")
+        assert cache.get("devices") is None
+        assert cache.validators("devices") == {}
+
+    def test_missing_entry(self):
+        cache, _ = _cache()
+        assert cache.get("rooms") is None
+
+
+class TestConditional:
+    def test_validators_from_response_headers(self):
+        cache, _ = _cache(rooms=10.0)
+        cache.store(
+            "rooms",
+            b"[]",
+            {"ETag": '"abc"', "Last-Modified": "Sat, 17 Oct 2026 10:00:00 GMT"},
+        )
+        assert cache.validators("rooms") == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Sat, 17 Oct 2026 10:00:00 GMT",
+        }
+
+    def test_no_validators_without_headers(self):
+        cache, _ = _cache(rooms=10.0)
+        cache.store("rooms", b"[]")
+        assert cache.validators("rooms") == {}
+
+    def test_revalidated_extends_expiry(self):
+        cache, clock = _cache(rooms=10.0)
+        cache.store("rooms", b"[1]", {"ETag": '"abc"'})
+        clock.now += 15.0
+        assert cache.get("rooms") is None
+        assert cache.revalidated("rooms") == b"[1]"
+        clock.now += 9.0
+        assert cache.get("rooms") == b"[1]"
+        assert cache.validators("rooms") == {"If-None-Match": '"abc"'}
+
+    def test_revalidated_after_invalidation(self):
+        cache, _ = _cache(rooms=10.0)
+        cache.store("rooms", b"[]")
+        cache.invalidate("rooms")
+        assert cache.revalidated("rooms") is None
+
+
+class TestInvalidation:
+    def test_invalidate_one(self):
+        cache, _ = _cache(rooms=10.0, scenarios=10.0)
+        cache.store("rooms", b"[]")
+        cache.store("scenarios", b"[]")
+        cache.invalidate("rooms")
+        assert cache.get("rooms") is None
+        assert cache.get("scenarios") == b"[]"
+
+    def test_invalidate_all(self):
+        cache, _ = _cache(rooms=10.0, scenarios=10.0)
+        cache.store("rooms", b"[]")
+        cache.store("scenarios", b"[]")
+        cache.invalidate()
+        assert cache.get("rooms") is None
+        assert cache.get("scenarios") is None
+
+    def test_invalidate_for_event(self):
+        cache = SHCResponseCache({**DEFAULT_TTLS, "information": 60.0})
+        for resource in cache._ttls:
+            cache.store(resource, b"[]")
+        cache.invalidate_for_event({"@type": "userDefinedState", "id": "u1"})
+        assert cache.get("userdefinedstates") is None
+        cache.invalidate_for_event({"@type": "device", "id": "d1"})
+        assert cache.get("rooms") is None
+        cache.invalidate_for_event({"@type": "scenarioTriggered", "id": "s1"})
+        assert cache.get("scenarios") is None
+        assert cache.get("information") == b"[]"
+
+    def test_information_is_not_cached_by_default(self):
+        cache = SHCResponseCache()
+        assert not cache.caches("information")
+        assert not cache.caches("public_information")
+
+    def test_unrelated_event_keeps_entries(self):
+        cache = SHCResponseCache()
+        cache.store("rooms", b"[]")
+        cache.invalidate_for_event({"@type": "DeviceServiceData", "id": "x"})
+        cache.invalidate_for_event({"id": "no-type"})
+        assert cache.get("rooms") == b"[]"
@@ -0,0 +1,63 @@
+"""Tests for boschshcpy.retry — retry policy decisions and backoff."""
+
+import pytest
+
+from boschshcpy.retry import RETRY_ONCE_ON_DROP, SHCRetryPolicy
+
+
+class TestRetriesError:
+    def test_idempotent_methods_retry_up_to_max_attempts(self):
+        policy = SHCRetryPolicy(max_attempts=3)
+        for method in ("GET", "PUT"):
+            assert policy.retries_error(method, 1, dropped=False)
+            assert policy.retries_error(method, 2, dropped=True)
+            assert not policy.retries_error(method, 3, dropped=True)
+
+    def test_post_only_retries_a_dropped_first_attempt(self):
+        policy = SHCRetryPolicy(max_attempts=5)
+        assert policy.retries_error("POST", 1, dropped=True)
+        assert not policy.retries_error("POST", 2, dropped=True)
+        assert not policy.retries_error("POST", 1, dropped=False)
+
+    def test_single_attempt_never_retries(self):
+        policy = SHCRetryPolicy(max_attempts=1)
+        assert not policy.retries_error("GET", 1, dropped=True)
+
+
+class TestRetriesStatus:
+    def test_retryable_status_for_idempotent_methods(self):
+        policy = SHCRetryPolicy()
+        assert policy.retries_status("GET", 503, 1)
+        assert policy.retries_status("PUT", 502, 2)
+        assert not policy.retries_status("GET", 503, 3)
+        assert not policy.retries_status("POST", 503, 1)
+        assert not policy.retries_status("GET", 500, 1)
+        assert not policy.retries_status("GET", 404, 1)
+
+    def test_custom_statuses_and_methods(self):
+        policy = SHCRetryPolicy(
+            retry_statuses=frozenset({429}), idempotent_methods=frozenset({"GET"})
+        )
+        assert policy.retries_status("GET", 429, 1)
+        assert not policy.retries_status("PUT", 429, 1)
+
+
+class TestBackoff:
+    def test_doubles_up_to_cap_without_jitter(self):
+        policy = SHCRetryPolicy(backoff_base=0.5, backoff_max=3.0, jitter=0.0)
+        assert [policy.backoff(n) for n in range(1, 6)] == [0.5, 1.0, 2.0, 3.0, 3.0]
+
+    @pytest.mark.parametrize("rand, expected", [(0.0, 2.0), (1.0, 1.0), (0.5, 1.5)])
+    def test_jitter_shortens_delay(self, rand, expected):
+        policy = SHCRetryPolicy(backoff_base=1.0, jitter=0.5)
+        assert policy.backoff(2, rand=lambda: rand) == pytest.approx(expected)
+
+
+class TestRetryOnceOnDrop:
+    def test_matches_the_historical_behaviour(self):
+        for method in ("GET", "PUT", "POST"):
+            assert RETRY_ONCE_ON_DROP.retries_error(method, 1, dropped=True)
+            assert not RETRY_ONCE_ON_DROP.retries_error(method, 2, dropped=True)
+            assert not RETRY_ONCE_ON_DROP.retries_error(method, 1, dropped=False)
+            assert not RETRY_ONCE_ON_DROP.retries_status(method, 503, 1)
+        assert RETRY_ONCE_ON_DROP.backoff(1) == 0.0
@@ -0,0 +1,206 @@
+"""Tests for boschshcpy.scheduler — token bucket and priority queue."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from boschshcpy.exceptions import SHCConnectionError, SHCQueueFullError
+from boschshcpy.scheduler import (
+    Priority,
+    SHCRequestScheduler,
+    SHCRequestSchedulerAsync,
+    request_priority,
+    scheduling_priority,
+)
+
+ROOT = "https://192.0.2.1:8444/smarthome"
+
+
+class TestRequestPriority:
+    def test_classes(self):
+        assert request_priority("GET", f"{ROOT}/devices") is Priority.READ
+        assert request_priority("PUT", f"{ROOT}/devices/d/services/s/state") is (
+            Priority.INTERACTIVE
+        )
+        assert request_priority("POST", f"{ROOT}/intrusion/actions/arm") is (
+            Priority.IDS
+        )
+        assert request_priority("GET", f"{ROOT}/intrusion/states/system") is (
+            Priority.READ
+        )
+
+    def test_jsonrpc_is_not_scheduled(self):
+        url = "https://192.0.2.1:8444/remote/json-rpc"
+        assert request_priority("POST", url) is None
+        with scheduling_priority(Priority.BACKGROUND):
+            assert request_priority("POST", url) is None
+
+    def test_override_applies_to_block_only(self):
+        with scheduling_priority(Priority.BACKGROUND):
+            assert request_priority("GET", f"{ROOT}/services") is Priority.BACKGROUND
+            assert request_priority("PUT", f"{ROOT}/devices/d") is Priority.BACKGROUND
+        assert request_priority("GET", f"{ROOT}/services") is Priority.READ
+
+    def test_override_is_per_thread(self):
+        seen = []
+        with scheduling_priority(Priority.BACKGROUND):
+            thread = threading.Thread(
+                target=lambda: seen.append(request_priority("GET", f"{ROOT}/rooms"))
+            )
+            thread.start()
+            thread.join(5)
+        assert seen == [Priority.READ]
+
+
+class TestValidation:
+    @pytest.mark.parametrize(
+        "kwargs", [{"rate": 0}, {"burst": 0}, {"max_queue": 0}]
+    )
+    def test_invalid_settings(self, kwargs):
+        with pytest.raises(ValueError):
+            SHCRequestScheduler(**kwargs)
+
+    def test_queue_full_is_a_connection_error(self):
+        assert issubclass(SHCQueueFullError, SHCConnectionError)
+
+
+class TestSHCRequestScheduler:
+    def test_burst_is_granted_immediately(self):
+        scheduler = SHCRequestScheduler(rate=0.01, burst=3)
+        for _ in range(3):
+            scheduler.acquire(Priority.READ)
+        stats = scheduler.stats
+        assert stats.granted == 3
+        assert stats.queued == 0
+        assert stats.rejected == 0
+
+    def test_tokens_refill_at_rate(self):
+        now = [0.0]
+        scheduler = SHCRequestScheduler(rate=2.0, burst=1, clock=lambda: now[0])
+        scheduler.acquire(Priority.READ)
+        now[0] += 0.5
+        scheduler.acquire(Priority.READ)  # one token refilled, no wait
+        assert scheduler.stats.granted == 2
+
+    def test_higher_priority_overtakes_queued_requests(self):
+        scheduler = SHCRequestScheduler(rate=20.0, burst=1)
+        scheduler.acquire(Priority.READ)
+        order = []
+
+        def request(name, priority):
+            scheduler.acquire(priority)
+            order.append(name)
+
+        background = threading.Thread(
+            target=request, args=("background", Priority.BACKGROUND)
+        )
+        background.start()
+        deadline = time.monotonic() + 5
+        while scheduler.stats.queued < 1 and time.monotonic() < deadline:
+            time.sleep(0.001)
+        interactive = threading.Thread(
+            target=request, args=("interactive", Priority.INTERACTIVE)
+        )
+        interactive.start()
+        background.join(5)
+        interactive.join(5)
+
+        assert order == ["interactive", "background"]
+        assert scheduler.stats.peak_queued == 2
+        assert scheduler.stats.wait_seconds > 0
+
+    def test_full_queue_rejects_newcomer_of_same_class(self):
+        scheduler = SHCRequestScheduler(rate=0.001, burst=1, max_queue=1)
+        scheduler.acquire(Priority.READ)
+        errors = []
+
+        def request():
+            try:
+                scheduler.acquire(Priority.READ)
+            except SHCQueueFullError as e:
+                errors.append(e)
+
+        waiting = threading.Thread(target=request)
+        waiting.start()
+        deadline = time.monotonic() + 5
+        while scheduler.stats.queued < 1 and time.monotonic() < deadline:
+            time.sleep(0.001)
+        with pytest.raises(SHCQueueFullError, match="queue full"):
+            scheduler.acquire(Priority.BACKGROUND)
+        assert scheduler.stats.rejected == 1
+        assert waiting.is_alive()
+        # A write evicts the waiting read; the write itself then waits for
+        # a token that takes minutes, so it runs on a daemon thread.
+        writer = threading.Thread(
+            target=scheduler.acquire, args=(Priority.INTERACTIVE,), daemon=True
+        )
+        writer.start()
+        waiting.join(5)
+        assert len(errors) == 1
+        assert scheduler.stats.rejected == 2
+
+
+class TestSHCRequestSchedulerAsync:
+    def test_priority_order(self):
+        scheduler = SHCRequestSchedulerAsync(rate=100.0, burst=1)
+        order = []
+
+        async def request(name, priority):
+            await scheduler.acquire(priority)
+            order.append(name)
+
+        async def run():
+            await scheduler.acquire(Priority.READ)
+            tasks = [
+                asyncio.create_task(request(name, priority))
+                for name, priority in (
+                    ("bg1", Priority.BACKGROUND),
+                    ("bg2", Priority.BACKGROUND),
+                    ("read", Priority.READ),
+                    ("ids", Priority.IDS),
+                    ("write", Priority.INTERACTIVE),
+                )
+            ]
+            await asyncio.gather(*tasks)
+
+        asyncio.run(run())
+        assert order == ["write", "ids", "read", "bg1", "bg2"]
+        assert scheduler.stats.granted == 6
+
+    def test_full_queue_drops_newest_lower_class_request(self):
+        scheduler = SHCRequestSchedulerAsync(rate=100.0, burst=1, max_queue=2)
+
+        async def run():
+            await scheduler.acquire(Priority.READ)
+            bg1 = asyncio.create_task(scheduler.acquire(Priority.BACKGROUND))
+            bg2 = asyncio.create_task(scheduler.acquire(Priority.BACKGROUND))
+            await asyncio.sleep(0)
+            write = asyncio.create_task(scheduler.acquire(Priority.INTERACTIVE))
+            await asyncio.sleep(0)
+            with pytest.raises(SHCQueueFullError):
+                await scheduler.acquire(Priority.BACKGROUND)
+            await write
+            await bg1
+            with pytest.raises(SHCQueueFullError, match="Dropped"):
+                await bg2
+
+        asyncio.run(run())
+        assert scheduler.stats.rejected == 2
+        assert scheduler.stats.granted == 3
+
+    def test_cancelled_request_leaves_the_queue(self):
+        scheduler = SHCRequestSchedulerAsync(rate=0.01, burst=1)
+
+        async def run():
+            await scheduler.acquire(Priority.READ)
+            waiting = asyncio.create_task(scheduler.acquire(Priority.READ))
+            await asyncio.sleep(0)
+            assert scheduler.stats.queued == 1
+            waiting.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiting
+            assert scheduler.stats.queued == 0
+
+        asyncio.run(run())
@@ -20,8 +20,10 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from boschshcpy.api_async import JSONRPCError
+from boschshcpy.callbacks import SHCCallbackTasks
 from boschshcpy.exceptions import SHCConnectionError, SHCSessionError
 from boschshcpy.session_async import SHCSessionAsync, _AsyncSHCInformation
+from boschshcpy.subscriptions import SHCSubscriptionRegistry
 
 
 # ---------------------------------------------------------------------------
@@ -72,14 +74,29 @@ def _bare_session(api: AsyncMock | None = None) -> SHCSessionAsync:
     s._domains_by_id = {}
     s._messages_by_id = {}
     s._userdefinedstates_by_id = {}
-    s._subscribers = []
+    s._subscriptions = SHCSubscriptionRegistry()
+    s._event_streams = []
     s._emma = MagicMock()
+    s._poll_result_handlers = s._default_poll_result_handlers()
+    s._link_handlers = {"com.bosch.tt.emma.applink": s._handle_emma_link}
+    s._coalescer = None
+    s._response_cache = None
+    s._retry_policy = None
+    s._adaptive_poll_wait = None
+    s._pipeline_depth = None
+    s._event_journal = None
+    s._callback_tasks = SHCCallbackTasks()
     s._shc_information = _AsyncSHCInformation(
         {"macAddress": "AA-BB-CC-DD-EE-FF", "shcIpAddress": "192.168.2.99"},
         {},
     )
+    s._topology_cache = None
+    s._reconcile_task = None
+    s._topology_lock = asyncio.Lock()
     s._poll_id = None
     s._poll_task = None
+    s._dispatch_queue = None
+    s._dispatch_task = None
     s._stop_polling = False
     s._scenario_callbacks = {}
     s._userdefinedstate_callbacks = defaultdict(list)
@@ -169,7 +186,7 @@ class TestAsyncInit:
 
         # Return a minimal service and device so _add_device is exercised
         api.get_services.return_value = [
-            {"id": "PowerSwitch", "deviceId": "hdm:ZigBee:D1"},
+            {"@type": "DeviceServiceData", "id": "PowerSwitch", "deviceId": "hdm:ZigBee:D1"},
         ]
         api.get_devices.return_value = [
             {"id": "hdm:ZigBee:D1", "deviceModel": "PSM", "manufacturer": "BOSCH",
@@ -274,6 +291,143 @@ class TestAsyncInit:
             asyncio.run(run())
 
 
+class TestConcurrentAsyncInit:
+    """async_init(concurrent=True) overlaps the enumeration GETs."""
+
+    @staticmethod
+    async def _init(api, **kwargs):
+        s = _bare_session(api)
+        with patch("boschshcpy.session_async.SHCIntrusionSystem") as MockIDS:
+            MockIDS.return_value = MagicMock()
+            with patch("boschshcpy.session_async.SHCDeviceHelper") as MockHelper:
+                MockHelper.return_value = s._device_helper
+                await s.async_init(**kwargs)
+        return s
+
+    def _run_init(self, api, **kwargs):
+        return asyncio.run(self._init(api, **kwargs))
+
+    def test_gets_are_in_flight_together(self):
+        """get_services only returns once get_rooms has started — a serial
+        enumeration would deadlock here."""
+        api = _fake_api()
+        rooms_started = asyncio.Event()
+
+        async def get_services(**kwargs):
+            await asyncio.wait_for(rooms_started.wait(), timeout=2)
+            return []
+
+        async def get_rooms():
+            rooms_started.set()
+            return []
+
+        api.get_services.side_effect = get_services
+        api.get_rooms.side_effect = get_rooms
+
+        self._run_init(api, concurrent=True)
+        api.get_services.assert_awaited_once()
+        api.get_rooms.assert_awaited_once()
+        api.get_domain_intrusion_detection.assert_awaited_once()
+
+    def test_devices_built_after_full_services_map_in_order(self):
+        api = _fake_api()
+        api.get_services.return_value = [
+            {"@type": "DeviceServiceData", "id": "PowerSwitch", "deviceId": "hdm:D1"},
+            {"@type": "DeviceServiceData", "id": "PowerSwitch", "deviceId": "hdm:D2"},
+        ]
+        api.get_devices.return_value = [{"id": "hdm:D2"}, {"id": "hdm:D1"}]
+        seen = []
+
+        async def run():
+            s = _bare_session(api)
+
+            def device_init(raw_device, services):
+                # Every device sees the complete services map at build time.
+                seen.append((raw_device["id"], sorted(s._services_by_device_id)))
+                return MagicMock()
+
+            s._device_helper.device_init.side_effect = device_init
+            with patch("boschshcpy.session_async.SHCIntrusionSystem"):
+                with patch("boschshcpy.session_async.SHCDeviceHelper") as MockHelper:
+                    MockHelper.return_value = s._device_helper
+                    await s.async_init(concurrent=True)
+            return s
+
+        s = asyncio.run(run())
+        assert seen == [
+            ("hdm:D2", ["hdm:D1", "hdm:D2"]),
+            ("hdm:D1", ["hdm:D1", "hdm:D2"]),
+        ]
+        assert list(s._devices_by_id) == ["hdm:D2", "hdm:D1"]
+
+    def test_concurrent_timings_report_fetch_and_build_phases(self):
+        s = self._run_init(_fake_api(), concurrent=True)
+        assert set(s.startup_timings) == {
+            "authenticate",
+            "fetch",
+            "services",
+            "devices",
+            "rooms",
+            "scenarios",
+            "messages",
+            "userdefinedstates",
+            "domains",
+            "emma",
+        }
+        assert all(v >= 0 for v in s.startup_timings.values())
+
+    def test_serial_timings_have_no_fetch_phase(self):
+        s = self._run_init(_fake_api())
+        assert "fetch" not in s.startup_timings
+        assert "devices" in s.startup_timings
+
+    def test_failure_cancels_sibling_requests(self):
+        api = _fake_api()
+        cancelled = []
+
+        async def slow_rooms():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+            return []
+
+        api.get_rooms.side_effect = slow_rooms
+        api.get_services.side_effect = SHCConnectionError("boom")
+
+        with pytest.raises(SHCConnectionError):
+            self._run_init(api, concurrent=True)
+        assert cancelled == [True]
+
+    def test_failure_waits_for_cancelled_siblings(self):
+        """The error only propagates once every sibling has wound down, and
+        a sibling's own failure during cleanup doesn't mask it."""
+        api = _fake_api()
+        finished = []
+
+        async def slow_rooms():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                await asyncio.sleep(0)
+                finished.append(True)
+                raise RuntimeError("cleanup failed")
+            return []
+
+        api.get_rooms.side_effect = slow_rooms
+        api.get_services.side_effect = SHCConnectionError("boom")
+
+        async def run():
+            try:
+                await self._init(api, concurrent=True)
+            except SHCConnectionError:
+                return list(finished)
+            return None
+
+        assert asyncio.run(run()) == [True]
+
+
 # ---------------------------------------------------------------------------
 # _add_device — sync path
 # ---------------------------------------------------------------------------
@@ -365,6 +519,18 @@ class TestPollingLifecycle:
         api.long_polling_unsubscribe.assert_awaited_once_with("pid-stop")
         api.close.assert_awaited_once()
 
+    def test_stop_polling_closes_journal(self):
+        journal = MagicMock()
+
+        async def run():
+            s = _bare_session()
+            s._event_journal = journal
+            s._poll_task = asyncio.get_running_loop().create_task(asyncio.sleep(9999))
+            await s.stop_polling()
+
+        asyncio.run(run())
+        journal.close.assert_called_once()
+
     def test_stop_polling_calls_close_even_if_unsubscribe_fails(self):
         api = _fake_api()
         api.long_polling_unsubscribe.side_effect = Exception("network error")
@@ -455,6 +621,36 @@ class TestPollLoop:
         dev = asyncio.run(run())
         dev.process_long_polling_poll_result.assert_called_once_with(raw_event)
 
+    def test_poll_loop_records_journal(self):
+        from boschshcpy.journal import SHCEventJournal
+
+        api = _fake_api()
+        raw_event = {"@type": "message", "id": "m1"}
+        call_count = [0]
+
+        async def fake_poll(poll_id, timeout):
+            call_count[0] += 1
+            if call_count[0] == 1:
+                return [raw_event]
+            raise asyncio.CancelledError
+
+        api.long_polling_poll.side_effect = fake_poll
+
+        async def run():
+            s = _bare_session(api)
+            s._poll_id = "pid-journal"
+            s._event_journal = SHCEventJournal()
+            await s.start_polling()
+            try:
+                await asyncio.wait_for(s._poll_task, timeout=2.0)
+            except (asyncio.CancelledError, asyncio.TimeoutError):
+                pass
+            s._poll_task = None
+            return s._event_journal
+
+        journal = asyncio.run(run())
+        assert [entry.result for entry in journal.replay()] == [raw_event]
+
     def test_poll_loop_stale_poll_id_triggers_resubscribe(self):
         """-32001 must invalidate poll_id and resubscribe on next iteration."""
         api = _fake_api()
@@ -467,6 +663,13 @@ class TestPollLoop:
 
         api.long_polling_subscribe.side_effect = fake_subscribe
 
+        async def fake_resubscribe(old_poll_id):
+            resubscribed.append(old_poll_id)
+            return await fake_subscribe()
+
+        resubscribed = []
+        api.long_polling_resubscribe.side_effect = fake_resubscribe
+
         poll_calls = [0]
 
         async def fake_poll(poll_id, timeout):
@@ -497,8 +700,9 @@ class TestPollLoop:
             return s
 
         asyncio.run(run())
-        # subscribe was called: once in run() + once for resubscribe inside _poll_loop
-        assert calls[0] >= 2
+        # subscribe in run(), then one resubscribe batch dropping the stale id
+        assert calls[0] == 2
+        assert resubscribed == ["pid-1"]
 
     def test_poll_loop_other_error_backoff(self):
         """Non-32001 exceptions must log and backoff without crashing."""
@@ -535,6 +739,40 @@ class TestPollLoop:
         # Must have slept 15s for the generic error
         assert 15.0 in sleep_calls
 
+    def test_poll_loop_backs_off_per_retry_policy(self):
+        """With a retry policy, consecutive errors back off exponentially
+        and a successful poll resets the sequence."""
+        from boschshcpy.retry import SHCRetryPolicy
+
+        api = _fake_api()
+        outcomes = [ValueError("a"), ValueError("b"), [], ValueError("c")]
+
+        async def fake_poll(poll_id, timeout):
+            if not outcomes:
+                raise asyncio.CancelledError
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        api.long_polling_poll.side_effect = fake_poll
+
+        async def run():
+            s = _bare_session(api)
+            s._retry_policy = SHCRetryPolicy(backoff_base=0.5, jitter=0.0)
+            s._poll_id = "pid-backoff"
+            sleep_calls = []
+
+            async def fake_sleep(seconds):
+                sleep_calls.append(seconds)
+
+            with patch("boschshcpy.session_async.asyncio.sleep", side_effect=fake_sleep):
+                with pytest.raises(asyncio.CancelledError):
+                    await s._poll_loop()
+            return sleep_calls
+
+        assert asyncio.run(run()) == [0.5, 1.0, 0.5]
+
     def test_poll_loop_cancelled_error_propagates(self):
         """CancelledError must NOT be swallowed — the task must end with it."""
         api = _fake_api()
@@ -751,7 +989,7 @@ class TestProcessPollResult:
         assert "hdm:D3" not in s._services_by_device_id
 
     def test_device_new_subscriber_mutating_list_does_not_raise(self):
-        """Regression: _subscribers must be snapshotted (list(...)) before
+        """Regression: class subscribers must be snapshotted before
         iterating, matching sync session.py — a callback that subscribes a
         new instance (e.g. HA platform setup registering further callbacks
         during dynamic entity creation) must not raise
@@ -767,9 +1005,9 @@ class TestProcessPollResult:
             s._async_add_new_device = fake_add
 
             def mutating_cb(_dev):
-                s._subscribers.append((object, MagicMock()))
+                s.subscribe((object, MagicMock()))
 
-            s._subscribers.append((object, mutating_cb))
+            s.subscribe((object, mutating_cb))
 
             raw = {"@type": "device", "id": "hdm:NEW2"}
             # Must not raise RuntimeError: list changed size during iteration
@@ -790,7 +1028,7 @@ class TestProcessPollResult:
 
             s._async_add_new_device = fake_add
             cb = MagicMock()
-            s._subscribers.append((object, cb))
+            s.subscribe((object, cb))
 
             raw = {"@type": "device", "id": "hdm:NEW"}
             await s._process_long_polling_poll_result(raw)
@@ -818,7 +1056,7 @@ class TestProcessPollResult:
             info_mock = _AsyncSHCInformation({"macAddress": "AA-BB"}, {})
             s._shc_information = info_mock
             cb = MagicMock()
-            s._subscribers.append((object, cb))
+            s.subscribe((object, cb))
 
             raw = {"@type": "userDefinedState", "id": "u99", "name": "New",
                    "state": False, "deleted": False}
@@ -969,7 +1207,7 @@ class TestSubscriptions:
         s = _bare_session()
         tpl = (MagicMock, lambda x: None)
         s.subscribe(tpl)
-        assert tpl in s._subscribers
+        assert s._subscriptions.class_subscribers(MagicMock()) == [tpl[1]]
 
     def test_subscribe_scenario_callback(self):
         s = _bare_session()
@@ -998,3 +1236,319 @@ class TestSubscriptions:
         s._userdefinedstate_callbacks["u1"] = [MagicMock()]
         s.unsubscribe_userdefinedstate_callbacks("u1")
         assert "u1" not in s._userdefinedstate_callbacks
+
+
+class TestPollResultHandlerRegistry:
+    def test_sync_and_coroutine_handlers_are_dispatched(self):
+        s = _bare_session()
+        seen = []
+
+        async def on_async(raw):
+            seen.append(("async", raw["id"]))
+
+        s.register_poll_result_handler("customType", lambda raw: seen.append(("sync", raw["id"])))
+        s.register_poll_result_handler("otherType", on_async)
+
+        asyncio.run(s._process_long_polling_poll_result({"@type": "customType", "id": "a"}))
+        asyncio.run(s._process_long_polling_poll_result({"@type": "otherType", "id": "b"}))
+
+        assert seen == [("sync", "a"), ("async", "b")]
+
+    def test_link_handler_registered_for_new_link_id(self):
+        s = _bare_session()
+        handler = AsyncMock()
+        s.register_link_handler("com.example.applink", handler)
+        raw = {"@type": "link", "id": "com.example.applink"}
+
+        asyncio.run(s._process_long_polling_poll_result(raw))
+
+        handler.assert_awaited_once_with(raw)
+        s._emma.update_emma_data.assert_not_called()
+
+    def test_emma_link_routed_by_default(self):
+        s = _bare_session()
+        raw = {"@type": "link", "id": "com.bosch.tt.emma.applink"}
+        asyncio.run(s._process_long_polling_poll_result(raw))
+        s._emma.update_emma_data.assert_called_once_with(raw)
+
+    def test_unknown_type_is_ignored(self):
+        s = _bare_session()
+        asyncio.run(s._process_long_polling_poll_result({"@type": "unknown", "id": "x"}))
+
+
+    def test_events_invalidate_response_cache(self):
+        from boschshcpy.response_cache import SHCResponseCache
+
+        s = _bare_session()
+        s._response_cache = SHCResponseCache()
+        s._response_cache.store("scenarios", b"[]")
+        s._response_cache.store("rooms", b"[]")
+
+        asyncio.run(
+            s._process_long_polling_poll_result({"@type": "scenarioTriggered", "id": "s1"})
+        )
+
+        assert s._response_cache.get("scenarios") is None
+        assert s._response_cache.get("rooms") == b"[]"
+
+
+class TestPollLoopCoalescing:
+    def test_poll_batch_coalesced(self):
+        from boschshcpy.longpoll import SHCPollResultCoalescer
+
+        api = AsyncMock()
+        first = {"@type": "DeviceServiceData", "id": "ShutterControl", "deviceId": "hdm:D1"}
+        last = dict(first, state={"level": 1.0})
+        calls = [0]
+
+        async def fake_poll(poll_id, timeout):
+            calls[0] += 1
+            if calls[0] == 1:
+                return [first, last]
+            raise asyncio.CancelledError
+
+        api.long_polling_poll.side_effect = fake_poll
+
+        async def run():
+            s = _bare_session(api)
+            s._coalescer = SHCPollResultCoalescer(0.0)
+            s._poll_id = "pid"
+            dev = MagicMock()
+            s._devices_by_id["hdm:D1"] = dev
+            with pytest.raises(asyncio.CancelledError):
+                await s._poll_loop_body()
+            return dev
+
+        dev = asyncio.run(run())
+        dev.process_long_polling_poll_result.assert_called_once_with(last)
+
+
+class TestPollLoopAdaptiveWait:
+    def test_wait_lengthens_while_quiet(self):
+        from boschshcpy.longpoll import SHCAdaptivePollWait
+
+        now = [0.0]
+        api = AsyncMock()
+        waits = []
+
+        async def fake_poll(poll_id, wait_seconds):
+            waits.append(wait_seconds)
+            if len(waits) == 3:
+                raise asyncio.CancelledError
+            now[0] += wait_seconds
+            return []
+
+        api.long_polling_poll.side_effect = fake_poll
+
+        async def run():
+            s = _bare_session(api)
+            s._adaptive_poll_wait = SHCAdaptivePollWait(30, 120, clock=lambda: now[0])
+            s._poll_id = "pid"
+            with pytest.raises(asyncio.CancelledError):
+                await s._poll_loop_body()
+
+        asyncio.run(run())
+        assert waits == [30, 60, 120]
+
+
+class TestPipelinedPollLoop:
+    def test_next_poll_is_outstanding_while_callbacks_run(self, monkeypatch):
+        # The stuck dispatcher is cancelled once the drain timeout expires.
+        monkeypatch.setattr(
+            "boschshcpy.session_async._DISPATCH_DRAIN_TIMEOUT", 0.01
+        )
+        api = AsyncMock()
+        entered = []
+        seen_during_second_poll = []
+
+        async def slow_handler(raw_result):
+            entered.append(raw_result)
+            await asyncio.Event().wait()  # a callback that never finishes
+
+        async def run():
+            s = _bare_session(api)
+            s._pipeline_depth = 1
+            s._poll_id = "pid"
+            s._poll_result_handlers["message"] = slow_handler
+
+            async def fake_poll(poll_id, wait_seconds):
+                if api.long_polling_poll.await_count == 1:
+                    return [{"@type": "message", "id": "m1"}]
+                for _ in range(3):
+                    await asyncio.sleep(0)  # the request is on the wire
+                seen_during_second_poll.extend(entered)
+                s._stop_polling = True
+                return []
+
+            api.long_polling_poll.side_effect = fake_poll
+            await s._poll_loop()
+            return s
+
+        s = asyncio.run(run())
+        assert seen_during_second_poll == [{"@type": "message", "id": "m1"}]
+        assert s._dispatch_task is None
+
+    def test_stop_dispatches_queued_batches(self):
+        async def run():
+            s = _bare_session()
+            s._pipeline_depth = 4
+            s._poll_id = "pid"
+            dispatched = []
+            release = asyncio.Event()
+
+            async def dispatch(raw_results, resubscribed):
+                await release.wait()
+                dispatched.append((raw_results, resubscribed))
+
+            async def fake_poll(poll_id, wait_seconds):
+                if s._api.long_polling_poll.await_count == 1:
+                    return [{"id": "r1"}]
+                s._poll_id = None  # the next poll resubscribes
+                if s._api.long_polling_poll.await_count == 3:
+                    s._stop_polling = True
+                    asyncio.get_running_loop().call_soon(release.set)
+                return []
+
+            s._dispatch_batch = dispatch
+            s._api.long_polling_poll.side_effect = fake_poll
+            await s._poll_loop()
+            return s, dispatched
+
+        s, dispatched = asyncio.run(run())
+        # Still queued when the loop stopped, the resubscribe refresh included.
+        assert dispatched == [([{"id": "r1"}], False), ([], True)]
+        assert s._dispatch_task is None and s._dispatch_queue is None
+
+    def test_dispatcher_survives_failing_batch(self, caplog):
+        async def run():
+            s = _bare_session()
+            done = asyncio.Event()
+            calls = []
+
+            async def dispatch(raw_results, resubscribed):
+                calls.append((raw_results, resubscribed))
+                if len(calls) == 1:
+                    raise ValueError("boom")
+                done.set()
+
+            s._dispatch_batch = dispatch
+            dispatch_queue = asyncio.Queue()
+            dispatch_queue.put_nowait(([{}], False))
+            dispatch_queue.put_nowait(([], True))
+            task = asyncio.ensure_future(s._dispatch_loop(dispatch_queue))
+            await asyncio.wait_for(done.wait(), 5)
+            task.cancel()
+            return calls
+
+        calls = asyncio.run(run())
+        assert calls == [([{}], False), ([], True)]
+        assert "boom" in caplog.text
+
+
+class TestCoroutineCallbacks:
+    def test_scenario_and_userdefinedstate_coroutines_run_as_tasks(self):
+        seen = []
+
+        async def on_scenario(raw_result):
+            seen.append(("scenario", raw_result["id"]))
+
+        async def on_state():
+            seen.append(("state", "u1"))
+
+        async def run():
+            s = _bare_session()
+            s._scenario_callbacks["sc1"] = on_scenario
+            s._userdefinedstates_by_id["u1"] = MagicMock()
+            s._userdefinedstate_callbacks["u1"].append(on_state)
+            await s._process_long_polling_poll_result(
+                {"@type": "scenarioTriggered", "id": "sc1"}
+            )
+            await s._process_long_polling_poll_result(
+                {"@type": "userDefinedState", "id": "u1"}
+            )
+            assert s._callback_tasks.pending == 2
+            await s._callback_tasks.drain()
+
+        asyncio.run(run())
+        assert seen == [("scenario", "sc1"), ("state", "u1")]
+
+    def test_failing_coroutine_does_not_reach_the_poll_loop(self):
+        async def broken(raw_result):
+            raise ValueError("boom")
+
+        async def run():
+            s = _bare_session()
+            s._scenario_callbacks["sc1"] = broken
+            await s._process_long_polling_poll_result(
+                {"@type": "scenarioTriggered", "id": "sc1"}
+            )
+            await s._callback_tasks.drain()
+            return s._callback_tasks.failed
+
+        assert asyncio.run(run()) == 1
+
+
+class TestEventStreams:
+    def test_long_poll_change_is_streamed(self):
+        from boschshcpy.device_service import SHCDeviceService
+        from boschshcpy.events import SHCEventFilter
+
+        def dsd(switch_state):
+            return {
+                "@type": "DeviceServiceData",
+                "id": "PowerSwitch",
+                "deviceId": "hdm:D1",
+                "state": {"@type": "powerSwitchState", "switchState": switch_state},
+            }
+
+        service = SHCDeviceService(api=None, raw_device_service=dsd("OFF"))
+        dev = _fake_device("hdm:D1")
+        dev.device_model = "PSM"
+        dev.device_service.return_value = service
+        dev.process_long_polling_poll_result = service.process_long_polling_poll_result
+
+        async def run():
+            s = _bare_session()
+            s._devices_by_id["hdm:D1"] = dev
+            events = s.events(SHCEventFilter(device_models={"PSM"}))
+            other = s.events(SHCEventFilter(device_models={"BBL"}))
+            await s._process_long_polling_poll_result(dsd("ON"))
+            s._close_event_streams()
+            return [e async for e in events], [e async for e in other], s
+
+        received, other, s = asyncio.run(run())
+        assert [e.changes for e in received] == [{"switchState": ("OFF", "ON")}]
+        assert other == []
+        assert s._event_streams == []
+
+    def test_coroutine_change_subscriber(self):
+        from boschshcpy.device_service import SHCDeviceService
+        from boschshcpy.events import SHCEventFilter
+
+        raw = {
+            "@type": "DeviceServiceData",
+            "id": "PowerSwitch",
+            "deviceId": "hdm:D1",
+            "state": {"@type": "powerSwitchState", "switchState": "OFF"},
+        }
+        service = SHCDeviceService(api=None, raw_device_service=raw)
+        dev = _fake_device("hdm:D1")
+        dev.room_id = "hz_1"
+        dev.device_service.return_value = service
+        dev.process_long_polling_poll_result = service.process_long_polling_poll_result
+        seen = []
+
+        async def on_change(event):
+            seen.append(event.changes)
+
+        async def run():
+            s = _bare_session()
+            s._devices_by_id["hdm:D1"] = dev
+            s.subscribe_changes(on_change, SHCEventFilter(room_ids={"hz_1"}))
+            await s._process_long_polling_poll_result(
+                dict(raw, state={"@type": "powerSwitchState", "switchState": "ON"})
+            )
+            await s._callback_tasks.drain()
+
+        asyncio.run(run())
+        assert seen == [{"switchState": ("OFF", "ON")}]
@@ -26,7 +26,9 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from boschshcpy.api_async import JSONRPCError
+from boschshcpy.callbacks import SHCCallbackTasks
 from boschshcpy.session_async import SHCSessionAsync, _AsyncSHCInformation
+from boschshcpy.subscriptions import SHCSubscriptionRegistry
 
 
 # ---------------------------------------------------------------------------
@@ -94,14 +96,29 @@ def _bare_session(api: AsyncMock | None = None) -> SHCSessionAsync:
     s._domains_by_id = {}
     s._messages_by_id = {}
     s._userdefinedstates_by_id = {}
-    s._subscribers = []
+    s._subscriptions = SHCSubscriptionRegistry()
+    s._event_streams = []
     s._emma = MagicMock()
+    s._poll_result_handlers = s._default_poll_result_handlers()
+    s._link_handlers = {"com.bosch.tt.emma.applink": s._handle_emma_link}
+    s._coalescer = None
+    s._response_cache = None
+    s._retry_policy = None
+    s._adaptive_poll_wait = None
+    s._pipeline_depth = None
+    s._event_journal = None
+    s._callback_tasks = SHCCallbackTasks()
     s._shc_information = _AsyncSHCInformation(
         {"macAddress": "AA-BB-CC-DD-EE-FF", "shcIpAddress": "192.168.2.99"},
         {},
     )
+    s._topology_cache = None
+    s._reconcile_task = None
+    s._topology_lock = asyncio.Lock()
     s._poll_id = None
     s._poll_task = None
+    s._dispatch_queue = None
+    s._dispatch_task = None
     s._stop_polling = False
     s._scenario_callbacks = {}
     s._userdefinedstate_callbacks = defaultdict(list)
@@ -146,6 +163,9 @@ class TestRealInit:
             key="/key.pem",
             external_session=None,
             ssl_context=None,
+            response_cache=None,
+            scheduler=None,
+            retry_policy=None,
         )
 
     def test_real_init_passes_external_session(self):
@@ -161,6 +181,9 @@ class TestRealInit:
             key="/key.pem",
             external_session=fake_session,
             ssl_context=None,
+            response_cache=None,
+            scheduler=None,
+            retry_policy=None,
         )
 
     def test_real_init_device_helper_is_none(self):
@@ -183,7 +206,8 @@ class TestRealInit:
         assert s._scenarios_by_id == {}
         assert s._messages_by_id == {}
         assert s._userdefinedstates_by_id == {}
-        assert s._subscribers == []
+        assert s._subscriptions.class_subscribers(object()) == []
+        assert not s._subscriptions
         assert s._scenario_callbacks == {}
 
 
@@ -192,11 +216,63 @@ class TestRealInit:
 # ---------------------------------------------------------------------------
 
 class TestEnumerateServices:
+    def test_streaming_builds_devices_while_receiving(self):
+        from boschshcpy.services_impl import SUPPORTED_DEVICE_SERVICE_IDS
+
+        api = _fake_api()
+        events = []
+
+        async def iter_services(service_ids):
+            assert service_ids is SUPPORTED_DEVICE_SERVICE_IDS
+            yield {"@type": "DeviceServiceData", "id": "PowerSwitch", "deviceId": "hdm:D1"}
+
+        async def iter_devices():
+            for device_id in ("hdm:D1", "hdm:D2"):
+                events.append(f"received {device_id}")
+                yield {"id": device_id}
+
+        api.iter_services = iter_services
+        api.iter_devices = iter_devices
+
+        async def run():
+            s = _bare_session(api)
+            s._add_device = lambda raw: events.append(f"built {raw['id']}")
+            await s._async_enumerate_services(streaming=True)
+            await s._async_enumerate_devices(streaming=True)
+            return s
+
+        s = asyncio.run(run())
+        assert len(s._services_by_device_id["hdm:D1"]) == 1
+        assert events == [
+            "received hdm:D1",
+            "built hdm:D1",
+            "received hdm:D2",
+            "built hdm:D2",
+        ]
+        api.get_services.assert_not_awaited()
+        api.get_devices.assert_not_awaited()
+
+    def test_enumerate_services_validates_while_grouping(self):
+        from boschshcpy.exceptions import SHCSessionError
+
+        api = _fake_api()
+        api.get_services.return_value = [
+            {"@type": "message", "id": "PowerSwitch", "deviceId": "hdm:D1"},
+        ]
+
+        async def run():
+            s = _bare_session(api)
+            await s._async_enumerate_services()
+
+        with pytest.raises(SHCSessionError, match="expected 'DeviceServiceData'"):
+            asyncio.run(run())
+        api.get_services.assert_awaited_once_with(validate=False)
+
     def test_enumerate_services_skips_unsupported_ids(self):
         """Services with IDs not in SUPPORTED_DEVICE_SERVICE_IDS must be skipped."""
         api = _fake_api()
         api.get_services.return_value = [
-            {"id": "UNSUPPORTED_XYZ_SERVICE", "deviceId": "hdm:D1"},
+            {"@type": "DeviceServiceData", "id": "UNSUPPORTED_XYZ_SERVICE", "deviceId": "hdm:D1"},
         ]
 
         async def run():
@@ -214,8 +290,8 @@ class TestEnumerateServices:
         supported_id = next(iter(SUPPORTED_DEVICE_SERVICE_IDS))
         api = _fake_api()
         api.get_services.return_value = [
-            {"id": supported_id, "deviceId": "hdm:D1"},
-            {"id": "UNSUPPORTED_GARBAGE", "deviceId": "hdm:D1"},
+            {"@type": "DeviceServiceData", "id": supported_id, "deviceId": "hdm:D1"},
+            {"@type": "DeviceServiceData", "id": "UNSUPPORTED_GARBAGE", "deviceId": "hdm:D1"},
         ]
 
         async def run():
@@ -383,8 +459,11 @@ class TestStopPollingExceptionBranch:
 
 class TestPollLoopResubscribeRefresh:
     def test_poll_loop_resubscribe_refreshes_devices(self):
-        """After resubscribe, _poll_loop must async-short-poll all devices."""
+        """After resubscribe, _poll_loop must refresh all devices via GET /services."""
         api = _fake_api()
+        svc1 = {"@type": "DeviceServiceData", "id": "A", "deviceId": "hdm:D1"}
+        svc2 = {"@type": "DeviceServiceData", "id": "B", "deviceId": "hdm:D2"}
+        api.get_services.return_value = [svc1, svc2]
 
         # First call: poll_id is None → resubscribe, then poll returns empty
         # Second call: CancelledError to exit
@@ -428,13 +507,18 @@ class TestPollLoopResubscribeRefresh:
             return dev1, dev2
 
         dev1, dev2 = asyncio.run(run())
-        # Both devices must have been async-updated with fire_callbacks=True
-        dev1.async_update.assert_called_once_with(fire_callbacks=True)
-        dev2.async_update.assert_called_once_with(fire_callbacks=True)
+        # One bulk GET, each service routed to its device; no per-device polls
+        api.get_services.assert_awaited_once_with()
+        dev1.process_refresh_result.assert_called_once_with(svc1)
+        dev2.process_refresh_result.assert_called_once_with(svc2)
+        dev1.async_update.assert_not_called()
+        dev2.async_update.assert_not_called()
 
     def test_poll_loop_resubscribe_refresh_device_update_error_is_logged(self):
-        """A failing device.update() during refresh must be caught, not crash the loop."""
+        """A failing fallback async_update() must be caught, not crash the loop."""
         api = _fake_api()
+        # Bulk GET /services fails → per-device short-poll fallback
+        api.get_services.side_effect = ConnectionError("bulk refresh failed")
 
         subscribe_calls = [0]
 
@@ -470,9 +554,11 @@ class TestPollLoopResubscribeRefresh:
                 except (asyncio.CancelledError, asyncio.TimeoutError):
                     pass
                 s._poll_task = None
+            return dev
 
         # Must not raise — exception in device.update() is caught and logged
-        asyncio.run(run())
+        dev = asyncio.run(run())
+        dev.async_update.assert_called_once_with(fire_callbacks=True)
 
 
 # ---------------------------------------------------------------------------
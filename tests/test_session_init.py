@@ -66,6 +66,9 @@ class TestInitApiConstruction:
             key="/fake/key.pem",
             verify_hostname=False,
             ssl_verify=True,
+            response_cache=None,
+            scheduler=None,
+            retry_policy=None,
         )
 
     def test_api_attribute_is_shcapi_instance(self):
@@ -147,7 +150,8 @@ class TestInitAttributes:
         assert self.session._userdefinedstates_by_id == {}
 
     def test_subscribers_empty_list(self):
-        assert self.session._subscribers == []
+        assert self.session._subscriptions.class_subscribers(object()) == []
+        assert not self.session._subscriptions
 
 
 # ---------------------------------------------------------------------------
@@ -222,3 +226,26 @@ class TestInitPostEnumerateAttributes:
         s = self.session
         assert isinstance(s._userdefinedstate_callbacks, defaultdict)
         assert s._userdefinedstate_callbacks["new_key"] == []
+
+
+# ---------------------------------------------------------------------------
+# parallel_enumeration / enumeration_workers
+# ---------------------------------------------------------------------------
+
+class TestInitParallelEnumeration:
+    def _session(self, **kwargs):
+        with patch("boschshcpy.session.SHCAPI"), \
+             patch("boschshcpy.session.SHCDeviceHelper"), \
+             patch("boschshcpy.session.SHCEmma"):
+            return SHCSession("192.0.2.1", "/c.pem", "/k.pem", lazy=True, **kwargs)
+
+    def test_serial_by_default(self):
+        assert self._session()._parallel_enumeration is False
+
+    def test_workers_bounded_to_resource_count(self):
+        session = self._session(parallel_enumeration=True, enumeration_workers=64)
+        assert session._parallel_enumeration is True
+        assert session._enumeration_workers == 7
+
+    def test_workers_at_least_one(self):
+        assert self._session(enumeration_workers=0)._enumeration_workers == 1
@@ -10,6 +10,7 @@ Isolation strategy:
 
 import json
 import threading
+import warnings
 from collections import defaultdict
 from types import SimpleNamespace
 from unittest.mock import MagicMock, call, patch
@@ -17,8 +18,9 @@ from unittest.mock import MagicMock, call, patch
 import pytest
 
 from boschshcpy.api import JSONRPCError
-from boschshcpy.exceptions import SHCSessionError
+from boschshcpy.exceptions import SHCConnectionError, SHCSessionError
 from boschshcpy.session import SHCSession
+from boschshcpy.subscriptions import SHCSubscriptionRegistry
 
 
 # ---------------------------------------------------------------------------
@@ -31,9 +33,25 @@ def _bare_session() -> SHCSession:
     s._api = MagicMock()
     s._device_helper = MagicMock()
     s._poll_id = None
+    s._expired_poll_id = None
     s._shc_information = None
     s._zeroconf = None
     s._long_poll_timeout = 10
+    s._parallel_enumeration = False
+    s._streaming_enumeration = False
+    s._response_cache = None
+    s._retry_policy = None
+    s._adaptive_poll_wait = None
+    s._pipeline_depth = None
+    s._event_journal = None
+    s._topology_lock = threading.RLock()
+    s._reconcile_pending = False
+    s._dispatch_queue = None
+    s._dispatch_thread = None
+    s._callback_executor = None
+    s._enumeration_workers = 7
+    s._topology_cache = None
+    s._reconcile_thread = None
     s._rooms_by_id = {}
     s._scenarios_by_id = {}
     s._devices_by_id = {}
@@ -41,8 +59,12 @@ def _bare_session() -> SHCSession:
     s._domains_by_id = {}
     s._messages_by_id = {}
     s._userdefinedstates_by_id = {}
-    s._subscribers = []
+    s._subscriptions = SHCSubscriptionRegistry()
+    s._event_streams = []
     s._emma = MagicMock()
+    s._poll_result_handlers = s._default_poll_result_handlers()
+    s._link_handlers = {"com.bosch.tt.emma.applink": s._handle_emma_link}
+    s._coalescer = None
     s._polling_thread = None
     s._stop_polling_thread = False
     s.reset_connection_listener = None
@@ -182,7 +204,7 @@ class TestSubscriptions:
         s = _bare_session()
         cb_tuple = (MagicMock, lambda x: None)
         s.subscribe(cb_tuple)
-        assert cb_tuple in s._subscribers
+        assert s._subscriptions.class_subscribers(MagicMock()) == [cb_tuple[1]]
 
     def test_subscribe_scenario_callback(self):
         s = _bare_session()
@@ -277,6 +299,46 @@ class TestLongPoll:
             s._long_poll()
         assert exc_info.value.code == -32600
 
+    def test_long_poll_records_journal(self):
+        from boschshcpy.journal import SHCEventJournal
+
+        s = _bare_session()
+        s._event_journal = SHCEventJournal(clock=lambda: 5.0)
+        s._api.long_polling_subscribe.return_value = "poll-1"
+        result = {"@type": "message", "id": "m1"}
+        s._api.long_polling_poll.return_value = [result]
+        s._resync_device_services = MagicMock()
+
+        s._long_poll()  # subscribes: the gap comes first
+        s._long_poll()
+
+        assert s._event_journal.replay() == [
+            (1, 5.0, None),
+            (2, 5.0, result),
+            (3, 5.0, result),
+        ]
+
+    def test_long_poll_survives_failing_journal_spill(self, tmp_path, caplog):
+        from boschshcpy.journal import SHCEventJournal
+
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        s = _bare_session()
+        s._event_journal = SHCEventJournal(spill_path=blocker / "journal.jsonl")
+        s._poll_id = "pid"
+        result = {"@type": "DeviceServiceData", "deviceId": "hdm:X"}
+        s._api.long_polling_poll.return_value = [result]
+        dev = MagicMock()
+        s._devices_by_id["hdm:X"] = dev
+
+        assert s._long_poll() is True
+        s._event_journal.close()
+        assert s._long_poll() is True
+
+        assert dev.process_long_polling_poll_result.call_count == 2
+        assert s._event_journal.last_seq == 2
+        assert caplog.text.count("Stopped spilling the event journal") == 1
+
     def test_long_poll_passes_wait_seconds(self):
         s = _bare_session()
         s._poll_id = "pid"
@@ -391,6 +453,25 @@ class TestProcessLongPollingPollResult:
         raw = {"@type": "scenarioTriggered", "id": "sc_none"}
         s._process_long_polling_poll_result(raw)  # must not raise
 
+    def test_coroutine_callbacks_are_closed_with_warning(self, caplog):
+        s = _bare_session()
+        s._userdefinedstates_by_id["u1"] = MagicMock()
+
+        async def listener(*args):
+            pass
+
+        s._scenario_callbacks["sc1"] = listener
+        s._userdefinedstate_callbacks["u1"].append(listener)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")  # no "never awaited" RuntimeWarning
+            s._process_long_polling_poll_result(
+                {"@type": "scenarioTriggered", "id": "sc1"}
+            )
+            s._process_long_polling_poll_result(
+                {"@type": "userDefinedState", "id": "u1", "state": True}
+            )
+        assert caplog.text.count("needs SHCSessionAsync") == 2
+
     # --- device: update existing ---
 
     def test_device_update_existing(self):
@@ -437,7 +518,7 @@ class TestProcessLongPollingPollResult:
         s._add_device = fake_add_device
 
         cb = MagicMock()
-        s._subscribers.append((object, cb))  # isinstance(new_dev, object) is True
+        s.subscribe((object, cb))  # isinstance(new_dev, object) is True
         s._process_long_polling_poll_result(raw)
         assert captured["called_with"] is raw
         cb.assert_called_once_with(new_dev)
@@ -519,7 +600,7 @@ class TestProcessLongPollingPollResult:
             MockUDS.return_value = new_uds
             cb = MagicMock()
             # subscriber for any object type
-            s._subscribers.append((object, cb))
+            s.subscribe((object, cb))
             s._process_long_polling_poll_result(raw)
 
         assert "u99" in s._userdefinedstates_by_id
@@ -618,6 +699,13 @@ class TestPollingLifecycle:
         s._api.long_polling_unsubscribe.assert_not_called()
         assert s._polling_thread is None
 
+    def test_stop_polling_closes_journal(self):
+        s = _bare_session()
+        s._polling_thread = MagicMock()
+        s._event_journal = MagicMock()
+        s.stop_polling()
+        s._event_journal.close.assert_called_once()
+
 
 # ---------------------------------------------------------------------------
 # Polling thread internal logic (white-box: extract the closure)
@@ -875,8 +963,8 @@ class TestEnumerateHelpers:
     def test_enumerate_services_filters_unsupported(self):
         s = _bare_session()
         s._api.get_services.return_value = [
-            {"id": "SupportedService", "deviceId": "hdm:D1"},
-            {"id": "UnsupportedService", "deviceId": "hdm:D2"},
+            {"@type": "DeviceServiceData", "id": "SupportedService", "deviceId": "hdm:D1"},
+            {"@type": "DeviceServiceData", "id": "UnsupportedService", "deviceId": "hdm:D2"},
         ]
         import boschshcpy.session as session_mod
         original = session_mod.SUPPORTED_DEVICE_SERVICE_IDS
@@ -888,6 +976,22 @@ class TestEnumerateHelpers:
         assert "hdm:D1" in s._services_by_device_id
         assert "hdm:D2" not in s._services_by_device_id
 
+    def test_enumerate_services_validates_while_grouping(self):
+        s = _bare_session()
+        s._api.get_services.return_value = [
+            {"@type": "DeviceServiceData", "id": "PowerSwitch", "deviceId": "hdm:D1"},
+            {"@type": "device", "id": "PowerSwitch", "deviceId": "hdm:D2"},
+        ]
+        with pytest.raises(SHCSessionError, match="expected 'DeviceServiceData'"):
+            s._enumerate_services()
+        # The API's own element pass is skipped; the session checks instead.
+        s._api.get_services.assert_called_once_with(validate=False)
+
+    def test_load_services_from_snapshot_is_not_revalidated(self):
+        s = _bare_session()
+        s._load_services([{"id": "PowerSwitch", "deviceId": "hdm:D1"}])
+        assert len(s._services_by_device_id["hdm:D1"]) == 1
+
     def test_enumerate_rooms_populates_dict(self):
         s = _bare_session()
         raw_room = {"id": "room1", "name": "Living Room", "iconId": "1"}
@@ -953,6 +1057,29 @@ class TestEnumerateHelpers:
         assert "hdm:D1" in added
         assert "hdm:D2" in added
 
+    def test_streaming_enumeration_uses_iterators(self):
+        s = _bare_session()
+        s._streaming_enumeration = True
+        s._api.iter_services.return_value = iter(
+            [{"@type": "DeviceServiceData", "id": "PowerSwitch", "deviceId": "hdm:D1"}]
+        )
+        s._api.iter_devices.return_value = iter([{"id": "hdm:D1"}, {"id": "hdm:D2"}])
+        added = []
+        s._add_device = lambda raw, update_services=False: added.append(raw["id"])
+
+        s._enumerate_services()
+        s._enumerate_devices()
+
+        from boschshcpy.services_impl import SUPPORTED_DEVICE_SERVICE_IDS
+
+        s._api.iter_services.assert_called_once_with(SUPPORTED_DEVICE_SERVICE_IDS)
+        s._api.get_services.assert_not_called()
+        s._api.get_devices.assert_not_called()
+        assert [svc["id"] for svc in s._services_by_device_id["hdm:D1"]] == [
+            "PowerSwitch"
+        ]
+        assert added == ["hdm:D1", "hdm:D2"]
+
     def test_add_device_update_services_skips_unsupported(self):
         """Line 82: the continue branch inside update_services loop."""
         s = _bare_session()
@@ -1041,6 +1168,102 @@ class TestInitializeHelpers:
         ]
 
 
+class TestParallelEnumeration:
+    def _api(self):
+        api = MagicMock()
+        api.get_services.return_value = [
+            {"@type": "DeviceServiceData", "id": "PowerSwitch", "deviceId": "hdm:D1"},
+            {"@type": "DeviceServiceData", "id": "NotSupportedService", "deviceId": "hdm:D1"},
+            {"@type": "DeviceServiceData", "id": "PowerSwitch", "deviceId": "hdm:D2"},
+        ]
+        api.get_devices.return_value = [{"id": "hdm:D2"}, {"id": "hdm:D1"}]
+        api.get_rooms.return_value = [{"id": "r1", "name": "Kitchen"}]
+        api.get_scenarios.return_value = [{"id": "sc1", "name": "Away"}]
+        api.get_messages.return_value = [{"id": "m1"}]
+        api.get_userdefinedstates.return_value = [{"id": "u1", "name": "Guest"}]
+        api.get_domain_intrusion_detection.return_value = {"@type": "systemState"}
+        return api
+
+    def _enumerate(self, parallel):
+        s = _bare_session()
+        s._api = self._api()
+        s._parallel_enumeration = parallel
+        s._shc_information = MagicMock(macAddress="AA-BB")
+        s.authenticate = lambda: None
+        built = []
+
+        def device_init(raw_device, services):
+            built.append((raw_device["id"], [svc["deviceId"] for svc in services]))
+            return MagicMock()
+
+        s._device_helper.device_init.side_effect = device_init
+        with patch("boschshcpy.session.SHCIntrusionSystem") as MockIDS, patch(
+            "boschshcpy.session.SHCEmma"
+        ):
+            MockIDS.return_value = "ids"
+            s._enumerate_all()
+        return s, built
+
+    def test_parallel_builds_identical_graph(self):
+        serial, serial_built = self._enumerate(parallel=False)
+        parallel, parallel_built = self._enumerate(parallel=True)
+
+        assert parallel_built == serial_built == [
+            ("hdm:D2", ["hdm:D2"]),
+            ("hdm:D1", ["hdm:D1"]),
+        ]
+        for attr in (
+            "_devices_by_id",
+            "_rooms_by_id",
+            "_scenarios_by_id",
+            "_messages_by_id",
+            "_userdefinedstates_by_id",
+        ):
+            assert list(getattr(parallel, attr)) == list(getattr(serial, attr))
+        assert dict(parallel._services_by_device_id) == dict(
+            serial._services_by_device_id
+        )
+        assert parallel._domains_by_id == serial._domains_by_id == {"IDS": "ids"}
+
+    def test_parallel_gets_run_on_worker_threads_concurrently(self):
+        s = _bare_session()
+        s._api = self._api()
+        s._parallel_enumeration = True
+        s._shc_information = MagicMock(macAddress="AA-BB")
+        s.authenticate = lambda: None
+        rooms_started = threading.Event()
+        caller = threading.current_thread()
+        fetch_threads = []
+
+        def get_services(**kwargs):
+            fetch_threads.append(threading.current_thread())
+            # Only returns once get_rooms is running in parallel.
+            assert rooms_started.wait(timeout=2)
+            return []
+
+        def get_rooms():
+            rooms_started.set()
+            return []
+
+        s._api.get_services.side_effect = get_services
+        s._api.get_rooms.side_effect = get_rooms
+        with patch("boschshcpy.session.SHCIntrusionSystem"), patch(
+            "boschshcpy.session.SHCEmma"
+        ):
+            s._enumerate_all()
+        assert fetch_threads and fetch_threads[0] is not caller
+
+    def test_parallel_failure_propagates(self):
+        s = _bare_session()
+        s._api = self._api()
+        s._parallel_enumeration = True
+        s.authenticate = lambda: None
+        s._api.get_devices.side_effect = SHCSessionError("boom")
+        with pytest.raises(SHCSessionError):
+            s._enumerate_all()
+        assert s._devices_by_id == {}
+
+
 # ---------------------------------------------------------------------------
 # rawscan
 # ---------------------------------------------------------------------------
@@ -1163,14 +1386,22 @@ class TestPollIdResubscribeCycle:
         assert result1 is False
         assert s._poll_id is None
 
-        # Second call: subscribe succeeds + poll returns empty
-        s._api.long_polling_subscribe.return_value = "fresh-id"
+        # Second call: one batch drops the stale id and subscribes again
+        s._api.long_polling_resubscribe.return_value = "fresh-id"
         s._api.long_polling_poll.side_effect = None
         s._api.long_polling_poll.return_value = []
         result2 = s._long_poll()
         assert result2 is True
         assert s._poll_id == "fresh-id"
-        s._api.long_polling_subscribe.assert_called_once()
+        s._api.long_polling_resubscribe.assert_called_once_with("stale-id")
+        s._api.long_polling_subscribe.assert_not_called()
+
+        # The next resubscribe after that starts from the fresh id again
+        s._api.long_polling_poll.side_effect = err
+        s._long_poll()
+        s._api.long_polling_poll.side_effect = None
+        s._long_poll()
+        s._api.long_polling_resubscribe.assert_called_with("fresh-id")
 
 
 # ---------------------------------------------------------------------------
@@ -1179,15 +1410,19 @@ class TestPollIdResubscribeCycle:
 # ---------------------------------------------------------------------------
 
 class TestResubscribeRefresh:
-    """Verify that _long_poll calls device.update() on every known device after
-    a fresh subscribe (poll_id was None at entry) and NOT on a normal poll.
+    """Verify that _long_poll refreshes every known device after a fresh
+    subscribe (poll_id was None at entry) and NOT on a normal poll.
+
+    The refresh is one bulk GET /services routed through
+    device.process_refresh_result(); the per-device update() sweep is only
+    the fallback when the bulk GET fails.
 
     Limitation: this validates the call path; it cannot test that the SHC
     actually returns updated state (that requires a live device).
     """
 
     def test_no_refresh_on_normal_poll(self):
-        """When poll_id is already set, device.update() must NOT be called."""
+        """When poll_id is already set, no refresh must happen."""
         s = _bare_session()
         s._poll_id = "existing-id"
         dev = MagicMock()
@@ -1196,27 +1431,65 @@ class TestResubscribeRefresh:
 
         s._long_poll()
 
+        s._api.get_services.assert_not_called()
         dev.update.assert_not_called()
 
     def test_refresh_called_on_all_devices_after_resubscribe(self):
-        """When poll_id is None (first call or after -32001), device.update() must
-        be called once per registered device after the fresh subscribe succeeds."""
+        """When poll_id is None (first call or after -32001), one GET /services
+        must be issued and each entry routed to its owning device."""
         s = _bare_session()
         s._poll_id = None
         dev1 = MagicMock()
         dev2 = MagicMock()
         s._devices_by_id["hdm:D1"] = dev1
         s._devices_by_id["hdm:D2"] = dev2
+        svc1 = {"@type": "DeviceServiceData", "id": "A", "deviceId": "hdm:D1"}
+        svc2 = {"@type": "DeviceServiceData", "id": "B", "deviceId": "hdm:D2"}
+        s._api.get_services.return_value = [svc1, svc2]
         s._api.long_polling_subscribe.return_value = "new-id"
         s._api.long_polling_poll.return_value = []
 
         result = s._long_poll()
 
         assert result is True
-        # #183: resubscribe refresh must opt in to callback firing so HA entity
-        # closures are notified of state that changed during the poll-id gap.
-        dev1.update.assert_called_once_with(fire_callbacks=True)
-        dev2.update.assert_called_once_with(fire_callbacks=True)
+        s._api.get_services.assert_called_once_with()
+        dev1.process_refresh_result.assert_called_once_with(svc1)
+        dev2.process_refresh_result.assert_called_once_with(svc2)
+        dev1.update.assert_not_called()
+        dev2.update.assert_not_called()
+
+    def test_refresh_is_scheduled_as_background_work(self):
+        from boschshcpy.scheduler import Priority, request_priority
+
+        s = _bare_session()
+        s._poll_id = None
+        seen = []
+        s._api.get_services.side_effect = lambda: seen.append(
+            request_priority("GET", "https://shc/smarthome/services")
+        ) or []
+        s._api.long_polling_subscribe.return_value = "new-id"
+        s._api.long_polling_poll.return_value = []
+
+        s._long_poll()
+
+        assert seen == [Priority.BACKGROUND]
+        assert request_priority("GET", "https://shc/smarthome/services") is (
+            Priority.READ
+        )
+
+    def test_refresh_ignores_services_of_unknown_devices(self):
+        s = _bare_session()
+        s._poll_id = None
+        dev = MagicMock()
+        s._devices_by_id["hdm:D1"] = dev
+        s._api.get_services.return_value = [
+            {"@type": "DeviceServiceData", "id": "A", "deviceId": "hdm:GONE"}
+        ]
+        s._api.long_polling_subscribe.return_value = "new-id"
+        s._api.long_polling_poll.return_value = []
+
+        assert s._long_poll() is True
+        dev.process_refresh_result.assert_not_called()
 
     def test_refresh_not_called_again_on_next_normal_poll(self):
         """After one resubscribe-refresh cycle, subsequent polls must NOT re-refresh."""
@@ -1224,31 +1497,32 @@ class TestResubscribeRefresh:
         s._poll_id = None
         dev = MagicMock()
         s._devices_by_id["hdm:D1"] = dev
+        s._api.get_services.return_value = []
         s._api.long_polling_subscribe.return_value = "new-id"
         s._api.long_polling_poll.return_value = []
 
         # First call: resubscribe → refresh
         s._long_poll()
-        assert dev.update.call_count == 1
+        assert s._api.get_services.call_count == 1
 
         # Second call: poll_id already set → no refresh
         s._api.long_polling_poll.return_value = []
         s._long_poll()
-        assert dev.update.call_count == 1  # unchanged
+        assert s._api.get_services.call_count == 1  # unchanged
 
     def test_refresh_called_again_after_second_invalidation(self):
         """A second -32001 → invalidate → resubscribe cycle must also trigger refresh."""
         s = _bare_session()
         dev = MagicMock()
         s._devices_by_id["hdm:D1"] = dev
+        s._api.get_services.return_value = []
         s._api.long_polling_subscribe.return_value = "new-id"
         s._api.long_polling_poll.return_value = []
 
         # Cycle 1
         s._poll_id = None
         s._long_poll()
-        update_count_after_first = dev.update.call_count
-        assert update_count_after_first == 1
+        assert s._api.get_services.call_count == 1
 
         # Simulate -32001 during a normal poll
         err = JSONRPCError(-32001, "UNKNOWN_POLLID")
@@ -1260,15 +1534,34 @@ class TestResubscribeRefresh:
         s._api.long_polling_poll.side_effect = None
         s._api.long_polling_poll.return_value = []
         s._long_poll()
-        assert dev.update.call_count == 2  # one per resubscribe
+        assert s._api.get_services.call_count == 2  # one per resubscribe
+
+    def test_bulk_failure_falls_back_to_per_device_update(self):
+        """If GET /services fails, every device is short-polled instead (#183)."""
+        s = _bare_session()
+        s._poll_id = None
+        dev1 = MagicMock()
+        dev2 = MagicMock()
+        s._devices_by_id["hdm:D1"] = dev1
+        s._devices_by_id["hdm:D2"] = dev2
+        s._api.get_services.side_effect = SHCConnectionError("timeout")
+        s._api.long_polling_subscribe.return_value = "new-id"
+        s._api.long_polling_poll.return_value = []
+
+        assert s._long_poll() is True
+        # #183: the fallback refresh must opt in to callback firing so HA entity
+        # closures are notified of state that changed during the poll-id gap.
+        dev1.update.assert_called_once_with(fire_callbacks=True)
+        dev2.update.assert_called_once_with(fire_callbacks=True)
 
     def test_refresh_device_update_exception_does_not_abort_poll(self):
-        """If device.update() raises, _long_poll must still return True (logged, not re-raised)."""
+        """If a fallback device.update() raises, _long_poll must still return True."""
         s = _bare_session()
         s._poll_id = None
         dev = MagicMock()
         dev.update.side_effect = OSError("connection refused")
         s._devices_by_id["hdm:D1"] = dev
+        s._api.get_services.side_effect = SHCConnectionError("timeout")
         s._api.long_polling_subscribe.return_value = "fresh-id"
         s._api.long_polling_poll.return_value = []
 
@@ -1287,3 +1580,367 @@ class TestResubscribeRefresh:
         result = s._long_poll()
 
         assert result is True
+
+
+class TestPollResultHandlerRegistry:
+    def test_register_handler_for_new_type(self):
+        s = _bare_session()
+        handler = MagicMock()
+        s.register_poll_result_handler("customType", handler)
+        raw = {"@type": "customType", "id": "x"}
+
+        s._process_long_polling_poll_result(raw)
+
+        handler.assert_called_once_with(raw)
+
+    def test_register_handler_replaces_builtin(self):
+        s = _bare_session()
+        dev = MagicMock()
+        s._devices_by_id["hdm:D1"] = dev
+        handler = MagicMock()
+        s.register_poll_result_handler("DeviceServiceData", handler)
+
+        s._process_long_polling_poll_result(
+            {"@type": "DeviceServiceData", "id": "PowerSwitch", "deviceId": "hdm:D1"}
+        )
+
+        handler.assert_called_once()
+        dev.process_long_polling_poll_result.assert_not_called()
+
+    def test_link_handlers(self):
+        s = _bare_session()
+        handler = MagicMock()
+        s.register_link_handler("com.example.applink", handler)
+        custom = {"@type": "link", "id": "com.example.applink"}
+        emma = {"@type": "link", "id": "com.bosch.tt.emma.applink"}
+        unknown = {"@type": "link", "id": "com.example.unknown"}
+
+        for raw in (custom, emma, unknown):
+            s._process_long_polling_poll_result(raw)
+
+        handler.assert_called_once_with(custom)
+        s._emma.update_emma_data.assert_called_once_with(emma)
+
+    def test_unknown_type_is_ignored(self):
+        s = _bare_session()
+        s._process_long_polling_poll_result({"@type": "unknown", "id": "x"})
+
+    def test_payload_not_formatted_when_debug_disabled(self):
+        s = _bare_session()
+        raw = {"@type": "unknown", "id": "x"}
+        with patch("boschshcpy.session.logger") as mock_logger:
+            s._process_long_polling_poll_result(raw)
+        # Lazy %-style args: the dict is passed through, never pre-formatted
+        assert mock_logger.debug.call_args_list[0].args == ("Long poll: %s", raw)
+
+
+    def test_events_invalidate_response_cache(self):
+        from boschshcpy.response_cache import SHCResponseCache
+
+        s = _bare_session()
+        s._response_cache = SHCResponseCache()
+        s._response_cache.store("userdefinedstates", b"[]")
+        s._response_cache.store("rooms", b"[]")
+
+        s._process_long_polling_poll_result({"@type": "userDefinedState", "id": "u1"})
+
+        assert s._response_cache.get("userdefinedstates") is None
+        assert s._response_cache.get("rooms") == b"[]"
+
+
+class TestLongPollCoalescing:
+    def test_batch_is_coalesced_before_dispatch(self):
+        from boschshcpy.longpoll import SHCPollResultCoalescer
+
+        s = _bare_session()
+        s._coalescer = SHCPollResultCoalescer(0.0)
+        s._poll_id = "pid"
+        dev = MagicMock()
+        s._devices_by_id["hdm:D1"] = dev
+        first = {"@type": "DeviceServiceData", "id": "ShutterControl", "deviceId": "hdm:D1"}
+        last = dict(first, state={"level": 1.0})
+        s._api.long_polling_poll.return_value = [first, last]
+
+        assert s._long_poll() is True
+
+        dev.process_long_polling_poll_result.assert_called_once_with(last)
+
+    def test_window_defers_dispatch_and_shortens_wait(self):
+        from boschshcpy.longpoll import SHCPollResultCoalescer
+
+        now = [0.0]
+        s = _bare_session()
+        s._coalescer = SHCPollResultCoalescer(2.0, clock=lambda: now[0])
+        s._poll_id = "pid"
+        dev = MagicMock()
+        s._devices_by_id["hdm:D1"] = dev
+        raw = {"@type": "DeviceServiceData", "id": "ShutterControl", "deviceId": "hdm:D1"}
+        s._api.long_polling_poll.return_value = [raw]
+
+        s._long_poll()
+        dev.process_long_polling_poll_result.assert_not_called()
+
+        now[0] = 0.5
+
+        def quiet_poll(poll_id, wait_seconds):
+            now[0] += wait_seconds  # nothing arrives before the wait expires
+            return []
+
+        s._api.long_polling_poll.side_effect = quiet_poll
+        s._long_poll()
+
+        assert s._api.long_polling_poll.call_args_list[1] == call("pid", 2)
+        dev.process_long_polling_poll_result.assert_called_once_with(raw)
+
+
+class TestAdaptivePollWait:
+    def test_wait_follows_event_rate(self):
+        from boschshcpy.longpoll import SHCAdaptivePollWait
+
+        now = [0.0]
+        s = _bare_session()
+        s._adaptive_poll_wait = SHCAdaptivePollWait(10, 40, clock=lambda: now[0])
+        s._poll_id = "pid"
+        batches = [[], [], [{"@type": "message", "id": "m1"}], []]
+
+        def poll(poll_id, wait_seconds):
+            batch = batches.pop(0)
+            now[0] += 0.1 if batch else wait_seconds
+            return batch
+
+        s._api.long_polling_poll.side_effect = poll
+        for _ in range(4):
+            s._long_poll()
+
+        waits = [c.args[1] for c in s._api.long_polling_poll.call_args_list]
+        assert waits == [10, 20, 40, 10]
+
+    def test_explicit_wait_bypasses_adaptive(self):
+        from boschshcpy.longpoll import SHCAdaptivePollWait
+
+        s = _bare_session()
+        s._adaptive_poll_wait = SHCAdaptivePollWait(10, 40)
+        s._poll_id = "pid"
+        s._api.long_polling_poll.return_value = []
+
+        s._long_poll(5)
+
+        s._api.long_polling_poll.assert_called_once_with("pid", 5)
+        assert s._adaptive_poll_wait.current_wait == 10
+
+class TestPipelinedDispatch:
+    def test_batch_is_queued_not_dispatched(self):
+        import queue
+
+        s = _bare_session()
+        s._dispatch_queue = queue.Queue(maxsize=2)
+        s._poll_id = "pid"
+        dev = MagicMock()
+        s._devices_by_id["hdm:D1"] = dev
+        raw = {"@type": "DeviceServiceData", "id": "ShutterControl", "deviceId": "hdm:D1"}
+        s._api.long_polling_poll.side_effect = [[raw], []]
+
+        assert s._long_poll() is True
+        assert s._long_poll() is True
+
+        dev.process_long_polling_poll_result.assert_not_called()
+        assert s._dispatch_queue.get_nowait() == ([raw], False)
+        assert s._dispatch_queue.empty()  # empty batches are not queued
+
+    def test_next_poll_is_sent_while_callbacks_run(self):
+        s = _bare_session()
+        s._pipeline_depth = 2
+        s._poll_id = "pid"
+        entered = threading.Event()
+        release = threading.Event()
+        second_poll = threading.Event()
+        dev = MagicMock()
+        dev.process_long_polling_poll_result.side_effect = lambda raw: (
+            entered.set(),
+            release.wait(5),
+        )
+        s._devices_by_id["hdm:D1"] = dev
+        raw = {"@type": "DeviceServiceData", "id": "ShutterControl", "deviceId": "hdm:D1"}
+
+        def poll(poll_id, wait_seconds):
+            if s._api.long_polling_poll.call_count == 1:
+                return [raw]
+            s._stop_polling_thread = True
+            second_poll.set()
+            release.wait(5)
+            return []
+
+        s._api.long_polling_poll.side_effect = poll
+        s.start_polling()
+        polling_thread, dispatch_thread = s._polling_thread, s._dispatch_thread
+        try:
+            # Both the callback and the next poll are in progress.
+            assert second_poll.wait(5)
+            assert entered.wait(5)
+        finally:
+            release.set()
+        polling_thread.join(5)
+        dispatch_thread.join(5)
+
+        # The poll thread stopped the dispatcher on its way out.
+        assert not dispatch_thread.is_alive()
+        dev.process_long_polling_poll_result.assert_called_once_with(raw)
+        assert s._dispatch_queue is None
+
+    def test_dispatcher_survives_failing_batch(self, caplog):
+        import queue
+
+        s = _bare_session()
+        s._dispatch_batch = MagicMock(side_effect=[ValueError("boom"), None])
+        dispatch_queue = queue.Queue()
+        for item in (([{}], False), ([], True), None):
+            dispatch_queue.put(item)
+
+        s._dispatch_thread_main(dispatch_queue)
+
+        assert s._dispatch_batch.call_args_list == [call([{}], False), call([], True)]
+        assert "boom" in caplog.text
+
+class TestCallbackExecutor:
+    def test_results_run_on_the_executor(self):
+        from boschshcpy.dispatch import SHCCallbackExecutor
+
+        s = _bare_session()
+        s._callback_executor = SHCCallbackExecutor(workers=2)
+        threads = []
+        dev = MagicMock()
+        dev.process_long_polling_poll_result.side_effect = lambda raw: threads.append(
+            threading.current_thread().name
+        )
+        s._devices_by_id["hdm:D1"] = dev
+        raw = {"@type": "DeviceServiceData", "id": "ShutterControl", "deviceId": "hdm:D1"}
+
+        s._dispatch_batch([raw, raw], False)
+
+        assert s._callback_executor.join(5)
+        assert dev.process_long_polling_poll_result.call_count == 2
+        assert all(name.startswith("SHCCallbackWorker") for name in threads)
+        s._callback_executor.shutdown(5)
+
+    def test_resubscribe_refresh_waits_for_queued_results(self):
+        from boschshcpy.dispatch import SHCCallbackExecutor
+
+        s = _bare_session()
+        s._callback_executor = SHCCallbackExecutor(workers=1)
+        dev = MagicMock()
+        s._devices_by_id["hdm:D1"] = dev
+        raw = {"@type": "DeviceServiceData", "id": "ShutterControl", "deviceId": "hdm:D1"}
+        stats_at_refresh = []
+        s._resync_device_services = lambda: stats_at_refresh.append(
+            s._callback_executor.stats
+        )
+
+        s._dispatch_batch([raw] * 20, True)
+
+        assert stats_at_refresh[0].queued == 0
+        assert stats_at_refresh[0].running == 0
+        assert stats_at_refresh[0].executed == 20
+        s._callback_executor.shutdown(5)
+
+    def test_stop_polling_shuts_executor_down(self):
+        s = _bare_session()
+        s._callback_executor = MagicMock()
+        s._polling_thread = MagicMock()
+
+        s.stop_polling()
+
+        s._callback_executor.shutdown.assert_called_once_with(timeout=10)
+
+class TestEventStreams:
+    def _session_with_switch(self):
+        from boschshcpy.device_service import SHCDeviceService
+
+        s = _bare_session()
+        service = SHCDeviceService(
+            api=None,
+            raw_device_service={
+                "@type": "DeviceServiceData",
+                "id": "PowerSwitch",
+                "deviceId": "hdm:D1",
+                "state": {"@type": "powerSwitchState", "switchState": "OFF"},
+            },
+        )
+        dev = MagicMock()
+        dev.id = "hdm:D1"
+        dev.device_service.return_value = service
+        dev.process_long_polling_poll_result = service.process_long_polling_poll_result
+        dev.process_refresh_result = service.process_refresh_result
+        s._devices_by_id["hdm:D1"] = dev
+        return s
+
+    @staticmethod
+    def _dsd(switch_state):
+        return {
+            "@type": "DeviceServiceData",
+            "id": "PowerSwitch",
+            "deviceId": "hdm:D1",
+            "state": {"@type": "powerSwitchState", "switchState": switch_state},
+        }
+
+    def test_long_poll_change_is_streamed(self):
+        s = self._session_with_switch()
+        stream = s.events()
+
+        s._process_long_polling_poll_result(self._dsd("ON"))
+
+        event = stream.get(0)
+        assert event.device.id == "hdm:D1"
+        assert event.changes == {"switchState": ("OFF", "ON")}
+
+    def test_resubscribe_refresh_change_is_streamed(self):
+        s = self._session_with_switch()
+        s._api.get_services.return_value = [self._dsd("ON")]
+        stream = s.events()
+
+        s._resync_device_services()
+
+        assert stream.get(0).changes == {"switchState": ("OFF", "ON")}
+
+    def test_closed_stream_is_unregistered(self):
+        s = self._session_with_switch()
+        with s.events() as stream:
+            assert s._event_streams == [stream]
+        assert s._event_streams == []
+
+    def test_subscribe_changes(self):
+        from boschshcpy.events import SHCEventFilter
+
+        s = self._session_with_switch()
+        seen = []
+        unsubscribe = s.subscribe_changes(
+            seen.append, SHCEventFilter(service_ids={"PowerSwitch"})
+        )
+        s.subscribe_changes(seen.append, SHCEventFilter(service_ids={"ShutterControl"}))
+
+        s._process_long_polling_poll_result(self._dsd("ON"))
+        unsubscribe()
+        s._process_long_polling_poll_result(self._dsd("OFF"))
+
+        assert [event.changes for event in seen] == [{"switchState": ("OFF", "ON")}]
+
+    def test_stop_polling_ends_streams(self):
+        s = _bare_session()
+        s._polling_thread = MagicMock()
+        stream = s.events()
+
+        s.stop_polling()
+
+        assert list(stream) == []
+        assert s._event_streams == []
+
+class TestPollErrorBackoff:
+    def test_fixed_15_seconds_without_policy(self):
+        s = _bare_session()
+        assert [s._error_backoff(n) for n in (1, 2, 5)] == [15.0, 15.0, 15.0]
+
+    def test_policy_backoff(self):
+        from boschshcpy.retry import SHCRetryPolicy
+
+        s = _bare_session()
+        s._retry_policy = SHCRetryPolicy(backoff_base=1.0, backoff_max=4.0, jitter=0.0)
+        assert [s._error_backoff(n) for n in (1, 2, 3, 4)] == [1.0, 2.0, 4.0, 4.0]
@@ -0,0 +1,163 @@
+"""Tests for boschshcpy.singleflight — coalescing of identical in-flight calls."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from boschshcpy.singleflight import AsyncSingleFlight, SingleFlight
+
+
+class TestSingleFlight:
+    def test_concurrent_callers_share_one_call(self):
+        group = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return {"state": "ON"}
+
+        results = []
+        leader = threading.Thread(target=lambda: results.append(group.do("k", fetch)))
+        leader.start()
+        assert started.wait(5)
+        assert "k" in group
+        joining = threading.Semaphore(0)
+
+        def follow():
+            joining.release()
+            results.append(group.do("k", fetch))
+
+        followers = [threading.Thread(target=follow) for _ in range(3)]
+        for follower in followers:
+            follower.start()
+        for _ in followers:
+            assert joining.acquire(timeout=5)
+        time.sleep(0.05)  # let the followers reach do()
+        release.set()
+        for thread in [leader, *followers]:
+            thread.join(5)
+
+        assert calls == [1]
+        assert len(results) == 4
+        assert all(result is results[0] for result in results)
+        assert "k" not in group
+
+    def test_exception_is_raised_in_every_caller(self):
+        group = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+
+        def fetch():
+            started.set()
+            release.wait(5)
+            raise ValueError("boom")
+
+        errors = []
+
+        def call():
+            try:
+                group.do("k", fetch)
+            except ValueError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=call)]
+        threads[0].start()
+        assert started.wait(5)
+        threads.append(threading.Thread(target=call))
+        threads[1].start()
+        time.sleep(0.05)  # let the follower reach do()
+        release.set()
+        for thread in threads:
+            thread.join(5)
+        assert len(errors) == 2
+        assert "k" not in group
+
+    def test_sequential_calls_are_not_coalesced(self):
+        group = SingleFlight()
+        calls = []
+        group.do("k", lambda: calls.append(1))
+        group.do("k", lambda: calls.append(1))
+        assert calls == [1, 1]
+
+    def test_distinct_keys_run_separately(self):
+        group = SingleFlight()
+        assert group.do("a", lambda: 1) == 1
+        assert group.do("b", lambda: 2) == 2
+
+
+class TestAsyncSingleFlight:
+    def test_concurrent_callers_share_one_call(self):
+        group = AsyncSingleFlight()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return {"state": "ON"}
+
+        async def run():
+            results = await asyncio.gather(*(group.do("k", fetch) for _ in range(4)))
+            assert "k" not in group
+            return results
+
+        results = asyncio.run(run())
+        assert calls == [1]
+        assert all(result is results[0] for result in results)
+
+    def test_exception_is_raised_in_every_caller(self):
+        group = AsyncSingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0)
+            raise ValueError("boom")
+
+        async def run():
+            return await asyncio.gather(
+                group.do("k", fetch), group.do("k", fetch), return_exceptions=True
+            )
+
+        results = asyncio.run(run())
+        assert [type(result) for result in results] == [ValueError, ValueError]
+
+    def test_cancelling_one_waiter_keeps_the_call(self):
+        group = AsyncSingleFlight()
+        release = None
+
+        async def fetch():
+            await release.wait()
+            return "done"
+
+        async def run():
+            nonlocal release
+            release = asyncio.Event()
+            first = asyncio.create_task(group.do("k", fetch))
+            second = asyncio.create_task(group.do("k", fetch))
+            await asyncio.sleep(0)
+            first.cancel()
+            await asyncio.sleep(0)
+            release.set()
+            with pytest.raises(asyncio.CancelledError):
+                await first
+            return await second
+
+        assert asyncio.run(run()) == "done"
+
+    def test_sequential_calls_are_not_coalesced(self):
+        group = AsyncSingleFlight()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+
+        async def run():
+            await group.do("k", fetch)
+            await group.do("k", fetch)
+
+        asyncio.run(run())
+        assert calls == [1, 1]
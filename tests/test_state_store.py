@@ -0,0 +1,115 @@
+"""Tests for state_store.py — interning of retained raw JSON.
+
+Isolation: NO HA harness, NO real network.
+"""
+from __future__ import annotations
+
+import json
+from unittest.mock import MagicMock
+
+from boschshcpy.device import SHCDevice
+from boschshcpy.device_service import SHCDeviceService
+from boschshcpy import state_store
+from boschshcpy.state_store import MAX_INTERNED_VALUE_LENGTH, intern_raw
+
+
+def _parsed(obj):
+    """A fresh json.loads copy, i.e. with freshly allocated strings."""
+    return json.loads(json.dumps(obj))
+
+
+def _dsd(value):
+    return {
+        "@type": "DeviceServiceData",
+        "id": "PowerSwitch",
+        "deviceId": "hdm:ZigBee:0001",
+        "path": "/devices/hdm:ZigBee:0001/services/PowerSwitch",
+        "state": {"@type": "powerSwitchState", "switchState": value},
+    }
+
+
+def test_structure_and_values_preserved():
+    raw = {"a": [1, 2.5, None, True, {"b": "x" * 200}], "c": {"d": "ON"}}
+    assert intern_raw(_parsed(raw)) == raw
+
+
+def test_caller_document_is_not_mutated():
+    raw = _parsed(_dsd("ON"))
+    interned = intern_raw(raw)
+    assert interned is not raw
+    assert interned["state"] is not raw["state"]
+
+
+def test_equal_keys_and_enum_values_share_one_object():
+    first = intern_raw(_parsed(_dsd("ON")))
+    second = intern_raw(_parsed(_dsd("ON")))
+
+    first_keys = {key: key for key in first["state"]}
+    for key in second["state"]:
+        assert key is first_keys[key]
+    assert first["state"]["switchState"] is second["state"]["switchState"]
+    assert first["state"]["@type"] is second["state"]["@type"]
+
+
+def test_other_values_are_not_shared():
+    # Ids, timestamps and free text are unbounded: sharing them would keep
+    # every value ever received alive.
+    raw = {"deviceId": "hdm:ZigBee:0001", "latestMotionDetected": "2026-10-18"}
+    first = intern_raw(_parsed(raw))
+    second = intern_raw(_parsed(raw))
+    assert first == second
+    assert first["deviceId"] is not second["deviceId"]
+    assert first["latestMotionDetected"] is not second["latestMotionDetected"]
+
+
+def test_long_values_are_not_shared():
+    long_value = "Y" * (MAX_INTERNED_VALUE_LENGTH + 1)
+    first = intern_raw(_parsed({"k": long_value}))
+    second = intern_raw(_parsed({"k": long_value}))
+    assert first["k"] == second["k"]
+    assert first["k"] is not second["k"]
+
+
+def test_shared_value_table_is_bounded(monkeypatch):
+    monkeypatch.setattr(state_store, "_shared_values", {})
+    monkeypatch.setattr(state_store, "MAX_SHARED_VALUES", 2)
+    for value in ("A", "B", "C"):
+        intern_raw(_parsed({"k": value}))
+    assert list(state_store._shared_values) == ["A", "B"]
+    assert intern_raw(_parsed({"k": "C"}))["k"] == "C"
+
+
+def test_non_json_values_pass_through():
+    marker = MagicMock()
+    assert intern_raw(marker) is marker
+    assert intern_raw(42) == 42
+
+
+def test_service_interns_construction_and_refresh_state():
+    svc = SHCDeviceService(api=MagicMock(), raw_device_service=_parsed(_dsd("ON")))
+    before = svc.state["switchState"]
+
+    svc.process_refresh_result(_parsed(_dsd("OFF")))
+    svc.process_refresh_result(_parsed(_dsd("ON")))
+
+    assert svc.state["switchState"] is before
+
+
+def test_long_poll_result_is_kept_as_received():
+    svc = SHCDeviceService(api=MagicMock(), raw_device_service=_parsed(_dsd("ON")))
+    raw_result = _parsed(_dsd("OFF"))
+
+    svc.process_long_polling_poll_result(raw_result)
+
+    assert svc._raw_device_service is raw_result
+    assert svc.state is raw_result["state"]
+
+
+def test_device_interns_raw_device():
+    raw = {"id": "hdm:ZigBee:0001", "deviceModel": "XYZ", "status": "AVAILABLE"}
+    devices = [
+        SHCDevice(api=MagicMock(), raw_device=_parsed(raw), raw_device_services=[_dsd("ON")])
+        for _ in range(2)
+    ]
+    assert devices[0].status == "AVAILABLE"
+    assert devices[0].status is devices[1].status
@@ -0,0 +1,148 @@
+"""Tests for boschshcpy.subscriptions — indexed session subscriptions."""
+
+import threading
+from unittest.mock import MagicMock
+
+from boschshcpy.events import SHCChangeEvent, SHCEventFilter
+from boschshcpy.subscriptions import SHCSubscriptionRegistry
+
+
+class Base:
+    pass
+
+
+class Light(Base):
+    pass
+
+
+class Plug(Base):
+    pass
+
+
+def _event(device_id="hdm:D1", service_id="PowerSwitch", model="PSM", room_id="hz_1"):
+    device = MagicMock()
+    device.id = device_id
+    device.device_model = model
+    device.room_id = room_id
+    service = MagicMock()
+    service.id = service_id
+    return SHCChangeEvent(device, service, frozenset({"x"}), {"x": 0}, {"x": 1})
+
+
+class TestClassSubscriptions:
+    def test_matches_along_mro_in_subscription_order(self):
+        registry = SHCSubscriptionRegistry()
+        calls = []
+        registry.add_class(Light, lambda o: calls.append("light"))
+        registry.add_class(Base, lambda o: calls.append("base"))
+        registry.add_class(Plug, lambda o: calls.append("plug"))
+        registry.add_class(object, lambda o: calls.append("object"))
+
+        for callback in registry.class_subscribers(Light()):
+            callback(None)
+
+        assert calls == ["light", "base", "object"]
+
+    def test_cache_is_invalidated_on_change(self):
+        registry = SHCSubscriptionRegistry()
+        first = registry.add_class(Light, print)
+        assert registry.class_subscribers(Light()) == [print]
+
+        registry.add_class(Base, repr)
+        assert registry.class_subscribers(Light()) == [print, repr]
+
+        registry.remove(first)
+        assert registry.class_subscribers(Light()) == [repr]
+        assert registry.class_subscribers(object()) == []
+
+    def test_class_subscriptions_do_not_enable_change_capture(self):
+        registry = SHCSubscriptionRegistry()
+        registry.add_class(Light, print)
+        assert not registry
+
+
+class TestChangeSubscriptions:
+    def test_filters_by_each_field(self):
+        registry = SHCSubscriptionRegistry()
+        seen = []
+
+        def subscribe(name, **fields):
+            registry.add_changes(lambda e: seen.append(name), SHCEventFilter(**fields))
+
+        subscribe("device", device_ids={"hdm:D1"})
+        subscribe("other-device", device_ids={"hdm:D2"})
+        subscribe("service", service_ids={"PowerSwitch"})
+        subscribe("model", device_models={"PSM", "BSM"})
+        subscribe("room", room_ids={"hz_1"})
+        subscribe("other-room", room_ids={"hz_2"})
+        registry.add_changes(lambda e: seen.append("all"))
+
+        registry.publish(_event())
+
+        assert seen == ["device", "service", "model", "room", "all"]
+
+    def test_remaining_fields_are_checked(self):
+        registry = SHCSubscriptionRegistry()
+        seen = []
+        registry.add_changes(
+            seen.append,
+            SHCEventFilter(service_ids={"PowerSwitch"}, room_ids={"hz_2"}),
+        )
+
+        registry.publish(_event(room_id="hz_1"))
+        registry.publish(_event(room_id="hz_2"))
+
+        assert [event.device.room_id for event in seen] == ["hz_2"]
+
+    def test_remove(self):
+        registry = SHCSubscriptionRegistry()
+        seen = []
+        by_service = registry.add_changes(
+            seen.append, SHCEventFilter(service_ids={"PowerSwitch", "Thermostat"})
+        )
+        wildcard = registry.add_changes(seen.append)
+        assert registry
+
+        registry.remove(by_service)
+        registry.remove(wildcard)
+        registry.remove(wildcard)  # unknown tokens are ignored
+        registry.publish(_event())
+
+        assert seen == []
+        assert not registry
+
+    def test_subscription_added_during_publish_waits_for_next_event(self):
+        registry = SHCSubscriptionRegistry()
+        seen = []
+
+        def subscribe_more(event):
+            seen.append("first")
+            registry.add_changes(lambda e: seen.append("second"))
+
+        registry.add_changes(subscribe_more, SHCEventFilter(service_ids={"PowerSwitch"}))
+        registry.publish(_event())
+
+        assert seen == ["first"]
+
+
+def test_concurrent_subscribe_while_matching():
+    registry = SHCSubscriptionRegistry()
+    for _ in range(50):
+        registry.add_class(Base, repr)
+    stop = threading.Event()
+    in_room = SHCEventFilter(room_ids={"hz_1"})
+
+    def churn():
+        while not stop.is_set():
+            registry.remove(registry.add_class(Light, repr))
+            registry.remove(registry.add_changes(repr, in_room))
+
+    churner = threading.Thread(target=churn)
+    churner.start()
+    try:
+        for _ in range(2000):
+            assert len(registry.class_subscribers(Light())) >= 50
+            registry.publish(_event())
+    finally:
+        stop.set()
+        churner.join(5)
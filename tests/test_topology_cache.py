@@ -0,0 +1,520 @@
+"""Tests for boschshcpy/topology_cache.py and the session warm-start path.
+
+Strategy:
+- SHCTopologyCache is exercised against pytest's tmp_path.
+- Sessions are built via __new__ with a MagicMock/AsyncMock API (same as
+  test_session_unit.py / test_session_async.py); devices are real SHCDevice
+  objects so the snapshot round-trips the actual raw dicts.
+"""
+
+import asyncio
+import json
+import threading
+from collections import defaultdict
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from boschshcpy.callbacks import SHCCallbackTasks
+from boschshcpy.device_helper import SHCDeviceHelper
+from boschshcpy.session import SHCSession
+from boschshcpy.session_async import SHCSessionAsync, _AsyncSHCInformation
+from boschshcpy.subscriptions import SHCSubscriptionRegistry
+from boschshcpy.topology_cache import TOPOLOGY_CACHE_VERSION, SHCTopologyCache
+
+MAC = "64-DA-A0-AA-BB-CC"
+
+
+def _raw_service(device_id, switch_state="ON"):
+    return {
+        "@type": "DeviceServiceData",
+        "id": "PowerSwitch",
+        "deviceId": device_id,
+        "path": f"/devices/{device_id}/services/PowerSwitch",
+        "state": {"@type": "powerSwitchState", "switchState": switch_state},
+    }
+
+
+def _raw_device(device_id, name="Plug"):
+    return {
+        "@type": "device",
+        "id": device_id,
+        "deviceModel": "UNKNOWN_MODEL",
+        "name": name,
+        "deviceServiceIds": ["PowerSwitch"],
+    }
+
+
+def _resources(switch_state="ON"):
+    return {
+        "services": [_raw_service("hdm:D1", switch_state)],
+        "devices": [_raw_device("hdm:D1")],
+        "rooms": [{"@type": "room", "id": "hz_1", "name": "Kitchen"}],
+        "scenarios": [{"@type": "scenario", "id": "sc1", "name": "Away"}],
+        "userdefinedstates": [
+            {"@type": "userDefinedState", "id": "u1", "name": "Guest", "state": False}
+        ],
+    }
+
+
+# ---------------------------------------------------------------------------
+# SHCTopologyCache
+# ---------------------------------------------------------------------------
+
+class TestTopologyCache:
+    def test_round_trip(self, tmp_path):
+        cache = SHCTopologyCache(tmp_path / "cache")
+        cache.save(MAC, _resources())
+        snapshot = cache.load(MAC)
+        assert snapshot["version"] == TOPOLOGY_CACHE_VERSION
+        assert snapshot["macAddress"] == MAC
+        assert snapshot["devices"] == _resources()["devices"]
+        assert cache.path(MAC).name == "topology-64-DA-A0-AA-BB-CC.json"
+
+    def test_missing_returns_none(self, tmp_path):
+        assert SHCTopologyCache(tmp_path).load(MAC) is None
+
+    def test_no_mac_is_a_miss_and_not_saved(self, tmp_path):
+        cache = SHCTopologyCache(tmp_path)
+        cache.save(None, _resources())
+        assert list(tmp_path.iterdir()) == []
+        assert cache.load(None) is None
+
+    def test_version_mismatch_ignored(self, tmp_path):
+        cache = SHCTopologyCache(tmp_path)
+        cache.save(MAC, _resources())
+        data = json.loads(cache.path(MAC).read_text())
+        data["version"] = TOPOLOGY_CACHE_VERSION + 1
+        cache.path(MAC).write_text(json.dumps(data))
+        assert cache.load(MAC) is None
+
+    def test_foreign_mac_ignored(self, tmp_path):
+        cache = SHCTopologyCache(tmp_path)
+        cache.save(MAC, _resources())
+        data = json.loads(cache.path(MAC).read_text())
+        data["macAddress"] = "00-00-00-00-00-00"
+        cache.path(MAC).write_text(json.dumps(data))
+        assert cache.load(MAC) is None
+
+    def test_corrupt_file_ignored(self, tmp_path):
+        cache = SHCTopologyCache(tmp_path)
+        cache.path(MAC).write_text("{not json")
+        assert cache.load(MAC) is None
+
+    def test_expired_snapshot_ignored(self, tmp_path):
+        cache = SHCTopologyCache(tmp_path, max_age=60)
+        with patch("boschshcpy.topology_cache.time.time", return_value=1000.0):
+            cache.save(MAC, _resources())
+        with patch("boschshcpy.topology_cache.time.time", return_value=1030.0):
+            assert cache.load(MAC) is not None
+        with patch("boschshcpy.topology_cache.time.time", return_value=1100.0):
+            assert cache.load(MAC) is None
+
+    def test_invalidate(self, tmp_path):
+        cache = SHCTopologyCache(tmp_path)
+        cache.save(MAC, _resources())
+        cache.invalidate(MAC)
+        cache.invalidate(MAC)  # idempotent
+        assert cache.load(MAC) is None
+
+    def test_failed_write_leaves_no_temp_file(self, tmp_path):
+        cache = SHCTopologyCache(tmp_path)
+        with patch("boschshcpy.topology_cache.json.dump", side_effect=TypeError):
+            try:
+                cache.save(MAC, _resources())
+            except TypeError:
+                pass
+        assert list(tmp_path.iterdir()) == []
+
+
+# ---------------------------------------------------------------------------
+# SHCSession warm start
+# ---------------------------------------------------------------------------
+
+def _sync_session(cache, api):
+    s = SHCSession.__new__(SHCSession)
+    s._api = api
+    s._device_helper = SHCDeviceHelper(api)
+    s._poll_id = None
+    s._expired_poll_id = None
+    s._zeroconf = None
+    s._long_poll_timeout = 10
+    s._parallel_enumeration = False
+    s._streaming_enumeration = False
+    s._response_cache = None
+    s._retry_policy = None
+    s._adaptive_poll_wait = None
+    s._pipeline_depth = None
+    s._event_journal = None
+    s._dispatch_queue = None
+    s._dispatch_thread = None
+    s._callback_executor = None
+    s._enumeration_workers = 7
+    s._topology_cache = cache
+    s._reconcile_thread = None
+    s._reconcile_pending = False
+    s._topology_lock = threading.RLock()
+    s._rooms_by_id = {}
+    s._scenarios_by_id = {}
+    s._devices_by_id = {}
+    s._services_by_device_id = defaultdict(list)
+    s._domains_by_id = {}
+    s._messages_by_id = {}
+    s._userdefinedstates_by_id = {}
+    s._subscriptions = SHCSubscriptionRegistry()
+    s._event_streams = []
+    s._emma = MagicMock()
+    s._poll_result_handlers = s._default_poll_result_handlers()
+    s._link_handlers = {"com.bosch.tt.emma.applink": s._handle_emma_link}
+    s._coalescer = None
+    s._polling_thread = None
+    s._stop_polling_thread = False
+    s._scenario_callbacks = {}
+    s._userdefinedstate_callbacks = defaultdict(list)
+    s._shc_information = MagicMock(macAddress=MAC)
+    s.authenticate = lambda: None
+    return s
+
+
+def _sync_api(resources):
+    api = MagicMock()
+    api.get_services.return_value = resources["services"]
+    api.get_devices.return_value = resources["devices"]
+    api.get_rooms.return_value = resources["rooms"]
+    api.get_scenarios.return_value = resources["scenarios"]
+    api.get_messages.return_value = []
+    api.get_userdefinedstates.return_value = resources["userdefinedstates"]
+    api.get_domain_intrusion_detection.return_value = {"@type": "systemState"}
+    return api
+
+
+class TestSyncWarmStart:
+    def test_cold_start_writes_snapshot(self, tmp_path):
+        cache = SHCTopologyCache(tmp_path)
+        s = _sync_session(cache, _sync_api(_resources()))
+        with patch("boschshcpy.session.SHCEmma"):
+            s._enumerate_all()
+        snapshot = cache.load(MAC)
+        assert snapshot["devices"] == _resources()["devices"]
+        assert snapshot["services"] == _resources()["services"]
+        assert snapshot["rooms"] == _resources()["rooms"]
+
+    def test_warm_start_builds_graph_then_reconciles(self, tmp_path):
+        cache = SHCTopologyCache(tmp_path)
+        cache.save(MAC, _resources(switch_state="ON"))
+        # The controller has moved on: the plug is now OFF.
+        api = _sync_api(_resources(switch_state="OFF"))
+        s = _sync_session(cache, api)
+
+        started = []
+        with patch("boschshcpy.session.SHCEmma"), patch(
+            "boschshcpy.session.threading.Thread"
+        ) as MockThread:
+            MockThread.return_value.start.side_effect = lambda: started.append(True)
+            s._enumerate_all()
+            assert started == []  # only once the session is constructed
+            s._start_reconcile()
+
+        # Usable straight from the snapshot, before any topology GET.
+        api.get_services.assert_not_called()
+        api.get_devices.assert_not_called()
+        api.get_domain_intrusion_detection.assert_called_once()
+        service = s.device("hdm:D1").device_service("PowerSwitch")
+        assert service.state["switchState"] == "ON"
+        assert started == [True]
+
+        fired = []
+        service.subscribe_callback("entity", lambda: fired.append(True))
+        s.reconcile_topology()
+        assert service.state["switchState"] == "OFF"
+        assert fired == [True]
+        assert cache.load(MAC)["services"][0]["state"]["switchState"] == "OFF"
+
+    def test_warm_start_through_constructor(self, tmp_path):
+        cache = SHCTopologyCache(tmp_path)
+        cache.save(MAC, _resources(switch_state="ON"))
+        fresh = _resources(switch_state="OFF")
+        fresh["rooms"] = [{"@type": "room", "id": "hz_2", "name": "Hall"}]
+        fresh["userdefinedstates"][0]["state"] = True
+        api = _sync_api(fresh)
+
+        def authenticate(session):
+            session._shc_information = MagicMock(macAddress=MAC)
+
+        with patch("boschshcpy.session.SHCAPI", return_value=api), patch(
+            "boschshcpy.session.SHCEmma"
+        ), patch.object(SHCSession, "authenticate", authenticate):
+            s = SHCSession("192.0.2.1", "/c.pem", "/k.pem", topology_cache=cache)
+            thread = s._reconcile_thread
+            if thread is not None:
+                thread.join(5)
+
+        assert s.device("hdm:D1").device_service("PowerSwitch").state[
+            "switchState"
+        ] == "OFF"
+        assert [room.id for room in s.rooms] == ["hz_2"]
+        assert s._userdefinedstates_by_id["u1"].state is True
+        assert cache.load(MAC)["rooms"] == fresh["rooms"]
+
+    def test_dispatch_waits_for_reconcile(self, tmp_path):
+        s = _sync_session(None, _sync_api(_resources()))
+        with patch("boschshcpy.session.SHCEmma"):
+            s._enumerate_all()
+        processed = []
+        s._process_long_polling_poll_result = processed.append
+
+        with s._topology_lock:  # as held by reconcile_topology()
+            dispatcher = threading.Thread(
+                target=s._dispatch_batch, args=([{"id": "r1"}], False)
+            )
+            dispatcher.start()
+            dispatcher.join(0.1)
+            assert processed == []
+        dispatcher.join(5)
+        assert processed == [{"id": "r1"}]
+
+    def test_reconcile_unchanged_state_fires_nothing(self, tmp_path):
+        cache = SHCTopologyCache(tmp_path)
+        s = _sync_session(cache, _sync_api(_resources()))
+        with patch("boschshcpy.session.SHCEmma"):
+            s._enumerate_all()
+        device = s.device("hdm:D1")
+        fired = []
+        device.subscribe_callback("entity", lambda: fired.append("device"))
+        device.device_service("PowerSwitch").subscribe_callback(
+            "entity", lambda: fired.append("service")
+        )
+        s.reconcile_topology()
+        assert fired == []
+
+    def test_reconcile_adds_and_removes_devices(self, tmp_path):
+        cache = SHCTopologyCache(tmp_path)
+        resources = _resources()
+        s = _sync_session(cache, _sync_api(resources))
+        with patch("boschshcpy.session.SHCEmma"):
+            s._enumerate_all()
+
+        fresh = _resources()
+        fresh["devices"] = [_raw_device("hdm:D2", name="New plug")]
+        fresh["services"] = [_raw_service("hdm:D2")]
+        fresh["userdefinedstates"] = []
+        s._api = _sync_api(fresh)
+        s._api.get_device_services.return_value = [_raw_service("hdm:D2")]
+        new_devices = []
+        s.subscribe((object, new_devices.append))
+
+        s.reconcile_topology()
+        assert list(s._devices_by_id) == ["hdm:D2"]
+        assert [d.id for d in new_devices] == ["hdm:D2"]
+        assert s._userdefinedstates_by_id == {}
+
+    def test_reconcile_does_not_dispatch_stale_events(self, tmp_path):
+        """A Keypad press that happened while the session was down is current
+        state, not a new event — register_event callbacks must stay quiet."""
+        cache = SHCTopologyCache(tmp_path)
+        s = _sync_session(cache, _sync_api(_resources()))
+        with patch("boschshcpy.session.SHCEmma"):
+            s._enumerate_all()
+        device = s.device("hdm:D1")
+        keypad = MagicMock(id="Keypad")
+        device._device_services_by_id["Keypad"] = keypad
+        fresh = _resources()
+        fresh["services"].append(
+            {
+                "@type": "DeviceServiceData",
+                "id": "Keypad",
+                "deviceId": "hdm:D1",
+                "state": {"@type": "keypadState", "eventTimestamp": 2},
+            }
+        )
+        s._api = _sync_api(fresh)
+        s._topology_cache = None  # the MagicMock service isn't serialisable
+        s.reconcile_topology()
+        keypad.process_refresh_result.assert_called_once()
+        keypad.process_long_polling_poll_result.assert_not_called()
+
+    def test_reconcile_keeps_state_polled_during_fetch(self, tmp_path):
+        s = _sync_session(None, _sync_api(_resources(switch_state="ON")))
+        with patch("boschshcpy.session.SHCEmma"):
+            s._enumerate_all()
+        service = s.device("hdm:D1").device_service("PowerSwitch")
+
+        def get_services():
+            # The plug is switched ON -> OFF while the GET is in flight; the
+            # response still carries the state from before.
+            s._dispatch_batch([_raw_service("hdm:D1", "OFF")], False)
+            return [_raw_service("hdm:D1", "ON")]
+
+        s._api.get_services.side_effect = get_services
+        s.reconcile_topology()
+        assert service.state["switchState"] == "OFF"
+
+    def test_reconcile_adds_new_services_to_existing_devices(self, tmp_path):
+        s = _sync_session(None, _sync_api(_resources()))
+        with patch("boschshcpy.session.SHCEmma"):
+            s._enumerate_all()
+        device = s.device("hdm:D1")
+        battery = {
+            "@type": "DeviceServiceData",
+            "id": "BatteryLevel",
+            "deviceId": "hdm:D1",
+            "path": "/devices/hdm:D1/services/BatteryLevel",
+        }
+        fresh = _resources()
+        fresh["services"].append(battery)
+        s._api = _sync_api(fresh)
+
+        s.reconcile_topology()
+        assert s.device("hdm:D1") is device
+        assert device.device_service("BatteryLevel").path == battery["path"]
+
+    def test_unwritable_cache_does_not_break_startup(self, tmp_path):
+        cache = MagicMock()
+        cache.load.return_value = None
+        cache.save.side_effect = OSError("read-only")
+        s = _sync_session(cache, _sync_api(_resources()))
+        with patch("boschshcpy.session.SHCEmma"):
+            s._enumerate_all()
+        assert "hdm:D1" in s._devices_by_id
+
+
+# ---------------------------------------------------------------------------
+# SHCSessionAsync warm start
+# ---------------------------------------------------------------------------
+
+def _async_session(cache, resources):
+    api = AsyncMock()
+    api.get_public_information.return_value = {"macAddress": MAC}
+    api.get_information.return_value = {}
+    api.get_services.return_value = resources["services"]
+    api.get_devices.return_value = resources["devices"]
+    api.get_rooms.return_value = resources["rooms"]
+    api.get_scenarios.return_value = resources["scenarios"]
+    api.get_messages.return_value = []
+    api.get_userdefinedstates.return_value = resources["userdefinedstates"]
+    api.get_domain_intrusion_detection.return_value = {"@type": "systemState"}
+
+    s = SHCSessionAsync.__new__(SHCSessionAsync)
+    s._api = api
+    s._device_helper = None
+    s._long_poll_timeout = 30
+    s._rooms_by_id = {}
+    s._scenarios_by_id = {}
+    s._devices_by_id = {}
+    s._services_by_device_id = defaultdict(list)
+    s._domains_by_id = {}
+    s._messages_by_id = {}
+    s._userdefinedstates_by_id = {}
+    s._subscriptions = SHCSubscriptionRegistry()
+    s._event_streams = []
+    s._emma = None
+    s._poll_result_handlers = s._default_poll_result_handlers()
+    s._link_handlers = {"com.bosch.tt.emma.applink": s._handle_emma_link}
+    s._coalescer = None
+    s._response_cache = None
+    s._retry_policy = None
+    s._adaptive_poll_wait = None
+    s._pipeline_depth = None
+    s._event_journal = None
+    s._callback_tasks = SHCCallbackTasks()
+    s._shc_information = _AsyncSHCInformation({"macAddress": MAC}, {})
+    s._startup_timings = {}
+    s._topology_cache = cache
+    s._reconcile_task = None
+    s._topology_lock = asyncio.Lock()
+    s._poll_id = None
+    s._poll_task = None
+    s._dispatch_queue = None
+    s._dispatch_task = None
+    s._stop_polling = False
+    s._scenario_callbacks = {}
+    s._userdefinedstate_callbacks = defaultdict(list)
+    return s
+
+
+class TestAsyncWarmStart:
+    def test_cold_start_writes_snapshot(self, tmp_path):
+        cache = SHCTopologyCache(tmp_path)
+        s = _async_session(cache, _resources())
+        asyncio.run(s.async_init(concurrent=True))
+        assert cache.load(MAC)["devices"] == _resources()["devices"]
+        assert "topology_cache" in s.startup_timings
+
+    def test_warm_start_reconciles_in_background(self, tmp_path):
+        cache = SHCTopologyCache(tmp_path)
+        cache.save(MAC, _resources(switch_state="ON"))
+        s = _async_session(cache, _resources(switch_state="OFF"))
+
+        async def run():
+            await s.async_init()
+            service = s.device("hdm:D1").device_service("PowerSwitch")
+            before = service.state["switchState"]
+            assert s._reconcile_task is not None
+            await s._reconcile_task
+            return before, service.state["switchState"]
+
+        before, after = asyncio.run(run())
+        assert (before, after) == ("ON", "OFF")
+        assert s._reconcile_task is None
+        assert cache.load(MAC)["services"][0]["state"]["switchState"] == "OFF"
+
+    def test_reconcile_failure_is_logged_not_raised(self, tmp_path):
+        cache = SHCTopologyCache(tmp_path)
+        cache.save(MAC, _resources())
+        s = _async_session(cache, _resources())
+        s._api.get_devices.side_effect = RuntimeError("boom")
+
+        async def run():
+            await s.async_init()
+            await s._reconcile_task
+
+        asyncio.run(run())
+        assert "hdm:D1" in s._devices_by_id
+
+    def test_reconcile_replaces_messages(self, tmp_path):
+        s = _async_session(None, _resources())
+        s._api.get_messages.return_value = [{"@type": "message", "id": "m1"}]
+        asyncio.run(s.async_init())
+        assert [m.id for m in s.messages] == ["m1"]
+
+        s._api.get_messages.return_value = []
+        asyncio.run(s.async_reconcile_topology())
+        assert s.messages == []
+
+    def test_reconcile_and_poll_add_a_new_device_once(self, tmp_path):
+        s = _async_session(None, _resources())
+        asyncio.run(s.async_init())
+        fresh = _resources()
+        fresh["devices"].append(_raw_device("hdm:D2"))
+        fresh["services"].append(_raw_service("hdm:D2"))
+        s._api.get_devices.return_value = fresh["devices"]
+        s._api.get_services.return_value = fresh["services"]
+        async def get_device_services(device_id):
+            for _ in range(5):
+                await asyncio.sleep(0)
+            return [_raw_service(device_id)]
+
+        s._api.get_device_services.side_effect = get_device_services
+        new_devices = []
+        s.subscribe((object, new_devices.append))
+
+        async def run():
+            # The SHC announces the device while the reconcile GETs run.
+            await asyncio.gather(
+                s.async_reconcile_topology(),
+                s._dispatch_batch([_raw_device("hdm:D2")], False),
+            )
+
+        asyncio.run(run())
+        assert [d.id for d in new_devices] == ["hdm:D2"]
+
+    def test_reconcile_keeps_state_polled_during_fetch(self, tmp_path):
+        s = _async_session(None, _resources(switch_state="ON"))
+        asyncio.run(s.async_init())
+        service = s.device("hdm:D1").device_service("PowerSwitch")
+
+        async def get_services():
+            await s._dispatch_batch([_raw_service("hdm:D1", "OFF")], False)
+            return [_raw_service("hdm:D1", "ON")]
+
+        s._api.get_services.side_effect = get_services
+        asyncio.run(s.async_reconcile_topology())
+        assert service.state["switchState"] == "OFF"